@@ -0,0 +1,59 @@
+"""add recurring_series table
+
+Persists the recurring-charge model so the dashboard no longer re-derives
+every merchant's cadence from the full itemized history on each read. The
+table starts empty and is built by the first scrape after upgrading (or by
+``POST /api/analytics/recurring/rebuild``); until then readers detect on the fly.
+
+Revision ID: a3c5e7f9b1d4
+Revises: f2a4c6e8b0d3
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a3c5e7f9b1d4"
+down_revision: Union[str, Sequence[str], None] = "f2a4c6e8b0d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLE = "recurring_series"
+
+
+def upgrade() -> None:
+    """Create ``recurring_series`` unless ``create_all`` already did."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if _TABLE in inspector.get_table_names():
+        return
+    op.create_table(
+        _TABLE,
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("normalized", sa.String(), nullable=False, unique=True),
+        sa.Column("label", sa.String(), nullable=False),
+        sa.Column("category", sa.String(), nullable=True),
+        sa.Column("cadence", sa.String(), nullable=False),
+        sa.Column("period_days", sa.Integer(), nullable=False),
+        sa.Column("occurrences", sa.Integer(), nullable=False),
+        sa.Column("first_date", sa.String(), nullable=False),
+        sa.Column("last_date", sa.String(), nullable=False),
+        sa.Column("interval_median", sa.Float(), nullable=False),
+        sa.Column("interval_std", sa.Float(), nullable=False),
+        sa.Column("amount", sa.Float(), nullable=False),
+        sa.Column("last_amount", sa.Float(), nullable=False),
+        sa.Column("prior_median", sa.Float(), nullable=False),
+        sa.Column("price_change", sa.Float(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop the ``recurring_series`` table."""
+    op.drop_table(_TABLE)
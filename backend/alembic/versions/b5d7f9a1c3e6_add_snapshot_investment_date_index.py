@@ -0,0 +1,75 @@
+"""add unique (investment_id, date) index to investment_balance_snapshots
+
+Valuation reads every investment's snapshots in one query ordered by
+``(investment_id, date)``, and snapshot writes are an
+``INSERT .. ON CONFLICT (investment_id, date)`` upsert, which SQLite only
+accepts when a unique index covers exactly those columns. Databases created
+from the current models already have the ``uq_snapshot_investment_date``
+unique constraint. Older databases without it get a unique index of the
+same name, after duplicate ``(investment_id, date)`` rows are removed
+(the most recently inserted row of each pair is kept).
+
+Revision ID: b5d7f9a1c3e6
+Revises: a3c5e7f9b1d4
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b5d7f9a1c3e6"
+down_revision: Union[str, Sequence[str], None] = "a3c5e7f9b1d4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLE = "investment_balance_snapshots"
+_INDEX = "uq_snapshot_investment_date"
+_COLUMNS = ["investment_id", "date"]
+
+
+def upgrade() -> None:
+    """Create the unique index unless a unique constraint or index covers it.
+
+    Idempotent: skipped when the table is missing and when a unique
+    constraint or unique index on exactly ``(investment_id, date)`` exists.
+    """
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if _TABLE not in inspector.get_table_names():
+        return
+    unique = [
+        uc["column_names"] for uc in inspector.get_unique_constraints(_TABLE)
+    ]
+    unique += [
+        idx["column_names"]
+        for idx in inspector.get_indexes(_TABLE)
+        if idx.get("unique")
+    ]
+    if _COLUMNS in unique:
+        return
+    op.execute(
+        sa.text(
+            f"DELETE FROM {_TABLE} WHERE id NOT IN "
+            f"(SELECT MAX(id) FROM {_TABLE} GROUP BY investment_id, date)"
+        )
+    )
+    op.create_index(_INDEX, _TABLE, _COLUMNS, unique=True)
+
+
+def downgrade() -> None:
+    """Drop the unique index if :func:`upgrade` created it.
+
+    A model-created ``uq_snapshot_investment_date`` is a table constraint,
+    not a named index, and is left alone. Removed duplicates are not
+    restored.
+    """
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if _TABLE not in inspector.get_table_names():
+        return
+    if _INDEX in {idx["name"] for idx in inspector.get_indexes(_TABLE)}:
+        op.drop_index(_INDEX, table_name=_TABLE)
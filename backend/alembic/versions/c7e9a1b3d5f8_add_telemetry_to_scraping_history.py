@@ -0,0 +1,52 @@
+"""add telemetry to scraping_history
+
+Stores the phase spans of each scrape (initialize, login, otp_wait, fetch,
+convert, save, tag, rebalance, …) with the history row, so a slow provider
+can be diagnosed from the record of its runs instead of from logs.
+
+Revision ID: c7e9a1b3d5f8
+Revises: b5d7f9a1c3e6
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e9a1b3d5f8"
+down_revision: Union[str, Sequence[str], None] = "b5d7f9a1c3e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLE = "scraping_history"
+_COLUMN = "telemetry"
+
+
+def upgrade() -> None:
+    """Add the nullable ``telemetry`` column when it isn't already present.
+
+    Idempotent: a fresh database created from the models already has the
+    column. Existing rows keep NULL — their timings were never measured.
+    """
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if _TABLE not in inspector.get_table_names():
+        return
+    columns = [c["name"] for c in inspector.get_columns(_TABLE)]
+    if _COLUMN not in columns:
+        with op.batch_alter_table(_TABLE) as batch_op:
+            batch_op.add_column(sa.Column(_COLUMN, sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Drop the ``telemetry`` column if it exists."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if _TABLE not in inspector.get_table_names():
+        return
+    if _COLUMN in [c["name"] for c in inspector.get_columns(_TABLE)]:
+        with op.batch_alter_table(_TABLE, recreate="always") as batch_op:
+            batch_op.drop_column(_COLUMN)
@@ -0,0 +1,46 @@
+"""add recurring_series_state table
+
+Records that the recurring-charge model was built and a watermark of the
+source tables it was built from, so readers can tell a current model (even
+an empty one) from a stale or never-built one after a restart. The table
+starts empty: existing models count as stale until the next scrape or
+``POST /api/analytics/recurring/rebuild`` stamps them.
+
+Revision ID: d2f4a6c8e0b3
+Revises: c7e9a1b3d5f8
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2f4a6c8e0b3"
+down_revision: Union[str, Sequence[str], None] = "c7e9a1b3d5f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLE = "recurring_series_state"
+
+
+def upgrade() -> None:
+    """Create ``recurring_series_state`` unless ``create_all`` already did."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if _TABLE in inspector.get_table_names():
+        return
+    op.create_table(
+        _TABLE,
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("source_watermark", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Drop the ``recurring_series_state`` table."""
+    op.drop_table(_TABLE)
@@ -46,6 +46,10 @@ class Tables(Enum):
         Name of the table storing provider account credentials.
     LIABILITY_TRANSACTIONS : str
         Name of the table storing auto-generated liability payment transactions.
+    RECURRING_SERIES : str
+        Name of the table storing the persisted per-merchant recurring-charge model.
+    RECURRING_SERIES_STATE : str
+        Name of the table recording when the recurring-charge model was built.
     """
 
     CREDIT_CARD = "credit_card_transactions"
@@ -73,6 +77,8 @@ class Tables(Enum):
     INTEREST_RATES = "interest_rates"
     RETIREMENT_GOAL = "retirement_goals"
     SAVINGS_GOALS = "savings_goals"
+    RECURRING_SERIES = "recurring_series"
+    RECURRING_SERIES_STATE = "recurring_series_state"
 
 
 def _create_enum(name: str, fields: list[tuple[str, str]]) -> Type[Enum]:
@@ -9,16 +9,25 @@ import os
 from contextlib import contextmanager
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import NullPool
 
 from backend.config import AppConfig
 
 # Importing for side effect: registers the Session event listeners that
-# clear the per-session DataFrame cache on commit/rollback. Everything that
-# opens a session imports this module, so registration is guaranteed.
+# clear the per-session DataFrame cache on commit/rollback, and (with
+# data_generation) the engine listeners that track committed writes.
+# Everything that opens a session imports this module, so registration is
+# guaranteed.
 import backend.utils.session_cache  # noqa: F401  (side-effect import)
+from backend.utils.data_generation import invalidate_all
+
+# Seconds a connection waits for another connection's write transaction to
+# finish before failing with "database is locked". The post-scrape pipeline
+# holds the write lock for its whole unit of work, so this must comfortably
+# cover one pipeline run rather than SQLite's 5 s default.
+SQLITE_BUSY_TIMEOUT_SECONDS = 60
 
 
 def get_database_url(db_path: str = None) -> str:
@@ -78,12 +87,32 @@ def create_db_engine(db_path: str = None, echo: bool = False):
         except OSError:
             pass
 
-    return create_engine(
+    engine = create_engine(
         get_database_url(db_path),
         echo=echo,
-        connect_args={"check_same_thread": False},  # Required for SQLite with FastAPI
+        connect_args={
+            "check_same_thread": False,  # Required for SQLite with FastAPI
+            "timeout": SQLITE_BUSY_TIMEOUT_SECONDS,
+        },
         poolclass=NullPool,  # Create fresh connections for thread safety
     )
+    event.listen(engine, "connect", _enable_wal)
+    return engine
+
+
+def _enable_wal(dbapi_connection, connection_record) -> None:
+    """Switch each new connection's database to write-ahead logging.
+
+    In WAL mode readers never block on a writer, so requests keep reading
+    while a scrape's pipeline holds the write lock; other writers queue
+    behind it for up to ``SQLITE_BUSY_TIMEOUT_SECONDS``. The mode is stored
+    in the file, so after the first connection this is a no-op.
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+    finally:
+        cursor.close()
 
 
 # Default engine and session factory
@@ -199,3 +228,6 @@ def reset_engine():
         _engine.dispose()
     _engine = None
     _SessionLocal = None
+    # The database file may be swapped (backup restore, demo mode) without
+    # any tracked write — drop every cross-request cached value.
+    invalidate_all()
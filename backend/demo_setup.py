@@ -339,6 +339,12 @@ def prepare_demo_database() -> None:
 
     if os.path.exists(source):
         os.makedirs(os.path.dirname(demo_db_path), exist_ok=True)
+        database.reset_engine()
+        # A write-ahead log left by the previous demo copy would be replayed
+        # onto the fresh file.
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(demo_db_path + suffix):
+                os.remove(demo_db_path + suffix)
         shutil.copy2(source, demo_db_path)
 
     database.reset_engine()
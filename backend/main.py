@@ -145,6 +145,9 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down Finance Analysis API...")
+    from backend.scraper.adapter import close_browser_pool
+
+    await close_browser_pool()
 
 
 # Only expose OpenAPI/Swagger docs outside of production. ``ENVIRONMENT=production``
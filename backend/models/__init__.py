@@ -17,6 +17,7 @@ from backend.models.investment import Investment
 from backend.models.liability import Liability, LiabilityTransaction
 from backend.models.investment_balance_snapshot import InvestmentBalanceSnapshot
 from backend.models.pending_refund import PendingRefund, RefundLink
+from backend.models.recurring_series import RecurringSeries, RecurringSeriesState
 from backend.models.retirement_goal import RetirementGoal
 from backend.models.savings_goal import SavingsGoal
 from backend.models.scraping import ScrapingHistory
@@ -61,4 +62,6 @@ __all__ = [
     "BudgetMonthOverride",
     "RetirementGoal",
     "SavingsGoal",
+    "RecurringSeries",
+    "RecurringSeriesState",
 ]
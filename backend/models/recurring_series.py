@@ -0,0 +1,99 @@
+"""RecurringSeries database model.
+
+Persists the recurring-charge model — one row per normalized merchant that
+passed detection — so the dashboard reads subscriptions from a small table
+instead of re-deriving every merchant's cadence from the full itemized
+history. Rows are refreshed per merchant after each scrape and rebuilt in
+full on demand (see ``RecurringService``). ``RecurringSeriesState`` records
+that the model was built and which source data it was built from.
+"""
+
+from sqlalchemy import Column, Float, Integer, String
+
+from backend.constants.tables import Tables
+from backend.models.base import Base, TimestampMixin
+
+
+class RecurringSeries(Base, TimestampMixin):
+    """ORM model for one detected recurring-charge series.
+
+    Attributes
+    ----------
+    normalized : str
+        Normalized merchant key (see ``RecurringService._normalize``). Unique.
+    label : str
+        Most common raw description for the merchant.
+    category : str or None
+        Most common category of the merchant's charges.
+    cadence : str
+        ``weekly`` / ``monthly`` / ``quarterly`` / ``annual``.
+    period_days : int
+        Expected days between charges for the cadence.
+    occurrences : int
+        Number of net-charge days in the merchant's history.
+    first_date, last_date : str
+        First and latest charge dates (``YYYY-MM-DD``).
+    interval_median, interval_std : float
+        Median and population standard deviation of the days between
+        consecutive charges.
+    amount : float
+        Median net charge (positive).
+    last_amount : float
+        Latest net charge (positive).
+    prior_median : float
+        Median net charge excluding the latest one; the price-change baseline.
+    price_change : float
+        Signed latest-vs-prior change when above the threshold, else 0.
+    status : str
+        ``active`` / ``new`` / ``price_changed`` / ``ended`` as of the last
+        refresh. Readers re-derive it against the current date.
+    """
+
+    __tablename__ = Tables.RECURRING_SERIES.value
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    normalized = Column(String, nullable=False, unique=True)
+    label = Column(String, nullable=False)
+    category = Column(String, nullable=True)
+    cadence = Column(String, nullable=False)
+    period_days = Column(Integer, nullable=False)
+    occurrences = Column(Integer, nullable=False)
+    first_date = Column(String, nullable=False)
+    last_date = Column(String, nullable=False)
+    interval_median = Column(Float, nullable=False)
+    interval_std = Column(Float, nullable=False)
+    amount = Column(Float, nullable=False)
+    last_amount = Column(Float, nullable=False)
+    prior_median = Column(Float, nullable=False)
+    price_change = Column(Float, nullable=False, default=0.0)
+    status = Column(String, nullable=False)
+
+    def __repr__(self):
+        return (
+            f"<RecurringSeries(normalized={self.normalized!r}, "
+            f"cadence={self.cadence!r}, amount={self.amount})>"
+        )
+
+
+class RecurringSeriesState(Base, TimestampMixin):
+    """ORM model for the single row describing the persisted recurring model.
+
+    Its presence marks the model as built, even when no merchant passed
+    detection; its watermark tells readers whether the source tables have
+    changed since — also across restarts and writes from other processes.
+
+    Attributes
+    ----------
+    source_watermark : str
+        Row count, highest primary key and latest ``updated_at`` of every
+        table detection reads, as of the build (see
+        ``RecurringSeriesRepository.source_watermark``).
+    """
+
+    __tablename__ = Tables.RECURRING_SERIES_STATE.value
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_watermark = Column(String, nullable=False)
+
+    def __repr__(self):
+        return f"<RecurringSeriesState(source_watermark={self.source_watermark!r})>"
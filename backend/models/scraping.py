@@ -2,7 +2,7 @@
 Scraping history model.
 """
 
-from sqlalchemy import Column, Index, Integer, String
+from sqlalchemy import JSON, Column, Index, Integer, String
 
 from backend.models.base import Base, TimestampMixin
 from backend.constants.tables import Tables
@@ -38,6 +38,12 @@ class ScrapingHistory(Base, TimestampMixin):
         scraper's ``ScrapingResult.error_type``. Kept separate from
         ``error_message`` so the UI can show friendly, translated copy while the
         raw provider text stays available for debugging.
+    telemetry : list of dict, optional
+        Phase spans of the run — ``initialize``, ``login``, ``otp_wait``,
+        ``fetch`` (with ``fetch_month`` / ``fetch_account`` children),
+        ``convert``, ``save``, ``tag``, ``rebalance``, … — each with
+        ``name``, ``duration_ms``, ``requests`` and ``rows``. Recorded when
+        the scrape ends; NULL for rows written before telemetry existed.
     """
 
     __tablename__ = Tables.SCRAPING_HISTORY.value
@@ -66,3 +72,5 @@ class ScrapingHistory(Base, TimestampMixin):
     error_message = Column(String, nullable=True)
     # Failure category driving the user-facing message; see class docstring.
     error_type = Column(String, nullable=True)
+    # Per-phase timings of the run; see class docstring.
+    telemetry = Column(JSON(none_as_null=True), nullable=True)
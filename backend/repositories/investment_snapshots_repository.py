@@ -2,10 +2,12 @@
 Investment balance snapshots repository with SQLAlchemy ORM.
 """
 
-from typing import Optional
+from typing import Dict, Iterable, NamedTuple, Optional
 
+import numpy as np
 import pandas as pd
 from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from backend.utils.session_cache import session_cache_get, session_cache_set
 from sqlalchemy.exc import IntegrityError
@@ -15,6 +17,26 @@ from backend.errors import EntityNotFoundException
 from backend.models.investment_balance_snapshot import InvestmentBalanceSnapshot
 
 
+class SnapshotArrays(NamedTuple):
+    """One investment's snapshots as parallel arrays, ascending by date.
+
+    Attributes
+    ----------
+    dates : np.ndarray
+        Snapshot dates as ``datetime64[D]``.
+    balances : np.ndarray
+        Balance on each date.
+    """
+
+    dates: np.ndarray
+    balances: np.ndarray
+
+
+# Rows per multi-VALUES statement, keeping the bound parameters under
+# SQLite's historical 999-variable limit.
+_UPSERT_CHUNK_ROWS = 200
+
+
 class InvestmentSnapshotsRepository:
     """Repository for managing investment balance snapshots using ORM.
 
@@ -91,6 +113,60 @@ class InvestmentSnapshotsRepository:
 
         self.db.commit()
 
+    def upsert_snapshots(
+        self,
+        investment_id: int,
+        snapshots: pd.DataFrame,
+        source: str = "calculated",
+        commit: bool = True,
+    ) -> None:
+        """Create or update many snapshots of one investment at once.
+
+        One ``INSERT .. ON CONFLICT (investment_id, date) DO UPDATE`` per
+        chunk of rows instead of a try-update/insert round trip per date.
+        The conflict target needs the unique ``uq_snapshot_investment_date``
+        constraint or index; migration ``b5d7f9a1c3e6`` adds it to databases
+        created without it.
+
+        Parameters
+        ----------
+        investment_id : int
+            Foreign key referencing the investment record.
+        snapshots : pd.DataFrame
+            Columns ``date`` (``YYYY-MM-DD``) and ``balance``.
+        source : str
+            Source stamped on every row. Defaults to ``"calculated"``.
+        commit : bool
+            Commit after writing. Pass ``False`` to batch several
+            investments into the caller's transaction.
+        """
+        rows = [
+            {
+                "investment_id": investment_id,
+                "date": snapshot_date,
+                "balance": balance,
+                "source": source,
+            }
+            for snapshot_date, balance in zip(
+                snapshots["date"].tolist(), snapshots["balance"].astype(float).tolist()
+            )
+        ]
+        for offset in range(0, len(rows), _UPSERT_CHUNK_ROWS):
+            stmt = sqlite_insert(InvestmentBalanceSnapshot).values(
+                rows[offset:offset + _UPSERT_CHUNK_ROWS]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["investment_id", "date"],
+                set_={
+                    "balance": stmt.excluded.balance,
+                    "source": stmt.excluded.source,
+                    "updated_at": func.now(),
+                },
+            )
+            self.db.execute(stmt)
+        if commit:
+            self.db.commit()
+
     def get_snapshots_for_investment(self, investment_id: int) -> pd.DataFrame:
         """Get all snapshots for an investment ordered by date ascending.
 
@@ -120,6 +196,80 @@ class InvestmentSnapshotsRepository:
         session_cache_set(self.db, cache_key, df)
         return df
 
+    def get_snapshots_for_investments(
+        self,
+        investment_ids: Optional[Iterable[int]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> pd.DataFrame:
+        """Get the snapshots of many investments in one query.
+
+        Served by the ``(investment_id, date)`` index.
+
+        Parameters
+        ----------
+        investment_ids : iterable of int, optional
+            Investments to include. ``None`` includes every investment.
+        start_date : str, optional
+            Earliest date to include (``YYYY-MM-DD``, inclusive).
+        end_date : str, optional
+            Latest date to include (``YYYY-MM-DD``, inclusive).
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per snapshot, sorted by ``investment_id`` then ``date``.
+        """
+        ids = None if investment_ids is None else tuple(sorted({int(i) for i in investment_ids}))
+        cache_key = ("investment_snapshots.for_investments", ids, start_date, end_date)
+        cached = session_cache_get(self.db, cache_key)
+        if cached is not None:
+            return cached
+
+        stmt = select(InvestmentBalanceSnapshot).order_by(
+            InvestmentBalanceSnapshot.investment_id.asc(),
+            InvestmentBalanceSnapshot.date.asc(),
+        )
+        if ids is not None:
+            stmt = stmt.where(InvestmentBalanceSnapshot.investment_id.in_(ids))
+        if start_date is not None:
+            stmt = stmt.where(InvestmentBalanceSnapshot.date >= start_date)
+        if end_date is not None:
+            stmt = stmt.where(InvestmentBalanceSnapshot.date <= end_date)
+        df = pd.read_sql(stmt, self.db.bind)
+        session_cache_set(self.db, cache_key, df)
+        return df
+
+    def get_snapshot_arrays(
+        self,
+        investment_ids: Optional[Iterable[int]] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[int, SnapshotArrays]:
+        """Get many investments' snapshots grouped into per-investment arrays.
+
+        Same filters as :meth:`get_snapshots_for_investments`.
+
+        Returns
+        -------
+        dict[int, SnapshotArrays]
+            Date and balance arrays keyed by investment id. Investments
+            without snapshots in range are absent.
+        """
+        df = self.get_snapshots_for_investments(investment_ids, start_date, end_date)
+        if df.empty:
+            return {}
+        owners = df["investment_id"].to_numpy(dtype=np.int64)
+        dates = df["date"].to_numpy().astype("datetime64[D]")
+        balances = df["balance"].to_numpy(dtype=float)
+        # Rows are sorted by investment, so each group is a contiguous slice.
+        starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        bounds = np.r_[starts, len(owners)].tolist()
+        return {
+            int(owners[first]): SnapshotArrays(dates[first:last], balances[first:last])
+            for first, last in zip(bounds[:-1], bounds[1:])
+        }
+
     def get_latest_snapshot_dates(self, target_date: str) -> dict[int, str]:
         """Get the most recent snapshot date on or before a target date, per investment.
 
@@ -239,7 +389,7 @@ class InvestmentSnapshotsRepository:
             )
 
     def delete_snapshots_for_investment(
-        self, investment_id: int, source: Optional[str] = None
+        self, investment_id: int, source: Optional[str] = None, commit: bool = True
     ) -> None:
         """Delete all snapshots for an investment, optionally filtered by source.
 
@@ -250,6 +400,9 @@ class InvestmentSnapshotsRepository:
         source : str, optional
             When provided, only snapshots with this source value are deleted.
             When ``None``, all snapshots for the investment are removed.
+        commit : bool
+            Commit after deleting. Pass ``False`` to batch the delete into
+            the caller's transaction.
         """
         stmt = delete(InvestmentBalanceSnapshot).where(
             InvestmentBalanceSnapshot.investment_id == investment_id
@@ -259,4 +412,5 @@ class InvestmentSnapshotsRepository:
             stmt = stmt.where(InvestmentBalanceSnapshot.source == source)
 
         self.db.execute(stmt)
-        self.db.commit()
+        if commit:
+            self.db.commit()
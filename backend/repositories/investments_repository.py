@@ -12,6 +12,7 @@ from backend.utils.session_cache import session_cache_get, session_cache_set
 
 from backend.models.investment import Investment
 from backend.models.investment_balance_snapshot import InvestmentBalanceSnapshot
+from backend.models.transaction import InsuranceTransaction
 from backend.constants.tables import InvestmentsTableFields, Tables
 
 
@@ -140,6 +141,29 @@ class InvestmentsRepository:
 
         return pd.read_sql(stmt, self.db.bind)
 
+    def get_linked_insurance_transactions(self) -> pd.DataFrame:
+        """Get the insurance transactions of every insurance-linked investment.
+
+        One join of investments to ``insurance_transactions`` on the policy
+        number, instead of a query per linked investment.
+
+        Returns
+        -------
+        pd.DataFrame
+            Insurance transaction columns plus ``investment_id``, one row per
+            linked (investment, transaction) pair, ordered by investment and
+            then insertion order. Amounts are as stored (positive deposits).
+        """
+        stmt = (
+            select(Investment.id.label("investment_id"), InsuranceTransaction)
+            .join(
+                InsuranceTransaction,
+                InsuranceTransaction.account_number == Investment.insurance_policy_id,
+            )
+            .order_by(Investment.id, InsuranceTransaction.unique_id)
+        )
+        return pd.read_sql(stmt, self.db.bind)
+
     def get_by_id(self, investment_id: int) -> pd.DataFrame:
         """Get an investment by its ID.
 
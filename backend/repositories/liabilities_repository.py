@@ -254,6 +254,23 @@ class LiabilitiesRepository:
         )
         return list(self.db.execute(stmt).scalars().all())
 
+    def get_all_liability_transactions(self) -> pd.DataFrame:
+        """Get the auto-generated transactions of every liability.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns ``liability_id``, ``date``, ``amount``, ordered by
+            liability and date (empty with those columns when none exist).
+        """
+        stmt = select(
+            LiabilityTransaction.liability_id,
+            LiabilityTransaction.date,
+            LiabilityTransaction.amount,
+        ).order_by(LiabilityTransaction.liability_id, LiabilityTransaction.date)
+        rows = self.db.execute(stmt).all()
+        return pd.DataFrame(rows, columns=["liability_id", "date", "amount"])
+
     def add_liability_transaction(self, **fields) -> None:
         """Create an auto-generated liability transaction.
 
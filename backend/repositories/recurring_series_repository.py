@@ -0,0 +1,143 @@
+"""Data access for the persisted recurring-charge model."""
+
+from typing import Iterable, Optional
+
+import pandas as pd
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from backend.models.base import Base
+from backend.models.recurring_series import RecurringSeries, RecurringSeriesState
+
+
+class RecurringSeriesRepository:
+    """Repository for ``recurring_series`` reads and per-merchant replacement.
+
+    Also owns ``recurring_series_state``, the watermark stored with the model.
+    """
+
+    COLUMNS = [
+        "normalized", "label", "category", "cadence", "period_days",
+        "occurrences", "first_date", "last_date", "interval_median",
+        "interval_std", "amount", "last_amount", "prior_median",
+        "price_change", "status",
+    ]
+
+    def __init__(self, db: Session):
+        """Initialize the repository.
+
+        Parameters
+        ----------
+        db : Session
+            SQLAlchemy session for database operations.
+        """
+        self.db = db
+
+    def get_all(self) -> pd.DataFrame:
+        """Return every persisted series (empty with the canonical columns)."""
+        stmt = select(RecurringSeries).order_by(RecurringSeries.normalized)
+        records = self.db.execute(stmt).scalars().all()
+        if not records:
+            return pd.DataFrame(columns=self.COLUMNS)
+        df = pd.DataFrame([r.__dict__ for r in records])
+        return df.drop(columns=["_sa_instance_state"], errors="ignore")
+
+    def count(self) -> int:
+        """Return the number of persisted series."""
+        return int(self.db.execute(select(func.count(RecurringSeries.id))).scalar_one())
+
+    def get_watermark(self) -> Optional[str]:
+        """Return the source watermark stored with the model.
+
+        Returns
+        -------
+        str or None
+            The watermark of the last build, or ``None`` if the model was
+            never built.
+        """
+        return self.db.execute(
+            select(RecurringSeriesState.source_watermark).limit(1)
+        ).scalar_one_or_none()
+
+    def source_watermark(self, tables: Iterable[str]) -> str:
+        """Fingerprint the current contents of ``tables``.
+
+        Row count, highest primary key and latest ``updated_at`` per table:
+        inserts, deletes and ORM/Core updates all change it. Unlike the
+        in-process write generations it survives restarts and sees writes
+        made by other processes.
+
+        Parameters
+        ----------
+        tables : iterable of str
+            Names of tables with an integer primary key and ``updated_at``.
+
+        Returns
+        -------
+        str
+            Opaque watermark to compare for equality.
+        """
+        parts = []
+        for name in tables:
+            table = Base.metadata.tables[name]
+            pk = next(iter(table.primary_key.columns))
+            count, max_pk, last_update = self.db.execute(
+                select(func.count(), func.max(pk), func.max(table.c.updated_at))
+            ).one()
+            parts.append(f"{name}:{count}:{max_pk}:{last_update}")
+        return "|".join(parts)
+
+    def replace(
+        self,
+        normalized: list[str],
+        rows: list[dict],
+        watermark: Optional[str] = None,
+    ) -> None:
+        """Replace the series for the given merchant keys in one commit.
+
+        Every key in ``normalized`` is deleted first, then ``rows`` are
+        inserted — a merchant that no longer passes detection simply gets
+        no replacement row.
+
+        Parameters
+        ----------
+        normalized : list[str]
+            Merchant keys whose rows are being refreshed.
+        rows : list[dict]
+            New rows, each keyed by ``COLUMNS``. Their ``normalized`` values
+            must be a subset of ``normalized``.
+        watermark : str, optional
+            Source watermark the refreshed model now reflects; stored in
+            the same commit when given.
+        """
+        if normalized:
+            self.db.execute(
+                delete(RecurringSeries).where(RecurringSeries.normalized.in_(normalized))
+            )
+        self.db.add_all(RecurringSeries(**row) for row in rows)
+        if watermark is not None:
+            self._set_watermark(watermark)
+        self.db.commit()
+
+    def replace_all(self, rows: list[dict], watermark: Optional[str] = None) -> None:
+        """Discard every persisted series and insert ``rows`` in one commit.
+
+        Parameters
+        ----------
+        rows : list[dict]
+            The complete new model, each row keyed by ``COLUMNS``.
+        watermark : str, optional
+            Source watermark the new model was built from; stored in the
+            same commit when given, marking the model as built even when
+            ``rows`` is empty.
+        """
+        self.db.execute(delete(RecurringSeries))
+        self.db.add_all(RecurringSeries(**row) for row in rows)
+        if watermark is not None:
+            self._set_watermark(watermark)
+        self.db.commit()
+
+    def _set_watermark(self, watermark: str) -> None:
+        """Replace the state row with one carrying ``watermark`` (no commit)."""
+        self.db.execute(delete(RecurringSeriesState))
+        self.db.add(RecurringSeriesState(source_watermark=watermark))
@@ -5,7 +5,7 @@ Scraping history repository with SQLAlchemy ORM.
 from datetime import datetime, timedelta
 
 import pandas as pd
-from sqlalchemy import delete, select, update
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.orm import Session
 
 from backend.models.scraping import ScrapingHistory
@@ -81,6 +81,7 @@ class ScrapingHistoryRepository:
         status: str,
         error_message: str = None,
         error_type: str = None,
+        telemetry: list[dict] | None = None,
     ) -> None:
         """Update a scraping record with its final status and optional error.
 
@@ -99,6 +100,9 @@ class ScrapingHistoryRepository:
             ``GENERAL_ERROR``, …) used to pick the user-facing message, keeping
             ``error_message`` free to carry the raw provider text. By default
             None.
+        telemetry : list[dict], optional
+            Phase spans of the run (see ``ScrapingHistory.telemetry``). By
+            default None.
 
         Returns
         -------
@@ -111,6 +115,7 @@ class ScrapingHistoryRepository:
                 status=status,
                 error_message=error_message,
                 error_type=error_type,
+                telemetry=telemetry,
             )
         )
         self.db.execute(stmt)
@@ -241,6 +246,82 @@ class ScrapingHistoryRepository:
 
         return self.db.execute(stmt).scalar()
 
+    def get_latest_telemetry_by_account(self) -> dict[tuple[str, str, str], dict]:
+        """Get the phase spans of every account's most recent instrumented scrape.
+
+        One grouped query for all accounts. Failed runs are included — a slow
+        or stuck phase is most often the reason a run failed.
+
+        Returns
+        -------
+        dict
+            ``(service_name, provider_name, account_name)`` ->
+            ``{"scrape_id", "date", "status", "phases"}``. Accounts with no
+            run that recorded telemetry are absent.
+        """
+        account = (
+            ScrapingHistory.service_name,
+            ScrapingHistory.provider_name,
+            ScrapingHistory.account_name,
+        )
+        latest = (
+            select(*account, func.max(ScrapingHistory.date).label("date"))
+            .where(ScrapingHistory.telemetry.is_not(None))
+            .group_by(*account)
+            .subquery()
+        )
+        stmt = (
+            select(
+                *account,
+                ScrapingHistory.id,
+                ScrapingHistory.date,
+                ScrapingHistory.status,
+                ScrapingHistory.telemetry,
+            )
+            .join(
+                latest,
+                (ScrapingHistory.service_name == latest.c.service_name)
+                & (ScrapingHistory.provider_name == latest.c.provider_name)
+                & (ScrapingHistory.account_name == latest.c.account_name)
+                & (ScrapingHistory.date == latest.c.date),
+            )
+            .where(ScrapingHistory.telemetry.is_not(None))
+            .order_by(ScrapingHistory.id)
+        )
+        # Runs sharing the latest date resolve to the last one recorded.
+        return {
+            (row.service_name, row.provider_name, row.account_name): {
+                "scrape_id": row.id,
+                "date": row.date,
+                "status": row.status,
+                "phases": row.telemetry,
+            }
+            for row in self.db.execute(stmt)
+        }
+
+    def get_telemetry_since(self, since: datetime) -> list[tuple[str, list[dict]]]:
+        """Get the phase spans of every instrumented scrape since ``since``.
+
+        Parameters
+        ----------
+        since : datetime
+            Oldest scrape to include.
+
+        Returns
+        -------
+        list[tuple[str, list[dict]]]
+            ``(provider_name, phases)`` per scrape, oldest first.
+        """
+        stmt = (
+            select(ScrapingHistory.provider_name, ScrapingHistory.telemetry)
+            .where(
+                ScrapingHistory.date >= since.isoformat(),
+                ScrapingHistory.telemetry.is_not(None),
+            )
+            .order_by(ScrapingHistory.date)
+        )
+        return [(row[0], row[1]) for row in self.db.execute(stmt).all()]
+
     def delete_for_account(self, service: str, provider: str, account: str) -> None:
         """Delete all scrape history for one account.
 
@@ -35,16 +35,23 @@ class SplitTransactionsRepository:
     def _assure_table_exists(self) -> None:
         pass
 
-    def get_data(self) -> pd.DataFrame:
+    def get_data(self, category: str | None = None) -> pd.DataFrame:
         """Get all split transactions.
 
+        Parameters
+        ----------
+        category : str, optional
+            When given, only splits in this category are read.
+
         Returns
         -------
         pd.DataFrame
-            All split transaction rows with columns id, transaction_id, source,
-            amount, category, tag.
+            All (matching) split transaction rows with columns id,
+            transaction_id, source, amount, category, tag.
         """
         stmt = select(SplitTransaction)
+        if category is not None:
+            stmt = stmt.where(SplitTransaction.category == category)
         return pd.read_sql(stmt, self.db.bind)
 
     def get_splits_for_transaction(
@@ -167,6 +167,124 @@ class TransactionsRepository(IngestionMixin, SplitsMixin):
         """
         return self.get_table(exclude_services=self._ITEMIZED_EXCLUDED, **kwargs)
 
+    def get_itemized_descriptions(self) -> list[str]:
+        """Distinct descriptions across the tables ``get_itemized_transactions`` reads.
+
+        Split children inherit their parent's description, so this covers
+        them too.
+
+        Returns
+        -------
+        list[str]
+            Unique non-null descriptions.
+        """
+        excluded = {self.get_repo_by_source(s) for s in self._ITEMIZED_EXCLUDED}
+        descriptions: set[str] = set()
+        for repo in (
+            self.cc_repo,
+            self.bank_repo,
+            self.cash_repo,
+            self.manual_investments_repo,
+            self.insurance_repo,
+        ):
+            if repo not in excluded:
+                descriptions.update(repo.get_distinct_descriptions())
+        return sorted(descriptions)
+
+    def get_itemized_transactions_by_description(
+        self, descriptions: list[str]
+    ) -> pd.DataFrame:
+        """Get the itemized view restricted to some descriptions, filtered in SQL.
+
+        Equivalent to ``get_itemized_transactions()`` filtered to
+        ``descriptions`` — split parents are replaced by their children —
+        but only the matching rows are read from each table.
+
+        Parameters
+        ----------
+        descriptions : list[str]
+            Exact descriptions to select.
+
+        Returns
+        -------
+        pd.DataFrame
+            Matching transactions from every itemized source, dates as
+            ``YYYY-MM-DD``.
+        """
+        excluded = {self.get_repo_by_source(s) for s in self._ITEMIZED_EXCLUDED}
+        dfs = [
+            df
+            for repo in (
+                self.cc_repo,
+                self.bank_repo,
+                self.cash_repo,
+                self.manual_investments_repo,
+                self.insurance_repo,
+            )
+            if repo not in excluded
+            and not (df := repo.get_table(descriptions=descriptions)).empty
+        ]
+        df = (
+            pd.concat(dfs, ignore_index=True)
+            if dfs
+            else pd.DataFrame(columns=[f.value for f in TransactionsTableFields])
+        )
+        df = self._filter_split_parents(df)
+
+        children = self._get_split_children(None, self._ITEMIZED_EXCLUDED)
+        if not children.empty:
+            children = children[children["description"].isin(descriptions)]
+            df = pd.concat([df, children], ignore_index=True)
+        return self._normalize_dates(df)
+
+    def get_category_transactions(self, category: str) -> pd.DataFrame:
+        """Get the merged view restricted to one category, filtered in SQL.
+
+        Equivalent to ``get_table()`` filtered to ``category`` — split
+        parents are replaced by their children and a child counts under its
+        own category — but only the matching rows are read from each table.
+
+        Parameters
+        ----------
+        category : str
+            Category to select (e.g. ``Liabilities``).
+
+        Returns
+        -------
+        pd.DataFrame
+            Matching transactions from all sources, dates as ``YYYY-MM-DD``.
+        """
+        cache_key = ("transactions.get_category_transactions", category)
+        cached = session_cache_get(self.db, cache_key)
+        if cached is not None:
+            return cached
+
+        dfs = [
+            df
+            for repo in (
+                self.cc_repo,
+                self.bank_repo,
+                self.cash_repo,
+                self.manual_investments_repo,
+                self.insurance_repo,
+            )
+            if not (df := repo.get_table(category=category)).empty
+        ]
+        df = (
+            pd.concat(dfs, ignore_index=True)
+            if dfs
+            else pd.DataFrame(columns=[f.value for f in TransactionsTableFields])
+        )
+        df = self._filter_split_parents(df)
+
+        children = self._get_split_children(None, category=category)
+        if not children.empty:
+            df = pd.concat([df, children], ignore_index=True)
+        df = self._normalize_dates(df)
+
+        session_cache_set(self.db, cache_key, df)
+        return df
+
     def get_table(
         self,
         service: T_service | None = None,
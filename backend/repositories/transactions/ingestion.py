@@ -36,7 +36,7 @@ class IngestionMixin:
         df: pd.DataFrame,
         table_name: str,
         scrape_start_date: str | None = None,
-    ) -> None:
+    ) -> pd.DataFrame:
         """Persist scraped transactions, skipping rows that already exist.
 
         Parameters
@@ -52,6 +52,12 @@ class IngestionMixin:
             this date onward are reconciled (see Notes). Falls back to the
             earliest date in ``df``.
 
+        Returns
+        -------
+        pd.DataFrame
+            The rows actually inserted (string-typed key columns, carried-over
+            tags applied); empty when the scrape brought nothing new.
+
         Raises
         ------
         ValueError
@@ -114,7 +120,7 @@ class IngestionMixin:
         if new_rows.empty:
             # Still commit any pending-row deletions from the reconcile step.
             self.db.commit()
-            return
+            return new_rows
 
         # Prepare list of model instances
         model_columns = {c.name for c in repo.model.__table__.columns}
@@ -144,6 +150,7 @@ class IngestionMixin:
 
         self.db.add_all(instances)
         self.db.commit()
+        return new_rows
 
     def _reconcile_pending_rows(
         self,
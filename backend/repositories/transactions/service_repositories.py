@@ -81,17 +81,40 @@ class ServiceRepository:
         """
         self.db = db
 
-    def get_table(self) -> pd.DataFrame:
+    def get_table(
+        self,
+        category: str | None = None,
+        descriptions: list[str] | None = None,
+    ) -> pd.DataFrame:
         """Get all transactions as a DataFrame.
 
+        Parameters
+        ----------
+        category : str, optional
+            When given, only rows in this category are read (filtered in SQL).
+        descriptions : list[str], optional
+            When given, only rows with one of these descriptions are read
+            (filtered in SQL).
+
         Returns
         -------
         pd.DataFrame
-            All rows from this service's transaction table.
+            All (matching) rows from this service's transaction table.
         """
         stmt = select(self.model)
+        if category is not None:
+            stmt = stmt.where(self.model.category == category)
+        if descriptions is not None:
+            stmt = stmt.where(self.model.description.in_(descriptions))
         return pd.read_sql(stmt, self.db.bind)
 
+    def get_distinct_descriptions(self) -> list[str]:
+        """Return every distinct non-null description in this table."""
+        stmt = select(self.model.description).where(
+            self.model.description.is_not(None)
+        ).distinct()
+        return list(self.db.execute(stmt).scalars())
+
     def update_tagging_by_unique_id(
         self, unique_id: int, category: str, tag: str
     ) -> None:
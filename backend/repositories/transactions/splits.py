@@ -43,6 +43,7 @@ class SplitsMixin:
         self,
         service: T_service | None,
         exclude_services: list[T_service] | None = None,
+        category: str | None = None,
     ) -> pd.DataFrame:
         """Build split-child rows for all splits, filtered by service if given.
 
@@ -52,13 +53,15 @@ class SplitsMixin:
             If provided, include only splits whose source maps to this service.
         exclude_services : list[T_service] | None
             If provided, exclude splits whose source maps to any of these services.
+        category : str | None
+            If provided, include only splits assigned to this category.
 
         Returns
         -------
         pd.DataFrame
             DataFrame of split-child rows; empty if no splits exist or all filtered.
         """
-        splits_df = self.split_repo.get_data()
+        splits_df = self.split_repo.get_data(category=category)
 
         if splits_df.empty:
             return pd.DataFrame()
@@ -11,6 +11,7 @@ from sqlalchemy.orm import Session
 
 from backend.dependencies import get_database
 from backend.services.analysis_service import AnalysisService
+from backend.services.dashboard_service import DashboardService
 from backend.services.recurring_service import RecurringService
 from backend.services.insights_service import InsightsService
 
@@ -216,6 +217,25 @@ def get_recurring(
     return service.get_recurring()
 
 
+@router.post("/recurring/rebuild")
+def rebuild_recurring(
+    db: Session = Depends(get_database),
+):
+    """Rebuild the persisted recurring-charge model from the full history.
+
+    The next scrape rebuilds a model its source tables have outdated, and
+    until then reads detect on the fly; this rebuilds it now, and also
+    for changes no write reveals, such as new merchant-normalization rules.
+
+    Returns
+    -------
+    dict
+        ``{series: int}`` — number of recurring series now stored.
+    """
+    service = RecurringService(db)
+    return {"series": service.rebuild_series()}
+
+
 @router.get("/insights")
 def get_insights(
     db: Session = Depends(get_database),
@@ -234,6 +254,7 @@ def get_insights(
 
 @router.get("/cash-flow-forecast")
 def get_cash_flow_forecast(
+    horizon_days: int | None = Query(None, ge=1, le=366),
     db: Session = Depends(get_database),
 ):
     """Return the current-month cash-flow forecast.
@@ -241,14 +262,20 @@ def get_cash_flow_forecast(
     Combines month-to-date actuals with trend-based projection to estimate
     the month-end bank balance and the "safe to spend" figure.
 
+    Parameters
+    ----------
+    horizon_days : int, optional
+        Also project this many days ahead with a scenario band.
+
     Returns
     -------
     dict
-        Forecast metrics plus a ``daily`` trajectory for charting. See
+        Forecast metrics plus a ``daily`` trajectory for charting (and a
+        ``horizon`` block when requested). See
         ``AnalysisService.get_cash_flow_forecast``.
     """
     service = AnalysisService(db)
-    return service.get_cash_flow_forecast()
+    return service.get_cash_flow_forecast(horizon_days=horizon_days)
 
 
 @router.get("/net-worth-over-time")
@@ -265,3 +292,23 @@ def get_net_worth_over_time(
     """
     service = AnalysisService(db)
     return service.get_net_worth_over_time()
+
+
+@router.get("/dashboard")
+def get_dashboard(
+    db: Session = Depends(get_database),
+):
+    """Return every dashboard analytics panel in one response.
+
+    Shared intermediates (monthly expenses, income series, recurring
+    charges, balances) are computed once for the whole bundle instead of
+    once per panel request.
+
+    Returns
+    -------
+    dict
+        Panel name → the payload of the matching analytics endpoint. See
+        ``DashboardService.get_dashboard``.
+    """
+    service = DashboardService(db)
+    return service.get_dashboard()
@@ -7,12 +7,17 @@ FIRE projections with Israeli-specific savings vehicles.
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy.orm import Session
 
 from backend.dependencies import get_database
 from backend.routes.schemas import ApiRequestModel
+from backend.services.retirement_projection import (
+    DISTRIBUTIONS,
+    MAX_PATHS,
+    MonteCarloConfig,
+)
 from backend.services.retirement_service import RetirementService
 
 router = APIRouter()
@@ -100,6 +105,28 @@ class IncomeProjectionPoint(BaseModel):
     expenses: float
 
 
+class MonteCarloProjectionPoint(BaseModel):
+    """Single year of the Monte Carlo projection."""
+
+    age: int
+    p10: float
+    p25: float
+    p50: float
+    p75: float
+    p90: float
+    depletion_probability: float
+
+
+class MonteCarloProjection(BaseModel):
+    """Stochastic projection: wealth percentile bands and depletion odds."""
+
+    paths: int
+    seed: int
+    distribution: str
+    success_probability: float
+    projection: list[MonteCarloProjectionPoint]
+
+
 class RetirementProjectionsResponse(BaseModel):
     """Response body for FIRE projections."""
 
@@ -115,6 +142,7 @@ class RetirementProjectionsResponse(BaseModel):
     full_pension_age: int
     net_worth_projection: list[NetWorthProjectionPoint]
     income_projection: list[IncomeProjectionPoint]
+    monte_carlo: Optional[MonteCarloProjection] = None
 
 
 class RetirementSuggestionsResponse(BaseModel):
@@ -149,6 +177,28 @@ class ScrapedDefaultsResponse(BaseModel):
     avg_monthly_salary: Optional[float] = None
 
 
+def monte_carlo_config(
+    monte_carlo: bool = Query(False),
+    paths: int = Query(10_000, ge=100, le=MAX_PATHS),
+    seed: int = Query(0, ge=0),
+    distribution: str = Query("normal", pattern=f"^({'|'.join(DISTRIBUTIONS)})$"),
+    return_volatility: float = Query(0.15, ge=0, le=1),
+    inflation_volatility: float = Query(0.01, ge=0, le=0.2),
+    degrees_of_freedom: float = Query(5.0, gt=2, le=100),
+) -> Optional[MonteCarloConfig]:
+    """Stochastic projection settings from the query string (None unless enabled)."""
+    if not monte_carlo:
+        return None
+    return MonteCarloConfig(
+        paths=paths,
+        seed=seed,
+        distribution=distribution,
+        return_volatility=return_volatility,
+        inflation_volatility=inflation_volatility,
+        degrees_of_freedom=degrees_of_freedom,
+    )
+
+
 @router.get("/goal", response_model=Optional[RetirementGoalResponse])
 def get_goal(db: Session = Depends(get_database)):
     """Get the retirement goal profile, or null if not configured."""
@@ -173,19 +223,30 @@ def get_status(db: Session = Depends(get_database)):
 
 
 @router.get("/projections", response_model=RetirementProjectionsResponse)
-def get_projections(db: Session = Depends(get_database)):
-    """Get FIRE projections from the saved goal."""
+def get_projections(
+    monte_carlo: Optional[MonteCarloConfig] = Depends(monte_carlo_config),
+    db: Session = Depends(get_database),
+):
+    """Get FIRE projections from the saved goal.
+
+    With ``monte_carlo=true`` the response also carries percentile bands
+    and depletion probabilities from randomly simulated return paths.
+    """
     service = RetirementService(db)
-    return service.get_projections()
+    return service.get_projections(monte_carlo=monte_carlo)
 
 
 @router.post("/projections", response_model=RetirementProjectionsResponse)
 def preview_projections(
-    data: RetirementGoalUpsert, db: Session = Depends(get_database)
+    data: RetirementGoalUpsert,
+    monte_carlo: Optional[MonteCarloConfig] = Depends(monte_carlo_config),
+    db: Session = Depends(get_database),
 ):
     """Compute FIRE projections from provided goal params without saving."""
     service = RetirementService(db)
-    return service.get_projections(goal_override=data.model_dump())
+    return service.get_projections(
+        goal_override=data.model_dump(), monte_carlo=monte_carlo
+    )
 
 
 @router.get("/suggestions", response_model=RetirementSuggestionsResponse)
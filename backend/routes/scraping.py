@@ -7,12 +7,16 @@ automated scraping of Israeli financial institutions.
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from backend.dependencies import get_database
-from backend.services.scraping_service import ScrapingService
+from backend.services.scraping_service import (
+    TELEMETRY_SUMMARY_DAYS,
+    ScrapingService,
+)
 
 router = APIRouter()
 
@@ -25,6 +29,10 @@ class StartScrapingRequest(BaseModel):
     force_2fa: bool = False
 
 
+class StartAllScrapingRequest(BaseModel):
+    scraping_period_days: Optional[int] = Field(default=None, gt=0, le=365)
+
+
 class TFAFinishRequest(BaseModel):
     service: str
     provider: str
@@ -78,6 +86,59 @@ def start_scraping_single(
     return scraping_process_id
 
 
+@router.post("/start-all")
+def start_scraping_all(
+    data: StartAllScrapingRequest, db: Session = Depends(get_database)
+) -> int:
+    """Start scraping every configured account as one batch.
+
+    Accounts without 2FA scrape concurrently under a global browser limit;
+    2FA accounts are queued so only one asks for a code at a time. If a
+    batch is already running, its id is returned instead.
+
+    Parameters
+    ----------
+    data : StartAllScrapingRequest
+        Optional ``scraping_period_days`` applied to every account.
+
+    Returns
+    -------
+    int
+        Batch ID used to poll ``/start-all/status``.
+    """
+    service = ScrapingService(db)
+    return service.start_scraping_all(
+        scraping_period_days=data.scraping_period_days
+    )
+
+
+@router.get("/start-all/status")
+def get_scraping_all_status(
+    batch_id: int, db: Session = Depends(get_database)
+) -> dict:
+    """Return the aggregate progress of a "scrape all" batch.
+
+    Parameters
+    ----------
+    batch_id : int
+        ID returned by the ``/start-all`` endpoint.
+
+    Returns
+    -------
+    dict
+        Per-account ``accounts`` statuses (``queued`` until a slot frees
+        up), ``counts`` per status, the account ``awaiting_2fa`` (if any),
+        and a ``done`` flag.
+
+    Raises
+    ------
+    HTTPException
+        404 if the batch is unknown.
+    """
+    service = ScrapingService(db)
+    return service.get_scraping_all_status(batch_id)
+
+
 @router.post("/abort", response_model=StatusResponse)
 def abort_scraping(
     data: AbortRequest, db: Session = Depends(get_database)
@@ -120,6 +181,40 @@ def get_scraping_status(
     return service.get_scraping_status(scraping_process_id)
 
 
+@router.get("/events")
+def stream_scraping_events(
+    scraping_process_id: int,
+    last_event_id: int = Header(0, alias="Last-Event-ID", ge=0),
+    db: Session = Depends(get_database),
+) -> StreamingResponse:
+    """Push a scraping job's updates as Server-Sent Events.
+
+    Replaces polling ``/status``: the stream carries ``status`` events
+    (same payload as ``/status``), ``progress`` lines and a ``2fa_required``
+    event the moment the scraper asks for an OTP, and closes after the final
+    status.
+
+    Parameters
+    ----------
+    scraping_process_id : int
+        ID returned by the ``/start`` endpoint.
+    last_event_id : int
+        ``Last-Event-ID`` header of a reconnecting client; events up to it
+        are not replayed.
+
+    Returns
+    -------
+    StreamingResponse
+        A ``text/event-stream`` response.
+    """
+    service = ScrapingService(db)
+    return StreamingResponse(
+        service.stream_events(scraping_process_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/2fa", response_model=StatusResponse)
 def handle_2fa(
     data: TFAFinishRequest, db: Session = Depends(get_database)
@@ -186,8 +281,31 @@ def get_last_scrapes(db: Session = Depends(get_database)) -> list:
     Returns
     -------
     list[dict]
-        List of records with ``service``, ``provider``, ``account``, and
-        ``last_scrape_date`` fields.
+        List of records with ``service``, ``provider``, ``account``,
+        ``last_scrape_date`` and ``last_scrape_telemetry`` (phase timings of
+        the account's latest run, or null) fields.
     """
     service = ScrapingService(db)
     return service.get_last_scrape_dates()
+
+
+@router.get("/telemetry/summary")
+def get_telemetry_summary(
+    days: int = Query(TELEMETRY_SUMMARY_DAYS, gt=0, le=365),
+    db: Session = Depends(get_database),
+) -> list:
+    """Return p50/p95 phase durations per provider.
+
+    Parameters
+    ----------
+    days : int
+        Look-back window in days.
+
+    Returns
+    -------
+    list[dict]
+        Per provider: ``provider``, ``scrapes`` and ``phases`` with each
+        phase's ``name``, ``count``, ``p50_ms`` and ``p95_ms``.
+    """
+    service = ScrapingService(db)
+    return service.get_telemetry_summary(days)
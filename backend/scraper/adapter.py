@@ -14,6 +14,8 @@ import importlib
 import logging
 import os
 import sys
+import time
+from contextlib import contextmanager
 from datetime import date
 
 import pandas as pd
@@ -26,7 +28,20 @@ from backend.errors import EntityNotFoundException
 from backend.repositories.credentials_repository import CredentialsRepository
 from backend.repositories.scraping_history_repository import ScrapingHistoryRepository
 from backend.repositories.transactions_repository import TransactionsRepository
+from backend.scraper.events import (
+    PROGRESS_EVENT,
+    TFA_REQUIRED_EVENT,
+    publish_status,
+    scrape_events,
+)
+from backend.scraper.db_writer import (
+    CancelToken,
+    PipelineCancelled,
+    run_on_writer,
+    unit_of_work,
+)
 from backend.services.bank_balance_service import BankBalanceService
+from backend.services.recurring_service import RecurringService
 from backend.services.tagging_rules_service import TaggingRulesService
 from backend.services.tagging_service import CategoriesTagsService
 
@@ -35,7 +50,8 @@ logger = logging.getLogger(__name__)
 # Hard ceiling on a single scrape lifecycle. Enforces the documented
 # 5-minute scraping limit (see .claude/rules/backend_scraper.md → "Timeouts
 # & Limits") at the adapter level, so a hung browser / provider can't pin a
-# scrape coroutine indefinitely.
+# scrape coroutine indefinitely. The post-scrape DB pipeline gets whatever
+# the scrape left of it.
 SCRAPE_TIMEOUT_SECONDS = 300
 
 # Recorded when a scraper reports success but returned no accounts at all.
@@ -83,6 +99,18 @@ def _import_scraper_module(name: str):
     return importlib.import_module(name)
 
 
+async def close_browser_pool() -> None:
+    """Shut down the scrapers' shared browser pool, if it was ever used.
+
+    Called on application shutdown. Checks ``sys.modules`` rather than
+    importing, so a server that never ran a browser scraper does not load
+    Playwright just to close nothing.
+    """
+    browser_pool = sys.modules.get("scraper.utils.browser_pool")
+    if browser_pool is not None:
+        await browser_pool.get_browser_pool().close()
+
+
 # Re-export the root-package OTP errors so callers (e.g. ScrapingService) can
 # ``from backend.scraper.adapter import ResendNotSupportedError`` without doing
 # a bare ``import scraper`` (which collides with ``backend.scraper``). Resolved
@@ -98,6 +126,10 @@ OtpRateLimitError = _import_scraper_module(
 _describe_exception = _import_scraper_module(
     "scraper.base.base_scraper"
 ).describe_exception
+# Phase-span recorder shared with the scraper package, so the backend's
+# convert / save / tag / … phases are recorded in the same shape as the
+# scraper's own initialize / login / fetch spans.
+ScrapeTelemetry = _import_scraper_module("scraper.utils.telemetry").ScrapeTelemetry
 
 # Maps frontend service names to DB table / source column values.
 _SERVICE_TO_TABLE = {
@@ -249,6 +281,28 @@ class ScraperAdapter:
         # activity this window" (a real success) from "we fetched nothing
         # at all" (a swallowed failure). See NO_ACCOUNTS_ERROR.
         self._accounts_fetched: int | None = None
+        # Cancellation token of the post-scrape pipeline while it runs on
+        # the writer thread; every session the pipeline opens is guarded
+        # by it (see ``_pipeline_db``).
+        self._cancel_token: CancelToken | None = None
+        # The one session every pipeline stage shares while ``_run_pipeline``
+        # runs (see ``unit_of_work``); ``None`` outside of it.
+        self._pipeline_session = None
+        # Rows the save stage actually inserted, or None before it ran. Later
+        # stages use it instead of re-reading the tables to learn what changed.
+        self._delta: pd.DataFrame | None = None
+        # Wall-clock seconds per pipeline stage of the last run, in run order.
+        self.stage_timings: dict[str, float] = {}
+        # Transactions the tagging stage tagged, or None before it ran.
+        self._tagged_count: int | None = None
+        # Whether the recurring model was current when the pipeline started,
+        # before the save stage wrote anything; None when not checked.
+        self._recurring_was_current: bool | None = None
+        # Phase spans: the scraper's own (from its result) and the backend's
+        # convert / pipeline-stage / total spans, recorded with the history
+        # row (see ``_collect_telemetry``).
+        self._scrape_spans: list[dict] = []
+        self._telemetry = ScrapeTelemetry()
 
     # ------------------------------------------------------------------
     # Public interface
@@ -265,6 +319,8 @@ class ScraperAdapter:
         # Capture the loop we're running on so set_otp_code (called from a
         # threadpool worker thread) can wake us thread-safely.
         self._loop = asyncio.get_running_loop()
+        deadline = self._loop.time() + SCRAPE_TIMEOUT_SECONDS
+        started = time.perf_counter()
 
         _scraper_pkg = _import_scraper_module("scraper")
         create_scraper = _scraper_pkg.create_scraper
@@ -276,6 +332,7 @@ class ScraperAdapter:
             "[%s] %s: Scraping started (from %s)",
             ts, self._log_id, self.start_date,
         )
+        publish_status(self.process_id, ScrapingHistoryRepository.IN_PROGRESS)
 
         scraper = None
         try:
@@ -283,29 +340,32 @@ class ScraperAdapter:
             # Expose the scraper so resend_otp can reach it while the
             # coroutine is parked in _otp_callback awaiting the user's code.
             self._scraper = scraper
+            scraper.on_progress = self._on_progress
             if scraper_is_2fa_required(self.provider_name):
                 scraper.on_otp_request = self._otp_callback
 
             result = await asyncio.wait_for(
                 scraper.scrape(), timeout=SCRAPE_TIMEOUT_SECONDS
             )
+            if result.http_stats:
+                logger.debug("%s: HTTP traffic %s", self._log_id, result.http_stats)
+            self._scrape_spans = list(getattr(result, "telemetry", None) or [])
 
             if result.success:
                 self._accounts_fetched = len(result.accounts)
-                self._data = self._result_to_dataframe(result, self.service_name)
+                with self._telemetry.span("convert") as span:
+                    self._data = self._result_to_dataframe(result, self.service_name)
+                    span.rows = 0 if self._data is None else len(self._data)
                 if self._data is not None and not self._data.empty:
                     self._data = self._data.sort_values(by=["date"])
-                    # TODO(perf): these are blocking sync DB writes (save,
-                    # auto-tag, rebalance) that run on the event loop thread.
-                    # Offloading them via run_in_executor was considered but
-                    # deferred: thread-pool work is NOT cancellable by the
-                    # asyncio.wait_for timeout above, so an executor hop would
-                    # let DB writes outlive the 5-minute ceiling. Revisit with
-                    # an explicit cancellation/cleanup story before offloading.
-                    self._save_scraped_transactions()
-                    self._apply_auto_tagging()
-                    self._recalculate_bank_balances()
-                    self._post_save_hook(result)
+                    # Blocking DB writes go to the single writer thread so
+                    # the event loop (every other route and scrape) keeps
+                    # running; see backend.scraper.db_writer for how the
+                    # remaining time budget is enforced.
+                    await run_on_writer(
+                        lambda token: self._run_pipeline(result, token),
+                        timeout=max(deadline - self._loop.time(), 0.0),
+                    )
             else:
                 self._error_type = result.error_type or "GENERAL_ERROR"
                 self._error = (
@@ -333,6 +393,16 @@ class ScraperAdapter:
             # cleanup here to avoid leaking a Playwright process on timeout.
             if scraper is not None:
                 await scraper._safe_terminate(False)
+        except PipelineCancelled:
+            self._error_type = "TIMEOUT"
+            self._error = (
+                f"Saving the scraped data exceeded the {SCRAPE_TIMEOUT_SECONDS}-"
+                "second limit; none of its changes were saved"
+            )
+            logger.error(
+                "%s: Post-scrape pipeline timed out — %s",
+                self._log_id, self._error,
+            )
         except Exception as exc:
             self._error_type = "GENERAL_ERROR"
             self._error = _describe_exception(exc)
@@ -355,6 +425,7 @@ class ScraperAdapter:
             # adapter stuck in _active_scrapers — permanently blocking new
             # scrapes for the account until process restart.
             self._unregister_from_2fa_waiting()
+            self._telemetry.add("total", (time.perf_counter() - started) * 1000)
             try:
                 self._record_scraping_attempt(self.process_id)
             except Exception:
@@ -448,6 +519,8 @@ class ScraperAdapter:
             The one-time password, or ``"cancel"`` to abort the scrape.
         """
         self._otp_code = code
+        if code != self.CANCEL:
+            publish_status(self.process_id, ScrapingHistoryRepository.IN_PROGRESS)
         loop = self._loop
         if loop is not None and not loop.is_closed():
             # run() executes on the server's main event loop; this method is
@@ -558,11 +631,11 @@ class ScraperAdapter:
         return self._otp_code
 
     def _mark_waiting_for_2fa(self) -> None:
-        """Update the scraping-history status to WAITING_FOR_2FA.
+        """Update the scraping-history status to WAITING_FOR_2FA and push the prompt.
 
-        Wrapped in a try/except so a transient DB failure can't crash the
-        OTP flow — the scrape can still complete and report its final
-        status; only the intermediate UI hint would be lost.
+        The DB write is wrapped in a try/except so a transient failure can't
+        crash the OTP flow — the scrape can still complete and report its
+        final status; only the status read by ``/status`` pollers would lag.
         """
         try:
             with get_db_context() as db:
@@ -575,6 +648,23 @@ class ScraperAdapter:
                 "%s: Failed to mark waiting_for_2fa — %s",
                 self._log_id, exc,
             )
+        # Pushed regardless of the DB write: the stream is what shows the
+        # OTP prompt, and the scraper is waiting on it either way.
+        publish_status(self.process_id, ScrapingHistoryRepository.WAITING_FOR_2FA)
+        scrape_events.publish(
+            self.process_id,
+            TFA_REQUIRED_EVENT,
+            {
+                "service": self.service_name,
+                "provider": self.provider_name,
+                "account": self.account_name,
+            },
+        )
+
+    def _on_progress(self, message: str) -> None:
+        """Forward a scraper progress line to the scrape's event stream."""
+        logger.debug("%s: %s", self._log_id, message)
+        scrape_events.publish(self.process_id, PROGRESS_EVENT, {"message": message})
 
     # ------------------------------------------------------------------
     # Data conversion
@@ -722,11 +812,95 @@ class ScraperAdapter:
     # Pipeline helpers (mirrored from the legacy Scraper base class)
     # ------------------------------------------------------------------
 
+    def _run_pipeline(self, result, token: CancelToken) -> None:
+        """Run the post-scrape stages on the writer thread as one unit of work.
+
+        Every stage shares one session (see ``unit_of_work``): their commits
+        only release savepoints, and the scrape's writes become visible in a
+        single commit after the last stage. Checks ``token`` before every
+        stage, so a timed-out pipeline stops at the next stage boundary and
+        everything it wrote is rolled back. Stage durations are recorded in
+        :attr:`stage_timings`.
+
+        Parameters
+        ----------
+        result : ScrapingResult
+            The scrape's result, for :meth:`_post_save_hook`.
+        token : CancelToken
+            Cancellation token of this run.
+        """
+        stages = (
+            ("save", self._save_scraped_transactions),
+            ("tag", self._apply_auto_tagging),
+            ("recurring", self._update_recurring_series),
+            ("rebalance", self._recalculate_bank_balances),
+            ("post_save", lambda: self._post_save_hook(result)),
+        )
+        self.stage_timings = {}
+        token.check()
+        self._cancel_token = token
+        try:
+            with unit_of_work(token) as db:
+                self._pipeline_session = db
+                self._check_recurring_model()
+                for name, stage in stages:
+                    token.check()
+                    with self._telemetry.span(name) as span:
+                        stage()
+                        span.rows = self._stage_rows(name)
+                    self.stage_timings[name] = span.duration_ms / 1000
+                committed = time.perf_counter()
+            self.stage_timings["commit"] = time.perf_counter() - committed
+            self._telemetry.add("commit", self.stage_timings["commit"] * 1000)
+        finally:
+            self._pipeline_session = None
+            self._cancel_token = None
+        logger.info(
+            "%s: Post-scrape pipeline took %.0f ms (%s)",
+            self._log_id,
+            sum(self.stage_timings.values()) * 1000,
+            ", ".join(
+                f"{name}={seconds * 1000:.0f}ms"
+                for name, seconds in self.stage_timings.items()
+            ),
+        )
+
+    def _stage_rows(self, name: str) -> int | None:
+        """Transactions a finished pipeline stage wrote, where it is known."""
+        if name == "save" and self._delta is not None:
+            return len(self._delta)
+        if name == "tag":
+            return self._tagged_count
+        return None
+
+    @contextmanager
+    def _pipeline_db(self):
+        """Yield the session a pipeline stage writes through.
+
+        Inside :meth:`_run_pipeline` this is the shared unit-of-work
+        session; a stage that fails has its uncommitted work rolled back
+        to its last commit, as a session of its own would. Called outside
+        the pipeline (e.g. a stage run on its own), it opens a session that
+        refuses to commit once the pipeline is cancelled.
+        """
+        if self._pipeline_session is not None:
+            db = self._pipeline_session
+            try:
+                yield db
+            except BaseException:
+                db.rollback()
+                raise
+            return
+        with get_db_context() as db:
+            if self._cancel_token is not None:
+                self._cancel_token.guard(db)
+            yield db
+
     def _save_scraped_transactions(self) -> None:
         """Persist the scraped DataFrame to the database."""
-        with get_db_context() as db:
+        with self._pipeline_db() as db:
             transactions_repo = TransactionsRepository(db)
-            transactions_repo.add_scraped_transactions(
+            self._delta = transactions_repo.add_scraped_transactions(
                 self._data,
                 self._table_name,
                 scrape_start_date=self.start_date.strftime("%Y-%m-%d"),
@@ -736,15 +910,21 @@ class ScraperAdapter:
         """Apply tagging rules to newly scraped transactions.
 
         Only tags transactions that do not already have a category
-        (``overwrite=False``).
+        (``overwrite=False``). Skipped when the save stage inserted nothing:
+        every untagged row then predates this scrape and was already seen
+        by the tagging of the scrape that inserted it.
         """
+        if self._delta is not None and self._delta.empty:
+            logger.debug("%s: No new transactions to tag", self._log_id)
+            return
         try:
-            with get_db_context() as db:
+            with self._pipeline_db() as db:
                 cat_and_tags_service = CategoriesTagsService(db)
                 cat_and_tags_service.add_new_credit_card_tags()
                 tagging_rules_service = TaggingRulesService(db)
                 count = tagging_rules_service.apply_rules(overwrite=False)
                 count += tagging_rules_service.auto_tag_credit_cards_bills()
+                self._tagged_count = count
                 if count > 0:
                     logger.info(
                         "%s: Auto-tagged %d transactions",
@@ -756,12 +936,51 @@ class ScraperAdapter:
                 self._log_id, exc,
             )
 
+    def _check_recurring_model(self) -> None:
+        """Record whether the recurring model is current before the save stage.
+
+        Once this scrape's rows are written the model looks stale either
+        way, so only now can a refresh of just this scrape's merchants be
+        told apart from one that also has to catch up on earlier edits.
+        """
+        if self.service_name == Services.INSURANCE.value:
+            return
+        try:
+            with self._pipeline_db() as db:
+                self._recurring_was_current = RecurringService(db).model_is_current()
+        except Exception as exc:
+            logger.error(
+                "%s: Error checking the recurring model — %s",
+                self._log_id, exc,
+            )
+
+    def _update_recurring_series(self) -> None:
+        """Refresh the recurring-charge series of merchants in this scrape.
+
+        Runs after auto-tagging so category exclusions see the final tags.
+        Insurance deposits never feed recurring detection and are skipped.
+        The model is rebuilt in full unless :meth:`_check_recurring_model`
+        found it current.
+        """
+        if self.service_name == Services.INSURANCE.value:
+            return
+        try:
+            with self._pipeline_db() as db:
+                RecurringService(db).update_series(
+                    self._data, was_current=bool(self._recurring_was_current)
+                )
+        except Exception as exc:
+            logger.error(
+                "%s: Error updating recurring series — %s",
+                self._log_id, exc,
+            )
+
     def _recalculate_bank_balances(self) -> None:
         """Recalculate bank balance after a successful bank scrape."""
         if self.service_name != Services.BANK.value:
             return
         try:
-            with get_db_context() as db:
+            with self._pipeline_db() as db:
                 balance_service = BankBalanceService(db)
                 balance_service.recalculate_for_account(
                     self.provider_name, self.account_name,
@@ -807,11 +1026,31 @@ class ScraperAdapter:
             error_message = self._error or None
             error_type = self._error_type or "GENERAL_ERROR"
 
-        with get_db_context() as db:
-            history_repo = ScrapingHistoryRepository(db)
-            history_repo.record_scrape_end(
-                id_, status, error_message, error_type
-            )
+        try:
+            with get_db_context() as db:
+                history_repo = ScrapingHistoryRepository(db)
+                history_repo.record_scrape_end(
+                    id_, status, error_message, error_type,
+                    telemetry=self._collect_telemetry(),
+                )
+        finally:
+            # After the write, so a client refetching on "success" reads the
+            # committed rows; even if it failed, so the stream still ends.
+            publish_status(id_, status, error_message, error_type, final=True)
+
+    def _collect_telemetry(self) -> list[dict]:
+        """Return the run's phase spans: the scraper's, then the backend's.
+
+        A scrape that never returned a result (timed out, crashed) still
+        reports the spans its scraper recorded so far — the phase it was
+        stuck in included.
+        """
+        spans = self._scrape_spans
+        if not spans:
+            telemetry = getattr(self._scraper, "telemetry", None)
+            if isinstance(telemetry, ScrapeTelemetry):
+                spans = telemetry.to_list()
+        return [*spans, *self._telemetry.to_list()]
 
 
 class InsuranceScraperAdapter(ScraperAdapter):
@@ -854,7 +1093,7 @@ class InsuranceScraperAdapter(ScraperAdapter):
             return
 
         try:
-            with get_db_context() as db:
+            with self._pipeline_db() as db:
                 service = InsuranceAccountService(db)
                 for meta in accounts_to_upsert:
                     service.upsert(**meta)
@@ -0,0 +1,206 @@
+"""Single-writer worker thread for the post-scrape database pipeline.
+
+Saving, auto-tagging and rebalancing a big scrape are blocking SQLAlchemy
+calls. Run on the event loop they freeze every other route and scraper
+coroutine for the duration, so they run on one dedicated thread instead.
+A single writer also serializes concurrent scrapes' writes (e.g. a
+"scrape all" batch), which SQLite would otherwise answer with
+``database is locked``.
+
+Cancellation contract
+---------------------
+Thread-pool work cannot be interrupted, so a timed-out pipeline is
+stopped cooperatively through a :class:`CancelToken`:
+
+- the pipeline calls :meth:`CancelToken.check` between stages, and
+- every session it opens is :meth:`guarded <CancelToken.guard>`, so the
+  next ``commit()`` after cancellation raises instead of committing and
+  the session's open transaction is rolled back when it closes.
+
+:func:`run_on_writer` cancels the token when the time budget runs out and
+then waits for the worker to reach one of those points, so no write from
+a timed-out pipeline lands after the caller has recorded the timeout.
+
+Unit of work
+------------
+:func:`unit_of_work` gives the pipeline one session on one database
+transaction for all of its stages. The repositories and services it calls
+commit as they go; inside the unit of work those commits only release
+savepoints, and the outer transaction commits once at the end — or is
+rolled back whole when the pipeline is cancelled or fails.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from backend.database import get_engine
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class PipelineCancelled(Exception):
+    """Raised inside the writer thread once the pipeline's token is cancelled."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag shared with the writer thread."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._interrupted = False
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether :meth:`cancel` was called."""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Ask the pipeline to stop at its next checkpoint or commit."""
+        self._event.set()
+
+    @property
+    def interrupted(self) -> bool:
+        """Whether a checkpoint or commit was refused, even if the error was swallowed."""
+        return self._interrupted
+
+    def check(self) -> None:
+        """Checkpoint: raise :class:`PipelineCancelled` if cancelled."""
+        if self._event.is_set():
+            self._interrupted = True
+            raise PipelineCancelled("post-scrape pipeline cancelled")
+
+    def guard(self, db: Session) -> Session:
+        """Make ``db`` refuse to commit once the token is cancelled.
+
+        Parameters
+        ----------
+        db : Session
+            Session opened by the pipeline. Anything that is not a
+            ``Session`` (a test double) is passed through unguarded.
+
+        Returns
+        -------
+        Session
+            ``db`` itself, for chaining.
+        """
+        if isinstance(db, Session):
+            event.listen(db, "before_commit", lambda session: self.check())
+        return db
+
+
+@contextmanager
+def unit_of_work(
+    token: Optional[CancelToken] = None, engine: Optional[Engine] = None
+) -> Iterator[Session]:
+    """Open one session whose stage commits land in a single transaction.
+
+    The session joins an outer transaction on a dedicated connection in
+    ``create_savepoint`` mode, so ``commit()`` inside a stage releases a
+    savepoint and ``rollback()`` discards only the stage's work since its
+    last commit. Leaving the block normally commits the outer transaction;
+    leaving it with an exception rolls all of it back.
+
+    Parameters
+    ----------
+    token : CancelToken, optional
+        Guards the session and is checked once more before the final commit.
+    engine : Engine, optional
+        Engine to connect with; defaults to the application engine.
+
+    Yields
+    ------
+    Session
+        The shared session.
+    """
+    engine = engine if engine is not None else get_engine()
+    with engine.connect() as conn:
+        trans = conn.begin()
+        if conn.dialect.name == "sqlite":
+            # pysqlite defers BEGIN until the first DML statement, so a
+            # SAVEPOINT issued first would open the transaction itself and
+            # its RELEASE would commit. Start the transaction explicitly.
+            conn.exec_driver_sql("BEGIN")
+        db = Session(
+            bind=conn, autoflush=False, join_transaction_mode="create_savepoint"
+        )
+        if token is not None:
+            token.guard(db)
+        try:
+            yield db
+            if token is not None:
+                token.check()
+            db.commit()
+        except BaseException:
+            db.close()
+            trans.rollback()
+            raise
+        db.close()
+        trans.commit()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the process-wide single-thread writer, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="scrape-db-writer"
+            )
+        return _executor
+
+
+async def run_on_writer(
+    pipeline: Callable[[CancelToken], T], timeout: Optional[float] = None
+) -> T:
+    """Run ``pipeline`` on the writer thread within ``timeout`` seconds.
+
+    Parameters
+    ----------
+    pipeline : Callable
+        Blocking function taking the run's :class:`CancelToken`. It must
+        check the token between stages and guard every session it opens.
+    timeout : float, optional
+        Seconds the pipeline may take, including time queued behind other
+        scrapes' pipelines. ``None`` waits indefinitely.
+
+    Returns
+    -------
+    Any
+        What ``pipeline`` returned.
+
+    Raises
+    ------
+    PipelineCancelled
+        If the budget ran out. By the time it is raised the worker has
+        stopped and its uncommitted writes are rolled back.
+    """
+    token = CancelToken()
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(_get_executor(), pipeline, token)
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+    except asyncio.TimeoutError:
+        token.cancel()
+        # Cleanup half of the contract: wait until the worker has actually
+        # stopped. A pipeline that never started is dropped at its first
+        # checkpoint; one that finished during the race still counts —
+        # unless a stage swallowed a refused commit on its way out.
+        result = await future
+        if token.interrupted:
+            raise PipelineCancelled("post-scrape pipeline cancelled")
+        return result
+    except asyncio.CancelledError:
+        # Our caller is being cancelled (e.g. server shutdown); stop the
+        # worker at its next checkpoint without waiting for it.
+        token.cancel()
+        raise
@@ -0,0 +1,236 @@
+"""In-process event bus pushing live scrape updates to Server-Sent Events clients.
+
+``ScraperAdapter`` publishes every status transition, the 2FA prompt and the
+scraper's progress lines here; ``GET /api/scraping/events`` streams them to
+the browser, so the UI no longer polls ``/status`` (one DB session per poll)
+and an OTP prompt shows up the moment the scraper asks for it.
+
+Events are kept per ``process_id`` (a short history), so a client that
+subscribes late — or reconnects with ``Last-Event-ID`` — is replayed what it
+missed before receiving live events. Like the adapter registries, the bus is
+plain in-process state: the app runs a single worker.
+
+Publishing is thread-safe. Adapters publish from the event loop, but OTP
+submission and aborts arrive on threadpool workers; events are handed to each
+subscriber's queue on the subscriber's own loop.
+"""
+
+import asyncio
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Optional
+
+# Events remembered per process for replay; progress lines beyond this are
+# dropped oldest-first (status events are never the bulk of a scrape).
+EVENT_HISTORY_LIMIT = 200
+
+# Finished processes whose history is kept for late subscribers.
+MAX_KEPT_FINISHED_PROCESSES = 50
+
+# Seconds between keep-alive comments on an idle stream, so proxies and the
+# browser don't drop a connection that is waiting on a slow login.
+SSE_HEARTBEAT_SECONDS = 15.0
+
+STATUS_EVENT = "status"
+PROGRESS_EVENT = "progress"
+TFA_REQUIRED_EVENT = "2fa_required"
+
+
+@dataclass(frozen=True)
+class ScrapeEvent:
+    """One update of a scrape.
+
+    Attributes
+    ----------
+    process_id : int
+        Scraping history ID the event belongs to.
+    seq : int
+        Per-process sequence number, used as the SSE event ID.
+    type : str
+        ``status``, ``progress`` or ``2fa_required``.
+    data : dict
+        JSON payload.
+    final : bool
+        Whether this event ends the scrape; live streams close after it.
+    """
+
+    process_id: int
+    seq: int
+    type: str
+    data: dict = field(default_factory=dict)
+    final: bool = False
+
+    def to_sse(self) -> str:
+        """Render the event in the ``text/event-stream`` wire format."""
+        return f"id: {self.seq}\nevent: {self.type}\ndata: {json.dumps(self.data)}\n\n"
+
+
+@dataclass
+class _Subscriber:
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue
+
+
+class ScrapeEventBus:
+    """Fan-out of scrape events to per-process subscribers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._history: "OrderedDict[int, list[ScrapeEvent]]" = OrderedDict()
+        self._seq: dict[int, int] = {}
+        self._finished: "OrderedDict[int, None]" = OrderedDict()
+        self._subscribers: dict[int, list[_Subscriber]] = {}
+
+    def publish(
+        self, process_id: int, type_: str, data: Optional[dict] = None, final: bool = False
+    ) -> ScrapeEvent:
+        """Record an event and deliver it to the process's subscribers.
+
+        Parameters
+        ----------
+        process_id : int
+            Scraping history ID.
+        type_ : str
+            Event type.
+        data : dict, optional
+            JSON-serializable payload.
+        final : bool, optional
+            Marks the end of the scrape.
+
+        Returns
+        -------
+        ScrapeEvent
+            The published event.
+        """
+        with self._lock:
+            seq = self._seq.get(process_id, 0) + 1
+            self._seq[process_id] = seq
+            event = ScrapeEvent(process_id, seq, type_, dict(data or {}), final)
+            history = self._history.setdefault(process_id, [])
+            history.append(event)
+            if len(history) > EVENT_HISTORY_LIMIT:
+                del history[0]
+            if final:
+                self._finished[process_id] = None
+                self._finished.move_to_end(process_id)
+                self._evict_finished()
+            subscribers = list(self._subscribers.get(process_id, ()))
+        for subscriber in subscribers:
+            if not subscriber.loop.is_closed():
+                subscriber.loop.call_soon_threadsafe(subscriber.queue.put_nowait, event)
+        return event
+
+    def knows(self, process_id: int) -> bool:
+        """Whether any event of ``process_id`` is still remembered."""
+        with self._lock:
+            return process_id in self._history
+
+    async def subscribe(
+        self,
+        process_id: int,
+        last_event_id: int = 0,
+        heartbeat: Optional[float] = SSE_HEARTBEAT_SECONDS,
+    ) -> AsyncIterator[Optional[ScrapeEvent]]:
+        """Yield the events of ``process_id``: first the missed ones, then live.
+
+        The stream ends after a final event. On an idle stream ``None`` is
+        yielded every ``heartbeat`` seconds, for the caller to turn into a
+        keep-alive.
+
+        Parameters
+        ----------
+        process_id : int
+            Scraping history ID.
+        last_event_id : int, optional
+            Sequence number the client already has; older events are not
+            replayed.
+        heartbeat : float, optional
+            Keep-alive interval; ``None`` disables keep-alives.
+
+        Yields
+        ------
+        ScrapeEvent or None
+            The next event, or ``None`` for a keep-alive.
+        """
+        subscriber = _Subscriber(asyncio.get_running_loop(), asyncio.Queue())
+        with self._lock:
+            self._subscribers.setdefault(process_id, []).append(subscriber)
+            missed = [
+                event
+                for event in self._history.get(process_id, ())
+                if event.seq > last_event_id
+            ]
+            finished = process_id in self._finished
+        # Registering and snapshotting under one lock hold means every event
+        # is either replayed below or queued for us, never both.
+        try:
+            for event in missed:
+                yield event
+            if finished:
+                return
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscriber.queue.get(), heartbeat)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                yield event
+                if event.final:
+                    return
+        finally:
+            with self._lock:
+                subscribers = self._subscribers.get(process_id, [])
+                if subscriber in subscribers:
+                    subscribers.remove(subscriber)
+                if not subscribers:
+                    self._subscribers.pop(process_id, None)
+
+    def _evict_finished(self) -> None:
+        """Forget the oldest finished processes beyond the retention limit."""
+        while len(self._finished) > MAX_KEPT_FINISHED_PROCESSES:
+            process_id, _ = self._finished.popitem(last=False)
+            self._history.pop(process_id, None)
+            self._seq.pop(process_id, None)
+
+
+scrape_events = ScrapeEventBus()
+
+
+def publish_status(
+    process_id: int,
+    status: str,
+    error_message: Optional[str] = None,
+    error_type: Optional[str] = None,
+    final: bool = False,
+) -> ScrapeEvent:
+    """Publish a status transition, shaped like ``GET /api/scraping/status``.
+
+    Parameters
+    ----------
+    process_id : int
+        Scraping history ID.
+    status : str
+        New status (a ``ScrapingHistoryRepository`` status value).
+    error_message, error_type : str, optional
+        Failure detail and category, as recorded in the history row.
+    final : bool, optional
+        Whether the status ends the scrape.
+
+    Returns
+    -------
+    ScrapeEvent
+        The published event.
+    """
+    return scrape_events.publish(
+        process_id,
+        STATUS_EVENT,
+        {
+            "status": status,
+            "process_id": process_id,
+            "error_message": error_message,
+            "error_type": error_type,
+        },
+        final=final,
+    )
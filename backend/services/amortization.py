@@ -0,0 +1,264 @@
+"""Array-based amortization schedule engine.
+
+Computes loan schedules as NumPy columns rather than a list of per-month
+dicts, for the three Israeli payment structures (see
+:class:`backend.constants.loans.AmortizationMethod`):
+
+- **Shpitzer** — the loan is split into constant-rate segments. Within a
+  segment the balance follows the closed-form annuity recurrence
+  ``B_j = B_0 (1 + r)^j - A ((1 + r)^j - 1) / r``, so each segment is one
+  vectorized step; the payment ``A`` is re-amortized over the remaining
+  term at every rate change.
+- **Keren Shava** (equal principal) — a running subtraction of the fixed
+  principal portion.
+- **Balloon** — interest on the untouched principal, repaid at maturity.
+
+Schedules depend only on their inputs, so :func:`compute_schedule` is
+memoized process-wide on ``(principal, rate, term, start, method,
+rate steps)``. The rate steps are a
+:class:`~backend.services.rate_series.RateSeries`, which hashes by value,
+so a refreshed rate series is a cache miss without explicit invalidation. Cached
+schedules are shared, so their arrays are read-only.
+"""
+
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.constants.loans import AmortizationMethod
+from backend.services.rate_series import RateSeries
+
+
+@dataclass(frozen=True)
+class AmortizationSchedule:
+    """A loan schedule as parallel, read-only arrays (one element per payment).
+
+    Monetary columns are rounded to 2 decimals and ``annual_rate`` to 4,
+    matching the values exposed through the API.
+
+    Attributes
+    ----------
+    dates : np.ndarray
+        Payment dates as ``YYYY-MM-DD`` strings.
+    payment : np.ndarray
+        Total payment amount.
+    principal : np.ndarray
+        Portion reducing the principal.
+    interest : np.ndarray
+        Interest component.
+    remaining : np.ndarray
+        Outstanding balance after the payment.
+    annual_rate : np.ndarray
+        Annual rate applied to the payment (%).
+    """
+
+    dates: np.ndarray
+    payment: np.ndarray
+    principal: np.ndarray
+    interest: np.ndarray
+    remaining: np.ndarray
+    annual_rate: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Return the schedule as a list of per-payment dicts.
+
+        Returns
+        -------
+        list[dict]
+            Dicts with ``payment_number``, ``date``, ``payment``,
+            ``principal_portion``, ``interest_portion``,
+            ``remaining_balance`` and ``annual_rate``.
+        """
+        return [
+            {
+                "payment_number": i,
+                "date": d,
+                "payment": p,
+                "principal_portion": pp,
+                "interest_portion": ip,
+                "remaining_balance": rb,
+                "annual_rate": ar,
+            }
+            for i, (d, p, pp, ip, rb, ar) in enumerate(
+                zip(
+                    self.dates.tolist(),
+                    self.payment.tolist(),
+                    self.principal.tolist(),
+                    self.interest.tolist(),
+                    self.remaining.tolist(),
+                    self.annual_rate.tolist(),
+                ),
+                start=1,
+            )
+        ]
+
+
+def payment_dates(start_date: date, count: int) -> np.ndarray:
+    """Get the payment dates 0..``count`` months after ``start_date``.
+
+    Day-of-month is clamped to 28 so every month has a valid date.
+
+    Parameters
+    ----------
+    start_date : date
+        Loan start date.
+    count : int
+        Last month offset to include.
+
+    Returns
+    -------
+    np.ndarray
+        ``datetime64[D]`` array of length ``count + 1``.
+    """
+    first_month = np.datetime64(f"{start_date.year:04d}-{start_date.month:02d}", "M")
+    months = first_month + np.arange(count + 1)
+    return months.astype("datetime64[D]") + (min(start_date.day, 28) - 1)
+
+
+def annuity_payment(balance: float, monthly_rate: float, months: int) -> float:
+    """Compute the constant annuity payment for the remaining loan.
+
+    Parameters
+    ----------
+    balance : float
+        Outstanding principal.
+    monthly_rate : float
+        Monthly interest rate as a fraction (annual% / 100 / 12).
+    months : int
+        Remaining number of payments.
+
+    Returns
+    -------
+    float
+        The per-period payment amount.
+    """
+    if months <= 0:
+        return balance
+    if monthly_rate == 0:
+        return balance / months
+    factor = (1 + monthly_rate) ** months
+    return balance * monthly_rate * factor / (factor - 1)
+
+
+@lru_cache(maxsize=1024)
+def compute_schedule(
+    principal: float,
+    annual_rate: float,
+    term_months: int,
+    start_date: date,
+    amortization_method: str = AmortizationMethod.SHPITZER.value,
+    rate_steps: Optional[RateSeries] = None,
+) -> AmortizationSchedule:
+    """Compute (or fetch from cache) an amortization schedule.
+
+    Parameters
+    ----------
+    principal : float
+        Original loan amount.
+    annual_rate : float
+        Annual interest rate as a percentage, used wherever no rate step
+        is in effect.
+    term_months : int
+        Total number of monthly payments.
+    start_date : date
+        Loan start date (first payment lands one month later).
+    amortization_method : str, optional
+        One of :class:`backend.constants.loans.AmortizationMethod` values.
+        Defaults to Shpitzer (annuity).
+    rate_steps : RateSeries, optional
+        Piecewise-constant annual rate curve. Each payment uses the rate
+        in effect at the start of its interest period.
+
+    Returns
+    -------
+    AmortizationSchedule
+        The schedule columns.
+    """
+    n = max(int(term_months), 0)
+    dates = payment_dates(start_date, n)
+    period_starts, due_dates = dates[:-1], dates[1:]
+
+    rates = np.full(n, float(annual_rate))
+    if rate_steps:
+        stepped = rate_steps.values_at(period_starts)
+        rates = np.where(np.isnan(stepped), rates, stepped)
+    monthly = rates / 100.0 / 12.0
+
+    if n == 0:
+        prev = payment = principal_part = np.zeros(0)
+    elif amortization_method == AmortizationMethod.EQUAL_PRINCIPAL.value:
+        fixed_part = principal / n
+        prev = np.maximum(
+            np.subtract.accumulate(np.r_[principal, np.full(n - 1, fixed_part)]), 0.0
+        )
+        principal_part = np.minimum(fixed_part, prev)
+        payment = principal_part + prev * monthly
+    elif amortization_method == AmortizationMethod.BALLOON.value:
+        prev = np.full(n, float(principal))
+        principal_part = np.zeros(n)
+        principal_part[-1] = principal
+        payment = prev * monthly + principal_part
+    else:
+        prev, payment, principal_part = _shpitzer(principal, monthly, n)
+
+    interest = prev * monthly
+    remaining = np.maximum(prev - principal_part, 0.0)
+
+    columns = {
+        "dates": due_dates.astype(str),
+        "payment": np.round(payment, 2),
+        "principal": np.round(principal_part, 2),
+        "interest": np.round(interest, 2),
+        "remaining": np.round(remaining, 2),
+        "annual_rate": np.round(rates, 4),
+    }
+    for column in columns.values():
+        column.flags.writeable = False
+    return AmortizationSchedule(**columns)
+
+
+def _shpitzer(
+    principal: float, monthly: np.ndarray, n: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Annuity schedule, re-amortized at every change of ``monthly``.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray, np.ndarray]
+        Balance before each payment, payment, and principal portion.
+    """
+    changes = np.flatnonzero(np.r_[True, monthly[1:] != monthly[:-1]])
+    bounds = np.r_[changes, n]
+
+    prev = np.empty(n)
+    annuity = np.empty(n)
+    balance = float(principal)
+    for seg_start, seg_end in zip(bounds[:-1].tolist(), bounds[1:].tolist()):
+        rate = float(monthly[seg_start])
+        amount = annuity_payment(balance, rate, n - seg_start)
+        elapsed = np.arange(seg_end - seg_start + 1)
+        if rate == 0:
+            path = balance - amount * elapsed
+        else:
+            growth = (1 + rate) ** elapsed
+            path = balance * growth - amount * (growth - 1) / rate
+        path = np.maximum(path, 0.0)
+        prev[seg_start:seg_end] = path[:-1]
+        annuity[seg_start:seg_end] = amount
+        balance = float(path[-1])
+
+    # The final payment — and any that would overshoot the balance —
+    # repays exactly what is left plus its interest.
+    interest = prev * monthly
+    principal_part = annuity - interest
+    settle = principal_part > prev
+    settle[-1] = True
+    principal_part = np.where(settle, prev, principal_part)
+    payment = np.where(settle, prev + interest, annuity)
+    return prev, payment, principal_part
@@ -23,11 +23,13 @@ from backend.services.transaction_classification import (
     investment_mask,
     transactions_masks,
 )
+from backend.utils.session_cache import session_memoized
 
 
 class CashflowMixin:
     """Cash-flow aggregation methods for ``AnalysisService``."""
 
+    @session_memoized("analysis.get_income_expenses_over_time")
     def get_income_expenses_over_time(self, exclude_projects: bool = False, exclude_liabilities: bool = False, exclude_refunds: bool = False):
         """
         Aggregate income and expenses by month over time.
@@ -306,6 +308,7 @@ class CashflowMixin:
         income_df["source_label"] = np.where(is_loan, loan_label, non_loan_label)
         return income_df
 
+    @session_memoized("analysis.get_expenses_by_category_over_time")
     def get_expenses_by_category_over_time(self):
         """
         Get monthly expenses broken down by category over time.
@@ -6,15 +6,56 @@ projection ("This Month" hero) and the monthly-expense trend helper it
 builds on. Mixed into ``AnalysisService`` (see ``core.py``).
 """
 
+import numpy as np
 import pandas as pd
 
 from backend.constants.tables import TransactionsTableFields
+from backend.utils.session_cache import session_memoized
+
+
+def _recurring_impulses(items: list[dict], today: pd.Timestamp, n_days: int) -> np.ndarray:
+    """Place recurring charges on the day offsets they fall due.
+
+    Parameters
+    ----------
+    items : list[dict]
+        Active recurring items from ``RecurringService.get_recurring``.
+    today : pd.Timestamp
+        Day offset 0.
+    n_days : int
+        Last day offset to fill.
+
+    Returns
+    -------
+    np.ndarray
+        Length ``n_days + 1``; element ``t`` is the total charged ``t`` days
+        after ``today``. Each item repeats every ``period_days`` from its
+        ``next_expected_date``; occurrences on or before today are dropped.
+    """
+    impulses = np.zeros(n_days + 1)
+    if not items or n_days <= 0:
+        return impulses
+
+    next_due = pd.to_datetime([i["next_expected_date"] for i in items])
+    first = (next_due - today).days.to_numpy()
+    period = np.array([i["period_days"] for i in items])
+    amount = np.array([i["amount"] for i in items], dtype=float)
+
+    repeats = np.arange((n_days - min(first.min(), 0)) // period.min() + 1)
+    due = first[:, None] + period[:, None] * repeats[None, :]
+    in_window = (due > 0) & (due <= n_days)
+    np.add.at(impulses, due[in_window], np.broadcast_to(amount[:, None], due.shape)[in_window])
+    return impulses
 
 
 class ForecastMixin:
     """Forecasting methods for ``AnalysisService``."""
 
-    def get_cash_flow_forecast(self) -> dict:
+    # Average Gregorian month length, used to scale the scenario band.
+    _DAYS_PER_MONTH = 365.25 / 12
+
+    @session_memoized("analysis.get_cash_flow_forecast")
+    def get_cash_flow_forecast(self, horizon_days: int | None = None) -> dict:
         """Forecast the current month's cash flow from trend + month-to-date actuals.
 
         Projects where the month will end by combining what has already
@@ -22,12 +63,26 @@ class ForecastMixin:
         trend-based estimate of the remaining days. The expense trend is the
         rolling 3-month average (falling back to 6/12-month when sparse); the
         income trend is the average of the last 3 complete months. The
-        projection never dips below money already spent.
+        projection never dips below money already spent, nor below the
+        recurring charges still due this month.
 
         This is the data behind the dashboard "This Month" hero — the
         month-end balance projection and the "safe to spend" figure that
         Israeli budgeting apps (RiseUp et al.) lead with.
 
+        The trajectory is computed on day-indexed arrays: month-to-date
+        actuals are a cumulative sum over per-day net flow, and the projected
+        days are a linear trend fill with detected recurring charges placed
+        as impulses on the days they fall due. The same model extends past
+        month end when ``horizon_days`` is given.
+
+        Parameters
+        ----------
+        horizon_days : int, optional
+            When set, also project the balance this many days ahead of today
+            (e.g. 90) with a one-standard-deviation scenario band. Default is
+            ``None`` (current month only).
+
         Returns
         -------
         dict
@@ -49,12 +104,20 @@ class ForecastMixin:
               remaining days.
             - ``avg_monthly_income`` / ``avg_monthly_expenses`` – the trend
               baselines used.
-            - ``committed_remaining`` – detected recurring charges whose next
-              due date falls in the remainder of this month.
+            - ``committed_remaining`` – detected recurring charges falling due
+              in the remainder of this month.
             - ``daily`` – per-day list of ``{date, actual_balance,
               projected_balance}`` for the trajectory chart (one is null
               depending on whether the day is past or future).
+            - ``horizon`` – only when ``horizon_days`` is set: ``{days,
+              end_balance, low_end_balance, high_end_balance, min_balance,
+              min_balance_date, daily}`` where ``daily`` lists ``{date,
+              projected_balance, low_balance, high_balance}`` for each day
+              after today. The band widens with the square root of elapsed
+              months, using the spread of recent complete-month expenses.
         """
+        from backend.services.recurring_service import RecurringService
+
         today = pd.Timestamp.today().normalize()
         month_str = today.strftime("%Y-%m")
         month_start = today.replace(day=1)
@@ -80,27 +143,42 @@ class ForecastMixin:
         )
 
         # --- Month-to-date actuals (non-CC cashflow) ---
+        # Dates are normalized ``YYYY-MM-DD`` strings, so a lexicographic
+        # range selects the month without parsing the full history, and the
+        # day of month is read straight off the string.
         df = self.repo.get_cashflow_transactions()
         actual_income = 0.0
         actual_expenses = 0.0
-        per_day_net: dict[int, float] = {}
+        per_day_net = np.zeros(days_in_month)
         if not df.empty:
-            df = df.copy()
-            df["date_parsed"] = pd.to_datetime(df["date"])
-            mtd = df[(df["date_parsed"] >= month_start) & (df["date_parsed"] <= today)]
+            dates = df["date"]
+            mtd = df[
+                ((dates >= month_start.strftime("%Y-%m-%d")) & (dates <= today.strftime("%Y-%m-%d"))).to_numpy()
+            ]
             if not mtd.empty:
                 actual_income, _, actual_expenses = self.get_income_investments_and_expenses(mtd)
-                per_day_net = (
-                    mtd.groupby(mtd["date_parsed"].dt.day)["amount"].sum().to_dict()
+                day_idx = mtd["date"].str.slice(8, 10).astype(int).to_numpy() - 1
+                per_day_net = np.bincount(
+                    day_idx, weights=mtd["amount"].to_numpy(dtype=float), minlength=days_in_month
                 )
 
         # --- Current bank balance ---
         balances = self.bank_balance_service.get_all_balances()
         current_bank_balance = float(sum(b["balance"] for b in balances)) if balances else 0.0
 
+        # --- Known upcoming recurring charges ---
+        # Detected subscriptions/bills placed on the days they fall due. The
+        # ones still due this month are subtracted from "safe to spend" so the
+        # figure reflects money earmarked for committed bills, not just income
+        # minus what's been spent so far.
+        recurring = RecurringService(self.db).get_recurring()
+        active = [i for i in recurring["items"] if i["status"] != "ended"]
+        impulses = _recurring_impulses(active, today, max(days_remaining, horizon_days or 0))
+        committed_remaining = float(impulses[1 : days_remaining + 1].sum())
+
         # --- Projection ---
         trend_daily_expense = avg_monthly_expenses / days_in_month if days_in_month else 0.0
-        projected_remaining_expenses = max(0.0, trend_daily_expense * days_remaining)
+        projected_remaining_expenses = max(0.0, trend_daily_expense * days_remaining, committed_remaining)
         expected_expenses = actual_expenses + projected_remaining_expenses
         expected_income = max(actual_income, avg_monthly_income)
         projected_remaining_income = max(0.0, expected_income - actual_income)
@@ -109,58 +187,48 @@ class ForecastMixin:
             current_bank_balance + projected_remaining_income - projected_remaining_expenses
         )
 
-        # --- Known upcoming recurring charges still due this month ---
-        # Detected subscriptions/bills whose next expected charge falls in the
-        # remainder of the month. Subtracted from "safe to spend" so the figure
-        # reflects money still earmarked for committed bills, not just income
-        # minus what's been spent so far.
-        from backend.services.recurring_service import RecurringService
-
-        month_end = today + pd.offsets.MonthEnd(0)
-        committed_remaining = 0.0
-        for item in RecurringService(self.db).get_recurring()["items"]:
-            if item["status"] == "ended":
-                continue
-            next_due = pd.Timestamp(item["next_expected_date"])
-            if today < next_due <= month_end:
-                committed_remaining += item["amount"]
-
         safe_to_spend = max(0.0, expected_income - actual_expenses - committed_remaining)
         safe_to_spend_daily = (
             safe_to_spend / days_remaining if days_remaining > 0 else safe_to_spend
         )
 
         # --- Daily trajectory for the chart ---
-        month_start_balance = current_bank_balance - (actual_income - actual_expenses)
-        remaining_daily_net = (
-            (projected_remaining_income - projected_remaining_expenses) / days_remaining
-            if days_remaining > 0
-            else 0.0
+        # Remaining days: income and the non-recurring share of the expense
+        # trend accrue linearly; recurring charges land on their due days.
+        # Over the whole remainder this sums to the same totals as above.
+        # The actual line is walked back from today's balance by the day's
+        # net amounts, so it ends exactly where the month projection, the
+        # horizon and ``projected_end_balance`` all start.
+        actual_path = current_bank_balance - (
+            per_day_net[:day_of_month].sum() - np.cumsum(per_day_net[:day_of_month])
+        )
+        if days_remaining > 0:
+            remaining_daily_flow = (
+                projected_remaining_income - (projected_remaining_expenses - committed_remaining)
+            ) / days_remaining
+        else:
+            remaining_daily_flow = 0.0
+        projected_path = current_bank_balance + np.cumsum(
+            remaining_daily_flow - impulses[1 : days_remaining + 1]
         )
-        daily = []
-        cumulative = 0.0
-        last_actual_balance = month_start_balance
-        for d in range(1, days_in_month + 1):
-            date_str = month_start.replace(day=d).strftime("%Y-%m-%d")
-            if d <= day_of_month:
-                cumulative += float(per_day_net.get(d, 0.0))
-                bal = month_start_balance + cumulative
-                last_actual_balance = bal
-                daily.append({
-                    "date": date_str,
-                    "actual_balance": round(bal, 2),
-                    # anchor the projected line to today so the two segments join
-                    "projected_balance": round(bal, 2) if d == day_of_month else None,
-                })
-            else:
-                proj = last_actual_balance + remaining_daily_net * (d - day_of_month)
-                daily.append({
-                    "date": date_str,
-                    "actual_balance": None,
-                    "projected_balance": round(proj, 2),
-                })
 
-        return {
+        dates = pd.date_range(month_start, periods=days_in_month).strftime("%Y-%m-%d")
+        actual_rounded = np.round(actual_path, 2).tolist()
+        projected_rounded = np.round(projected_path, 2).tolist()
+        daily = [
+            {
+                "date": dates[d],
+                "actual_balance": actual_rounded[d],
+                # anchor the projected line to today so the two segments join
+                "projected_balance": actual_rounded[d] if d == day_of_month - 1 else None,
+            }
+            for d in range(day_of_month)
+        ] + [
+            {"date": dates[day_of_month + d], "actual_balance": None, "projected_balance": value}
+            for d, value in enumerate(projected_rounded)
+        ]
+
+        result = {
             "month": month_str,
             "days_in_month": days_in_month,
             "day_of_month": day_of_month,
@@ -180,6 +248,54 @@ class ForecastMixin:
             "daily": daily,
         }
 
+        if horizon_days:
+            # Past month end, each day accrues 1/len(month) of the income
+            # trend minus the non-recurring share of the expense trend.
+            offsets = np.arange(1, horizon_days + 1)
+            days = today.to_datetime64().astype("datetime64[D]") + offsets
+            months = days.astype("datetime64[M]")
+            month_lengths = (
+                (months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")
+            ).astype(int)
+            recurring_monthly = sum(i["monthly_equivalent"] for i in active)
+            discretionary_monthly = max(0.0, avg_monthly_expenses - recurring_monthly)
+            flow = np.where(
+                offsets <= days_remaining,
+                remaining_daily_flow,
+                (avg_monthly_income - discretionary_monthly) / month_lengths,
+            ) - impulses[1 : horizon_days + 1]
+            path = current_bank_balance + np.cumsum(flow)
+
+            history = [
+                m["expenses"] for m in monthly_exp["months"] if m["month"] < month_str
+            ][-12:]
+            sigma = float(np.std(history, ddof=1)) if len(history) >= 2 else 0.0
+            width = sigma * np.sqrt(offsets / self._DAYS_PER_MONTH)
+            low, high = path - width, path + width
+
+            horizon_dates = days.astype(str).tolist()
+            low_idx = int(np.argmin(path))
+            result["horizon"] = {
+                "days": horizon_days,
+                "end_balance": round(float(path[-1]), 2),
+                "low_end_balance": round(float(low[-1]), 2),
+                "high_end_balance": round(float(high[-1]), 2),
+                "min_balance": round(float(path[low_idx]), 2),
+                "min_balance_date": horizon_dates[low_idx],
+                "daily": [
+                    {"date": d, "projected_balance": p, "low_balance": lo, "high_balance": hi}
+                    for d, p, lo, hi in zip(
+                        horizon_dates,
+                        np.round(path, 2).tolist(),
+                        np.round(low, 2).tolist(),
+                        np.round(high, 2).tolist(),
+                    )
+                ],
+            }
+
+        return result
+
+    @session_memoized("analysis.get_monthly_expenses")
     def get_monthly_expenses(
         self,
         exclude_pending_refunds: bool = True,
@@ -11,6 +11,7 @@ from backend.errors import ValidationException
 from backend.repositories.bank_balance_repository import BankBalanceRepository
 from backend.repositories.scraping_history_repository import ScrapingHistoryRepository
 from backend.repositories.transactions_repository import TransactionsRepository
+from backend.utils.session_cache import session_memoized
 
 
 class BankBalanceService:
@@ -22,6 +23,7 @@ class BankBalanceService:
         self.transactions_repo = TransactionsRepository(db)
         self.scraping_history_repo = ScrapingHistoryRepository(db)
 
+    @session_memoized("bank_balances.get_all_balances")
     def get_all_balances(self) -> list[dict]:
         """
         Get all bank balance records.
@@ -0,0 +1,71 @@
+"""Single-pass dashboard bundle.
+
+The dashboard renders a dozen analytics panels whose computations overlap
+heavily — the forecast and the insights both need the monthly expense trend
+and the income series, and three panels need the recurring charges. Each
+overlapping intermediate is a ``session_memoized`` method, so assembling all
+panels against one request session evaluates every intermediate once.
+"""
+
+from sqlalchemy.orm import Session
+
+from backend.services.analysis import AnalysisService
+from backend.services.insights_service import InsightsService
+from backend.services.recurring_service import RecurringService
+
+
+class DashboardService:
+    """Assemble every dashboard analytics panel in one pass."""
+
+    def __init__(self, db: Session):
+        """Initialize the dashboard service.
+
+        Parameters
+        ----------
+        db : Session
+            SQLAlchemy session for database operations. All panels share
+            it, and with it the per-request memo.
+        """
+        self.db = db
+        self.analysis = AnalysisService(db)
+        self.recurring = RecurringService(db)
+        self.insights = InsightsService(db)
+
+    def get_dashboard(self) -> dict:
+        """Compute all dashboard panels.
+
+        Panels are evaluated forecast-first so the intermediates it pulls in
+        (monthly expenses, income series, balances, recurring charges) are
+        already memoized when the insights and recurring panels ask for them.
+
+        Returns
+        -------
+        dict
+            One key per panel, each holding exactly what the matching
+            ``/api/analytics/...`` endpoint returns with the parameters the
+            dashboard cards start with — the endpoint defaults, except that
+            ``income_expenses_over_time`` excludes project budgets:
+            ``overview``, ``cash_flow_forecast``, ``insights``,
+            ``recurring``, ``net_worth_over_time``,
+            ``debt_payments_over_time``, ``by_category``, ``sankey``,
+            ``income_expenses_over_time``,
+            ``expenses_by_category_over_time``,
+            ``income_by_source_over_time`` and ``monthly_expenses``.
+        """
+        cash_flow_forecast = self.analysis.get_cash_flow_forecast()
+        return {
+            "overview": self.analysis.get_overview(),
+            "cash_flow_forecast": cash_flow_forecast,
+            "insights": self.insights.get_insights(),
+            "recurring": self.recurring.get_recurring(),
+            "net_worth_over_time": self.analysis.get_net_worth_over_time(),
+            "debt_payments_over_time": self.analysis.get_debt_payments_over_time(),
+            "by_category": self.analysis.get_expenses_by_category(),
+            "sankey": self.analysis.get_sankey_data(),
+            "income_expenses_over_time": self.analysis.get_income_expenses_over_time(
+                exclude_projects=True
+            ),
+            "expenses_by_category_over_time": self.analysis.get_expenses_by_category_over_time(),
+            "income_by_source_over_time": self.analysis.get_income_by_source_over_time(),
+            "monthly_expenses": self.analysis.get_monthly_expenses(),
+        }
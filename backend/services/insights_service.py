@@ -5,8 +5,20 @@ spikes, new subscriptions, price increases, overspend pace, unusually large
 transactions. Each insight is returned as a structured ``{code, severity,
 data}`` object; the frontend maps ``code`` to a translated, interpolated
 message so copy stays bilingual (en/he) without backend string formatting.
+
+Each producer declares the data it needs in ``_PRODUCERS``. Dependencies are
+resolved once, as the first producer needing them is reached, through the
+session-memoized services (the memo is shared with the dashboard bundle); the
+producers — pure pandas/Python over the resolved data — run inline, each
+isolated so one failure drops only its cards. Loads and producers share one
+time budget: once it is spent, the producers not yet run are skipped along
+with any dependencies only they need, so a slow forecast cannot stall the
+dashboard.
 """
 
+import logging
+import time
+
 import pandas as pd
 from sqlalchemy.orm import Session
 
@@ -15,6 +27,8 @@ from backend.repositories.transactions_repository import TransactionsRepository
 from backend.services.analysis_service import AnalysisService
 from backend.services.recurring_service import RecurringService
 
+logger = logging.getLogger(__name__)
+
 
 class InsightsService:
     """Derive insight cards from forecast, category trends and recurring data."""
@@ -26,6 +40,18 @@ class InsightsService:
     _LARGE_TXN_MIN = 1000.0
     _MAX_INSIGHTS = 8
 
+    # Seconds the dependency loads and producers of one call may take in
+    # total; producers not started by then are skipped.
+    _PRODUCER_BUDGET_SECONDS = 2.0
+
+    # (producer method, dependency keys it receives as positional arguments).
+    _PRODUCERS = (
+        ("_pace_insight", ("forecast",)),
+        ("_category_spike_insights", ("expenses_by_category_over_time",)),
+        ("_recurring_insights", ("recurring",)),
+        ("_large_transaction_insight", ("itemized_transactions",)),
+    )
+
     def __init__(self, db: Session):
         """Initialize the insights service.
 
@@ -38,6 +64,12 @@ class InsightsService:
         self.analysis = AnalysisService(db)
         self.recurring = RecurringService(db)
         self.repo = TransactionsRepository(db)
+        self._dependencies = {
+            "forecast": self.analysis.get_cash_flow_forecast,
+            "expenses_by_category_over_time": self.analysis.get_expenses_by_category_over_time,
+            "recurring": self.recurring.get_recurring,
+            "itemized_transactions": self.repo.get_itemized_transactions,
+        }
 
     def get_insights(self) -> list[dict]:
         """Build the prioritized list of insight cards.
@@ -50,21 +82,96 @@ class InsightsService:
             - ``code`` – stable identifier the frontend maps to a message.
             - ``severity`` – ``positive`` / ``info`` / ``warning``.
             - ``data`` – payload for message interpolation (amounts, labels).
+
+        Notes
+        -----
+        A producer that raises or whose dependency fails to load is logged
+        and contributes no cards; the rest of the list is still returned.
+        Producers are checked against ``_PRODUCER_BUDGET_SECONDS`` before
+        each dependency load and after each run: one that finishes past the
+        deadline has its cards dropped, and the producers after it are
+        skipped without loading their dependencies.
         """
+        deadline = time.perf_counter() + self._PRODUCER_BUDGET_SECONDS
+        resolved: dict = {}
+        failed: set[str] = set()
+
         insights: list[dict] = []
-        insights.extend(self._pace_insight())
-        insights.extend(self._category_spike_insights())
-        insights.extend(self._recurring_insights())
-        insights.extend(self._large_transaction_insight())
+        for position, (name, depends_on) in enumerate(self._PRODUCERS):
+            if not self._resolve_dependencies(depends_on, resolved, failed, deadline):
+                self._log_skipped(position)
+                break
+            if any(dep in failed for dep in depends_on):
+                continue
+            started = time.perf_counter()
+            try:
+                cards = getattr(self, name)(*(resolved[dep] for dep in depends_on))
+            except Exception:
+                logger.exception("Insight producer %s failed", name)
+                continue
+            finished = time.perf_counter()
+            logger.debug("Insight producer %s ran in %.3fs", name, finished - started)
+            if finished > deadline:
+                self._log_skipped(position)
+                break
+            insights.extend(cards)
 
         # Order: warnings first, then info, then positive — most actionable up top.
         severity_rank = {"warning": 0, "info": 1, "positive": 2}
         insights.sort(key=lambda i: severity_rank.get(i["severity"], 1))
         return insights[: self._MAX_INSIGHTS]
 
-    def _pace_insight(self) -> list[dict]:
+    def _resolve_dependencies(
+        self, depends_on: tuple, resolved: dict, failed: set, deadline: float
+    ) -> bool:
+        """Load the dependencies of one producer that are not loaded yet.
+
+        Parameters
+        ----------
+        depends_on : tuple
+            Dependency keys the producer declares.
+        resolved : dict
+            Dependency key -> loaded value, shared across producers; filled
+            in place.
+        failed : set
+            Keys whose loader raised, so only the producers that need them
+            are skipped; filled in place.
+        deadline : float
+            ``time.perf_counter()`` value after which nothing more is loaded.
+
+        Returns
+        -------
+        bool
+            ``False`` when the budget ran out before or while loading.
+        """
+        for dep in depends_on:
+            if dep in resolved or dep in failed:
+                continue
+            started = time.perf_counter()
+            if started > deadline:
+                return False
+            try:
+                resolved[dep] = self._dependencies[dep]()
+            except Exception:
+                logger.exception("Insight dependency %s failed to load", dep)
+                failed.add(dep)
+                continue
+            finished = time.perf_counter()
+            logger.debug("Insight dependency %s loaded in %.3fs", dep, finished - started)
+            if finished > deadline:
+                return False
+        return True
+
+    def _log_skipped(self, position: int) -> None:
+        """Warn that the budget ran out at the producer at ``position``."""
+        logger.warning(
+            "Insights exceeded their %.1fs budget; skipped %s",
+            self._PRODUCER_BUDGET_SECONDS,
+            ", ".join(name for name, _ in self._PRODUCERS[position:]),
+        )
+
+    def _pace_insight(self, forecast: dict) -> list[dict]:
         """Flag whether the month is on pace to over- or under-spend."""
-        forecast = self.analysis.get_cash_flow_forecast()
         income = forecast["expected_income"]
         expenses = forecast["expected_expenses"]
         if income <= 0:
@@ -83,9 +190,8 @@ class InsightsService:
             }]
         return []
 
-    def _category_spike_insights(self) -> list[dict]:
+    def _category_spike_insights(self, monthly: list[dict]) -> list[dict]:
         """Flag categories whose current-month spend is well above their trend."""
-        monthly = self.analysis.get_expenses_by_category_over_time()
         if len(monthly) < 2:
             return []
 
@@ -122,10 +228,10 @@ class InsightsService:
         results.sort(key=lambda i: i.pop("_sort"), reverse=True)
         return results[:2]
 
-    def _recurring_insights(self) -> list[dict]:
+    def _recurring_insights(self, recurring: dict) -> list[dict]:
         """Surface newly detected subscriptions and price changes."""
         results = []
-        for item in self.recurring.get_recurring()["items"]:
+        for item in recurring["items"]:
             if item["status"] == "new":
                 results.append({
                     "code": "newRecurring",
@@ -149,9 +255,8 @@ class InsightsService:
                 })
         return results[:3]
 
-    def _large_transaction_insight(self) -> list[dict]:
+    def _large_transaction_insight(self, df: pd.DataFrame) -> list[dict]:
         """Flag an unusually large single expense in the current month."""
-        df = self.repo.get_itemized_transactions()
         if df.empty:
             return []
 
@@ -6,12 +6,15 @@ snapshot generator (daily compounding). Mixed into ``InvestmentsService``
 (see ``core.py``).
 """
 
-from datetime import date, datetime, timedelta
+from datetime import date
 from typing import Any, Dict, List, Optional
 
 import numpy as np
 import pandas as pd
 
+from backend.constants.loans import PRIME_SERIES
+from backend.services.rate_series import RateSeries
+
 
 class SnapshotsMixin:
     """Balance-snapshot methods for ``InvestmentsService``."""
@@ -88,14 +91,14 @@ class SnapshotsMixin:
 
         Replays the transaction timeline with daily compounding to produce
         monthly snapshots. Existing ``"calculated"`` snapshots are cleared first;
-        manual/scraped snapshots are preserved.
+        manual/scraped snapshots are preserved. The clear and the rewrite
+        are committed together.
 
         Supports two rate types:
 
         - ``fixed`` — constant ``interest_rate`` for the whole timeline.
         - ``prime_linked`` — the rate is the Israeli prime rate plus
-          ``rate_spread`` and follows every Bank of Israel decision; the
-          daily rate is re-derived whenever the walk crosses a rate step.
+          ``rate_spread`` and follows every Bank of Israel decision.
           Falls back to the flat ``interest_rate`` when the rate series
           is empty.
 
@@ -109,6 +112,60 @@ class SnapshotsMixin:
             End date for calculation in ``YYYY-MM-DD`` format.
             Defaults to today.
         """
+        self._write_rate_snapshots(investment_id, end_date)
+        self.db.commit()
+
+    def recalculate_prime_linked_snapshots(self) -> int:
+        """Regenerate calculated snapshots for every open prime-linked investment.
+
+        Called after a Bank of Israel rate refresh appends a new decision,
+        so prime-linked balances pick up the change without waiting for the
+        next manual recalculation. The whole re-price is one transaction.
+
+        Returns
+        -------
+        int
+            Number of investments recalculated.
+        """
+        df = self.investments_repo.get_all_investments(include_closed=False)
+        if df.empty or "interest_rate_type" not in df.columns:
+            return 0
+
+        from backend.services.rates_service import RatesService
+
+        ids = df.loc[df["interest_rate_type"] == "prime_linked", "id"].astype(int).tolist()
+        # Resolve the series before the first write: lookups from a session
+        # holding uncommitted writes bypass the shared series cache.
+        prime = RatesService(self.db).get_series(PRIME_SERIES)
+        try:
+            for investment_id in ids:
+                self._write_rate_snapshots(investment_id, prime=prime)
+        except Exception:
+            self.db.rollback()
+            raise
+        self.db.commit()
+        return len(ids)
+
+    def _write_rate_snapshots(
+        self,
+        investment_id: int,
+        end_date: Optional[str] = None,
+        prime: Optional[RateSeries] = None,
+    ) -> None:
+        """Replace an investment's calculated snapshots without committing.
+
+        Parameters
+        ----------
+        investment_id : int
+            ID of the investment.
+        end_date : str, optional
+            Last day to simulate (``YYYY-MM-DD``); defaults to today.
+        prime : RateSeries, optional
+            Prime series to price prime-linked investments against.
+            Fetched from :class:`RatesService` when not given.
+        """
+        from backend.services.rates_service import RatesService
+
         investment = self.investments_repo.get_by_id(investment_id)
         inv = investment.iloc[0]
 
@@ -126,118 +183,109 @@ class SnapshotsMixin:
         if transactions_df.empty:
             return
 
-        transactions_df = transactions_df.copy()
-        transactions_df["date"] = pd.to_datetime(transactions_df["date"])
-        transactions_df["amount"] = pd.to_numeric(
-            transactions_df["amount"], errors="coerce"
-        ).fillna(0.0)
-        transactions_df = transactions_df.sort_values("date")
-
-        start = transactions_df["date"].min().date()
-        end = (
-            datetime.strptime(end_date, "%Y-%m-%d").date()
-            if end_date
-            else date.today()
-        )
-
-        # Piecewise-constant daily-rate curve: [(effective_date, daily_rate)],
-        # ascending. Fixed investments get a single step; prime-linked ones
-        # get one step per Bank of Israel decision (prime + spread).
-        def _daily(annual_pct: float) -> float:
-            return (1 + annual_pct / 100.0) ** (1 / 365) - 1
+        days = pd.to_datetime(transactions_df["date"]).to_numpy().astype("datetime64[D]")
+        amounts = pd.to_numeric(transactions_df["amount"], errors="coerce").fillna(0.0)
+        start = days.min()
+        end = np.datetime64(end_date or date.today().isoformat(), "D")
 
-        rate_curve: List[tuple] = []
+        # Annual-rate step function from the first transaction on. Fixed
+        # investments get a single step; prime-linked ones one step per
+        # Bank of Israel decision (prime + spread).
+        curve = RateSeries.from_records([])
         if is_prime:
-            from backend.services.rates_service import RatesService
-
-            prime_steps = RatesService(self.db).get_prime_steps(
-                start.strftime("%Y-%m-%d")
-            )
-            rate_curve = [
-                (
-                    datetime.strptime(s["date"], "%Y-%m-%d").date(),
-                    _daily(s["value"] + spread),
-                )
-                for s in prime_steps
-            ]
-        if not rate_curve:
+            if prime is None:
+                prime = RatesService(self.db).get_series(PRIME_SERIES)
+            curve = prime.anchored(start).shifted(spread)
+        if not len(curve):
             # Fixed rate, or prime-linked with an empty rate series.
             flat_rate = inv.get("interest_rate")
             if not flat_rate:
                 return
-            rate_curve = [(start, _daily(float(flat_rate)))]
-
-        # Build a dict of date -> total transaction amount for that day.
-        # ``date`` is a datetime dtype here (parsed via ``pd.to_datetime`` above),
-        # so ``.dt.date`` yields the same per-row ``date`` objects the prior
-        # ``row["date"].date()`` loop produced. Vectorized groupby replaces the
-        # row-wise iterrows accumulation.
-        txn_by_date = (
-            transactions_df.groupby(transactions_df["date"].dt.date)["amount"]
-            .sum()
-            .to_dict()
+            curve = RateSeries(np.array([start]), np.array([float(flat_rate)]))
+
+        # Net flow per day: a deposit (negative amount) adds to the balance.
+        flows = pd.Series(-amounts.to_numpy(), index=days).groupby(level=0).sum()
+
+        # Monthly snapshots: every first of the month plus the end date.
+        month_starts = np.arange(
+            start.astype("datetime64[M]"), end.astype("datetime64[M]") + 1
+        ).astype("datetime64[D]")
+        snapshot_days = month_starts[(month_starts >= start) & (month_starts <= end)]
+        if end >= start:
+            snapshot_days = np.union1d(snapshot_days, end)
+        balances = _compounded_balances(
+            curve,
+            flows.index.to_numpy().astype("datetime64[D]"),
+            flows.to_numpy(),
+            snapshot_days,
         )
 
-        # Clear previous calculated snapshots
         self.snapshots_repo.delete_snapshots_for_investment(
-            investment_id, source="calculated"
+            investment_id, source="calculated", commit=False
         )
-
-        # Collect dates with manual/scraped snapshots to avoid overwriting
+        # Dates with manual/scraped snapshots are not overwritten.
         existing_df = self.snapshots_repo.get_snapshots_for_investment(investment_id)
-        protected_dates: set = set()
+        snapshots = pd.DataFrame(
+            {"date": snapshot_days.astype(str), "balance": np.round(balances, 2)}
+        )
         if not existing_df.empty:
-            protected_dates = set(existing_df["date"].tolist())
-
-        # Simulate daily compounding, advancing along the rate curve
-        balance = 0.0
-        current = start
-        daily_rate = rate_curve[0][1]
-        next_step = 1
-
-        while current <= end:
-            # Pick up rate steps that have come into effect
-            while next_step < len(rate_curve) and rate_curve[next_step][0] <= current:
-                daily_rate = rate_curve[next_step][1]
-                next_step += 1
-
-            # Apply transactions for this day (negative = deposit adds to balance)
-            if current in txn_by_date:
-                balance -= txn_by_date[current]  # negate: deposit(-1000) -> +1000
-
-            # Apply daily interest
-            if balance > 0:
-                balance *= 1 + daily_rate
-
-            # Store monthly snapshots (first of month or end date)
-            date_str = current.strftime("%Y-%m-%d")
-            if (current.day == 1 or current == end) and date_str not in protected_dates:
-                self.snapshots_repo.upsert_snapshot(
-                    investment_id,
-                    date_str,
-                    round(balance, 2),
-                    "calculated",
-                )
-
-            current += timedelta(days=1)
-
-    def recalculate_prime_linked_snapshots(self) -> int:
-        """Regenerate calculated snapshots for every open prime-linked investment.
-
-        Called after a Bank of Israel rate refresh appends a new decision,
-        so prime-linked balances pick up the change without waiting for the
-        next manual recalculation.
+            kept = existing_df.loc[existing_df["source"] != "calculated", "date"]
+            snapshots = snapshots[~snapshots["date"].isin(kept)]
+        self.snapshots_repo.upsert_snapshots(
+            investment_id, snapshots, source="calculated", commit=False
+        )
 
-        Returns
-        -------
-        int
-            Number of investments recalculated.
-        """
-        df = self.investments_repo.get_all_investments(include_closed=False)
-        if df.empty or "interest_rate_type" not in df.columns:
-            return 0
 
-        prime_linked = df[df["interest_rate_type"] == "prime_linked"]
-        for _, row in prime_linked.iterrows():
-            self.calculate_fixed_rate_snapshots(int(row["id"]))
-        return len(prime_linked)
+def _compounded_balances(
+    curve: RateSeries,
+    flow_days: np.ndarray,
+    flows: np.ndarray,
+    days: np.ndarray,
+) -> np.ndarray:
+    """Balance at the end of each of ``days`` under daily compounding.
+
+    Each flow is added at the start of its day; the day's interest
+    (``curve``'s rate compounded daily) then accrues only if the balance
+    is positive, so a non-positive balance stays flat until the next flow.
+
+    While the balance stays positive it is the cumulative sum of the
+    flows, each discounted by the growth accrued before it, re-grown to
+    the current day — one ``cumsum`` over all flows. Only the flows where
+    the balance turns non-positive restart that sum.
+
+    Parameters
+    ----------
+    curve : RateSeries
+        Annual rate step function covering the first flow day.
+    flow_days : np.ndarray
+        Ascending, unique ``datetime64[D]`` days with a flow.
+    flows : np.ndarray
+        Net amount added on each flow day.
+    days : np.ndarray
+        ``datetime64[D]`` days to report, none before the first flow.
+
+    Returns
+    -------
+    np.ndarray
+        Balance per day in ``days``.
+    """
+    growth = curve.log_growth(flow_days)
+    after_flow = np.empty(len(flows))
+    carried = 0.0
+    first = 0
+    while first < len(flows):
+        # Balance right after each flow, assuming it stays positive.
+        base = growth[first]
+        discounted = carried + np.cumsum(flows[first:] * np.exp(base - growth[first:]))
+        candidate = discounted * np.exp(growth[first:] - base)
+        non_positive = np.flatnonzero(candidate <= 0)
+        last = len(candidate) if not len(non_positive) else non_positive[0] + 1
+        after_flow[first:first + last] = candidate[:last]
+        # A non-positive balance earns nothing until the next flow.
+        carried = candidate[last - 1]
+        first += last
+
+    current = np.searchsorted(flow_days, days, side="right") - 1
+    balance = after_flow[current]
+    elapsed = np.exp(curve.log_growth(days + 1) - growth[current])
+    return np.where(balance > 0, balance * elapsed, balance)
@@ -7,14 +7,15 @@ metrics, portfolio aggregations, and the shared transaction-fetch helpers.
 Mixed into ``InvestmentsService`` (see ``core.py``).
 """
 
-from bisect import bisect_right
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
-from sqlalchemy import select
 
-from backend.models.transaction import InsuranceTransaction
+from backend.repositories.investment_snapshots_repository import SnapshotArrays
+from backend.utils.session_cache import session_memoized
+from backend.utils.time_series import sum_series
 
 
 class ValuationMixin:
@@ -47,11 +48,9 @@ class ValuationMixin:
             return 0.0
 
         # Try snapshot first
-        latest = self.snapshots_repo.get_latest_snapshot_on_or_before(
-            investment_id, date.today().strftime("%Y-%m-%d")
-        )
+        latest = self._latest_snapshot_balance(investment_id)
         if latest is not None:
-            return float(latest["balance"])
+            return latest
 
         # Fall back to transaction-based
         transactions_df = self._get_all_transactions_for_investment(
@@ -86,17 +85,17 @@ class ValuationMixin:
         """Snapshot-resolved total portfolio value at many dates in one pass.
 
         Equivalent to calling :meth:`get_total_value_at_date` for each date,
-        but fetches every investment's snapshots and transactions **once**
-        instead of once per date. This turns the net-worth-over-time chart
-        (which values the portfolio at each month end) from an O(months ×
-        investments) database walk into O(investments) — the per-month
-        resolution then happens in-memory.
+        but fetches every investment's snapshots in **one** query and each
+        investment's transactions at most once, instead of once per date.
+        This turns the net-worth-over-time chart (which values the portfolio
+        at each month end) from an O(months × investments) database walk
+        into one snapshot query plus in-memory lookups.
 
         Per investment and per date the resolution is identical to the
         single-date method: the latest snapshot on or before the date if one
-        exists (snapshots are unique per ``(investment, date)`` and stored as
-        ``YYYY-MM-DD`` strings, so an ordered lexical search is exact),
-        otherwise the transaction-based ``-sum(amounts up to the date)``.
+        exists (snapshots are unique per ``(investment, date)``, so a
+        sorted search over the dates is exact), otherwise the
+        transaction-based ``-sum(amounts up to the date)``.
 
         Parameters
         ----------
@@ -117,31 +116,27 @@ class ValuationMixin:
         if investments.empty:
             return totals
 
+        targets = np.array(target_dates, dtype="datetime64[D]")
+        running = np.zeros(len(targets))
+        snapshots = self.snapshots_repo.get_snapshot_arrays()
         for _, inv in investments.iterrows():
             inv_id = int(inv["id"])
-            snapshots = self.snapshots_repo.get_snapshots_for_investment(inv_id)
-            snapshot_dates = snapshots["date"].tolist() if not snapshots.empty else []
-            snapshot_balances = (
-                snapshots["balance"].tolist() if not snapshots.empty else []
-            )
+            values, covered = _latest_on_or_before(snapshots.get(inv_id), targets)
 
             # Transactions are only needed for dates with no preceding
             # snapshot; fetch lazily so investments fully covered by snapshots
             # never touch the transactions table.
-            txns = None
-            for target_date in target_dates:
-                idx = bisect_right(snapshot_dates, target_date) - 1
-                if idx >= 0:
-                    totals[target_date] += float(snapshot_balances[idx])
-                    continue
-                if txns is None:
-                    txns = self._get_all_transactions_for_investment(
-                        inv["category"], inv["tag"], investment_id=inv_id
-                    )
-                totals[target_date] += self._calculate_balance_from_transactions(
-                    txns, as_of_date=target_date
+            uncovered = np.flatnonzero(~covered)
+            if len(uncovered):
+                txns = self._get_all_transactions_for_investment(
+                    inv["category"], inv["tag"], investment_id=inv_id
                 )
-        return totals
+                for position in uncovered.tolist():
+                    values[position] = self._calculate_balance_from_transactions(
+                        txns, as_of_date=target_dates[position]
+                    )
+            running += values
+        return dict(zip(target_dates, running.tolist()))
 
     def calculate_balance_over_time(
         self, investment_id: int, start_date: str, end_date: str
@@ -182,9 +177,9 @@ class ValuationMixin:
             inv["category"], inv["tag"], investment_id=investment_id
         )
 
-        snapshots_df = self.snapshots_repo.get_snapshots_for_investment(investment_id)
+        snapshots = self.snapshots_repo.get_snapshot_arrays().get(int(investment_id))
 
-        if transactions_df.empty and snapshots_df.empty:
+        if transactions_df.empty and snapshots is None:
             return []
 
         # For closed investments, stop at the last transaction date
@@ -204,55 +199,50 @@ class ValuationMixin:
             sample_dates = sample_dates.union(
                 txn_dates[(txn_dates >= start_ts) & (txn_dates <= end_ts)]
             )
-        if not snapshots_df.empty:
-            snap_dates = pd.to_datetime(snapshots_df["date"])
+        if snapshots is not None:
+            snap_dates = pd.DatetimeIndex(snapshots.dates.astype("datetime64[ns]"))
             sample_dates = sample_dates.union(
                 snap_dates[(snap_dates >= start_ts) & (snap_dates <= end_ts)]
             )
 
-        if snapshots_df.empty:
-            balances = [
+        sample_strs = sample_dates.strftime("%Y-%m-%d").tolist()
+        if snapshots is None:
+            return [
                 {
-                    "date": d.strftime("%Y-%m-%d"),
+                    "date": d_str,
                     "balance": self._calculate_balance_from_transactions(
-                        transactions_df, as_of_date=d.strftime("%Y-%m-%d")
+                        transactions_df, as_of_date=d_str
                     ),
                 }
-                for d in sample_dates
+                for d_str in sample_strs
             ]
-        else:
-            snapshots_df = snapshots_df.copy()
-            snapshots_df["date"] = pd.to_datetime(snapshots_df["date"])
-            snapshots_df = snapshots_df.sort_values("date")
-
-            balances = []
-            for d in sample_dates:
-                d_str = d.strftime("%Y-%m-%d")
-                before = snapshots_df[snapshots_df["date"] <= d]
-                after = snapshots_df[snapshots_df["date"] >= d]
-
-                if not before.empty and not after.empty:
-                    prev = before.iloc[-1]
-                    nxt = after.iloc[0]
-
-                    if prev["date"] == nxt["date"]:
-                        balance = float(prev["balance"])
-                    else:
-                        total_days = (nxt["date"] - prev["date"]).days
-                        elapsed_days = (d - prev["date"]).days
-                        frac = elapsed_days / total_days if total_days > 0 else 0
-                        balance = float(prev["balance"]) + frac * (
-                            float(nxt["balance"]) - float(prev["balance"])
-                        )
-                elif not before.empty:
-                    balance = float(before.iloc[-1]["balance"])
-                else:
-                    balance = self._calculate_balance_from_transactions(
-                        transactions_df, as_of_date=d_str
-                    )
-
-                balances.append({"date": d_str, "balance": balance})
 
+        # Linear interpolation between the snapshots around each sample;
+        # the latest snapshot holds after the last one, and dates before
+        # the first snapshot fall back to the transaction-based balance.
+        days = sample_dates.to_numpy().astype("datetime64[D]")
+        last = len(snapshots.dates) - 1
+        prev = np.searchsorted(snapshots.dates, days, side="right") - 1
+        nxt = np.searchsorted(snapshots.dates, days, side="left")
+        has_prev = prev >= 0
+        prev, nxt = np.maximum(prev, 0), np.minimum(nxt, last)
+        prev_balance = snapshots.balances[prev]
+        next_balance = snapshots.balances[nxt]
+        total_days = (snapshots.dates[nxt] - snapshots.dates[prev]).astype(np.int64)
+        elapsed_days = (days - snapshots.dates[prev]).astype(np.int64)
+        frac = np.divide(
+            elapsed_days, total_days, out=np.zeros(len(days)), where=total_days > 0
+        )
+        interpolated = prev_balance + frac * (next_balance - prev_balance)
+        values = np.where(has_prev & (days <= snapshots.dates[last]), interpolated, prev_balance)
+
+        balances = []
+        for d_str, value, known in zip(sample_strs, values.tolist(), has_prev.tolist()):
+            if not known:
+                value = self._calculate_balance_from_transactions(
+                    transactions_df, as_of_date=d_str
+                )
+            balances.append({"date": d_str, "balance": value})
         return balances
 
     def calculate_profit_loss(self, investment_id: int) -> Dict[str, Any]:
@@ -291,11 +281,8 @@ class ValuationMixin:
         if transactions_df.empty:
             # No transactions — check if there's a snapshot (e.g. insurance-synced)
             if not inv["is_closed"]:
-                latest = self.snapshots_repo.get_latest_snapshot_on_or_before(
-                    investment_id, date.today().strftime("%Y-%m-%d")
-                )
-                if latest is not None:
-                    balance = float(latest["balance"])
+                balance = self._latest_snapshot_balance(investment_id)
+                if balance is not None:
                     return {
                         "total_deposits": 0.0,
                         "total_withdrawals": 0.0,
@@ -339,11 +326,9 @@ class ValuationMixin:
             absolute_profit_loss = total_withdrawals - total_deposits
         else:
             # Try snapshot first, fall back to transaction-based
-            latest = self.snapshots_repo.get_latest_snapshot_on_or_before(
-                investment_id, date.today().strftime("%Y-%m-%d")
-            )
+            latest = self._latest_snapshot_balance(investment_id)
             if latest is not None:
-                current_balance = float(latest["balance"])
+                current_balance = latest
             else:
                 current_balance = self._calculate_balance_from_transactions(transactions_df)
             absolute_profit_loss = current_balance - net_invested
@@ -535,24 +520,7 @@ class ValuationMixin:
             )
 
         # Build total line aligned across all dates
-        all_dates: set = set()
-        for s in all_series:
-            for point in s["data"]:
-                all_dates.add(point["date"])
-        sorted_dates = sorted(all_dates)
-
-        total = []
-        for d in sorted_dates:
-            balance_sum = 0.0
-            for s in all_series:
-                # Find latest point on or before this date for this series
-                latest_balance = 0.0
-                for point in s["data"]:
-                    if point["date"] <= d:
-                        latest_balance = point["balance"]
-                total_balance = latest_balance
-                balance_sum += total_balance
-            total.append({"date": d, "balance": balance_sum})
+        total = sum_series([s["data"] for s in all_series])
 
         return {"series": all_series, "total": total}
 
@@ -568,35 +536,80 @@ class ValuationMixin:
         Returns
         -------
         pd.DataFrame
-            Combined transactions with a parsed ``date_parsed`` column and
-            numeric ``amount``.  Empty DataFrame if no investments exist.
+            Combined transactions with ``investment_id``, a parsed
+            ``date_parsed`` column and numeric ``amount``.  Empty DataFrame
+            if no investments exist.
         """
         investments = self.investments_repo.get_all_investments(include_closed=include_closed)
         if investments.empty:
             return pd.DataFrame()
 
-        frames = []
-        for _, inv in investments.iterrows():
-            txns = self._get_all_transactions_for_investment(inv["category"], inv["tag"], investment_id=int(inv["id"]))
-            if not txns.empty:
-                frames.append(txns)
-
-        if not frames:
+        combined = self._get_transactions_by_investment()
+        combined = combined[combined["investment_id"].isin(investments["id"])]
+        if combined.empty:
             return pd.DataFrame()
 
-        combined = pd.concat(frames, ignore_index=True)
+        combined = combined.reset_index(drop=True)
         combined["date_parsed"] = pd.to_datetime(combined["date"])
         combined["amount"] = pd.to_numeric(combined["amount"], errors="coerce").fillna(0.0)
         return combined
 
+    @session_memoized("investments.transactions_by_investment")
+    def _get_transactions_by_investment(self) -> pd.DataFrame:
+        """Load every investment's transactions at once.
+
+        Tagged transactions come from one join of the investments to the
+        (session-cached) merged analysis table on ``(category, tag)``;
+        insurance deposits of linked funds from one SQL join, with their
+        amounts negated to the investment convention (negative = deposit).
+
+        Returns
+        -------
+        pd.DataFrame
+            ``investment_id`` plus the analysis columns, grouped by
+            investment (tagged rows first, then insurance rows, each in
+            source order).
+        """
+        investments = self.investments_repo.get_all_investments(include_closed=True)
+        analysis = self.transactions_service.get_data_for_analysis()
+        columns = ["investment_id", *analysis.columns]
+        if investments.empty:
+            return pd.DataFrame(columns=columns)
+
+        frames = []
+        if not analysis.empty:
+            keys = investments[["id", "category", "tag"]].rename(columns={"id": "investment_id"})
+            # An investment without a tag claims its whole category.
+            tagged = keys[keys["tag"].notna() & keys["tag"].astype(bool)]
+            untagged = keys.drop(tagged.index).drop(columns="tag")
+            frames += [
+                analysis.merge(tagged, on=["category", "tag"], how="inner"),
+                analysis.merge(untagged, on="category", how="inner"),
+            ]
+
+        insurance = self.investments_repo.get_linked_insurance_transactions()
+        if not insurance.empty:
+            # Insurance deposits are stored positive (money received by the
+            # fund); the investment convention is negative = deposit.
+            insurance["amount"] = -insurance["amount"]
+            frames.append(insurance[[c for c in columns if c in insurance.columns]])
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        combined = pd.concat(frames, ignore_index=True).reindex(columns=columns)
+        return combined.sort_values("investment_id", kind="stable", ignore_index=True)
+
     def _get_all_transactions_for_investment(
         self, category: str, tag: str, investment_id: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Fetch all transactions for a given investment identified by category and tag.
 
-        For insurance-linked investments, also includes insurance deposit
-        transactions (with amounts negated to match the investment convention:
+        With ``investment_id``, reads the investment's slice of
+        :meth:`_get_transactions_by_investment`, which also includes
+        insurance deposit transactions for insurance-linked investments
+        (with amounts negated to match the investment convention:
         negative = deposit).
 
         Parameters
@@ -613,36 +626,23 @@ class ValuationMixin:
         pd.DataFrame
             Matching transactions from the merged analysis table.
         """
-        manual_txns = self.transactions_service.get_transactions_by_tag(category, tag)
-
         if investment_id is None:
-            return manual_txns
-
-        inv_df = self.investments_repo.get_by_id(investment_id)
-        policy_id = inv_df.iloc[0].get("insurance_policy_id")
-        if not policy_id or pd.isna(policy_id):
-            return manual_txns
-
-        stmt = select(InsuranceTransaction).where(
-            InsuranceTransaction.account_number == policy_id
-        )
-        ins_txns = pd.read_sql(stmt, self.db.bind)
+            return self.transactions_service.get_transactions_by_tag(category, tag)
 
-        if ins_txns.empty:
-            return manual_txns
+        combined = self._get_transactions_by_investment()
+        rows = combined[combined["investment_id"] == int(investment_id)]
+        return rows.drop(columns="investment_id").reset_index(drop=True)
 
-        # Negate amounts: insurance txns are positive (deposits received),
-        # but investment convention is negative = deposit (money out)
-        ins_txns["amount"] = -ins_txns["amount"]
+    def _latest_snapshot_balance(self, investment_id: int) -> Optional[float]:
+        """Balance of the investment's latest snapshot up to today, if any.
 
-        if manual_txns.empty:
-            return ins_txns
-
-        # Preserve manual_txns column order so downstream code sees a stable schema
-        common_cols = [c for c in manual_txns.columns if c in ins_txns.columns]
-        return pd.concat(
-            [manual_txns[common_cols], ins_txns[common_cols]], ignore_index=True
-        )
+        Reads the request's shared bulk snapshot load instead of issuing a
+        query per investment.
+        """
+        snapshots = self.snapshots_repo.get_snapshot_arrays().get(int(investment_id))
+        today = np.array([date.today().isoformat()], dtype="datetime64[D]")
+        values, covered = _latest_on_or_before(snapshots, today)
+        return float(values[0]) if covered[0] else None
 
     def _calculate_balance_from_transactions(
         self, transactions_df: pd.DataFrame, as_of_date: Optional[str] = None
@@ -681,3 +681,28 @@ class ValuationMixin:
         balance = -filtered_df.loc[:, "amount"].sum()
 
         return float(balance)
+
+
+def _latest_on_or_before(
+    snapshots: Optional[SnapshotArrays], days: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Latest snapshot balance on or before each of ``days``.
+
+    Parameters
+    ----------
+    snapshots : SnapshotArrays or None
+        One investment's snapshots (``None`` when it has none).
+    days : np.ndarray
+        ``datetime64[D]`` dates to resolve.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Balance per day (``0.0`` where uncovered) and a mask of the days
+        that have a snapshot on or before them.
+    """
+    if snapshots is None:
+        return np.zeros(len(days)), np.zeros(len(days), dtype=bool)
+    idx = np.searchsorted(snapshots.dates, days, side="right") - 1
+    covered = idx >= 0
+    return np.where(covered, snapshots.balances[np.maximum(idx, 0)], 0.0), covered
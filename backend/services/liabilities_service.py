@@ -11,6 +11,7 @@ comparison against actual transactions.
 from datetime import date
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
@@ -19,13 +20,22 @@ from backend.constants.loans import (
     AmortizationMethod,
     LoanType,
     PRIME_BASED_LOAN_TYPES,
+    PRIME_SERIES,
 )
 from backend.constants.tables import LiabilityTransactionsTableFields as LTF
 from backend.constants.tables import Tables
 from backend.errors import ValidationException
 from backend.repositories.liabilities_repository import LiabilitiesRepository
 from backend.repositories.transactions_repository import TransactionsRepository
+from backend.services.amortization import (
+    AmortizationSchedule,
+    compute_schedule,
+    payment_dates,
+)
+from backend.services.rate_series import RateSeries
 from backend.services.rates_service import RatesService
+from backend.utils.session_cache import session_memoized
+from backend.utils.time_series import sum_series
 
 
 def _optional_number(value: Any) -> Optional[float]:
@@ -64,15 +74,119 @@ class LiabilitiesService:
         """
         Fetch all transactions in the Liabilities category.
 
+        The category filter runs in SQL (see
+        ``TransactionsRepository.get_category_transactions``), so the rest
+        of the merged transaction table is never loaded.
+
         Returns
         -------
         pd.DataFrame
-            Filtered transactions, or an empty DataFrame if none exist.
+            Filtered transactions with a numeric ``amount``, or an empty
+            DataFrame if none exist.
         """
-        all_txns = self.transactions_repo.get_table()
-        if all_txns.empty:
+        df = self.transactions_repo.get_category_transactions(LIABILITIES_CATEGORY)
+        if df.empty:
             return pd.DataFrame()
-        return all_txns[all_txns["category"] == LIABILITIES_CATEGORY].copy()
+        df["amount"] = pd.to_numeric(df["amount"], errors="coerce").fillna(0.0)
+        return df
+
+    @session_memoized("liabilities.payments")
+    def _get_payments(self) -> pd.DataFrame:
+        """Collect the payments of every liability into one frame.
+
+        Payments are negative Liabilities-category transactions matched to a
+        liability by tag, plus the liability's auto-generated transactions.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per payment with ``liability_id``, ``date``
+            (``YYYY-MM-DD``), ``amount`` (negative), ``generated`` (bool),
+            ``seq`` (1-based position among all of the liability's payments
+            by date) and ``real_seq`` (position among its non-generated
+            payments; ``0`` for generated rows). Sorted by liability and date.
+        """
+        columns = ["liability_id", "date", "amount", "generated"]
+        frames = []
+
+        liabilities = self.liabilities_repo.get_all_liabilities(include_paid_off=True)
+        txns = self._get_liability_category_transactions()
+        if not liabilities.empty and not txns.empty:
+            tags = liabilities.loc[
+                liabilities["tag"].fillna("").astype(bool), ["id", "tag"]
+            ].rename(columns={"id": "liability_id"})
+            real = txns.loc[txns["amount"] < 0, ["tag", "date", "amount"]].merge(tags, on="tag")
+            real["generated"] = False
+            frames.append(real[columns])
+
+        generated = self.liabilities_repo.get_all_liability_transactions()
+        generated = generated[generated["amount"] < 0].copy()
+        generated["generated"] = True
+        frames.append(generated[columns])
+
+        frames = [f for f in frames if not f.empty]
+        payments = (
+            pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=columns)
+        )
+        payments["date"] = payments["date"].astype(str).str[:10]
+        payments["amount"] = payments["amount"].astype(float)
+        payments = payments.sort_values(["liability_id", "date"], kind="stable").reset_index(drop=True)
+
+        payments["seq"] = payments.groupby("liability_id").cumcount() + 1
+        real_mask = ~payments["generated"].astype(bool)
+        payments["real_seq"] = 0
+        payments.loc[real_mask, "real_seq"] = (
+            payments[real_mask].groupby("liability_id").cumcount() + 1
+        )
+        return payments
+
+    @session_memoized("liabilities.actual_vs_expected")
+    def _get_actual_vs_expected(self) -> pd.DataFrame:
+        """Compare actual payments to the schedule, month by month, for every liability.
+
+        Covers each liability's scheduled payments up to and including the
+        current month. Actual payments (real and generated) are summed per
+        ``YYYY-MM``.
+
+        Returns
+        -------
+        pd.DataFrame
+            Columns ``liability_id``, ``date``, ``expected_payment``,
+            ``actual_payment`` and ``difference``, ordered by liability and
+            date.
+        """
+        columns = ["liability_id", "date", "expected_payment", "actual_payment", "difference"]
+        liabilities = self.liabilities_repo.get_all_liabilities(include_paid_off=True)
+        if liabilities.empty:
+            return pd.DataFrame(columns=columns)
+
+        current_month = date.today().strftime("%Y-%m")
+        frames = []
+        for record in liabilities.to_dict(orient="records"):
+            schedule = self._schedule_for_record(record)
+            due = int(np.searchsorted(schedule.dates.astype("U7"), current_month, side="right"))
+            frames.append(pd.DataFrame({
+                "liability_id": record["id"],
+                "date": schedule.dates[:due],
+                "expected_payment": schedule.payment[:due],
+            }))
+        expected = pd.concat(frames, ignore_index=True)
+        if expected.empty:
+            return pd.DataFrame(columns=columns)
+        expected["month"] = expected["date"].str[:7]
+
+        payments = self._get_payments()
+        actual = (
+            payments.assign(month=payments["date"].str[:7], actual_payment=-payments["amount"])
+            .groupby(["liability_id", "month"], as_index=False)["actual_payment"]
+            .sum()
+        )
+        frame = expected.merge(actual, on=["liability_id", "month"], how="left")
+        frame["actual_payment"] = frame["actual_payment"].fillna(0.0)
+        frame["difference"] = (frame["actual_payment"] - frame["expected_payment"]).round(2)
+        frame["expected_payment"] = frame["expected_payment"].round(2)
+        frame["actual_payment"] = frame["actual_payment"].round(2)
+        return frame[columns]
 
     def get_all_liabilities(self, include_paid_off: bool = False) -> List[Dict[str, Any]]:
         """
@@ -97,11 +211,11 @@ class LiabilitiesService:
         if df.empty:
             return []
 
-        liab_txns = self._get_liability_category_transactions()
+        payments = self._get_payments()
 
         records = df.to_dict(orient="records")
         for record in records:
-            self._enrich_with_calculations(record, liab_txns)
+            self._enrich_with_calculations(record, payments)
 
         return records
 
@@ -120,10 +234,9 @@ class LiabilitiesService:
             Liability record enriched with amortization-based calculations.
         """
         df = self.liabilities_repo.get_by_id(liability_id)
-        liab_txns = self._get_liability_category_transactions()
 
         record = df.iloc[0].to_dict()
-        self._enrich_with_calculations(record, liab_txns)
+        self._enrich_with_calculations(record, self._get_payments())
         return record
 
     def create_liability(
@@ -298,35 +411,37 @@ class LiabilitiesService:
         record = self.get_liability(liability_id)
         transactions = self.get_liability_transactions(liability_id)
 
-        schedule = self._schedule_for_record(record)
+        schedule_arrays = self._schedule_for_record(record)
+        schedule = schedule_arrays.to_records()
 
-        actual_vs_expected = self._compare_actual_vs_expected(schedule, transactions)
+        actual_vs_expected = self._compare_actual_vs_expected(liability_id)
 
         receipts = [t for t in transactions if t["amount"] > 0]
-        payments = [t for t in transactions if t["amount"] < 0]
         total_receipts = sum(t["amount"] for t in receipts)
-        total_payments = sum(abs(t["amount"]) for t in payments)
+        payments = self._get_payments()
+        payments = payments[payments["liability_id"] == liability_id]
+        total_payments = float(-payments["amount"].sum())
 
         num_payments = min(len(payments), len(schedule))
         remaining_balance = (
-            schedule[num_payments - 1]["remaining_balance"]
+            float(schedule_arrays.remaining[num_payments - 1])
             if num_payments > 0
             else record["principal_amount"]
         )
 
         # Interest split: already paid vs projected remaining
-        interest_paid = sum(e["interest_portion"] for e in schedule[:num_payments])
-        interest_remaining = sum(e["interest_portion"] for e in schedule[num_payments:])
+        interest_paid = float(schedule_arrays.interest[:num_payments].sum())
+        interest_remaining = float(schedule_arrays.interest[num_payments:].sum())
         total_interest_cost = interest_paid + interest_remaining
 
         # Next due payment (varies over the schedule for non-fixed loans)
         monthly_payment = (
-            schedule[min(num_payments, len(schedule) - 1)]["payment"]
+            float(schedule_arrays.payment[min(num_payments, len(schedule) - 1)])
             if schedule
             else 0.0
         )
 
-        total_cost = sum(e["payment"] for e in schedule)
+        total_cost = float(schedule_arrays.payment.sum())
         percent_paid = (total_payments / total_cost * 100) if total_cost > 0 else 0.0
 
         summary = {
@@ -458,55 +573,6 @@ class LiabilitiesService:
         combined = combined.where(pd.notnull(combined), None)
         return combined.to_dict(orient="records")
 
-    @staticmethod
-    def _payment_date(start_date: date, months_ahead: int) -> date:
-        """Get the payment date ``months_ahead`` months after ``start_date``.
-
-        Day-of-month is clamped to 28 so every month has a valid date.
-
-        Parameters
-        ----------
-        start_date : date
-            Loan start date.
-        months_ahead : int
-            Number of months to advance.
-
-        Returns
-        -------
-        date
-            The resulting payment date.
-        """
-        safe_day = min(start_date.day, 28)
-        month = start_date.month + months_ahead
-        year = start_date.year + (month - 1) // 12
-        month = ((month - 1) % 12) + 1
-        return date(year, month, safe_day)
-
-    @staticmethod
-    def _annuity_payment(balance: float, monthly_rate: float, months: int) -> float:
-        """Compute the constant annuity payment for the remaining loan.
-
-        Parameters
-        ----------
-        balance : float
-            Outstanding principal.
-        monthly_rate : float
-            Monthly interest rate as a fraction (annual% / 100 / 12).
-        months : int
-            Remaining number of payments.
-
-        Returns
-        -------
-        float
-            The per-period payment amount.
-        """
-        if months <= 0:
-            return balance
-        if monthly_rate == 0:
-            return balance / months
-        factor = (1 + monthly_rate) ** months
-        return balance * monthly_rate * factor / (factor - 1)
-
     @staticmethod
     def calculate_amortization_schedule(
         principal: float,
@@ -525,6 +591,9 @@ class LiabilitiesService:
         payments are re-amortized over the remaining term at the new
         rate — the standard Israeli bank behavior.
 
+        Thin list-of-dicts view over :func:`backend.services.amortization.compute_schedule`;
+        internal callers work on the cached array columns directly.
+
         Parameters
         ----------
         principal : float
@@ -559,63 +628,16 @@ class LiabilitiesService:
             - ``remaining_balance`` – outstanding balance after this payment.
             - ``annual_rate`` – annual rate applied to this payment (%).
         """
-        schedule: List[Dict[str, Any]] = []
-        balance = principal
-        current_rate: Optional[float] = None
-        payment = 0.0
-        fixed_principal_portion = principal / term_months if term_months else 0.0
-
-        for i in range(1, term_months + 1):
-            payment_date = LiabilitiesService._payment_date(start_date, i)
-            date_str = payment_date.strftime("%Y-%m-%d")
-            period_start_str = LiabilitiesService._payment_date(
-                start_date, i - 1
-            ).strftime("%Y-%m-%d")
-
-            rate = annual_rate
-            if rate_steps:
-                for step in rate_steps:
-                    if step["date"] <= period_start_str:
-                        rate = step["value"]
-                    else:
-                        break
-            monthly_rate = rate / 100.0 / 12.0
-
-            interest_portion = balance * monthly_rate
-
-            if amortization_method == AmortizationMethod.EQUAL_PRINCIPAL.value:
-                principal_portion = min(fixed_principal_portion, balance)
-                payment = principal_portion + interest_portion
-            elif amortization_method == AmortizationMethod.BALLOON.value:
-                principal_portion = balance if i == term_months else 0.0
-                payment = interest_portion + principal_portion
-            else:  # Shpitzer — re-amortize whenever the rate changes
-                if current_rate is None or rate != current_rate:
-                    remaining_months = term_months - i + 1
-                    payment = LiabilitiesService._annuity_payment(
-                        balance, monthly_rate, remaining_months
-                    )
-                    current_rate = rate
-                principal_portion = payment - interest_portion
-                if i == term_months or principal_portion > balance:
-                    principal_portion = balance
-                    payment = principal_portion + interest_portion
-
-            balance = max(balance - principal_portion, 0.0)
-
-            schedule.append({
-                "payment_number": i,
-                "date": date_str,
-                "payment": round(payment, 2),
-                "principal_portion": round(principal_portion, 2),
-                "interest_portion": round(interest_portion, 2),
-                "remaining_balance": round(balance, 2),
-                "annual_rate": round(rate, 4),
-            })
-
-        return schedule
-
-    def _get_rate_steps(self, record: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        return compute_schedule(
+            float(principal),
+            float(annual_rate),
+            int(term_months),
+            start_date,
+            amortization_method,
+            RateSeries.from_records(rate_steps) if rate_steps else None,
+        ).to_records()
+
+    def _get_rate_steps(self, record: Dict[str, Any]) -> Optional[RateSeries]:
         """Build the piecewise annual-rate curve for a liability record.
 
         Fixed-rate loans return ``None`` (flat ``interest_rate`` applies).
@@ -631,9 +653,8 @@ class LiabilitiesService:
 
         Returns
         -------
-        list[dict] or None
-            Rate steps with ``date`` and ``value``, or ``None`` for a
-            flat-rate schedule.
+        RateSeries or None
+            The loan's rate curve, or ``None`` for a flat-rate schedule.
         """
         loan_type = record.get("loan_type") or LoanType.FIXED_UNLINKED.value
         if loan_type not in PRIME_BASED_LOAN_TYPES:
@@ -641,37 +662,25 @@ class LiabilitiesService:
 
         start_date_str = str(record["start_date"])
         spread = _optional_number(record.get("rate_spread")) or 0.0
-        prime_steps = self.rates_service.get_prime_steps(start_date_str)
-        if not prime_steps:
+        prime = self.rates_service.get_series(PRIME_SERIES)
+        if not len(prime):
             return None
+        curve = prime.anchored(start_date_str).shifted(spread)
 
         if loan_type == LoanType.PRIME_LINKED.value:
-            return [
-                {"date": s["date"], "value": round(s["value"] + spread, 4)}
-                for s in prime_steps
-            ]
+            return curve
 
         # Variable: rate locks at each reset date until the next reset.
         reset_months = int(
             _optional_number(record.get("rate_reset_months")) or 12
         )
-        start = date.fromisoformat(start_date_str)
         term_months = int(record["term_months"])
-        steps = []
-        for offset in range(0, term_months, reset_months):
-            reset_date = self._payment_date(start, offset).strftime("%Y-%m-%d")
-            prime = None
-            for s in prime_steps:
-                if s["date"] <= reset_date:
-                    prime = s["value"]
-                else:
-                    break
-            if prime is None:
-                prime = prime_steps[0]["value"]
-            steps.append({"date": reset_date, "value": round(prime + spread, 4)})
-        return steps
-
-    def _schedule_for_record(self, record: Dict[str, Any]) -> List[Dict[str, Any]]:
+        reset_dates = payment_dates(date.fromisoformat(start_date_str), term_months)[
+            0:term_months:reset_months
+        ]
+        return curve.sampled(reset_dates)
+
+    def _schedule_for_record(self, record: Dict[str, Any]) -> AmortizationSchedule:
         """Build the amortization schedule for a liability record.
 
         Parameters
@@ -681,21 +690,20 @@ class LiabilitiesService:
 
         Returns
         -------
-        list[dict]
-            Schedule entries from :meth:`calculate_amortization_schedule`.
-        """
-        return self.calculate_amortization_schedule(
-            principal=record["principal_amount"],
-            annual_rate=_optional_number(record.get("interest_rate")) or 0.0,
-            term_months=int(record["term_months"]),
-            start_date=date.fromisoformat(str(record["start_date"])),
-            amortization_method=record.get("amortization_method")
-            or AmortizationMethod.SHPITZER.value,
-            rate_steps=self._get_rate_steps(record),
+        AmortizationSchedule
+            Cached schedule columns from :func:`compute_schedule`.
+        """
+        return compute_schedule(
+            float(record["principal_amount"]),
+            _optional_number(record.get("interest_rate")) or 0.0,
+            int(record["term_months"]),
+            date.fromisoformat(str(record["start_date"])),
+            record.get("amortization_method") or AmortizationMethod.SHPITZER.value,
+            self._get_rate_steps(record),
         )
 
     def _enrich_with_calculations(
-        self, record: Dict[str, Any], liab_txns: pd.DataFrame
+        self, record: Dict[str, Any], payments: pd.DataFrame
     ) -> None:
         """
         Enrich a liability record with amortization-based calculated fields.
@@ -712,8 +720,10 @@ class LiabilitiesService:
         ----------
         record : dict
             Liability record dict to enrich (modified in-place).
-        liab_txns : pd.DataFrame
-            All transactions with ``category == LIABILITIES_CATEGORY``.
+        payments : pd.DataFrame
+            All liabilities' payments from :meth:`_get_payments`. Only
+            non-generated payments count toward ``total_paid`` and
+            ``payments_made``.
         """
         record["loan_type"] = record.get("loan_type") or LoanType.FIXED_UNLINKED.value
         record["amortization_method"] = (
@@ -726,42 +736,37 @@ class LiabilitiesService:
         principal = record["principal_amount"]
         schedule = self._schedule_for_record(record)
 
-        total_interest = round(sum(e["interest_portion"] for e in schedule), 2)
-        total_cost = sum(e["payment"] for e in schedule)
+        total_interest = round(float(schedule.interest.sum()), 2)
+        total_cost = float(schedule.payment.sum())
 
-        tag = record.get("tag", "")
-        if not liab_txns.empty and tag:
-            tag_txns = liab_txns[liab_txns["tag"] == tag].copy()
-            tag_txns["amount"] = pd.to_numeric(tag_txns["amount"], errors="coerce").fillna(0.0)
-            payments = tag_txns[tag_txns["amount"] < 0]
-            total_paid = float(abs(payments["amount"].sum()))
-            payment_count = len(payments)
-        else:
-            total_paid = 0.0
-            payment_count = 0
+        own = payments[
+            (payments["liability_id"] == record["id"]) & ~payments["generated"].astype(bool)
+        ]
+        total_paid = float(abs(own["amount"].sum()))
+        payment_count = len(own)
 
         schedule_pos = min(payment_count, len(schedule))
         remaining_balance = (
-            schedule[schedule_pos - 1]["remaining_balance"]
+            float(schedule.remaining[schedule_pos - 1])
             if schedule_pos > 0
             else principal
         )
 
         # Next due payment (varies over the schedule for non-fixed loans)
         monthly_payment = (
-            schedule[min(schedule_pos, len(schedule) - 1)]["payment"]
-            if schedule
+            float(schedule.payment[min(schedule_pos, len(schedule) - 1)])
+            if len(schedule)
             else 0.0
         )
 
         # Effective annual rate today (last schedule entry not in the future)
         today_str = date.today().strftime("%Y-%m-%d")
-        current_rate = _optional_number(record.get("interest_rate")) or 0.0
-        for entry in schedule:
-            if entry["date"] <= today_str:
-                current_rate = entry["annual_rate"]
-            else:
-                break
+        elapsed = int(np.searchsorted(schedule.dates, today_str, side="right"))
+        current_rate = (
+            float(schedule.annual_rate[elapsed - 1])
+            if elapsed
+            else _optional_number(record.get("interest_rate")) or 0.0
+        )
 
         percent_paid = (total_paid / total_cost * 100) if total_cost > 0 else 0.0
 
@@ -790,49 +795,50 @@ class LiabilitiesService:
         if df.empty:
             return {"series": [], "total": []}
 
-        liab_txns = self._get_liability_category_transactions()
-        if not liab_txns.empty:
-            liab_txns["amount"] = pd.to_numeric(liab_txns["amount"], errors="coerce").fillna(0.0)
+        # Map the k-th payment of each liability onto schedule row k (capped
+        # at the last row) in one gather over the concatenated schedules.
+        records = df.to_dict(orient="records")
+        schedules = [self._schedule_for_record(record) for record in records]
+        lengths = np.array([len(schedule) for schedule in schedules])
+        offsets = dict(zip((int(r["id"]) for r in records), np.r_[0, np.cumsum(lengths)[:-1]].tolist()))
+        sizes = dict(zip((int(r["id"]) for r in records), lengths.tolist()))
+        remaining = np.concatenate([schedule.remaining for schedule in schedules] + [np.zeros(1)])
+
+        payments = self._get_payments()
+        payments = payments[
+            ~payments["generated"].astype(bool) & payments["liability_id"].isin(offsets)
+        ]
+        liability_ids = payments["liability_id"].astype(int)
+        size = liability_ids.map(sizes).to_numpy()
+        pos = np.minimum(payments["real_seq"].to_numpy(), size)
+        flat = liability_ids.map(offsets).to_numpy() + pos - 1
+        balances = np.where(pos > 0, remaining[np.maximum(flat, 0)], np.nan)
+        points_by_id = {
+            liability_id: group
+            for liability_id, group in pd.DataFrame({
+                "liability_id": liability_ids.to_numpy(),
+                "date": payments["date"].to_numpy(),
+                "balance": balances,
+            }).groupby("liability_id")
+        }
 
         series = []
-        for _, row in df.iterrows():
-            record = row.to_dict()
-            tag = record["tag"]
+        for record in records:
             principal = float(record["principal_amount"])
-            schedule = self._schedule_for_record(record)
             points = [{"date": record["start_date"], "balance": principal}]
-
-            if not liab_txns.empty and tag:
-                payments = liab_txns[
-                    (liab_txns["tag"] == tag) & (liab_txns["amount"] < 0)
-                ].sort_values("date")
-
-                for k, (_, txn) in enumerate(payments.iterrows(), start=1):
-                    pos = min(k, len(schedule))
-                    balance = (
-                        schedule[pos - 1]["remaining_balance"] if pos > 0 else principal
-                    )
-                    points.append({
-                        "date": str(txn["date"])[:10],
-                        "balance": balance,
-                    })
-
+            group = points_by_id.get(int(record["id"]))
+            if group is not None:
+                points.extend(
+                    {"date": d, "balance": principal if np.isnan(b) else float(b)}
+                    for d, b in zip(group["date"].tolist(), group["balance"].tolist())
+                )
             series.append({"name": record["name"], "points": points})
 
         # Build total line using last-known balance per liability at each date
-        all_dates = sorted({p["date"] for s in series for p in s["points"]})
-        total = []
-        for d in all_dates:
-            total_balance = 0.0
-            for s in series:
-                last_balance = 0.0
-                for p in s["points"]:
-                    if p["date"] <= d:
-                        last_balance = p["balance"]
-                    else:
-                        break
-                total_balance += last_balance
-            total.append({"date": d, "balance": round(total_balance, 2)})
+        total = [
+            {"date": p["date"], "balance": round(p["balance"], 2)}
+            for p in sum_series([s["points"] for s in series])
+        ]
 
         return {"series": series, "total": total}
 
@@ -854,14 +860,13 @@ class LiabilitiesService:
         """
         record = self.get_liability(liability_id)
 
-        schedule = self._schedule_for_record(record)
+        schedule = self._schedule_for_record(record).to_records()
 
         # Get existing payment months from all sources (real + generated)
-        transactions = self.get_liability_transactions(liability_id, tag=record.get("tag"))
-        existing_months = set()
-        for txn in transactions:
-            if txn.get("amount") is not None and txn["amount"] < 0:
-                existing_months.add(str(txn["date"])[:7])
+        payments = self._get_payments()
+        existing_months = set(
+            payments.loc[payments["liability_id"] == liability_id, "date"].str[:7]
+        )
 
         current_month = date.today().strftime("%Y-%m")
         created = 0
@@ -887,23 +892,17 @@ class LiabilitiesService:
 
         return created
 
-    @staticmethod
-    def _compare_actual_vs_expected(
-        schedule: List[Dict[str, Any]],
-        transactions: List[Dict[str, Any]],
-    ) -> List[Dict[str, Any]]:
+    def _compare_actual_vs_expected(self, liability_id: int) -> List[Dict[str, Any]]:
         """
-        Compare actual payments against the amortization schedule by month.
+        Compare a liability's actual payments against its schedule by month.
 
-        Groups negative transactions by ``YYYY-MM`` and compares to schedule
-        entries for each month.
+        Reads the liability's rows from the request-wide frame built by
+        :meth:`_get_actual_vs_expected`.
 
         Parameters
         ----------
-        schedule : list[dict]
-            Amortization schedule entries from ``calculate_amortization_schedule``.
-        transactions : list[dict]
-            Transaction dicts for this liability (from ``get_liability_transactions``).
+        liability_id : int
+            ID of the liability.
 
         Returns
         -------
@@ -911,27 +910,6 @@ class LiabilitiesService:
             List of dicts with keys: ``date``, ``expected_payment``,
             ``actual_payment``, ``difference``.
         """
-        actual_by_month: Dict[str, float] = {}
-        for txn in transactions:
-            amount = txn.get("amount", 0)
-            if amount is not None and amount < 0:
-                month_key = str(txn["date"])[:7]  # YYYY-MM
-                actual_by_month[month_key] = actual_by_month.get(month_key, 0.0) + abs(amount)
-
-        current_month = date.today().strftime("%Y-%m")
-
-        result = []
-        for entry in schedule:
-            month_key = entry["date"][:7]
-            if month_key > current_month:
-                break
-            expected = entry["payment"]
-            actual = actual_by_month.get(month_key, 0.0)
-            result.append({
-                "date": entry["date"],
-                "expected_payment": round(expected, 2),
-                "actual_payment": round(actual, 2),
-                "difference": round(actual - expected, 2),
-            })
-
-        return result
+        frame = self._get_actual_vs_expected()
+        rows = frame[frame["liability_id"] == liability_id]
+        return rows.drop(columns="liability_id").to_dict(orient="records")
@@ -0,0 +1,232 @@
+"""Immutable piecewise-constant annual rate curves.
+
+A :class:`RateSeries` holds a step function — the Bank of Israel key
+rate, prime, or a loan's own rate curve — as two sorted, read-only NumPy
+arrays. Point lookups are a ``searchsorted`` (O(log n)), and compounding
+over a date range is answered from a precomputed running integral of the
+daily log-growth, so neither walks the steps in Python.
+
+Series compare and hash by value, which makes them usable directly as
+part of a cache key (see :func:`backend.services.amortization.compute_schedule`):
+a refreshed rate history is a different key without explicit
+invalidation.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+DateLike = Union[str, date, np.datetime64]
+
+_DAYS_PER_YEAR = 365
+
+
+@dataclass(frozen=True, eq=False)
+class RateSeries:
+    """A step function of annual rates, in percent.
+
+    Each value is in effect from its date (inclusive) until the next
+    step. Build instances with :meth:`from_records` or the transforming
+    methods rather than directly.
+
+    Attributes
+    ----------
+    dates : np.ndarray
+        Ascending, unique ``datetime64[D]`` step dates.
+    values : np.ndarray
+        Annual rate (%) in effect from the matching date.
+    """
+
+    dates: np.ndarray
+    values: np.ndarray
+    _log_growth: np.ndarray = field(init=False, repr=False)
+    _key: tuple = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        dates = np.array(self.dates, dtype="datetime64[D]").reshape(-1)
+        values = np.array(self.values, dtype=float).reshape(-1)
+        if len(dates) != len(values):
+            raise ValueError("dates and values must have the same length")
+
+        # Running integral of the daily log-growth up to each step date.
+        daily = np.log1p(values / 100.0) / _DAYS_PER_YEAR
+        spans = np.diff(dates).astype(np.int64)
+        log_growth = np.r_[0.0, np.cumsum(spans * daily[:-1])] if len(dates) else daily
+
+        for array in (dates, values, log_growth):
+            array.flags.writeable = False
+        object.__setattr__(self, "dates", dates)
+        object.__setattr__(self, "values", values)
+        object.__setattr__(self, "_log_growth", log_growth)
+        object.__setattr__(self, "_key", (dates.tobytes(), values.tobytes()))
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> "RateSeries":
+        """Build a series from ``{date, value}`` dicts in any order.
+
+        Parameters
+        ----------
+        records : iterable of dict
+            Points with ``date`` (YYYY-MM-DD) and ``value`` (percent).
+
+        Returns
+        -------
+        RateSeries
+            The sorted series.
+        """
+        records = list(records)
+        dates = np.array([str(r["date"]) for r in records], dtype="datetime64[D]")
+        values = np.array([float(r["value"]) for r in records], dtype=float)
+        order = np.argsort(dates, kind="stable")
+        return cls(dates[order], values[order])
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RateSeries):
+            return NotImplemented
+        return self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Return the steps as ``{date, value}`` dicts, ascending."""
+        return [
+            {"date": d, "value": v}
+            for d, v in zip(self.dates.astype(str).tolist(), self.values.tolist())
+        ]
+
+    def values_at(self, days: Any) -> np.ndarray:
+        """Get the rate in effect on each of ``days``.
+
+        Parameters
+        ----------
+        days : array-like of date-like
+            Dates to look up, in any order.
+
+        Returns
+        -------
+        np.ndarray
+            Annual rate (%) per day; ``NaN`` before the first step.
+        """
+        days = np.asarray(days, dtype="datetime64[D]")
+        idx = np.searchsorted(self.dates, days, side="right") - 1
+        if not len(self):
+            return np.full(days.shape, np.nan)
+        return np.where(idx >= 0, self.values[np.maximum(idx, 0)], np.nan)
+
+    def value_at(self, day: DateLike) -> Optional[float]:
+        """Get the rate in effect on ``day``, or ``None`` before the first step."""
+        value = float(self.values_at(np.datetime64(str(day), "D")))
+        return None if np.isnan(value) else value
+
+    def shifted(self, offset: float) -> "RateSeries":
+        """Add a constant spread to every step (rounded to 4 decimals).
+
+        Parameters
+        ----------
+        offset : float
+            Percentage points to add, e.g. the 1.5 prime spread.
+
+        Returns
+        -------
+        RateSeries
+            The shifted series.
+        """
+        return RateSeries(self.dates, np.round(self.values + offset, 4))
+
+    def anchored(self, start: DateLike) -> "RateSeries":
+        """Restrict the series to a curve that begins exactly at ``start``.
+
+        The first step is dated ``start`` with the rate in effect that
+        day — or the earliest known rate when ``start`` predates the
+        series — followed by every later step.
+
+        Parameters
+        ----------
+        start : date-like
+            First day of the curve (e.g. a loan's origination date).
+
+        Returns
+        -------
+        RateSeries
+            The anchored series; empty when this one is.
+        """
+        if not len(self):
+            return self
+        start = np.datetime64(str(start), "D")
+        idx = int(np.searchsorted(self.dates, start, side="right")) - 1
+        return RateSeries(
+            np.r_[start, self.dates[idx + 1:]],
+            np.r_[self.values[max(idx, 0)], self.values[idx + 1:]],
+        )
+
+    def sampled(self, days: Any) -> "RateSeries":
+        """Lock the rate at each of ``days`` until the next one.
+
+        Models variable-rate loans that reset only on given dates.
+
+        Parameters
+        ----------
+        days : array-like of date-like
+            Ascending reset dates. Dates before the first step take the
+            first rate.
+
+        Returns
+        -------
+        RateSeries
+            One step per reset date.
+        """
+        days = np.asarray(days, dtype="datetime64[D]")
+        if not len(self):
+            return RateSeries(days, np.full(days.shape, np.nan))
+        idx = np.maximum(np.searchsorted(self.dates, days, side="right") - 1, 0)
+        return RateSeries(days, self.values[idx])
+
+    def log_growth(self, days: Any) -> np.ndarray:
+        """Cumulative log-growth from the first step date to each of ``days``.
+
+        Growth compounds daily at ``(1 + rate / 100) ** (1 / 365)``, the
+        rate being the one in effect on each day. Days before the first
+        step extrapolate the first rate backwards.
+
+        Parameters
+        ----------
+        days : array-like of date-like
+            Dates to evaluate, in any order.
+
+        Returns
+        -------
+        np.ndarray
+            ``log`` of the growth factor accumulated over
+            ``[dates[0], day)``.
+        """
+        days = np.asarray(days, dtype="datetime64[D]")
+        if not len(self):
+            return np.zeros(days.shape)
+        idx = np.maximum(np.searchsorted(self.dates, days, side="right") - 1, 0)
+        elapsed = (days - self.dates[idx]).astype(np.int64)
+        daily = np.log1p(self.values[idx] / 100.0) / _DAYS_PER_YEAR
+        return self._log_growth[idx] + elapsed * daily
+
+    def growth_factor(self, start: Any, end: Any) -> np.ndarray:
+        """Compound growth factor over ``[start, end)`` with daily compounding.
+
+        Vectorized over matching ``start`` / ``end`` arrays; each range
+        costs two binary searches regardless of how many steps it spans.
+
+        Parameters
+        ----------
+        start, end : array-like of date-like
+            Range bounds; ``end`` is exclusive.
+
+        Returns
+        -------
+        np.ndarray
+            Product of the daily factors of every day in the range.
+        """
+        return np.exp(self.log_growth(end) - self.log_growth(start))
@@ -14,6 +14,11 @@ Design choices (mirrors ``UpdateService``):
 - **Prime is derived, never stored.** Everyday Israeli "prime" is the
   BoI key rate plus a constant 1.5%; storing only the BoI series keeps
   one source of truth.
+- **Loaded once per change.** Lookups go through an immutable
+  :class:`~backend.services.rate_series.RateSeries` shared process-wide
+  and keyed on the write generation of the ``interest_rates`` table, so
+  every prime-linked loan and investment reuses one load and a refresh
+  that inserts a point is picked up on the next call.
 """
 
 import logging
@@ -26,8 +31,11 @@ import yaml
 from sqlalchemy.orm import Session
 
 from backend.constants.loans import BOI_RATE_SERIES, PRIME_SERIES, PRIME_SPREAD_PCT
+from backend.constants.tables import Tables
 from backend.errors import ValidationException
 from backend.repositories.interest_rates_repository import InterestRatesRepository
+from backend.services.rate_series import RateSeries
+from backend.utils.data_generation import generation_memoized
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +56,7 @@ class RatesService:
         db : Session
             SQLAlchemy session for database operations.
         """
+        self.db = db
         self.rates_repo = InterestRatesRepository(db)
 
     def ensure_seeded(self) -> None:
@@ -64,8 +73,8 @@ class RatesService:
         if points:
             self.rates_repo.upsert_points(BOI_RATE_SERIES, points, source="seed")
 
-    def get_history(self, series: str = BOI_RATE_SERIES) -> List[Dict[str, Any]]:
-        """Get the full step-point history of a series.
+    def get_series(self, series: str = BOI_RATE_SERIES) -> RateSeries:
+        """Get a rate series as an immutable step function.
 
         Parameters
         ----------
@@ -74,8 +83,8 @@ class RatesService:
 
         Returns
         -------
-        list[dict]
-            Points with ``date`` and ``value``, ascending by date.
+        RateSeries
+            The shared series (empty when no history is available).
 
         Raises
         ------
@@ -84,17 +93,37 @@ class RatesService:
         """
         if series not in (BOI_RATE_SERIES, PRIME_SERIES):
             raise ValidationException(f"Unknown rate series: {series}")
+        return self._load_series(series)
 
+    @generation_memoized(
+        "rates.series", tables=(Tables.INTEREST_RATES.value,), shared=True
+    )
+    def _load_series(self, series: str) -> RateSeries:
+        """Read the BoI history (seeding it if needed) and derive ``series``."""
         self.ensure_seeded()
         df = self.rates_repo.get_series(BOI_RATE_SERIES)
-        if df.empty:
-            return []
+        boi = RateSeries.from_records(df.to_dict(orient="records"))
+        return boi.shifted(PRIME_SPREAD_PCT if series == PRIME_SERIES else 0.0)
+
+    def get_history(self, series: str = BOI_RATE_SERIES) -> List[Dict[str, Any]]:
+        """Get the full step-point history of a series.
+
+        Parameters
+        ----------
+        series : str
+            ``boi_rate`` or ``prime`` (derived as BoI + 1.5).
+
+        Returns
+        -------
+        list[dict]
+            Points with ``date`` and ``value``, ascending by date.
 
-        offset = PRIME_SPREAD_PCT if series == PRIME_SERIES else 0.0
-        return [
-            {"date": row["date"], "value": round(float(row["value"]) + offset, 4)}
-            for _, row in df.iterrows()
-        ]
+        Raises
+        ------
+        ValidationException
+            If the series name is unknown.
+        """
+        return self.get_series(series).to_records()
 
     def get_current(self) -> Dict[str, Any]:
         """Get the latest known BoI rate and derived prime.
@@ -105,14 +134,14 @@ class RatesService:
             ``boi_rate``, ``prime``, and ``as_of`` (date of the latest
             point) — all ``None`` when the series is empty.
         """
-        history = self.get_history(BOI_RATE_SERIES)
-        if not history:
+        boi = self.get_series(BOI_RATE_SERIES)
+        if not len(boi):
             return {"boi_rate": None, "prime": None, "as_of": None}
-        latest = history[-1]
+        latest = float(boi.values[-1])
         return {
-            "boi_rate": latest["value"],
-            "prime": round(latest["value"] + PRIME_SPREAD_PCT, 4),
-            "as_of": latest["date"],
+            "boi_rate": latest,
+            "prime": round(latest + PRIME_SPREAD_PCT, 4),
+            "as_of": str(boi.dates[-1]),
         }
 
     def get_prime_at(self, at_date: str) -> Optional[float]:
@@ -129,14 +158,7 @@ class RatesService:
             Prime rate (BoI + 1.5) at that date, or ``None`` when the
             series has no point on or before the date.
         """
-        history = self.get_history(BOI_RATE_SERIES)
-        value = None
-        for point in history:
-            if point["date"] <= at_date:
-                value = point["value"]
-            else:
-                break
-        return None if value is None else round(value + PRIME_SPREAD_PCT, 4)
+        return self.get_series(PRIME_SERIES).value_at(at_date)
 
     def get_prime_steps(self, from_date: str) -> List[Dict[str, Any]]:
         """Get prime as a step function starting at ``from_date``.
@@ -144,7 +166,8 @@ class RatesService:
         The first step is anchored exactly at ``from_date`` (using the
         rate in effect that day) so callers can treat the result as a
         complete piecewise-constant rate curve for a loan originated on
-        that date.
+        that date. Internal callers use
+        ``get_series(PRIME_SERIES).anchored(from_date)`` directly.
 
         Parameters
         ----------
@@ -157,21 +180,7 @@ class RatesService:
             Points with ``date`` and ``value`` (prime, percent),
             ascending — empty when the series has no data at all.
         """
-        history = self.get_history(PRIME_SERIES)
-        if not history:
-            return []
-
-        anchor_value = None
-        steps = []
-        for point in history:
-            if point["date"] <= from_date:
-                anchor_value = point["value"]
-            else:
-                steps.append(point)
-        if anchor_value is None:
-            # Loan predates the whole series — anchor at the earliest point.
-            anchor_value = steps[0]["value"] if steps else history[0]["value"]
-        return [{"date": from_date, "value": anchor_value}] + steps
+        return self.get_series(PRIME_SERIES).anchored(from_date).to_records()
 
     def refresh_from_boi(self) -> Dict[str, Any]:
         """Fetch the current key rate from the BoI public API.
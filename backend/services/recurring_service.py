@@ -5,10 +5,21 @@ feed required. Groups expense transactions by a normalized merchant label and
 looks for a stable cadence (weekly/monthly/quarterly/annual) across at least
 three occurrences. This powers the dashboard subscriptions view and feeds the
 insights engine with "new subscription" / "price increase" signals.
+
+Detected series are persisted in ``recurring_series`` together with a
+watermark of the tables detection reads (``recurring_series_state``). A
+scrape refreshes only the merchants its new rows touch (``update_series``)
+and readers go straight to the table. Any other write to those tables —
+re-tagging, manual and cash transactions, deletes, split edits, project
+budgets, in this process or another — leaves the model stale: readers then
+detect on the fly, without writing, until the next scrape rebuilds the model
+in full. ``rebuild_series`` does the same on demand, e.g. after
+``_normalize`` changes.
 """
 
 import re
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
@@ -19,7 +30,22 @@ from backend.constants.categories import (
     LIABILITIES_CATEGORY,
     IncomeCategories,
 )
+from backend.constants.tables import Tables
+from backend.repositories.recurring_series_repository import RecurringSeriesRepository
 from backend.repositories.transactions_repository import TransactionsRepository
+from backend.utils.data_generation import data_generation, generation_memoized
+from backend.utils.session_cache import session_memoized
+
+# Tables whose writes can change what detection finds: the transaction rows
+# and their tags, splits, and the project budgets excluded from detection.
+SOURCE_TABLES = (
+    Tables.CREDIT_CARD.value,
+    Tables.BANK.value,
+    Tables.CASH.value,
+    Tables.MANUAL_INVESTMENT_TRANSACTIONS.value,
+    Tables.SPLIT_TRANSACTIONS.value,
+    Tables.BUDGET_RULES.value,
+)
 
 
 class RecurringService:
@@ -55,6 +81,7 @@ class RecurringService:
         """
         self.db = db
         self.repo = TransactionsRepository(db)
+        self.series_repo = RecurringSeriesRepository(db)
 
     @staticmethod
     def _normalize(desc) -> str:
@@ -82,30 +109,17 @@ class RecurringService:
         s = re.sub(r"\s+", " ", s).strip()
         return s
 
-    def _match_cadence(self, interval_days: float) -> tuple[str, int] | None:
-        """Match a median interval to the closest known cadence.
-
-        Parameters
-        ----------
-        interval_days : float
-            Median number of days between occurrences.
-
-        Returns
-        -------
-        tuple[str, int] or None
-            ``(cadence_name, period_days)`` or None if no cadence fits.
-        """
-        best = None
-        best_rel = self._CADENCE_TOLERANCE
-        for name, days in self._CADENCES:
-            rel = abs(interval_days - days) / days
-            if rel < best_rel:
-                best_rel = rel
-                best = (name, days)
-        return best
-
+    @session_memoized("recurring.get_recurring")
     def get_recurring(self) -> dict:
-        """Detect recurring charges across all itemized expense transactions.
+        """Return the detected recurring charges from the persisted model.
+
+        Reads ``recurring_series`` and re-derives the date-dependent status
+        against today. When the model was never built or its source tables
+        changed since (see ``model_is_current``), detection runs on the fly
+        instead; a read never writes the model, that is left to the scrape
+        pipeline and ``rebuild_series``. The dict is memoized in the
+        session cache, so the forecast, the insights engine and the
+        ``/recurring`` route share one read per request.
 
         Returns
         -------
@@ -123,11 +137,228 @@ class RecurringService:
             - ``total_monthly`` – sum of ``monthly_equivalent`` across all
               non-ended items.
         """
-        empty = {"items": [], "total_monthly": 0.0}
+        if self.model_is_current():
+            rows = self.series_repo.get_all().to_dict("records")
+        else:
+            rows = self._detect_on_the_fly()
+
+        return self._rows_to_result(rows)
+
+    def model_is_current(self) -> bool:
+        """Whether the persisted model reflects the current source tables.
+
+        The stored watermark catches writes from other processes and from
+        before a restart; the in-process write generations also catch an
+        edit landing in the same second as the build, which ``updated_at``
+        cannot resolve.
+
+        Returns
+        -------
+        bool
+            ``False`` when the model was never built or is stale.
+        """
+        watermark = self.series_repo.get_watermark()
+        if watermark is None:
+            return False
+        if data_generation(tables=SOURCE_TABLES) > data_generation(
+            tables=(Tables.RECURRING_SERIES.value, Tables.RECURRING_SERIES_STATE.value)
+        ):
+            return False
+        return watermark == self.series_repo.source_watermark(SOURCE_TABLES)
+
+    def rebuild_series(self) -> int:
+        """Recompute the whole recurring model from the full itemized history.
+
+        The scrape pipeline rebuilds a stale model on its own; this is for
+        a database nothing has been scraped into since upgrading and for
+        changes no table write reveals, such as a change to ``_normalize``.
+
+        Returns
+        -------
+        int
+            Number of recurring series now persisted.
+        """
+        rows = self._build_all_rows()
+        self.series_repo.replace_all(rows, self.series_repo.source_watermark(SOURCE_TABLES))
+        return len(rows)
+
+    def update_series(self, transactions: pd.DataFrame, was_current: bool = True) -> int:
+        """Refresh the persisted series of merchants touched by new transactions.
+
+        Only merchants whose normalized key appears in ``transactions`` are
+        re-evaluated, each from its own stored history — so pending-row
+        reconciliation, same-day refunds and a merchant falling out of
+        detection are all handled exactly, without re-deriving any other
+        merchant. Only those merchants' rows are read. A model that was
+        never built, or was already stale before these rows were written,
+        is rebuilt in full instead.
+
+        Parameters
+        ----------
+        transactions : pd.DataFrame
+            Newly ingested rows; only the ``description`` column is used.
+        was_current : bool
+            ``model_is_current()`` as of before the rows were written. The
+            caller has to take it then: afterwards the new rows themselves
+            make the model look stale.
+
+        Returns
+        -------
+        int
+            Number of merchant keys refreshed.
+        """
+        if transactions.empty or "description" not in transactions.columns:
+            return 0
+        if not was_current or self.series_repo.get_watermark() is None:
+            self.rebuild_series()
+            return 0
+
+        affected = set(self._normalize_column(transactions["description"])) - {""}
+        df = self._load_candidate_transactions(affected)
+        rows = self._detect_series(df, pd.Timestamp.today().normalize())
+        self.series_repo.replace(
+            sorted(affected), rows, self.series_repo.source_watermark(SOURCE_TABLES)
+        )
+        return len(affected)
+
+    @generation_memoized("recurring.detect_on_the_fly", tables=SOURCE_TABLES)
+    def _detect_on_the_fly(self) -> list[dict]:
+        """``_build_all_rows`` for readers of a stale or unbuilt model.
+
+        Memoized until a source table changes, so a model waiting for the
+        next scrape costs one detection pass rather than one per request.
+        """
+        return self._build_all_rows()
+
+    def _build_all_rows(self) -> list[dict]:
+        """Run detection over every eligible merchant and return persistable rows."""
+        df = self._load_candidate_transactions()
+        return self._detect_series(df, pd.Timestamp.today().normalize())
+
+    def _rows_to_result(self, rows: list[dict]) -> dict:
+        """Turn persisted series rows into the ``get_recurring`` payload.
+
+        Parameters
+        ----------
+        rows : list[dict]
+            Rows keyed by ``RecurringSeriesRepository.COLUMNS``.
+
+        Returns
+        -------
+        dict
+            ``{items, total_monthly}`` as documented on ``get_recurring``.
+        """
+        today = pd.Timestamp.today().normalize()
+        items: list[dict] = []
+        for row in sorted(rows, key=lambda r: r["normalized"]):
+            period_days = int(row["period_days"])
+            first_date = pd.Timestamp(row["first_date"])
+            last_date = pd.Timestamp(row["last_date"])
+            amount = float(row["amount"])
+            last_amount = float(row["last_amount"])
+            status, price_change = self._classify(
+                first_date, last_date, period_days,
+                last_amount, float(row["prior_median"]), today,
+            )
+            category = row["category"]
+            items.append({
+                "label": row["label"],
+                "normalized": row["normalized"],
+                "amount": round(amount, 2),
+                "last_amount": round(last_amount, 2),
+                "cadence": row["cadence"],
+                "period_days": period_days,
+                "monthly_equivalent": round(amount * 30.0 / period_days, 2),
+                "occurrences": int(row["occurrences"]),
+                "category": None if pd.isna(category) else category,
+                "first_date": first_date.strftime("%Y-%m-%d"),
+                "last_date": last_date.strftime("%Y-%m-%d"),
+                "next_expected_date": (
+                    last_date + pd.Timedelta(days=period_days)
+                ).strftime("%Y-%m-%d"),
+                "status": status,
+                "price_change": price_change,
+            })
+
+        items.sort(key=lambda i: i["monthly_equivalent"], reverse=True)
+        total_monthly = sum(i["monthly_equivalent"] for i in items if i["status"] != "ended")
+        return {"items": items, "total_monthly": round(total_monthly, 2)}
+
+    def _classify(
+        self,
+        first_date: pd.Timestamp,
+        last_date: pd.Timestamp,
+        period_days: int,
+        last_amount: float,
+        prior_median: float,
+        today: pd.Timestamp,
+    ) -> tuple[str, float]:
+        """Derive a series' status and price change as of ``today``.
+
+        Parameters
+        ----------
+        first_date, last_date : pd.Timestamp
+            First and latest charge dates.
+        period_days : int
+            Cadence period in days.
+        last_amount : float
+            Latest net charge (positive).
+        prior_median : float
+            Median net charge excluding the latest.
+        today : pd.Timestamp
+            Reference date.
+
+        Returns
+        -------
+        tuple[str, float]
+            ``(status, price_change)``.
+        """
+        # Status: ended if overdue past 1.5 periods, new if it only
+        # started within the last ~2 periods.
+        age_since_last = (today - last_date).days
+        age_since_first = (today - first_date).days
+        status = "active"
+        if age_since_last > period_days * 1.5:
+            status = "ended"
+        elif age_since_first <= period_days * 3:
+            status = "new"
+
+        # Price change: latest amount vs median of prior occurrences.
+        price_change = 0.0
+        if prior_median > 0 and abs(last_amount - prior_median) / prior_median > self._PRICE_CHANGE_THRESHOLD:
+            price_change = round(last_amount - prior_median, 2)
+            if status == "active":
+                status = "price_changed"
+        return status, price_change
+
+    def _load_candidate_transactions(self, merchants: set[str] | None = None) -> pd.DataFrame:
+        """Load itemized expenses eligible for recurring detection.
 
-        df = self.repo.get_itemized_transactions()
+        Parameters
+        ----------
+        merchants : set[str], optional
+            Restrict to these merchant keys. The distinct descriptions are
+            normalized first and only the rows of the matching ones are
+            read, instead of the whole history.
+
+        Returns
+        -------
+        pd.DataFrame
+            Itemized transactions outside the excluded categories, with
+            ``date_parsed`` (normalized timestamp) and ``norm`` (merchant
+            key) columns added. Rows with an empty key are dropped.
+        """
+        if merchants is None:
+            df = self.repo.get_itemized_transactions()
+        else:
+            descriptions = pd.Series(self.repo.get_itemized_descriptions(), dtype=object)
+            keys = pd.Series(self._normalize_column(descriptions), index=descriptions.index)
+            matching = descriptions[keys.isin(list(merchants))]
+            if matching.empty:
+                return pd.DataFrame()
+            df = self.repo.get_itemized_transactions_by_description(matching.tolist())
         if df.empty:
-            return empty
+            return df
 
         exclude = [
             CREDIT_CARDS,
@@ -144,107 +375,192 @@ class RecurringService:
 
         df = df[~df["category"].isin(exclude)].copy()
         if df.empty:
-            return empty
+            return df
 
         df["date_parsed"] = pd.to_datetime(df["date"]).dt.normalize()
-        df["norm"] = df["description"].apply(self._normalize)
-        df = df[df["norm"] != ""]
+        df["norm"] = self._normalize_column(df["description"])
+        return df[df["norm"] != ""]
+
+    def _normalize_column(self, descriptions: pd.Series) -> np.ndarray:
+        """Normalize a description column, running ``_normalize`` once per distinct value.
+
+        Scraped histories repeat the same few hundred descriptions across
+        thousands of rows, so factorizing first turns the per-row regex pass
+        into a per-merchant one.
+
+        Parameters
+        ----------
+        descriptions : pd.Series
+            Raw transaction descriptions.
+
+        Returns
+        -------
+        np.ndarray
+            Normalized merchant keys aligned with ``descriptions``.
+        """
+        codes, uniques = pd.factorize(descriptions)
+        # Missing values factorize to -1, which indexes the trailing "".
+        lookup = np.array([self._normalize(u) for u in uniques] + [""], dtype=object)
+        return lookup[codes]
+
+    def _detect_series(self, df: pd.DataFrame, today: pd.Timestamp) -> list[dict]:
+        """Run the grouped detection pass over candidate transactions.
+
+        Every merchant is evaluated at once: one sort of the per-day net
+        charges, then NumPy interval arithmetic and groupby aggregates
+        replace a per-group Series construction.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Output of ``_load_candidate_transactions`` (possibly narrowed
+            to some merchants).
+        today : pd.Timestamp
+            Reference date for the persisted ``status``.
+
+        Returns
+        -------
+        list[dict]
+            One persistable row per detected series, keyed by
+            ``RecurringSeriesRepository.COLUMNS``.
+        """
+        empty: list[dict] = []
         if df.empty:
             return empty
 
-        today = pd.Timestamp.today().normalize()
-        items: list[dict] = []
-
-        for norm, group in df.groupby("norm"):
-            # Net same-day charges and refunds: sum signed amounts per day, then
-            # keep only net-outflow days as charge occurrences. A same-day (or
-            # same-statement-day) refund shrinks the charge; a fully-refunded day
-            # drops out entirely instead of masquerading as a recurring hit.
-            daily_net = group.groupby("date_parsed")["amount"].sum().sort_index()
-            charges = daily_net[daily_net < 0]
-            if len(charges) < 3:
-                continue
-
-            dates = charges.index.to_series().reset_index(drop=True)
-            # Net charge magnitudes (positive), aligned to date order.
-            amounts = pd.Series(-charges.to_numpy())
-
-            diffs = dates.diff().dropna().dt.days
-            median_interval = float(diffs.median())
-            if median_interval <= 0:
-                continue
-
-            # Regular cadence: the gaps themselves must be consistent, not just
-            # their median. A merchant visited at random intervals (groceries)
-            # has a high spread and is rejected here.
-            interval_cv = float(diffs.std(ddof=0)) / median_interval
-            if interval_cv > self._MAX_INTERVAL_CV:
-                continue
-
-            cadence = self._match_cadence(median_interval)
-            if cadence is None:
-                continue
-            cadence_name, period_days = cadence
-
-            # Stable price: most charges must cluster near the median net amount.
-            # Variable-amount spend (a basket of groceries, one-off vendors with
-            # wildly different invoices) is rejected here.
-            amount = float(amounts.median())
-            if amount <= 0:
-                continue
-            within_band = float((amounts.sub(amount).abs() <= amount * self._AMOUNT_BAND).mean())
-            if within_band < self._MIN_AMOUNT_CONSISTENCY:
-                continue
-
-            last_amount = float(amounts.iloc[-1])
-            first_date = dates.iloc[0]
-            last_date = dates.iloc[-1]
-            next_expected = last_date + pd.Timedelta(days=period_days)
-
-            # Status: ended if overdue past 1.5 periods, new if it only
-            # started within the last ~2 periods.
-            age_since_last = (today - last_date).days
-            age_since_first = (today - first_date).days
-            status = "active"
-            if age_since_last > period_days * 1.5:
-                status = "ended"
-            elif age_since_first <= period_days * 3:
-                status = "new"
-
-            # Price change: latest amount vs median of prior occurrences.
-            price_change = 0.0
-            prior = amounts.iloc[:-1]
-            if len(prior) >= 1:
-                prior_med = float(prior.median())
-                if prior_med > 0 and abs(last_amount - prior_med) / prior_med > self._PRICE_CHANGE_THRESHOLD:
-                    price_change = round(last_amount - prior_med, 2)
-                    if status == "active":
-                        status = "price_changed"
-
-            label_mode = group["description"].mode()
-            label = label_mode.iloc[0] if not label_mode.empty else norm
-            cat_mode = group["category"].dropna().mode()
-            category = cat_mode.iloc[0] if not cat_mode.empty else None
-
-            monthly_equivalent = amount * 30.0 / period_days
+        # Net same-day charges and refunds: sum signed amounts per day, then
+        # keep only net-outflow days as charge occurrences. A same-day (or
+        # same-statement-day) refund shrinks the charge; a fully-refunded day
+        # drops out entirely instead of masquerading as a recurring hit.
+        # The groupby output is sorted by (norm, date), which every
+        # positional computation below relies on.
+        daily_net = df.groupby(["norm", "date_parsed"], sort=True)["amount"].sum()
+        charges = daily_net[daily_net < 0].reset_index()
+        charges["charge"] = -charges["amount"]
+        occurrences = charges.groupby("norm", sort=False)["norm"].transform("size")
+        charges = charges[occurrences >= 3].reset_index(drop=True)
+        if charges.empty:
+            return empty
 
-            items.append({
-                "label": label,
+        norms = charges["norm"].to_numpy()
+        day_numbers = charges["date_parsed"].to_numpy().astype("datetime64[D]").astype(np.int64)
+        first_in_group = np.r_[True, norms[1:] != norms[:-1]]
+        last_in_group = np.r_[norms[1:] != norms[:-1], True]
+
+        # Intervals between consecutive charges of the same merchant; the
+        # first charge of each merchant has no predecessor.
+        intervals = pd.Series(np.diff(day_numbers, prepend=0).astype(float))
+        intervals[first_in_group] = np.nan
+        charges["interval"] = intervals
+
+        grouped = charges.groupby("norm", sort=True)
+        stats = grouped.agg(
+            occurrences=("charge", "size"),
+            amount=("charge", "median"),
+            last_amount=("charge", "last"),
+            first_date=("date_parsed", "first"),
+            last_date=("date_parsed", "last"),
+            median_interval=("interval", "median"),
+        )
+        stats["interval_std"] = grouped["interval"].std(ddof=0)
+        # Median of every charge but the latest, for price-change detection.
+        stats["prior_median"] = (
+            charges[~last_in_group].groupby("norm", sort=True)["charge"].median()
+        )
+
+        # Stable price: most charges must cluster near the median net amount.
+        # Variable-amount spend (a basket of groceries, one-off vendors with
+        # wildly different invoices) is rejected here.
+        group_median = charges["norm"].map(stats["amount"])
+        in_band = (charges["charge"] - group_median).abs() <= group_median * self._AMOUNT_BAND
+        stats["within_band"] = in_band.groupby(charges["norm"], sort=True).mean()
+
+        median_interval = stats["median_interval"].to_numpy()
+        # Regular cadence: the gaps themselves must be consistent, not just
+        # their median. A merchant visited at random intervals (groceries)
+        # has a high spread and is rejected here.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            interval_cv = stats["interval_std"].to_numpy() / median_interval
+
+        # Closest cadence within the relative tolerance band; on a tie the
+        # shorter cadence wins (``_CADENCES`` is ordered shortest-first).
+        periods = np.array([days for _, days in self._CADENCES], dtype=float)
+        rel = np.abs(median_interval[:, None] - periods[None, :]) / periods[None, :]
+        best = rel.argmin(axis=1)
+        cadence_ok = rel[np.arange(len(rel)), best] < self._CADENCE_TOLERANCE
+
+        keep = (
+            (median_interval > 0)
+            & (interval_cv <= self._MAX_INTERVAL_CV)
+            & cadence_ok
+            & (stats["amount"].to_numpy() > 0)
+            & (stats["within_band"].to_numpy() >= self._MIN_AMOUNT_CONSISTENCY)
+        )
+        stats = stats[keep]
+        if stats.empty:
+            return empty
+        stats["cadence_idx"] = best[keep]
+
+        labels, categories = self._group_modes(df[df["norm"].isin(stats.index)])
+
+        rows: list[dict] = []
+        for norm, row in stats.iterrows():
+            cadence_name, period_days = self._CADENCES[int(row["cadence_idx"])]
+            last_amount = float(row["last_amount"])
+            prior_median = float(row["prior_median"])
+            status, price_change = self._classify(
+                row["first_date"], row["last_date"], period_days,
+                last_amount, prior_median, today,
+            )
+            rows.append({
                 "normalized": norm,
-                "amount": round(amount, 2),
-                "last_amount": round(last_amount, 2),
+                "label": labels.get(norm, norm),
+                "category": categories.get(norm),
                 "cadence": cadence_name,
                 "period_days": period_days,
-                "monthly_equivalent": round(monthly_equivalent, 2),
-                "occurrences": int(len(charges)),
-                "category": category,
-                "first_date": first_date.strftime("%Y-%m-%d"),
-                "last_date": last_date.strftime("%Y-%m-%d"),
-                "next_expected_date": next_expected.strftime("%Y-%m-%d"),
-                "status": status,
+                "occurrences": int(row["occurrences"]),
+                "first_date": row["first_date"].strftime("%Y-%m-%d"),
+                "last_date": row["last_date"].strftime("%Y-%m-%d"),
+                "interval_median": float(row["median_interval"]),
+                "interval_std": float(row["interval_std"]),
+                "amount": float(row["amount"]),
+                "last_amount": last_amount,
+                "prior_median": prior_median,
                 "price_change": price_change,
+                "status": status,
             })
+        return rows
 
-        items.sort(key=lambda i: i["monthly_equivalent"], reverse=True)
-        total_monthly = sum(i["monthly_equivalent"] for i in items if i["status"] != "ended")
-        return {"items": items, "total_monthly": round(total_monthly, 2)}
+    @staticmethod
+    def _group_modes(df: pd.DataFrame) -> tuple[dict, dict]:
+        """Most common raw description and category per merchant key.
+
+        Ties resolve to the smallest value, as ``Series.mode`` does.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Candidate transactions with ``norm``, ``description`` and
+            ``category`` columns.
+
+        Returns
+        -------
+        tuple[dict, dict]
+            ``(labels, categories)`` keyed by merchant key. Merchants whose
+            categories are all missing are absent from ``categories``.
+        """
+
+        def _mode(column: str) -> dict:
+            counts = (
+                df.dropna(subset=[column])
+                .groupby(["norm", column], sort=True)
+                .size()
+                .rename("n")
+                .reset_index()
+            )
+            # Stable sort keeps the ascending value order within equal counts.
+            counts = counts.sort_values("n", ascending=False, kind="stable")
+            top = counts.drop_duplicates("norm")
+            return dict(zip(top["norm"], top[column]))
+
+        return _mode("description"), _mode("category")
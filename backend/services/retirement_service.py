@@ -14,6 +14,7 @@ derived from today's expenses — directly comparable across the whole
 projection horizon.
 """
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Session
 
@@ -23,12 +24,24 @@ from backend.services.analysis_service import AnalysisService
 from backend.services.investments_service import InvestmentsService
 from backend.services.bank_balance_service import BankBalanceService
 from backend.services.cash_balance_service import CashBalanceService
+from backend.services.retirement_projection import (
+    MonteCarloConfig,
+    bracket_search,
+    future_value,
+    project_wealth,
+    simulate_wealth,
+)
 from backend.errors import EntityNotFoundException, ValidationException
+from backend.constants.tables import Tables
+from backend.utils.data_generation import generation_memoized
 
 # Israeli pension milestones
 FULL_PENSION_AGE_MALE = 67
 FULL_PENSION_AGE_FEMALE = 65
 
+# Wealth percentiles reported by the Monte Carlo projection
+_MONTE_CARLO_PERCENTILES = (10, 25, 50, 75, 90)
+
 
 def _get_full_pension_age(gender: str) -> int:
     """Return full pension age based on gender (67 for male, 65 for female)."""
@@ -129,9 +142,16 @@ class RetirementService:
             "avg_monthly_salary": self.analysis_service.get_avg_monthly_salary(),
         }
 
+    @generation_memoized(
+        "retirement.current_status", ignore=(Tables.RETIREMENT_GOAL.value,)
+    )
     def get_current_status(self) -> dict:
         """Aggregate current financial status from real dashboard data.
 
+        Cached process-wide until any table other than the goal's own gets
+        a committed write (see :mod:`backend.utils.data_generation`), so
+        goal-only previews skip every analytics query.
+
         Returns
         -------
         dict
@@ -214,7 +234,11 @@ class RetirementService:
             "tracked_kh_value": tracked_kh_value,
         }
 
-    def get_projections(self, goal_override: dict | None = None) -> dict:
+    def get_projections(
+        self,
+        goal_override: dict | None = None,
+        monte_carlo: MonteCarloConfig | None = None,
+    ) -> dict:
         """Compute FIRE projections based on goal + real data.
 
         Parameters
@@ -222,13 +246,17 @@ class RetirementService:
         goal_override : dict or None
             If provided, use these goal params instead of reading from DB.
             Allows preview calculations without saving.
+        monte_carlo : MonteCarloConfig or None
+            If provided, also run a stochastic projection with these
+            settings (see :meth:`_simulate_projection`).
 
         Returns
         -------
         dict
             Keys: fire_number, years_to_fire, fire_age,
             earliest_possible_retirement_age, monthly_savings_needed,
-            progress_pct, readiness, net_worth_projection, income_projection.
+            progress_pct, readiness, net_worth_projection, income_projection,
+            plus monte_carlo when requested.
         """
         goal_data = goal_override or self.get_goal()
         if not goal_data:
@@ -313,7 +341,7 @@ class RetirementService:
         # Retirement income projection (phase-based, from current age)
         income_projection = self._project_retirement_income(goal_data)
 
-        return {
+        result = {
             "fire_number": round(fire_number, 0),
             "years_to_fire": years_to_fire,
             "fire_age": fire_age,
@@ -331,6 +359,11 @@ class RetirementService:
             "net_worth_projection": net_worth_projection,
             "income_projection": income_projection,
         }
+        if monte_carlo:
+            result["monte_carlo"] = self._simulate_projection(
+                goal_data, status, monte_carlo
+            )
+        return result
 
     def _effective_status(self, goal_data: dict) -> dict:
         """Current status with the goal's manual overrides applied.
@@ -400,82 +433,178 @@ class RetirementService:
             Per-year projection with age, and net_worth for
             optimistic/baseline/conservative scenarios.
         """
-        current_age = goal["current_age"]
-        life_exp = goal["life_expectancy"]
-        target_age = goal["target_retirement_age"]
+        # Three return scenarios: ±1% on the nominal rate, then converted to
+        # real so the projection stays in today's shekels. Each point is the
+        # balance the user HAS at that age, before that year's growth —
+        # labelling it after the growth step shifted the whole curve (and
+        # `fire_age`) a year early.
         return_rate = goal["expected_return_rate"]
-        inflation = goal["inflation_rate"]
-        monthly_savings = status["monthly_savings"]
-        annual_savings = monthly_savings * 12
-        full_pension_age = _get_full_pension_age(goal.get("gender", "male"))
+        totals = np.round(
+            self._project_wealth(
+                goal,
+                status,
+                return_rate=np.array([return_rate + 0.01, return_rate, return_rate - 0.01]),
+            ),
+            0,
+        )
+        optimistic, baseline, conservative = totals.tolist()
+        return [
+            {
+                "age": age,
+                "net_worth_optimistic": opt,
+                "net_worth_baseline": base,
+                "net_worth_conservative": cons,
+            }
+            for age, opt, base, cons in zip(
+                range(goal["current_age"], goal["life_expectancy"] + 1),
+                optimistic,
+                baseline,
+                conservative,
+            )
+        ]
+
+    def _project_wealth(
+        self,
+        goal: dict,
+        status: dict,
+        *,
+        return_rate=None,
+        retirement_age=None,
+        monthly_expenses=None,
+    ) -> np.ndarray:
+        """Project total wealth per age for a batch of candidate parameters.
+
+        The goal's own values are used for every field that is not given;
+        given fields may be arrays of candidates, one projection path each
+        (see :func:`~backend.services.retirement_projection.project_wealth`).
 
-        kh_balance = goal["keren_hishtalmut_balance"]
-        kh_monthly = goal["keren_hishtalmut_monthly_contribution"]
-        base_nw = status["net_worth"] - status.get("tracked_kh_value", 0.0)
+        Parameters
+        ----------
+        goal : dict
+            Retirement goal parameters.
+        status : dict
+            Current financial status from real data.
+        return_rate : float or np.ndarray, optional
+            Nominal expected return rate(s).
+        retirement_age : int or np.ndarray, optional
+            Retirement age(s).
+        monthly_expenses : float or np.ndarray, optional
+            Monthly expenses in retirement.
 
-        annual_expenses = goal["monthly_expenses_in_retirement"] * 12
+        Returns
+        -------
+        np.ndarray
+            ``(paths, years)`` matrix of unrounded wealth (portfolio + KH)
+            from current age to life expectancy.
+        """
+        params = self._projection_params(goal, status)
+        if retirement_age is not None:
+            params["retirement_age"] = retirement_age
+        if monthly_expenses is not None:
+            params["annual_expenses"] = np.asarray(monthly_expenses) * 12
+        if return_rate is None:
+            return_rate = goal["expected_return_rate"]
+        return project_wealth(
+            real_rate=_real_rate(np.asarray(return_rate), goal["inflation_rate"]),
+            **params,
+        )
 
-        projections = []
-        # Three return scenarios: ±1% on the nominal rate, then converted to
-        # real so the projection stays in today's shekels.
-        scenarios = {
-            "optimistic": _real_rate(return_rate + 0.01, inflation),
-            "baseline": _real_rate(return_rate, inflation),
-            "conservative": _real_rate(return_rate - 0.01, inflation),
+    @staticmethod
+    def _projection_params(goal: dict, status: dict) -> dict:
+        """Projection kernel arguments for the goal, except the return rate.
+
+        Wealth and contributions combine the main portfolio with the Keren
+        Hishtalmut bucket, whose synced value is swapped out of the tracked
+        net worth (see :meth:`_project_net_worth`).
+        """
+        pension_income = goal["pension_monthly_payout_estimate"] * 12
+        if goal["bituach_leumi_eligible"]:
+            pension_income += goal["bituach_leumi_monthly_estimate"] * 12
+
+        return {
+            "current_age": goal["current_age"],
+            "life_expectancy": goal["life_expectancy"],
+            "full_pension_age": _get_full_pension_age(goal.get("gender", "male")),
+            "wealth": (
+                status["net_worth"]
+                - status.get("tracked_kh_value", 0.0)
+                + goal["keren_hishtalmut_balance"]
+            ),
+            "annual_contribution": (
+                status["monthly_savings"]
+                + goal["keren_hishtalmut_monthly_contribution"]
+            )
+            * 12,
+            "retirement_age": goal["target_retirement_age"],
+            "annual_expenses": goal["monthly_expenses_in_retirement"] * 12,
+            "passive_income": goal["other_passive_income"] * 12,
+            "pension_income": pension_income,
         }
 
-        for scenario_name, rate in scenarios.items():
-            nw = base_nw
-            kh = kh_balance
-
-            for year_offset in range(life_exp - current_age + 1):
-                age = current_age + year_offset
-
-                # Record the balance the user HAS at this age, before applying
-                # this year's growth. Recording after the growth step labelled
-                # today's point with a year of compounding already applied,
-                # which shifted the whole curve — and `fire_age` — a year early.
-                total = nw + kh
-                if scenario_name == "optimistic":
-                    projections.append(
-                        {
-                            "age": age,
-                            "net_worth_optimistic": round(total, 0),
-                            "net_worth_baseline": 0,
-                            "net_worth_conservative": 0,
-                        }
-                    )
-                else:
-                    projections[year_offset][f"net_worth_{scenario_name}"] = round(
-                        total, 0
-                    )
-
-                if age < target_age:
-                    # Accumulation phase: grow + save
-                    nw = nw * (1 + rate) + annual_savings
-                    kh = kh * (1 + rate) + kh_monthly * 12
-                else:
-                    # Drawdown phase: grow, then withdraw net-of-income needs
-                    annual_income = goal["other_passive_income"] * 12
-                    if age >= full_pension_age:
-                        annual_income += goal["pension_monthly_payout_estimate"] * 12
-                        if goal["bituach_leumi_eligible"]:
-                            annual_income += (
-                                goal["bituach_leumi_monthly_estimate"] * 12
-                            )
-
-                    withdrawal_needed = max(0, annual_expenses - annual_income)
-
-                    # Both buckets grow for the year, then the withdrawal
-                    # comes out — KH first (tax-free), remainder from the
-                    # main portfolio.
-                    nw = nw * (1 + rate)
-                    kh = kh * (1 + rate)
-                    kh_draw = min(kh, withdrawal_needed) if kh > 0 else 0.0
-                    kh -= kh_draw
-                    nw -= withdrawal_needed - kh_draw
-
-        return projections
+    def _simulate_projection(
+        self, goal: dict, status: dict, config: MonteCarloConfig
+    ) -> dict:
+        """Monte Carlo projection: wealth bands and depletion odds by age.
+
+        Each path draws its own annual nominal returns and inflation around
+        the goal's expected values (see
+        :func:`~backend.services.retirement_projection.simulate_wealth`)
+        and runs through the same KH-first drawdown and pension / Bituach
+        Leumi income model as the deterministic scenarios.
+
+        Parameters
+        ----------
+        goal : dict
+            Retirement goal parameters.
+        status : dict
+            Current financial status from real data.
+        config : MonteCarloConfig
+            Path count, seed and return distribution.
+
+        Returns
+        -------
+        dict
+            Keys: paths, seed, distribution, success_probability (share of
+            paths never depleted in drawdown through life expectancy), and
+            projection — per age, the p10/p25/p50/p75/p90 wealth and the
+            depletion_probability (share of paths depleted at or before
+            that age).
+        """
+        totals = np.round(
+            simulate_wealth(
+                self._projection_params(goal, status),
+                goal["expected_return_rate"],
+                goal["inflation_rate"],
+                config,
+            ),
+            0,
+        )
+        ages = np.arange(goal["current_age"], goal["life_expectancy"] + 1)
+
+        # Depletion counts in drawdown only, as in _find_depletion_age
+        depleted = (ages >= goal["target_retirement_age"]) & (totals <= 0)
+        depletion_probability = np.logical_or.accumulate(depleted, axis=1).mean(axis=0)
+        bands = np.percentile(totals, _MONTE_CARLO_PERCENTILES, axis=0).round(0)
+
+        projection = [
+            {
+                "age": age,
+                **{f"p{pct}": band for pct, band in zip(_MONTE_CARLO_PERCENTILES, column)},
+                "depletion_probability": round(prob, 4),
+            }
+            for age, column, prob in zip(
+                ages.tolist(), bands.T.tolist(), depletion_probability.tolist()
+            )
+        ]
+        return {
+            "paths": config.paths,
+            "seed": config.seed,
+            "distribution": config.distribution,
+            "success_probability": round(
+                1 - (projection[-1]["depletion_probability"] if projection else 0.0), 4
+            ),
+            "projection": projection,
+        }
 
     def _project_retirement_income(self, goal: dict) -> list[dict]:
         """Project income sources by age (from current age to life expectancy).
@@ -632,120 +761,127 @@ class RetirementService:
         )
 
     def _plan_on_track(self, goal: dict, status: dict) -> bool:
-        """Whether a plan reaches FIRE by its target age AND survives drawdown.
+        """Whether the goal's own plan is on track (see :meth:`_on_track`)."""
+        return bool(self._on_track(goal, status)[0])
+
+    def _on_track(
+        self,
+        goal: dict,
+        status: dict,
+        *,
+        return_rate=None,
+        retirement_age=None,
+        monthly_expenses=None,
+    ) -> np.ndarray:
+        """Whether each candidate plan reaches FIRE by its target age AND survives drawdown.
 
         This mirrors the readiness == "on_track" criteria in
         :meth:`get_projections`. Solvers must search against this predicate,
         not drawdown survival alone: a small pension-covered plan can survive
         at ANY return rate without ever reaching the FIRE number, and a
         survival-only search then converges to a meaningless answer.
+
+        Candidate arrays are evaluated together in one projection (see
+        :meth:`_project_wealth`); omitted fields come from ``goal``.
+
+        Returns
+        -------
+        np.ndarray
+            One boolean per candidate path.
         """
-        fire_number = (
-            goal["monthly_expenses_in_retirement"] * 12 / goal["withdrawal_rate"]
-        )
-        projection = self._project_net_worth(goal, status)
-        fire_reached_by_target = any(
-            point["age"] <= goal["target_retirement_age"]
-            and point["net_worth_baseline"] >= fire_number
-            for point in projection
-        )
-        if not fire_reached_by_target:
-            return False
-        return (
-            self._find_depletion_age(
-                projection, goal["life_expectancy"], goal["target_retirement_age"]
-            )
-            is None
+        if retirement_age is None:
+            retirement_age = goal["target_retirement_age"]
+        if monthly_expenses is None:
+            monthly_expenses = goal["monthly_expenses_in_retirement"]
+
+        # Rounded like the displayed baseline, so the solvers agree with
+        # the readiness computed from net_worth_projection.
+        totals = np.round(
+            self._project_wealth(
+                goal,
+                status,
+                return_rate=return_rate,
+                retirement_age=retirement_age,
+                monthly_expenses=monthly_expenses,
+            ),
+            0,
         )
+        ages = np.arange(goal["current_age"], goal["life_expectancy"] + 1)
+        retire = np.reshape(retirement_age, (-1, 1))
+        fire_number = np.reshape(monthly_expenses, (-1, 1)) * 12 / goal["withdrawal_rate"]
+
+        fire_reached_by_target = ((ages <= retire) & (totals >= fire_number)).any(axis=1)
+        depleted = ((ages >= retire) & (totals <= 0)).any(axis=1)
+        return fire_reached_by_target & ~depleted
 
     def _solve_target_retirement_age(self, goal: dict, status: dict) -> int:
         """Find earliest retirement age where the plan is fully on track.
 
-        For each candidate age (starting from earliest FIRE-eligible), runs
-        the full simulation to verify both FIRE-by-candidate-age and
-        drawdown longevity.
+        Every candidate age from the earliest FIRE-eligible one to life
+        expectancy is simulated in one batch, checking both
+        FIRE-by-candidate-age and drawdown longevity.
         """
-        annual_expenses = goal["monthly_expenses_in_retirement"] * 12
-        fire_number = annual_expenses / goal["withdrawal_rate"]
-
-        current_age = goal["current_age"]
-        rate = _real_rate(goal["expected_return_rate"], goal["inflation_rate"])
-        monthly_savings = status["monthly_savings"]
-        annual_savings = monthly_savings * 12
-        kh_balance = goal["keren_hishtalmut_balance"]
-        kh_monthly = goal["keren_hishtalmut_monthly_contribution"]
-
-        # First find earliest age where FIRE number is reached (KH bucket
-        # swaps out any synced KH value — see _project_net_worth)
-        nw = status["net_worth"] - status.get("tracked_kh_value", 0.0)
-        kh = kh_balance
-        fire_eligible_age = None
-        for year_offset in range(goal["life_expectancy"] - current_age + 1):
-            total = nw + kh
-            if total >= fire_number:
-                fire_eligible_age = current_age + year_offset
-                break
-            nw = nw * (1 + rate) + annual_savings
-            kh = kh * (1 + rate) + kh_monthly * 12
+        fire_number = (
+            goal["monthly_expenses_in_retirement"] * 12 / goal["withdrawal_rate"]
+        )
 
-        if fire_eligible_age is None:
+        # First find earliest age where FIRE number is reached, accumulating
+        # through the whole horizon (no drawdown)
+        accumulation = self._project_wealth(
+            goal, status, retirement_age=goal["life_expectancy"] + 1
+        )[0]
+        reached = np.flatnonzero(accumulation >= fire_number)
+        if not len(reached):
             return -1
 
-        # Now check each candidate age from fire_eligible_age onward
-        # to find the earliest whose plan is fully on track
-        for candidate_age in range(fire_eligible_age, goal["life_expectancy"] + 1):
-            test_goal = {**goal, "target_retirement_age": candidate_age}
-            if self._plan_on_track(test_goal, status):
-                return candidate_age
-
-        return -1  # Not reachable
+        # Earliest candidate age from there whose plan is fully on track
+        candidates = np.arange(
+            goal["current_age"] + int(reached[0]), goal["life_expectancy"] + 1
+        )
+        on_track = self._on_track(goal, status, retirement_age=candidates)
+        if not on_track.any():
+            return -1  # Not reachable
+        return int(candidates[np.argmax(on_track)])
 
     def _solve_monthly_expenses(self, goal: dict, status: dict) -> float:
         """Find max monthly retirement expenses where the plan stays on track.
 
-        Uses binary search: upper bound from the FIRE formula applied to the
-        projected wealth at target age, then verifies FIRE-by-target-age and
-        drawdown longevity together.
+        Bracket search: upper bound from the FIRE formula applied to the
+        projected wealth at target age, then each round verifies
+        FIRE-by-target-age and drawdown longevity for a grid of expense
+        levels at once.
 
         Returns -1 when no positive expense level works (already at/past the
         target age, or projected wealth never supports any spending) — the
         UI filters -1 out; a literal "0 ILS/month" suggestion is noise.
         """
-        current_age = goal["current_age"]
-        target_age = goal["target_retirement_age"]
-        years = target_age - current_age
+        years = goal["target_retirement_age"] - goal["current_age"]
         if years <= 0:
             return -1
 
-        rate = _real_rate(goal["expected_return_rate"], goal["inflation_rate"])
-        monthly_savings = status["monthly_savings"]
-        annual_savings = monthly_savings * 12
-        kh_balance = goal["keren_hishtalmut_balance"]
-        kh_monthly = goal["keren_hishtalmut_monthly_contribution"]
-
-        nw = status["net_worth"] - status.get("tracked_kh_value", 0.0)
-        kh = kh_balance
-        for _ in range(years):
-            nw = nw * (1 + rate) + annual_savings
-            kh = kh * (1 + rate) + kh_monthly * 12
-
-        projected_nw = nw + kh
+        projected_nw = future_value(
+            status["net_worth"]
+            - status.get("tracked_kh_value", 0.0)
+            + goal["keren_hishtalmut_balance"],
+            (status["monthly_savings"] + goal["keren_hishtalmut_monthly_contribution"])
+            * 12,
+            _real_rate(goal["expected_return_rate"], goal["inflation_rate"]),
+            years,
+        )
         # Upper bound: FIRE formula max (may not survive drawdown)
         max_monthly = (projected_nw * goal["withdrawal_rate"]) / 12
         if max_monthly <= 0:
             return -1
 
-        # Binary search for max expenses that keep the plan on track
-        lo, hi = 0.0, max_monthly
-        for _ in range(50):
-            mid = (lo + hi) / 2
-            test_goal = {**goal, "monthly_expenses_in_retirement": mid}
-            if self._plan_on_track(test_goal, status):
-                lo = mid
-            else:
-                hi = mid
-            if hi - lo < 100:  # converge to within 100 ILS
-                break
+        # Converge to within 100 ILS on the max expenses that keep the plan
+        # on track
+        lo, _ = bracket_search(
+            lambda expenses: self._on_track(goal, status, monthly_expenses=expenses),
+            0.0,
+            max_monthly,
+            100,
+            passes_above=False,
+        )
 
         # lo > 0 was verified on-track by the search; lo == 0 means not even
         # a token spending level works (e.g. wealth stays negative to target)
@@ -754,38 +890,29 @@ class RetirementService:
     def _solve_return_rate(self, goal: dict, status: dict) -> float:
         """Find minimum nominal return rate where the plan is on track.
 
-        Uses binary search over return rates, requiring both FIRE by the
-        target age and drawdown longevity (survival alone is trivially true
-        for pension-covered plans and would converge to the search floor).
+        Bracket search over return rates, requiring both FIRE by the target
+        age and drawdown longevity (survival alone is trivially true for
+        pension-covered plans and would converge to the search floor).
 
         Returns -1 when not achievable at any rate up to 30%, or when the
         target age is already at/behind the current age (no return rate can
         retire someone in the past) — the UI filters -1 out.
         """
-        current_age = goal["current_age"]
-        target_age = goal["target_retirement_age"]
-        years = target_age - current_age
+        years = goal["target_retirement_age"] - goal["current_age"]
         if years <= 0:
             return -1
 
-        # Binary search between -10% and 30%
+        # Search between -10% and 30%; check if achievable at max rate
         lo, hi = -0.10, 0.30
-
-        # Check if achievable at max rate
-        test_goal = {**goal, "expected_return_rate": hi}
-        if not self._plan_on_track(test_goal, status):
+        if not self._on_track(goal, status, return_rate=hi)[0]:
             return -1  # Not achievable even at 30%
 
-        for _ in range(100):
-            mid = (lo + hi) / 2
-            test_goal = {**goal, "expected_return_rate": mid}
-            if self._plan_on_track(test_goal, status):
-                hi = mid
-            else:
-                lo = mid
-            if hi - lo < 0.00001:
-                break
-
+        _, hi = bracket_search(
+            lambda rates: self._on_track(goal, status, return_rate=rates),
+            lo,
+            hi,
+            0.00001,
+        )
         return hi
 
     @staticmethod
@@ -1,8 +1,14 @@
 import asyncio
+import itertools
+import weakref
+from concurrent.futures import Future
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Coroutine, Dict, List, Optional
 
+import pandas as pd
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from backend.database import get_db_context
 from backend.errors import BadRequestException, EntityNotFoundException
@@ -15,6 +21,12 @@ from backend.scraper.adapter import (
     _active_scrapers,
     _tfa_scrapers_waiting,
 )
+from backend.scraper.events import (
+    STATUS_EVENT,
+    ScrapeEvent,
+    publish_status,
+    scrape_events,
+)
 
 
 # The server's main asyncio event loop, captured at startup (see
@@ -44,19 +56,75 @@ def set_main_loop(loop: "asyncio.AbstractEventLoop | None") -> None:
     _main_loop = loop
 
 
-def _launch_adapter(adapter: ScraperAdapter) -> None:
-    """Schedule ``adapter.run()`` on the server's main event loop.
+# Scrapers running at once in the whole process, single-account launches and
+# "scrape all" batches alike. Most providers drive a Chrome instance (hundreds
+# of MB each), so this caps memory rather than the provider-side request rate,
+# which stays per account.
+MAX_CONCURRENT_BROWSERS = 3
+
+# The limiter behind MAX_CONCURRENT_BROWSERS. asyncio primitives are bound to
+# one loop, so there is one per loop; the app only ever uses its main loop.
+_browser_slots: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Comment frame sent on an idle event stream; ignored by SSE clients.
+SSE_KEEP_ALIVE = ": keep-alive\n\n"
+
+# Finished batches kept for late status polls.
+_MAX_KEPT_BATCHES = 5
+
+_batch_ids = itertools.count(1)
+
+# Default look-back window of the per-provider telemetry summary.
+TELEMETRY_SUMMARY_DAYS = 30
+
+
+@dataclass
+class _BatchEntry:
+    """One account of a "scrape all" batch."""
+
+    name: str
+    service: str
+    provider: str
+    account: str
+    adapter: ScraperAdapter
+    requires_2fa: bool
+    process_id: int
+    # ``queued`` until the orchestrator starts it, then ``started``;
+    # ``skipped`` when it was aborted while still queued. Entries adopted
+    # from an already-running scrape start as ``started``.
+    state: str = "queued"
+
+
+@dataclass
+class _ScrapeBatch:
+    """A "scrape all accounts" run and the future of its orchestrator."""
+
+    batch_id: int
+    entries: List[_BatchEntry]
+    future: "Future | None" = None
+
+
+_scrape_batches: Dict[int, _ScrapeBatch] = {}
+
+
+def _submit(coro: Coroutine) -> Future:
+    """Schedule ``coro`` on the server's main event loop.
 
     Submitting via ``run_coroutine_threadsafe`` (rather than
     ``asyncio.create_task``) lets this work from a synchronous route running
-    in a threadpool worker thread, which has no running loop of its own. The
-    returned ``concurrent.futures.Future`` is stored on the adapter so the
-    running task stays referenced for its full lifetime.
+    in a threadpool worker thread, which has no running loop of its own.
 
     Parameters
     ----------
-    adapter : ScraperAdapter
-        The adapter whose ``run()`` coroutine should be launched.
+    coro : Coroutine
+        The coroutine to run.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        Future of the scheduled coroutine.
     """
     loop = _main_loop
     if loop is None:
@@ -66,11 +134,110 @@ def _launch_adapter(adapter: ScraperAdapter) -> None:
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError as exc:
+            coro.close()
             raise RuntimeError(
                 "No event loop available to launch scraper; set_main_loop() "
                 "was not called at startup."
             ) from exc
-    adapter._run_future = asyncio.run_coroutine_threadsafe(adapter.run(), loop)
+    return asyncio.run_coroutine_threadsafe(coro, loop)
+
+
+def _browser_slot() -> asyncio.Semaphore:
+    """Return the running loop's :data:`MAX_CONCURRENT_BROWSERS` limiter.
+
+    Returns
+    -------
+    asyncio.Semaphore
+        The limiter every scraper run acquires before starting.
+    """
+    loop = asyncio.get_running_loop()
+    slots = _browser_slots.get(loop)
+    if slots is None:
+        slots = _browser_slots[loop] = asyncio.Semaphore(MAX_CONCURRENT_BROWSERS)
+    return slots
+
+
+async def _run_in_browser_slot(name: str, adapter: ScraperAdapter) -> None:
+    """Run ``adapter`` once a browser slot is free.
+
+    An adapter aborted while it waited (no longer registered under ``name``
+    in ``_active_scrapers``) is not run.
+
+    Parameters
+    ----------
+    name : str
+        The ``"service - provider - account"`` key of the adapter.
+    adapter : ScraperAdapter
+        The adapter to run.
+    """
+    async with _browser_slot():
+        if _active_scrapers.get(name) is adapter:
+            await adapter.run()
+
+
+def _launch_adapter(name: str, adapter: ScraperAdapter) -> None:
+    """Schedule ``adapter`` on the server's main event loop.
+
+    The run waits for a browser slot (see :data:`MAX_CONCURRENT_BROWSERS`).
+    The returned ``concurrent.futures.Future`` is stored on the adapter so
+    the running task stays referenced for its full lifetime.
+
+    Parameters
+    ----------
+    name : str
+        The ``"service - provider - account"`` key the adapter is
+        registered under in ``_active_scrapers``.
+    adapter : ScraperAdapter
+        The adapter whose ``run()`` coroutine should be launched.
+    """
+    adapter._run_future = _submit(_run_in_browser_slot(name, adapter))
+
+
+async def _run_batch(entries: List[_BatchEntry]) -> None:
+    """Run the queued entries of a batch in the shared browser slots.
+
+    Accounts without 2FA run side by side. 2FA accounts run one after
+    another in a single chain, so the user is only ever asked for one code
+    at a time; the chain is scheduled first, so the prompt comes up while
+    the other accounts scrape. An entry aborted while queued (its adapter
+    no longer in ``_active_scrapers``) is skipped.
+
+    Parameters
+    ----------
+    entries : list of _BatchEntry
+        Every entry of the batch; only ``queued`` ones are run.
+    """
+    async def run_entry(entry: _BatchEntry) -> None:
+        async with _browser_slot():
+            if _active_scrapers.get(entry.name) is not entry.adapter:
+                entry.state = "skipped"
+                return
+            entry.state = "started"
+            # Registered only now, not at queue time: a code submitted for a
+            # queued account would have no prompt to answer.
+            if entry.requires_2fa:
+                _tfa_scrapers_waiting[entry.name] = entry.adapter
+            await entry.adapter.run()
+
+    async def run_2fa_chain(chain: List[_BatchEntry]) -> None:
+        for entry in chain:
+            await run_entry(entry)
+
+    queued = [entry for entry in entries if entry.state == "queued"]
+    await asyncio.gather(
+        run_2fa_chain([entry for entry in queued if entry.requires_2fa]),
+        *(run_entry(entry) for entry in queued if not entry.requires_2fa),
+        return_exceptions=True,
+    )
+
+
+def _read_scraping_status(process_id: int) -> Dict[str, str | int]:
+    """Read a process's status on a short-lived session of its own.
+
+    Used by the event stream, which outlives the request-scoped session.
+    """
+    with get_db_context() as db:
+        return ScrapingService(db).get_scraping_status(process_id)
 
 
 class ScrapingService:
@@ -84,6 +251,8 @@ class ScrapingService:
     or the process is aborted. Every running scraper (any provider) is
     also tracked in the module-level ``_active_scrapers`` dict, which
     makes ``start_scraping_single`` single-flight per account.
+    ``start_scraping_all`` queues every account into one batch run under a
+    shared browser limit.
     """
 
     def __init__(self, db: Session):
@@ -141,24 +310,84 @@ class ScrapingService:
     def get_last_scrape_dates(self) -> List[Dict]:
         """
         Get last successful scrape dates for all configured accounts.
-        Returns a list of dicts with service, provider, account_name, and last_scrape_date.
+        Returns a list of dicts with service, provider, account_name,
+        last_scrape_date, and last_scrape_telemetry — the phase spans of the
+        account's most recent instrumented run (see
+        ``ScrapingHistoryRepository.get_latest_telemetry_by_account``), or None.
         """
         accounts = self.credentials_repo.list_accounts()
+        telemetry_by_account = self.scraping_history_repo.get_latest_telemetry_by_account()
         result = []
         for acc in accounts:
             last_scrape = self.scraping_history_repo.get_last_successful_scrape_date(
                 acc["service"], acc["provider"], acc["account_name"]
             )
+            telemetry = telemetry_by_account.get(
+                (acc["service"], acc["provider"], acc["account_name"])
+            )
             result.append(
                 {
                     "service": acc["service"],
                     "provider": acc["provider"],
                     "account_name": acc["account_name"],
                     "last_scrape_date": last_scrape,
+                    "last_scrape_telemetry": telemetry,
                 }
             )
         return result
 
+    def get_telemetry_summary(self, days: int = TELEMETRY_SUMMARY_DAYS) -> List[Dict]:
+        """Summarize phase durations per provider over the last ``days`` days.
+
+        Parameters
+        ----------
+        days : int, optional
+            Look-back window in days.
+
+        Returns
+        -------
+        list[dict]
+            One entry per provider, sorted by name: ``provider``, the number
+            of ``scrapes``, and ``phases`` — per phase name, in the order
+            phases first appear, its span ``count`` and the ``p50_ms`` /
+            ``p95_ms`` of its ``duration_ms``. Phases recorded several times
+            per run (``fetch_month``, ``fetch_account``) count every span.
+        """
+        since = datetime.now() - timedelta(days=days)
+        runs = self.scraping_history_repo.get_telemetry_since(since)
+        rows = [
+            {"provider": provider, "run": run, "name": span.get("name"),
+             "duration_ms": span.get("duration_ms")}
+            for run, (provider, phases) in enumerate(runs)
+            for span in phases or []
+        ]
+        df = pd.DataFrame(rows, columns=["provider", "run", "name", "duration_ms"])
+        df = df.dropna(subset=["name", "duration_ms"])
+        if df.empty:
+            return []
+
+        summary = []
+        for provider, provider_df in df.groupby("provider", sort=True):
+            grouped = provider_df.groupby("name", sort=False)["duration_ms"]
+            quantiles = grouped.quantile([0.5, 0.95]).unstack()
+            counts = grouped.size()
+            summary.append(
+                {
+                    "provider": provider,
+                    "scrapes": int(provider_df["run"].nunique()),
+                    "phases": [
+                        {
+                            "name": name,
+                            "count": int(counts[name]),
+                            "p50_ms": round(float(quantiles.loc[name, 0.5]), 1),
+                            "p95_ms": round(float(quantiles.loc[name, 0.95]), 1),
+                        }
+                        for name in counts.index
+                    ],
+                }
+            )
+        return summary
+
     def start_scraping_single(
         self,
         service: str,
@@ -202,53 +431,175 @@ class ScrapingService:
         if existing is not None:
             return existing.process_id
 
-        if scraping_period_days is not None:
-            start_date = date.today() - timedelta(days=scraping_period_days)
-        else:
-            start_date = self._get_scraper_start_date(service, provider, account)
-        creds = self.credentials_repo.get_credentials(service, provider, account)
-        # A forced re-auth must ignore any stored OneZero long-term token so the
-        # scraper falls into the interactive SMS flow; the adapter persists the
-        # fresh token afterwards.
-        if force_2fa:
-            creds = {k: v for k, v in creds.items() if k != "otpLongTermToken"}
-        requires_2fa = is_2fa_required(service, provider)
-
-        # Always start IN_PROGRESS — even for 2FA-capable providers. The
-        # adapter's _otp_callback flips status to WAITING_FOR_2FA only when
-        # the scraper actually awaits the OTP, so the UI never shows a 2FA
-        # prompt for providers that didn't end up needing one (e.g. Hapoalim
-        # from a trusted device, OneZero with a stored long-term token).
-        with get_db_context() as db:
-            history_repo = ScrapingHistoryRepository(db)
-            process_id = history_repo.record_scrape_start(
-                service, provider, account, start_date, history_repo.IN_PROGRESS
-            )
-
-        adapter = create_adapter(
-            service, provider, account, creds, start_date, process_id,
-            force_2fa=force_2fa,
+        adapter, process_id = self._prepare_adapter(
+            service, provider, account, scraping_period_days, force_2fa
         )
-        _launch_adapter(adapter)
 
         # Register synchronously (no `await` between the earlier `.get()`
         # check and this insert) so a second concurrent call can't slip in
         # between the check and the registration. Registered for ALL
-        # providers, not just 2FA ones, so any account is single-flight.
-        # The adapter's run() pops this entry on completion (success,
-        # failure, or cancellation).
+        # providers, not just 2FA ones, so any account is single-flight,
+        # and before the launch, which skips an adapter that is no longer
+        # registered once its browser slot frees up. The adapter's run()
+        # pops this entry on completion (success, failure, or cancellation).
         _active_scrapers[name] = adapter
+        try:
+            _launch_adapter(name, adapter)
+        except BaseException:
+            self._release_unlaunched(name, adapter)
+            raise
 
         # Park the adapter so submit_2fa_code can resolve it later. We register
         # eagerly (rather than when the scraper actually awaits OTP) because
         # the user can submit the code immediately after receiving the SMS,
         # before the scraper has reached `await on_otp_request()`. The
         # adapter's run() cleans this entry up on completion.
-        if requires_2fa:
+        if is_2fa_required(service, provider):
             _tfa_scrapers_waiting[name] = adapter
 
         return process_id
 
+    def start_scraping_all(self, scraping_period_days: Optional[int] = None) -> int:
+        """
+        Scrape every configured account as one batch.
+
+        All accounts are queued at once (one history row and adapter each)
+        and a single orchestrator on the main event loop runs them: accounts
+        without 2FA concurrently, at most :data:`MAX_CONCURRENT_BROWSERS` at
+        a time, and 2FA accounts one after another so only one asks for a
+        code at a time. A full refresh therefore takes about as long as the
+        slowest accounts rather than the sum of all of them.
+
+        Accounts that are already scraping are adopted into the batch as-is
+        rather than launched twice. Queued accounts are registered in
+        ``_active_scrapers`` immediately, so single-account launches and
+        aborts see them; aborting one removes it from the queue. If setting
+        up an account or submitting the batch fails, every account queued so
+        far is released again. Only one batch runs at a time — while it
+        does, this returns its id.
+
+        Parameters
+        ----------
+        scraping_period_days : int, optional
+            Number of days to scrape back from today for every account. If
+            ``None``, each account uses its automatic start date.
+
+        Returns
+        -------
+        int
+            Batch id for :meth:`get_scraping_all_status`.
+        """
+        for batch in _scrape_batches.values():
+            if batch.future is not None and not batch.future.done():
+                return batch.batch_id
+
+        entries = []
+        try:
+            for acc in self.credentials_repo.list_accounts():
+                service, provider, account = (
+                    acc["service"], acc["provider"], acc["account_name"]
+                )
+                name = f"{service} - {provider} - {account}"
+                requires_2fa = is_2fa_required(service, provider)
+                existing = _active_scrapers.get(name)
+                if existing is not None:
+                    entries.append(_BatchEntry(
+                        name, service, provider, account, existing,
+                        requires_2fa, existing.process_id, state="started",
+                    ))
+                    continue
+                adapter, process_id = self._prepare_adapter(
+                    service, provider, account, scraping_period_days
+                )
+                _active_scrapers[name] = adapter
+                entries.append(_BatchEntry(
+                    name, service, provider, account, adapter, requires_2fa,
+                    process_id,
+                ))
+            future = _submit(_run_batch(entries))
+        except BaseException:
+            for entry in entries:
+                if entry.state == "queued":
+                    self._release_unlaunched(entry.name, entry.adapter)
+            raise
+
+        batch = _ScrapeBatch(next(_batch_ids), entries, future)
+        _scrape_batches[batch.batch_id] = batch
+        while len(_scrape_batches) > _MAX_KEPT_BATCHES:
+            del _scrape_batches[min(_scrape_batches)]
+        return batch.batch_id
+
+    def get_scraping_all_status(self, batch_id: int) -> Dict:
+        """
+        Get the aggregate progress of a "scrape all" batch.
+
+        Parameters
+        ----------
+        batch_id : int
+            Id returned by :meth:`start_scraping_all`.
+
+        Returns
+        -------
+        dict
+            Dictionary with keys:
+
+            - ``batch_id`` – echoed back ``batch_id``.
+            - ``accounts`` – one dict per account with ``service``,
+              ``provider``, ``account``, ``process_id``, ``status`` (as
+              :meth:`get_scraping_status`, or ``"queued"`` while waiting
+              for a slot) and ``error_type``.
+            - ``counts`` – number of accounts per status.
+            - ``awaiting_2fa`` – the account dict currently waiting for a
+              code, or ``None``.
+            - ``done`` – whether every account has finished.
+
+        Raises
+        ------
+        EntityNotFoundException
+            If the batch is unknown (never started, or long finished).
+        """
+        batch = _scrape_batches.get(int(batch_id))
+        if batch is None:
+            raise EntityNotFoundException("Scraping batch not found")
+
+        repo = self.scraping_history_repo
+        accounts = []
+        for entry in batch.entries:
+            process_id = entry.process_id
+            error_type = None
+            if (
+                entry.state == "queued"
+                and _active_scrapers.get(entry.name) is entry.adapter
+            ):
+                status = "queued"
+            else:
+                status = repo.get_scraping_status(process_id) or "unknown"
+                if status == repo.FAILED:
+                    error_type = repo.get_error(process_id)[1]
+            accounts.append({
+                "service": entry.service,
+                "provider": entry.provider,
+                "account": entry.account,
+                "process_id": process_id,
+                "status": status,
+                "error_type": error_type,
+            })
+
+        counts: Dict[str, int] = {}
+        for acc in accounts:
+            counts[acc["status"]] = counts.get(acc["status"], 0) + 1
+        pending = {"queued", repo.IN_PROGRESS, repo.WAITING_FOR_2FA}
+        return {
+            "batch_id": batch.batch_id,
+            "accounts": accounts,
+            "counts": counts,
+            "awaiting_2fa": next(
+                (acc for acc in accounts if acc["status"] == repo.WAITING_FOR_2FA),
+                None,
+            ),
+            "done": not any(acc["status"] in pending for acc in accounts),
+        }
+
     def submit_2fa_code(
         self, service: str, provider: str, account: str, code: str
     ) -> None:
@@ -400,6 +751,125 @@ class ScrapingService:
         with get_db_context() as db:
             history_repo = ScrapingHistoryRepository(db)
             history_repo.record_scrape_end(process_id, history_repo.FAILED)
+        publish_status(process_id, history_repo.FAILED, final=True)
+
+    async def stream_events(
+        self, scraping_process_id: int, last_event_id: int = 0
+    ) -> AsyncIterator[str]:
+        """
+        Stream a scraping process's updates as Server-Sent Events.
+
+        Replays the events after ``last_event_id`` and then pushes live ones
+        until the scrape ends. A process the event bus no longer remembers
+        (finished long ago, or started before a server restart) gets a
+        single status event read from the history table — final unless the
+        row is still in progress, in which case the stream stays open for
+        whatever the process publishes next.
+
+        Parameters
+        ----------
+        scraping_process_id : int
+            ID of the scraping history record to follow.
+        last_event_id : int, optional
+            ``Last-Event-ID`` sent by a reconnecting client.
+
+        Yields
+        ------
+        str
+            ``text/event-stream`` frames, including keep-alive comments.
+        """
+        process_id = int(scraping_process_id)
+        if not scrape_events.knows(process_id):
+            status = await run_in_threadpool(_read_scraping_status, process_id)
+            final = status["status"] not in (
+                ScrapingHistoryRepository.IN_PROGRESS,
+                ScrapingHistoryRepository.WAITING_FOR_2FA,
+            )
+            yield ScrapeEvent(process_id, 0, STATUS_EVENT, status, final).to_sse()
+            if final:
+                return
+        async for event in scrape_events.subscribe(process_id, last_event_id):
+            yield SSE_KEEP_ALIVE if event is None else event.to_sse()
+
+    def _prepare_adapter(
+        self,
+        service: str,
+        provider: str,
+        account: str,
+        scraping_period_days: Optional[int] = None,
+        force_2fa: bool = False,
+    ) -> tuple[ScraperAdapter, int]:
+        """
+        Record a scraping history entry and build the adapter for an account.
+
+        Parameters
+        ----------
+        service : str
+            Service type of the account.
+        provider : str
+            Provider identifier of the account.
+        account : str
+            Account name used to look up credentials.
+        scraping_period_days : int, optional
+            Number of days to scrape back from today; ``None`` uses the
+            automatic start date.
+        force_2fa : bool
+            Drop any stored long-term OTP token so the scrape re-authenticates.
+
+        Returns
+        -------
+        tuple[ScraperAdapter, int]
+            The adapter, not yet launched, and the ``process_id`` of its
+            history record.
+        """
+        if scraping_period_days is not None:
+            start_date = date.today() - timedelta(days=scraping_period_days)
+        else:
+            start_date = self._get_scraper_start_date(service, provider, account)
+        creds = self.credentials_repo.get_credentials(service, provider, account)
+        # A forced re-auth must ignore any stored OneZero long-term token so the
+        # scraper falls into the interactive SMS flow; the adapter persists the
+        # fresh token afterwards.
+        if force_2fa:
+            creds = {k: v for k, v in creds.items() if k != "otpLongTermToken"}
+
+        # Always start IN_PROGRESS — even for 2FA-capable providers. The
+        # adapter's _otp_callback flips status to WAITING_FOR_2FA only when
+        # the scraper actually awaits the OTP, so the UI never shows a 2FA
+        # prompt for providers that didn't end up needing one (e.g. Hapoalim
+        # from a trusted device, OneZero with a stored long-term token).
+        with get_db_context() as db:
+            history_repo = ScrapingHistoryRepository(db)
+            process_id = history_repo.record_scrape_start(
+                service, provider, account, start_date, history_repo.IN_PROGRESS
+            )
+
+        adapter = create_adapter(
+            service, provider, account, creds, start_date, process_id,
+            force_2fa=force_2fa,
+        )
+        return adapter, process_id
+
+    def _release_unlaunched(self, name: str, adapter: ScraperAdapter) -> None:
+        """Undo the registration of an adapter that never got launched.
+
+        Drops its ``_active_scrapers`` entry (only if it is still this
+        adapter) and closes its history row as failed, so the account is
+        not left single-flight-locked behind an ``IN_PROGRESS`` row.
+
+        Parameters
+        ----------
+        name : str
+            The ``"service - provider - account"`` key of the adapter.
+        adapter : ScraperAdapter
+            The adapter that was registered but not launched.
+        """
+        if _active_scrapers.get(name) is adapter:
+            _active_scrapers.pop(name, None)
+        with get_db_context() as db:
+            history_repo = ScrapingHistoryRepository(db)
+            history_repo.record_scrape_end(adapter.process_id, history_repo.FAILED)
+        publish_status(adapter.process_id, history_repo.FAILED, final=True)
 
     def _get_scraper_start_date(
         self, service: str, provider: str, account: str
@@ -438,43 +908,3 @@ class ScrapingService:
         else:
             start_date = date.today() - timedelta(days=365)
         return start_date
-
-    def _collect_adapters(
-        self, credentials: Dict
-    ) -> tuple[Dict[str, ScraperAdapter], Dict[str, ScraperAdapter]]:
-        """
-        Build adapter instances for all accounts in a credentials dict.
-
-        Parameters
-        ----------
-        credentials : dict
-            Nested credentials dict in the form
-            ``{service: {provider: {account: creds}}}``.
-
-        Returns
-        -------
-        tuple[dict, dict]
-            A ``(normal, tfa)`` pair where ``normal`` maps account name strings
-            to adapters that do not require 2FA, and ``tfa`` maps to adapters
-            that do require 2FA.
-
-        Notes
-        -----
-        This method is not called by the current scraping flow (which creates
-        adapters one at a time via ``start_scraping_single``) and may be unused.
-        """
-        normal: Dict[str, ScraperAdapter] = {}
-        tfa: Dict[str, ScraperAdapter] = {}
-        for service, providers in credentials.items():
-            for provider, accounts in providers.items():
-                for account, acc_creds in accounts.items():
-                    name = f"{service} - {provider} - {account}"
-                    start = self._get_scraper_start_date(service, provider, account)
-                    adapter = create_adapter(
-                        service, provider, account, acc_creds, start, 0
-                    )
-                    if is_2fa_required(service, provider):
-                        tfa[name] = adapter
-                    else:
-                        normal[name] = adapter
-        return normal, tfa
@@ -0,0 +1,268 @@
+"""Process-wide write generations of the database tables.
+
+The session cache (:mod:`backend.utils.session_cache`) lives for one
+request. Derived values that are expensive to rebuild and requested over
+and over — the retirement planner recomputes the user's current status
+on every slider move — need a cache that survives across requests and is
+still never stale.
+
+Every committed ``INSERT`` / ``UPDATE`` / ``DELETE`` advances a global
+write counter and stamps the tables it touched with the new value; DDL
+and out-of-band changes (the database file being swapped by a backup
+restore or demo-mode toggle, see :func:`invalidate_all`) stamp every
+table. :func:`data_generation` is the latest stamp over the tables a
+value depends on, so a value cached under it is valid exactly until one
+of those tables next changes.
+
+Writes are detected with engine-level events on the SQL actually
+executed, so ORM unit-of-work flushes, ``session.execute(update(...))``
+and raw ``engine.connect()`` writes are all counted. They count at
+commit, not at execution: a reader never caches data from an
+uncommitted transaction under a generation other readers would trust.
+
+SQLAlchemy's ``commit`` event fires *before* the DBAPI commit, so a reader
+on another thread can read the old rows under the generation that event
+published. The written tables are therefore stamped twice: when the
+commit starts and again when the connection goes back to the pool, after
+the commit has landed. Whatever was cached in between is keyed by a
+generation that is already gone.
+
+Other processes (the CLI scraper) write the same file without going
+through these events; their commits are noticed through the size and
+modification time of the database file and its write-ahead log, which
+are part of every cache key.
+"""
+
+import copy
+import functools
+import inspect
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Callable, Hashable, Iterable, Optional, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import Pool
+
+_ALL_TABLES = "*"
+_PENDING_KEY = "_pending_table_writes"
+_COMMITTED_KEY = "_committed_table_writes"
+
+_WRITE_RE = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)"
+    r"\s+[`\"\[]?(\w+)",
+    re.IGNORECASE,
+)
+_DDL_RE = re.compile(r"^\s*(?:CREATE|DROP|ALTER)\b", re.IGNORECASE)
+
+_lock = threading.Lock()
+_counter = 0
+_last_write: dict[str, int] = {}
+
+_CACHE_SIZE = 64
+_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def data_generation(
+    ignore: Iterable[str] = (), tables: Optional[Iterable[str]] = None
+) -> int:
+    """Return the current write generation of every table not in ``ignore``.
+
+    Parameters
+    ----------
+    ignore : iterable of str
+        Table names whose writes should not count (e.g. a settings table
+        the cached value does not read).
+    tables : iterable of str, optional
+        Restrict the generation to these tables (plus out-of-band changes)
+        for values that read only a few of them.
+
+    Returns
+    -------
+    int
+        A number that changes whenever a write to any of the tables is
+        committed.
+    """
+    ignored = set(ignore)
+    watched = None if tables is None else {*tables, _ALL_TABLES}
+    with _lock:
+        return max(
+            (
+                gen
+                for table, gen in _last_write.items()
+                if table not in ignored and (watched is None or table in watched)
+            ),
+            default=0,
+        )
+
+
+def invalidate_all() -> None:
+    """Advance the generation of every table.
+
+    For changes the write tracking cannot see, such as the database file
+    being replaced while the process runs.
+    """
+    _bump({_ALL_TABLES})
+
+
+def has_pending_writes(db: Session) -> bool:
+    """Whether ``db`` holds writes that are not committed yet.
+
+    Values derived inside such a session reflect data other sessions
+    cannot see (and that may still roll back), so they must not be cached
+    process-wide.
+    """
+    if db.new or db.dirty or db.deleted:
+        return True
+    if not db.in_transaction():
+        return False
+    return bool(db.connection().info.get(_PENDING_KEY))
+
+
+def generation_memoized(
+    name: str,
+    ignore: Iterable[str] = (),
+    tables: Optional[Iterable[str]] = None,
+    shared: bool = False,
+) -> Callable[[_F], _F]:
+    """Memoize a service method process-wide until its data changes.
+
+    The key is the method's bound arguments (as in
+    :func:`~backend.utils.session_cache.session_memoized`), the database
+    URL, today's date (derived values such as "complete months" move with
+    the calendar) and :func:`data_generation`. Results are deep-copied in
+    and out unless ``shared`` is set. The cache is bypassed when the object has no real ``Session``
+    as ``self.db`` or that session has uncommitted writes.
+
+    Parameters
+    ----------
+    name : str
+        Cache-key namespace, e.g. ``"retirement.current_status"``.
+    ignore : iterable of str
+        Tables whose writes do not affect the result.
+    tables : iterable of str, optional
+        The only tables whose writes affect the result.
+    shared : bool
+        Hand out the cached object itself. Only for immutable results.
+
+    Returns
+    -------
+    Callable
+        Decorator returning the memoized method.
+    """
+    ignored = tuple(ignore)
+    watched = None if tables is None else tuple(tables)
+    store = (lambda value: value) if shared else copy.deepcopy
+
+    def decorator(method: _F) -> _F:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            db = getattr(self, "db", None)
+            if not isinstance(db, Session) or has_pending_writes(db):
+                return method(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key: tuple[Hashable, ...] = (
+                name,
+                str(db.get_bind().url),
+                date.today(),
+                data_generation(ignored, watched),
+                _file_stamp(db),
+                *tuple(bound.arguments.items())[1:],
+            )
+            with _lock:
+                if key in _cache:
+                    _cache.move_to_end(key)
+                    return store(_cache[key])
+
+            result = method(self, *args, **kwargs)
+            with _lock:
+                _cache[key] = store(result)
+                while len(_cache) > _CACHE_SIZE:
+                    _cache.popitem(last=False)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _file_stamp(db: Session) -> tuple:
+    """Size and modification time of the SQLite file and its write-ahead log.
+
+    Changes when any process commits to the file. Empty for in-memory and
+    non-SQLite databases.
+    """
+    url = db.get_bind().url
+    path = url.database
+    if url.get_backend_name() != "sqlite" or not path or path == ":memory:":
+        return ()
+    stamp = []
+    for candidate in (path, path + "-wal"):
+        try:
+            stat = os.stat(candidate)
+        except OSError:
+            stamp.append(None)
+        else:
+            stamp.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(stamp)
+
+
+def _bump(tables: set[str]) -> None:
+    """Stamp ``tables`` with a new generation."""
+    global _counter
+    with _lock:
+        _counter += 1
+        for table in tables:
+            _last_write[table] = _counter
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_write(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Remember which tables the connection's open transaction wrote."""
+    match = _WRITE_RE.match(statement)
+    if match:
+        table = match.group(1).lower()
+    elif _DDL_RE.match(statement):
+        table = _ALL_TABLES
+    else:
+        return
+    conn.info.setdefault(_PENDING_KEY, set()).add(table)
+
+
+@event.listens_for(Engine, "commit")
+def _publish_writes(conn) -> None:
+    """Advance the generation of the tables the committing transaction wrote.
+
+    Runs just before the DBAPI commit; the tables are stamped once more by
+    :func:`_republish_writes` once it has completed.
+    """
+    tables = conn.info.pop(_PENDING_KEY, None)
+    if tables:
+        _bump(tables)
+        conn.info.setdefault(_COMMITTED_KEY, set()).update(tables)
+
+
+@event.listens_for(Pool, "checkin")
+def _republish_writes(dbapi_connection, connection_record) -> None:
+    """Stamp the tables committed on a connection again as it is released."""
+    if connection_record is None:
+        return
+    tables = connection_record.info.pop(_COMMITTED_KEY, None)
+    if tables:
+        _bump(tables)
+
+
+@event.listens_for(Engine, "rollback")
+def _discard_writes(conn) -> None:
+    """Forget writes that were rolled back."""
+    conn.info.pop(_PENDING_KEY, None)
@@ -10,10 +10,22 @@ cache collapses those to one read.
 Invalidation: every repository write method commits immediately, so the
 cache is cleared on every ``commit()`` / ``rollback()`` via global Session
 event listeners. A long-lived session (tests, the scrape pipeline) therefore
-never observes stale frames after a write.
+never observes stale frames after a write. Each commit therefore starts a
+new "generation" of the transaction tables as far as cached readers are
+concerned.
+
+Derived results that are not DataFrames (e.g. the recurring-charge dict
+built from the itemized table) may be cached too; they are deep-copied on
+the way in and out for the same reason frames are. ``session_memoized``
+wraps a service method so its result becomes one node of a per-request
+computation graph: every service built on the same session (the dashboard
+bundle, insights, the forecast) shares each intermediate, computed once.
 """
 
-from typing import Hashable
+import copy
+import functools
+import inspect
+from typing import Any, Callable, Hashable, TypeVar
 
 import pandas as pd
 from sqlalchemy import event
@@ -21,9 +33,11 @@ from sqlalchemy.orm import Session
 
 _INFO_KEY = "_dataframe_cache"
 
+_F = TypeVar("_F", bound=Callable[..., Any])
 
-def session_cache_get(db: Session, key: tuple[Hashable, ...]) -> pd.DataFrame | None:
-    """Return a copy of the cached frame for ``key``, or None on miss.
+
+def session_cache_get(db: Session, key: tuple[Hashable, ...]) -> pd.DataFrame | Any | None:
+    """Return a copy of the cached value for ``key``, or None on miss.
 
     Parameters
     ----------
@@ -35,15 +49,17 @@ def session_cache_get(db: Session, key: tuple[Hashable, ...]) -> pd.DataFrame |
 
     Returns
     -------
-    pd.DataFrame | None
-        A defensive copy of the cached frame (callers routinely mutate
+    pd.DataFrame | Any | None
+        A defensive copy of the cached value (callers routinely mutate
         DataFrames in place), or None when absent.
     """
     cached = db.info.get(_INFO_KEY, {}).get(key)
-    return cached.copy() if cached is not None else None
+    if cached is None:
+        return None
+    return _copy_value(cached)
 
 
-def session_cache_set(db: Session, key: tuple[Hashable, ...], df: pd.DataFrame) -> None:
+def session_cache_set(db: Session, key: tuple[Hashable, ...], df: pd.DataFrame | Any) -> None:
     """Store a copy of ``df`` in the session cache under ``key``.
 
     Parameters
@@ -52,11 +68,56 @@ def session_cache_set(db: Session, key: tuple[Hashable, ...], df: pd.DataFrame)
         The request-scoped SQLAlchemy session.
     key : tuple
         Hashable cache key.
-    df : pd.DataFrame
-        Frame to cache. A copy is stored so later caller-side mutation
-        of ``df`` cannot corrupt the cache.
+    df : pd.DataFrame | Any
+        Frame (or other derived value) to cache. A copy is stored so later
+        caller-side mutation of ``df`` cannot corrupt the cache.
     """
-    db.info.setdefault(_INFO_KEY, {})[key] = df.copy()
+    db.info.setdefault(_INFO_KEY, {})[key] = _copy_value(df)
+
+
+def session_memoized(name: str) -> Callable[[_F], _F]:
+    """Memoize a service method's result in its session cache.
+
+    The decorated method must belong to an object exposing the request
+    session as ``self.db``. Arguments are bound against the signature
+    (defaults applied) so ``f()`` and ``f(flag=False)`` share one entry.
+
+    Parameters
+    ----------
+    name : str
+        Cache-key namespace, e.g. ``"analysis.get_monthly_expenses"``.
+
+    Returns
+    -------
+    Callable
+        Decorator returning the memoized method.
+    """
+
+    def decorator(method: _F) -> _F:
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (name, *tuple(bound.arguments.items())[1:])
+            cached = session_cache_get(self.db, key)
+            if cached is not None:
+                return cached
+            result = method(self, *args, **kwargs)
+            session_cache_set(self.db, key, result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def _copy_value(value: pd.DataFrame | Any) -> pd.DataFrame | Any:
+    """Copy a cached value — ``DataFrame.copy`` for frames, deepcopy otherwise."""
+    if isinstance(value, pd.DataFrame):
+        return value.copy()
+    return copy.deepcopy(value)
 
 
 def _clear_cache(session: Session) -> None:
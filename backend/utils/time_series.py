@@ -0,0 +1,89 @@
+"""
+Alignment helpers for sparse multi-series time data.
+
+Endpoints that chart several step series (debt per liability, balance per
+investment) plus a combined "total" line need every series' value at every
+date any of them has a point. Each series holds its last known value until
+its next point and counts as zero before its first one.
+
+Dates are ``YYYY-MM-DD`` strings, which sort lexicographically in date
+order, so alignment is one ``searchsorted`` per series over the union of
+dates — O((dates + points) log points) instead of scanning every series'
+points for every date.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+def align_series(
+    series: Sequence[Sequence[Dict[str, Any]]],
+    date_key: str = "date",
+    value_key: str = "balance",
+) -> Tuple[List[str], np.ndarray]:
+    """Forward-fill each series onto the union of all their dates.
+
+    Parameters
+    ----------
+    series : sequence of list[dict]
+        One list of points per series, each point carrying ``date_key`` and
+        ``value_key``. Points need not be sorted; among points sharing a
+        date the one listed last wins.
+    date_key : str, optional
+        Key of the ``YYYY-MM-DD`` date in each point. Default ``"date"``.
+    value_key : str, optional
+        Key of the numeric value in each point. Default ``"balance"``.
+
+    Returns
+    -------
+    tuple[list[str], np.ndarray]
+        The sorted union of dates, and a ``(len(series), len(dates))``
+        matrix whose row ``i`` is series ``i``'s last value on or before
+        each date (``0.0`` before its first point).
+    """
+    per_series = []
+    for points in series:
+        dates = np.array([str(p[date_key]) for p in points], dtype=str)
+        values = np.array([p[value_key] for p in points], dtype=float)
+        order = np.argsort(dates, kind="stable")
+        per_series.append((dates[order], values[order]))
+
+    if not per_series:
+        return [], np.zeros((0, 0))
+    union = np.unique(np.concatenate([d for d, _ in per_series]))
+
+    aligned = np.zeros((len(per_series), len(union)))
+    for row, (dates, values) in enumerate(per_series):
+        if not len(dates):
+            continue
+        idx = np.searchsorted(dates, union, side="right") - 1
+        aligned[row] = np.where(idx >= 0, values[np.maximum(idx, 0)], 0.0)
+    return union.tolist(), aligned
+
+
+def sum_series(
+    series: Sequence[Sequence[Dict[str, Any]]],
+    date_key: str = "date",
+    value_key: str = "balance",
+) -> List[Dict[str, Any]]:
+    """Build a combined line: the sum of all series at every date.
+
+    Parameters
+    ----------
+    series : sequence of list[dict]
+        Per-series points, as for :func:`align_series`.
+    date_key : str, optional
+        Key of the date in each point (and in the output). Default ``"date"``.
+    value_key : str, optional
+        Key of the value in each point (and in the output). Default
+        ``"balance"``.
+
+    Returns
+    -------
+    list[dict]
+        ``{date_key: str, value_key: float}`` per union date, ascending.
+    """
+    dates, aligned = align_series(series, date_key, value_key)
+    totals = aligned.sum(axis=0).tolist()
+    return [{date_key: d, value_key: v} for d, v in zip(dates, totals)]
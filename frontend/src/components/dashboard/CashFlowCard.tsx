@@ -1,18 +1,19 @@
 import { useQuery } from "@tanstack/react-query";
-import { analyticsApi } from "../../services/api";
 import { SankeyChart } from "../SankeyChart";
 import { Skeleton } from "../common/Skeleton";
 import { useQueryKeys } from "../../hooks/useQueryKeys";
+import { useDashboardPanel } from "../../hooks/useDashboardPanel";
 import { useTranslation } from "react-i18next";
 
 /** Cash Flow (Sankey) dashboard card. */
 export function CashFlowCard() {
   const { t } = useTranslation();
   const qk = useQueryKeys();
+  const dashboardPanel = useDashboardPanel();
 
   const { data: sankeyData, isLoading: sankeyLoading } = useQuery({
     queryKey: qk.analytics.sankey(),
-    queryFn: async () => (await analyticsApi.getSankeyData()).data,
+    queryFn: () => dashboardPanel("sankey"),
   });
 
   return (
@@ -10,9 +10,9 @@ import {
 } from "recharts";
 import { TrendingUp, Wallet, CalendarClock } from "lucide-react";
 import { useTranslation } from "react-i18next";
-import { analyticsApi } from "../../services/api";
 import { Skeleton } from "../common/Skeleton";
 import { useQueryKeys } from "../../hooks/useQueryKeys";
+import { useDashboardPanel } from "../../hooks/useDashboardPanel";
 import { formatCurrency } from "../../utils/numberFormatting";
 import { AXIS_DEFAULTS, CHART_COLORS, formatAxisNumber } from "../../utils/chartStyle";
 import { ChartTooltip } from "../charts/ChartTooltip";
@@ -24,19 +24,17 @@ import { formatDate } from "../../utils/dateFormatting";
  *
  * Surfaces the projected month-end bank balance and the "safe to spend"
  * figure — the headline numbers Israeli budgeting apps lead with — backed by
- * a trend-based projection of the rest of the month. Reads from
- * ``/analytics/cash-flow-forecast``.
+ * a trend-based projection of the rest of the month. Reads the
+ * ``cash_flow_forecast`` panel of ``/analytics/dashboard``.
  */
 export function CashFlowForecastSection() {
   const { t, i18n } = useTranslation();
   const qk = useQueryKeys();
+  const dashboardPanel = useDashboardPanel();
 
   const { data, isLoading } = useQuery({
     queryKey: qk.analytics.cashFlowForecast(),
-    queryFn: async () => {
-      const res = await analyticsApi.getCashFlowForecast();
-      return res.data;
-    },
+    queryFn: () => dashboardPanel("cash_flow_forecast"),
   });
 
   if (isLoading) {
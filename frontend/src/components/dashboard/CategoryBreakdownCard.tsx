@@ -1,7 +1,8 @@
 import { useQuery } from "@tanstack/react-query";
 import { TrendingDown, Tag } from "lucide-react";
-import { analyticsApi, taggingApi } from "../../services/api";
+import { taggingApi } from "../../services/api";
 import { useQueryKeys } from "../../hooks/useQueryKeys";
+import { useDashboardPanel } from "../../hooks/useDashboardPanel";
 import { useTranslation } from "react-i18next";
 import { formatCurrency } from "../../utils/numberFormatting";
 
@@ -9,10 +10,11 @@ import { formatCurrency } from "../../utils/numberFormatting";
 export function CategoryBreakdownCard() {
   const { t } = useTranslation();
   const qk = useQueryKeys();
+  const dashboardPanel = useDashboardPanel();
 
   const { data: categoryData } = useQuery({
     queryKey: qk.analytics.byCategory(),
-    queryFn: async () => (await analyticsApi.getByCategory()).data,
+    queryFn: () => dashboardPanel("by_category"),
   });
   const { data: categoryIcons } = useQuery({
     queryKey: qk.tagging.icons(),
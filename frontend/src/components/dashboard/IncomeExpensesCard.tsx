@@ -3,6 +3,7 @@ import { useQuery } from "@tanstack/react-query";
 import { TrendingUp, TrendingDown, ArrowUp, ArrowDown, Minus, ChevronDown, ChevronUp } from "lucide-react";
 import { analyticsApi } from "../../services/api";
 import { useQueryKeys } from "../../hooks/useQueryKeys";
+import { useDashboardPanel } from "../../hooks/useDashboardPanel";
 import { useTranslation } from "react-i18next";
 import { formatCurrency, formatCompactCurrency, formatChange } from "../../utils/numberFormatting";
 import { formatMonthShort } from "../../utils/dateFormatting";
@@ -78,22 +79,30 @@ export function IncomeExpensesCard() {
   const [excludePendingRefunds, setExcludePendingRefunds] = useState(true);
   const [includeProjects, setIncludeProjects] = useState(false);
   const [excludeRefunds, setExcludeRefunds] = useState(false);
+  const dashboardPanel = useDashboardPanel();
 
+  // The bundle carries the initial filter state; toggled filters fetch their own variant.
   const { data: incomeOutcome } = useQuery({
     queryKey: qk.analytics.incomeExpensesOverTime(includeProjects, excludeRefunds),
-    queryFn: async () => (await analyticsApi.getIncomeExpensesOverTime(!includeProjects, false, excludeRefunds)).data,
+    queryFn: async () =>
+      !includeProjects && !excludeRefunds
+        ? dashboardPanel("income_expenses_over_time")
+        : (await analyticsApi.getIncomeExpensesOverTime(!includeProjects, false, excludeRefunds)).data,
   });
   const { data: expensesByCategoryOverTime } = useQuery({
     queryKey: qk.analytics.expensesByCategoryOverTime(),
-    queryFn: async () => (await analyticsApi.getExpensesByCategoryOverTime()).data,
+    queryFn: () => dashboardPanel("expenses_by_category_over_time"),
   });
   const { data: incomeBySourceData } = useQuery({
     queryKey: qk.analytics.incomeBySourceOverTime(),
-    queryFn: async () => (await analyticsApi.getIncomeBySourceOverTime()).data,
+    queryFn: () => dashboardPanel("income_by_source_over_time"),
   });
   const { data: monthlyExpenses } = useQuery({
     queryKey: qk.analytics.monthlyExpenses(excludePendingRefunds, includeProjects),
-    queryFn: async () => (await analyticsApi.getMonthlyExpenses(excludePendingRefunds, includeProjects)).data,
+    queryFn: async () =>
+      excludePendingRefunds && !includeProjects
+        ? dashboardPanel("monthly_expenses")
+        : (await analyticsApi.getMonthlyExpenses(excludePendingRefunds, includeProjects)).data,
   });
 
   return (
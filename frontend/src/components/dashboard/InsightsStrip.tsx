@@ -1,8 +1,9 @@
 import { useQuery } from "@tanstack/react-query";
 import { useTranslation } from "react-i18next";
 import { AlertTriangle, Info, Sparkles, Lightbulb } from "lucide-react";
-import { analyticsApi, type Insight } from "../../services/api";
+import type { Insight } from "../../services/api";
 import { useQueryKeys } from "../../hooks/useQueryKeys";
+import { useDashboardPanel } from "../../hooks/useDashboardPanel";
 import { formatCurrency } from "../../utils/numberFormatting";
 
 const SEVERITY_STYLES: Record<Insight["severity"], { box: string; icon: typeof Info }> = {
@@ -47,18 +48,16 @@ function useInsightMessage() {
   };
 }
 
-/** Horizontal strip of rule-based insight cards from ``/analytics/insights``. */
+/** Horizontal strip of rule-based insight cards (``insights`` in ``/analytics/dashboard``). */
 export function InsightsStrip() {
   const { t } = useTranslation();
   const qk = useQueryKeys();
   const message = useInsightMessage();
+  const dashboardPanel = useDashboardPanel();
 
   const { data } = useQuery({
     queryKey: qk.analytics.insights(),
-    queryFn: async () => {
-      const res = await analyticsApi.getInsights();
-      return res.data;
-    },
+    queryFn: () => dashboardPanel("insights"),
   });
 
   if (!data || data.length === 0) return null;
@@ -14,8 +14,8 @@ import {
   Legend,
   Cell,
 } from "recharts";
-import { analyticsApi } from "../../services/api";
 import { useQueryKeys } from "../../hooks/useQueryKeys";
+import { useDashboardPanel } from "../../hooks/useDashboardPanel";
 import { useTranslation } from "react-i18next";
 import { formatCurrency, formatChange, formatPercentChange } from "../../utils/numberFormatting";
 import {
@@ -42,15 +42,16 @@ export function NetWorthCard() {
   const { t } = useTranslation();
   const qk = useQueryKeys();
   const [netWorthView, setNetWorthView] = useState<NetWorthView>("all");
+  const dashboardPanel = useDashboardPanel();
 
   const { data: debtPaymentsData } = useQuery({
     queryKey: qk.analytics.debtPayments(),
-    queryFn: async () => (await analyticsApi.getDebtPaymentsOverTime()).data,
+    queryFn: () => dashboardPanel("debt_payments_over_time"),
   });
 
   const { data: netWorthData } = useQuery({
     queryKey: qk.analytics.netWorthOverTime(),
-    queryFn: async () => (await analyticsApi.getNetWorthOverTime()).data,
+    queryFn: () => dashboardPanel("net_worth_over_time"),
   });
 
   const netWorthDeltas = useMemo(() => {
@@ -1,8 +1,9 @@
 import { useQuery } from "@tanstack/react-query";
 import { useTranslation } from "react-i18next";
 import { Repeat } from "lucide-react";
-import { analyticsApi, type RecurringItem } from "../../services/api";
+import type { RecurringItem } from "../../services/api";
 import { useQueryKeys } from "../../hooks/useQueryKeys";
+import { useDashboardPanel } from "../../hooks/useDashboardPanel";
 import { Skeleton } from "../common/Skeleton";
 import { formatCurrency } from "../../utils/numberFormatting";
 import { formatDate } from "../../utils/dateFormatting";
@@ -14,17 +15,15 @@ const STATUS_STYLES: Record<RecurringItem["status"], string> = {
   ended: "bg-rose-500/15 text-rose-300",
 };
 
-/** Dashboard subscriptions / recurring-charges panel from ``/analytics/recurring``. */
+/** Dashboard subscriptions / recurring-charges panel (``recurring`` in ``/analytics/dashboard``). */
 export function RecurringSection() {
   const { t } = useTranslation();
   const qk = useQueryKeys();
+  const dashboardPanel = useDashboardPanel();
 
   const { data, isLoading } = useQuery({
     queryKey: qk.analytics.recurring(),
-    queryFn: async () => {
-      const res = await analyticsApi.getRecurring();
-      return res.data;
-    },
+    queryFn: () => dashboardPanel("recurring"),
   });
 
   return (
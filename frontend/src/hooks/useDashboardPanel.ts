@@ -0,0 +1,28 @@
+import { useCallback } from "react";
+import { useQueryClient } from "@tanstack/react-query";
+import { analyticsApi, type DashboardBundle } from "../services/api";
+import { useQueryKeys } from "./useQueryKeys";
+
+/**
+ * Fetcher for one panel of the `/analytics/dashboard` bundle.
+ *
+ * Dashboard cards keep their own query keys but resolve them through one
+ * shared bundle query, so opening the page costs a single round trip and the
+ * backend computes the overlapping intermediates once. Invalidating
+ * `qkPrefix.analytics` marks the bundle stale as well, and the cards that
+ * refetch then share one new bundle request.
+ */
+export function useDashboardPanel() {
+  const queryClient = useQueryClient();
+  const qk = useQueryKeys();
+  return useCallback(
+    async <K extends keyof DashboardBundle>(panel: K): Promise<DashboardBundle[K]> => {
+      const bundle = await queryClient.fetchQuery({
+        queryKey: qk.analytics.dashboard(),
+        queryFn: async () => (await analyticsApi.getDashboard()).data,
+      });
+      return bundle[panel];
+    },
+    [queryClient, qk],
+  );
+}
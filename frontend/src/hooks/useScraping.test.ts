@@ -20,6 +20,9 @@ vi.mock("../services/api", () => ({
     resend2fa: vi
       .fn()
       .mockResolvedValue({ data: { status: "resent", process_id: 1 } }),
+    // No event stream by default, so these suites exercise the polling
+    // fallback; the stream suite below overrides it.
+    streamEvents: vi.fn().mockRejectedValue(new Error("no stream")),
   },
 }));
 
@@ -601,3 +604,64 @@ describe("useScraping — initial 2FA cooldown", () => {
     );
   });
 });
+
+describe("useScraping — status stream", () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it("applies pushed statuses without polling", async () => {
+    const qc = new QueryClient();
+    const invalidate = vi.spyOn(qc, "invalidateQueries");
+    const localWrapper = ({ children }: { children: ReactNode }) =>
+      createElement(QueryClientProvider, { client: qc }, children);
+
+    (scrapingApi.start as ReturnType<typeof vi.fn>).mockResolvedValueOnce({
+      data: 90,
+    });
+    let push: ((event: { type: string; data: object }) => void) | undefined;
+    (scrapingApi.streamEvents as ReturnType<typeof vi.fn>).mockImplementation(
+      (_id: number, onEvent: typeof push) => {
+        push = onEvent;
+        return new Promise(() => {});
+      },
+    );
+
+    const { result } = renderHook(() => useScraping(), {
+      wrapper: localWrapper,
+    });
+    await act(async () => {
+      await result.current.startScraper(acc, 30);
+    });
+    expect(scrapingApi.streamEvents).toHaveBeenCalledWith(
+      90,
+      expect.any(Function),
+      expect.any(AbortSignal),
+    );
+
+    await act(async () => {
+      push!({
+        type: "status",
+        data: { status: "waiting_for_2fa", process_id: 90 },
+      });
+    });
+    expect(result.current.getScraperForAccount(acc)?.status).toBe(
+      "waiting_for_2fa",
+    );
+    expect(result.current.resendCooldownRemaining(90)).toBeGreaterThan(0);
+
+    invalidate.mockClear();
+    await act(async () => {
+      push!({ type: "status", data: { status: "success", process_id: 90 } });
+      await vi.advanceTimersByTimeAsync(2000 * 3);
+    });
+    expect(result.current.getScraperForAccount(acc)?.status).toBe("success");
+    expect(invalidate).toHaveBeenCalled();
+    expect(scrapingApi.getStatus).not.toHaveBeenCalled();
+  });
+});
@@ -1,6 +1,7 @@
-import { useState, useEffect, useCallback } from "react";
+import { useState, useEffect, useCallback, useRef } from "react";
 import { useMutation, useQueryClient } from "@tanstack/react-query";
 import { scrapingApi } from "../services/api";
+import type { ScrapeStatusPayload } from "../services/api";
 import { qkPrefix } from "../services/queryKeys";
 
 export interface Account {
@@ -60,7 +61,7 @@ export const INITIAL_2FA_COOLDOWN_SECONDS = 30;
  *
  * A successful scrape writes new transactions (and, for insurance
  * providers, new policy balances) straight into the DB. Completion is
- * detected by POLLING, not by a mutation, so the shared
+ * detected from the status stream (or polling), not by a mutation, so the shared
  * `MutationCache.onSuccess` sweep in `queryClient.ts` never fires for it —
  * whatever isn't listed here stays stale for the full 5-minute
  * `staleTime`, i.e. freshly scraped transactions were invisible on the
@@ -361,7 +362,124 @@ export function useScraping() {
     (s) => s.status === "in_progress" || s.status === "waiting_for_2fa",
   );
 
-  // Polling effect
+  // Apply a status reported by the event stream or a poll.
+  const applyStatus = useCallback(
+    (scraper: ScraperState, payload: ScrapeStatusPayload) => {
+      const newStatus = payload.status;
+      const errorMessage = payload.error_message ?? undefined;
+      const errorType = payload.error_type ?? undefined;
+
+      if (newStatus === "waiting_for_2fa") {
+        // Seed the resend cooldown from the moment the button appears.
+        // `!== undefined` rather than a falsy check: an already-elapsed
+        // deadline must not be re-seeded, and it also keeps a real resend's
+        // longer cooldown from being clobbered back down to 30s.
+        setResendCooldownEnd((prev) =>
+          prev[scraper.process_id] !== undefined
+            ? prev
+            : {
+                ...prev,
+                [scraper.process_id]:
+                  Date.now() + INITIAL_2FA_COOLDOWN_SECONDS * 1000,
+              },
+        );
+      }
+
+      if (
+        newStatus !== scraper.status ||
+        Date.now() - scraper.last_updated > 5000
+      ) {
+        if (newStatus === "success" && scraper.status !== "success") {
+          for (const queryKey of SCRAPE_COMPLETION_PREFIXES) {
+            queryClient.invalidateQueries({ queryKey });
+          }
+        }
+        setRunningScrapers((prev) => ({
+          ...prev,
+          [scraper.process_id]: {
+            ...scraper,
+            status: newStatus,
+            error_message: errorMessage,
+            error_type: errorType,
+            last_updated: Date.now(),
+          },
+        }));
+      }
+    },
+    [queryClient],
+  );
+
+  // Latest state for the stream callbacks, which outlive a render.
+  const runningRef = useRef(runningScrapers);
+  useEffect(() => {
+    runningRef.current = runningScrapers;
+  }, [runningScrapers]);
+
+  // Open event streams by process id, and the processes whose stream failed
+  // and are polled instead.
+  const streamsRef = useRef(new Map<number, AbortController>());
+  const pollOnlyRef = useRef(new Set<number>());
+
+  // Status stream effect: one Server-Sent Events stream per active scrape
+  // pushes status changes (and the 2FA prompt) as they happen. The server
+  // closes it after the final status.
+  useEffect(() => {
+    const activeIds = new Set(
+      Object.values(runningScrapers)
+        .filter(
+          (s) => s.status === "in_progress" || s.status === "waiting_for_2fa",
+        )
+        .map((s) => s.process_id),
+    );
+    const streams = streamsRef.current;
+    for (const [processId, controller] of streams) {
+      if (!activeIds.has(processId)) {
+        controller.abort();
+        streams.delete(processId);
+      }
+    }
+    for (const processId of activeIds) {
+      if (streams.has(processId) || pollOnlyRef.current.has(processId)) {
+        continue;
+      }
+      const controller = new AbortController();
+      streams.set(processId, controller);
+      scrapingApi
+        .streamEvents(
+          processId,
+          (event) => {
+            if (event.type !== "status") return;
+            const scraper = runningRef.current[processId];
+            if (scraper) {
+              applyStatus(scraper, event.data as unknown as ScrapeStatusPayload);
+            }
+          },
+          controller.signal,
+        )
+        .catch((e) => {
+          console.warn("Status stream failed for", processId, e);
+        })
+        .finally(() => {
+          if (controller.signal.aborted) return;
+          // Ended without us closing it: either the scrape finished, or the
+          // stream broke (proxy, server restart). Poll from here on; a
+          // finished scrape is no longer active, so nothing is polled.
+          streams.delete(processId);
+          pollOnlyRef.current.add(processId);
+        });
+    }
+  }, [runningScrapers, applyStatus]);
+
+  // Close every stream on unmount.
+  useEffect(() => {
+    const streams = streamsRef.current;
+    return () => {
+      for (const controller of streams.values()) controller.abort();
+      streams.clear();
+    };
+  }, []);
+
+  // Polling effect: fallback for scrapes without a working status stream.
   useEffect(() => {
     const activeScrapers = Object.values(runningScrapers).filter(
       (s) => s.status === "in_progress" || s.status === "waiting_for_2fa",
@@ -370,48 +488,10 @@ export function useScraping() {
 
     const checkStatus = async () => {
       for (const scraper of activeScrapers) {
+        if (streamsRef.current.has(scraper.process_id)) continue;
         try {
           const res = await scrapingApi.getStatus(scraper.process_id);
-          const newStatus = res.data.status;
-          const errorMessage = res.data.error_message;
-          const errorType = res.data.error_type;
-
-          if (newStatus === "waiting_for_2fa") {
-            // Seed the resend cooldown from the moment the button appears.
-            // `!== undefined` rather than a falsy check: an already-elapsed
-            // deadline must not be re-seeded, and it also keeps a real resend's
-            // longer cooldown from being clobbered back down to 30s.
-            setResendCooldownEnd((prev) =>
-              prev[scraper.process_id] !== undefined
-                ? prev
-                : {
-                    ...prev,
-                    [scraper.process_id]:
-                      Date.now() + INITIAL_2FA_COOLDOWN_SECONDS * 1000,
-                  },
-            );
-          }
-
-          if (
-            newStatus !== scraper.status ||
-            Date.now() - scraper.last_updated > 5000
-          ) {
-            if (newStatus === "success" && scraper.status !== "success") {
-              for (const queryKey of SCRAPE_COMPLETION_PREFIXES) {
-                queryClient.invalidateQueries({ queryKey });
-              }
-            }
-            setRunningScrapers((prev) => ({
-              ...prev,
-              [scraper.process_id]: {
-                ...scraper,
-                status: newStatus,
-                error_message: errorMessage,
-                error_type: errorType,
-                last_updated: Date.now(),
-              },
-            }));
-          }
+          applyStatus(scraper, res.data);
         } catch (e) {
           console.error("Failed to check status for", scraper.process_id, e);
         }
@@ -420,7 +500,7 @@ export function useScraping() {
 
     const interval = setInterval(checkStatus, 2000);
     return () => clearInterval(interval);
-  }, [runningScrapers, queryClient]);
+  }, [runningScrapers, applyStatus]);
 
   return {
     startScraper,
@@ -179,6 +179,75 @@ export const mockOverview = {
   net_balance_change: 10000,
 };
 
+export const mockIncomeExpensesOverTime = [
+  { month: "2026-01", income: 15000, expenses: 5000 },
+  { month: "2026-02", income: 15000, expenses: 6000 },
+  { month: "2026-03", income: 15000, expenses: 4500 },
+];
+
+export const mockDebtPaymentsOverTime = [
+  { month: "2026-01", amount: 2900, tags: { Mortgage: 2900 } },
+  { month: "2026-02", amount: 2900, tags: { Mortgage: 2900 } },
+];
+
+export const mockExpensesByCategoryOverTime = [
+  { month: "2026-03", categories: { Food: 1200, Transport: 300 } },
+];
+
+export const mockByCategory = {
+  expenses: [
+    { category: "Food", amount: -1200 },
+    { category: "Transport", amount: -300 },
+  ],
+  refunds: [],
+};
+
+export const mockSankey = {
+  nodes: [],
+  links: [],
+};
+
+export const mockNetWorthOverTime = [
+  { month: "2026-01", bank_balance: 45000, investment_value: 30000, cash: 500, net_worth: 75500 },
+  { month: "2026-02", bank_balance: 48000, investment_value: 32000, cash: 500, net_worth: 80500 },
+  { month: "2026-03", bank_balance: 50000, investment_value: 35000, cash: 500, net_worth: 85500 },
+];
+
+export const mockIncomeBySourceOverTime = [
+  { month: "2026-03", sources: { Salary: 15000 }, total: 15000 },
+];
+
+export const mockMonthlyExpenses = {
+  months: [
+    { month: "2026-01", expenses: 5000 },
+    { month: "2026-02", expenses: 6000 },
+    { month: "2026-03", expenses: 4500 },
+  ],
+  avg_3_months: 5167,
+  avg_6_months: 5167,
+  avg_12_months: 5167,
+};
+
+export const mockCashFlowForecast = {
+  month: "2026-03",
+  days_in_month: 31,
+  day_of_month: 15,
+  days_remaining: 16,
+  actual_income: 15000,
+  actual_expenses: 2500,
+  expected_income: 15000,
+  expected_expenses: 5000,
+  projected_net: 10000,
+  current_bank_balance: 50000,
+  projected_end_balance: 47500,
+  safe_to_spend: 2000,
+  safe_to_spend_daily: 125,
+  avg_monthly_income: 15000,
+  avg_monthly_expenses: 5000,
+  committed_remaining: 500,
+  daily: [],
+};
+
 export const mockBudgetRules = [
   {
     id: 1,
@@ -391,60 +460,43 @@ export const handlers = [
     HttpResponse.json(mockOverview),
   ),
   http.get("/api/analytics/income-expenses-over-time", () =>
-    HttpResponse.json([
-      { month: "2026-01", income: 15000, expenses: 5000 },
-      { month: "2026-02", income: 15000, expenses: 6000 },
-      { month: "2026-03", income: 15000, expenses: 4500 },
-    ]),
+    HttpResponse.json(mockIncomeExpensesOverTime),
   ),
   http.get("/api/analytics/debt-payments-over-time", () =>
-    HttpResponse.json([
-      { month: "2026-01", amount: 2900, tags: { Mortgage: 2900 } },
-      { month: "2026-02", amount: 2900, tags: { Mortgage: 2900 } },
-    ]),
+    HttpResponse.json(mockDebtPaymentsOverTime),
   ),
   http.get("/api/analytics/expenses-by-category-over-time", () =>
-    HttpResponse.json([
-      { month: "2026-03", categories: { Food: 1200, Transport: 300 } },
-    ]),
+    HttpResponse.json(mockExpensesByCategoryOverTime),
   ),
   http.get("/api/analytics/by-category", () =>
-    HttpResponse.json({
-      expenses: [
-        { category: "Food", amount: -1200 },
-        { category: "Transport", amount: -300 },
-      ],
-      refunds: [],
-    }),
+    HttpResponse.json(mockByCategory),
   ),
   http.get("/api/analytics/sankey", () =>
-    HttpResponse.json({
-      nodes: [],
-      links: [],
-    }),
+    HttpResponse.json(mockSankey),
   ),
   http.get("/api/analytics/net-worth-over-time", () =>
-    HttpResponse.json([
-      { month: "2026-01", bank_balance: 45000, investment_value: 30000, cash: 500, net_worth: 75500 },
-      { month: "2026-02", bank_balance: 48000, investment_value: 32000, cash: 500, net_worth: 80500 },
-      { month: "2026-03", bank_balance: 50000, investment_value: 35000, cash: 500, net_worth: 85500 },
-    ]),
+    HttpResponse.json(mockNetWorthOverTime),
   ),
   http.get("/api/analytics/income-by-source-over-time", () =>
-    HttpResponse.json([
-      { month: "2026-03", sources: { Salary: 15000 }, total: 15000 },
-    ]),
+    HttpResponse.json(mockIncomeBySourceOverTime),
   ),
   http.get("/api/analytics/monthly-expenses", () =>
+    HttpResponse.json(mockMonthlyExpenses),
+  ),
+  http.get("/api/analytics/dashboard", () =>
     HttpResponse.json({
-      months: [
-        { month: "2026-01", expenses: 5000 },
-        { month: "2026-02", expenses: 6000 },
-        { month: "2026-03", expenses: 4500 },
-      ],
-      avg_3_months: 5167,
-      avg_6_months: 5167,
-      avg_12_months: 5167,
+      overview: mockOverview,
+      cash_flow_forecast: mockCashFlowForecast,
+      insights: [],
+      recurring: { items: [], total_monthly: 0 },
+      net_worth_over_time: mockNetWorthOverTime,
+      debt_payments_over_time: mockDebtPaymentsOverTime,
+      by_category: mockByCategory,
+      sankey: { ...mockSankey, node_labels: [] },
+      income_expenses_over_time: mockIncomeExpensesOverTime,
+      expenses_by_category_over_time: mockExpensesByCategoryOverTime,
+      income_by_source_over_time: mockIncomeBySourceOverTime,
+      monthly_expenses: mockMonthlyExpenses,
     }),
   ),
   http.get("/api/analytics/net-balance-over-time", () =>
@@ -3,7 +3,6 @@ import { useNavigate } from "react-router";
 import { useQuery } from "@tanstack/react-query";
 import { DollarSign } from "lucide-react";
 import {
-  analyticsApi,
   cashBalancesApi,
   bankBalancesApi,
   investmentsApi,
@@ -36,6 +35,7 @@ import { formatCurrency, formatChange, formatPercentChange } from "../utils/numb
 import { formatMonthCompact } from "../utils/dateFormatting";
 import { useDashboardLayout, cardSize, type DashboardCardId } from "../hooks/useDashboardLayout";
 import { useQueryKeys } from "../hooks/useQueryKeys";
+import { useDashboardPanel } from "../hooks/useDashboardPanel";
 
 
 /* How many leading cards render eagerly on first paint. The rest defer until
@@ -320,6 +320,7 @@ export function Dashboard() {
   const [showDemoConfirm, setShowDemoConfirm] = useState(false);
   const { layout } = useDashboardLayout();
   const qk = useQueryKeys();
+  const dashboardPanel = useDashboardPanel();
 
   // ---- Queries used by the page shell + the customizable cards ----
 
@@ -345,10 +346,7 @@ export function Dashboard() {
 
   const { data: netWorthData, isLoading: netWorthLoading } = useQuery({
     queryKey: qk.analytics.netWorthOverTime(),
-    queryFn: async () => {
-      const res = await analyticsApi.getNetWorthOverTime();
-      return res.data;
-    },
+    queryFn: () => dashboardPanel("net_worth_over_time"),
   });
 
   const { data: allTransactions, isLoading: transactionsLoading } = useQuery({
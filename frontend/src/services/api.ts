@@ -28,11 +28,14 @@ export function captureApiTokenFromUrl(): void {
 
 captureApiTokenFromUrl();
 
+function getApiToken(): string | null {
+  return typeof window !== "undefined"
+    ? localStorage.getItem(API_TOKEN_STORAGE_KEY)
+    : null;
+}
+
 api.interceptors.request.use((config) => {
-  const token =
-    typeof window !== "undefined"
-      ? localStorage.getItem(API_TOKEN_STORAGE_KEY)
-      : null;
+  const token = getApiToken();
   if (token) {
     config.headers.Authorization = `Bearer ${token}`;
   }
@@ -338,6 +341,83 @@ export const credentialsApi = {
 };
 
 // Scraping API
+export interface ScrapePhaseSpan {
+  name: string;
+  duration_ms: number;
+  requests: number;
+  rows: number | null;
+  label?: string;
+}
+
+/** Payload of a `status` event — the same shape `/scraping/status` returns. */
+export interface ScrapeStatusPayload {
+  status: string;
+  process_id: number;
+  error_message?: string | null;
+  error_type?: string | null;
+}
+
+/** One event of `/scraping/events`: `status`, `progress` or `2fa_required`. */
+export interface ScrapeStreamEvent {
+  type: string;
+  data: Record<string, unknown>;
+}
+
+/**
+ * Read a scrape's Server-Sent Events until the server closes the stream.
+ *
+ * Uses `fetch` streaming rather than `EventSource`, which cannot send the
+ * `Authorization` header remote clients need. Resolves when the stream ends
+ * (after the scrape's final status), rejects on HTTP or network errors, and
+ * stops quietly when `signal` is aborted.
+ */
+async function streamScrapeEvents(
+  processId: number,
+  onEvent: (event: ScrapeStreamEvent) => void,
+  signal: AbortSignal,
+): Promise<void> {
+  const headers: Record<string, string> = { Accept: "text/event-stream" };
+  const token = getApiToken();
+  if (token) headers.Authorization = `Bearer ${token}`;
+  const res = await fetch(
+    `/api/scraping/events?scraping_process_id=${processId}`,
+    { headers, signal },
+  );
+  if (!res.ok || !res.body) {
+    throw new Error(`Scrape event stream failed (${res.status})`);
+  }
+
+  const reader = res.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  try {
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) return;
+      buffer += decoder.decode(value, { stream: true }).replace(/\r\n/g, "\n");
+      let end = buffer.indexOf("\n\n");
+      while (end !== -1) {
+        const frame = buffer.slice(0, end);
+        buffer = buffer.slice(end + 2);
+        let type = "message";
+        const data: string[] = [];
+        for (const line of frame.split("\n")) {
+          // Lines starting with ":" are keep-alive comments.
+          if (line.startsWith("event:")) type = line.slice(6).trim();
+          else if (line.startsWith("data:")) data.push(line.slice(5).trimStart());
+        }
+        if (data.length > 0) onEvent({ type, data: JSON.parse(data.join("\n")) });
+        end = buffer.indexOf("\n\n");
+      }
+    }
+  } catch (e) {
+    if (signal.aborted) return;
+    throw e;
+  } finally {
+    reader.releaseLock();
+  }
+}
+
 export const scrapingApi = {
   getStatus: (processId: number) =>
     api.get("/scraping/status", { params: { scraping_process_id: processId } }),
@@ -350,6 +430,28 @@ export const scrapingApi = {
   }) => {
     return api.post("/scraping/start", payload);
   },
+  startAll: (payload: { scraping_period_days?: number } = {}) =>
+    api.post<number>("/scraping/start-all", payload),
+  getStartAllStatus: (batchId: number) =>
+    api.get<{
+      batch_id: number;
+      accounts: {
+        service: string;
+        provider: string;
+        account: string;
+        process_id: number;
+        status: string;
+        error_type: string | null;
+      }[];
+      counts: Record<string, number>;
+      awaiting_2fa: {
+        service: string;
+        provider: string;
+        account: string;
+        process_id: number;
+      } | null;
+      done: boolean;
+    }>("/scraping/start-all/status", { params: { batch_id: batchId } }),
   submit2fa: (
     service: string,
     provider: string,
@@ -363,6 +465,7 @@ export const scrapingApi = {
     ),
   abort: (processId: number) =>
     api.post("/scraping/abort", { process_id: processId }),
+  streamEvents: streamScrapeEvents,
   getLastScrapes: () =>
     api.get<
       {
@@ -370,8 +473,22 @@ export const scrapingApi = {
         provider: string;
         account_name: string;
         last_scrape_date: string | null;
+        last_scrape_telemetry: {
+          scrape_id: number;
+          date: string;
+          status: string;
+          phases: ScrapePhaseSpan[];
+        } | null;
       }[]
     >("/scraping/last-scrapes"),
+  getTelemetrySummary: (days?: number) =>
+    api.get<
+      {
+        provider: string;
+        scrapes: number;
+        phases: { name: string; count: number; p50_ms: number; p95_ms: number }[];
+      }[]
+    >("/scraping/telemetry/summary", { params: days ? { days } : {} }),
 };
 
 // Insurance Accounts API
@@ -582,12 +699,52 @@ export const analyticsApi = {
     }>("/analytics/monthly-expenses", {
       params: { exclude_pending_refunds: excludePendingRefunds, include_projects: includeProjects },
     }),
-  getCashFlowForecast: () =>
-    api.get<CashFlowForecast>("/analytics/cash-flow-forecast"),
+  getCashFlowForecast: (horizonDays?: number) =>
+    api.get<CashFlowForecast>("/analytics/cash-flow-forecast", {
+      params: horizonDays ? { horizon_days: horizonDays } : undefined,
+    }),
   getRecurring: () => api.get<RecurringSummary>("/analytics/recurring"),
+  rebuildRecurring: () =>
+    api.post<{ series: number }>("/analytics/recurring/rebuild"),
   getInsights: () => api.get<Insight[]>("/analytics/insights"),
+  getDashboard: () => api.get<DashboardBundle>("/analytics/dashboard"),
 };
 
+// Every dashboard panel in one response; each key mirrors the payload of
+// the matching /analytics endpoint called with default parameters.
+export interface DashboardBundle {
+  overview: {
+    latest_data_date: string | null;
+    total_income: number;
+    total_expenses: number;
+    total_investments: number;
+    net_balance_change: number;
+  };
+  cash_flow_forecast: CashFlowForecast;
+  insights: Insight[];
+  recurring: RecurringSummary;
+  net_worth_over_time: { month: string; bank_balance: number; investment_value: number; cash: number; net_worth: number }[];
+  debt_payments_over_time: { month: string; amount: number; tags: Record<string, number> }[];
+  by_category: {
+    expenses: { category: string; amount: number }[];
+    refunds: { category: string; amount: number }[];
+  };
+  sankey: {
+    nodes: number[];
+    node_labels: string[];
+    links: { source: number; target: number; value: number; label: string }[];
+  };
+  income_expenses_over_time: { month: string; income: number; expenses: number }[];
+  expenses_by_category_over_time: { month: string; categories: Record<string, number> }[];
+  income_by_source_over_time: { month: string; sources: Record<string, number>; total: number }[];
+  monthly_expenses: {
+    months: { month: string; expenses: number; project_expenses?: number }[];
+    avg_3_months: number;
+    avg_6_months: number;
+    avg_12_months: number;
+  };
+}
+
 export interface RecurringItem {
   label: string;
   normalized: string;
@@ -634,6 +791,20 @@ export interface CashFlowForecast {
   avg_monthly_expenses: number;
   committed_remaining: number;
   daily: { date: string; actual_balance: number | null; projected_balance: number | null }[];
+  horizon?: {
+    days: number;
+    end_balance: number;
+    low_end_balance: number;
+    high_end_balance: number;
+    min_balance: number;
+    min_balance_date: string;
+    daily: {
+      date: string;
+      projected_balance: number;
+      low_balance: number;
+      high_balance: number;
+    }[];
+  };
 }
 
 // Bank Balances API
@@ -870,6 +1041,33 @@ export interface RetirementProjections {
     total_income: number;
     expenses: number;
   }[];
+  // Present only when requested with monteCarlo params.
+  monte_carlo?: {
+    paths: number;
+    seed: number;
+    distribution: MonteCarloDistribution;
+    success_probability: number;
+    projection: {
+      age: number;
+      p10: number;
+      p25: number;
+      p50: number;
+      p75: number;
+      p90: number;
+      depletion_probability: number;
+    }[];
+  };
+}
+
+export type MonteCarloDistribution = "normal" | "lognormal" | "student_t";
+
+export interface MonteCarloParams {
+  paths?: number;
+  seed?: number;
+  distribution?: MonteCarloDistribution;
+  return_volatility?: number;
+  inflation_volatility?: number;
+  degrees_of_freedom?: number;
 }
 
 export const retirementApi = {
@@ -877,10 +1075,17 @@ export const retirementApi = {
   upsertGoal: (data: Omit<RetirementGoal, "id">) =>
     api.put<RetirementGoal>("/retirement/goal", data),
   getStatus: () => api.get<RetirementStatus>("/retirement/status"),
-  getProjections: () =>
-    api.get<RetirementProjections>("/retirement/projections"),
-  previewProjections: (data: Omit<RetirementGoal, "id">) =>
-    api.post<RetirementProjections>("/retirement/projections", data),
+  getProjections: (monteCarlo?: MonteCarloParams) =>
+    api.get<RetirementProjections>("/retirement/projections", {
+      params: monteCarlo ? { monte_carlo: true, ...monteCarlo } : undefined,
+    }),
+  previewProjections: (
+    data: Omit<RetirementGoal, "id">,
+    monteCarlo?: MonteCarloParams,
+  ) =>
+    api.post<RetirementProjections>("/retirement/projections", data, {
+      params: monteCarlo ? { monte_carlo: true, ...monteCarlo } : undefined,
+    }),
   getScrapedDefaults: () =>
     api.get<ScrapedDefaults>("/retirement/scraped-defaults"),
   getSuggestions: () =>
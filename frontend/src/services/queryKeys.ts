@@ -150,6 +150,7 @@ export function makeQueryKeys(demo: boolean) {
       recurring: () => ["analytics", "recurring", demo] as const,
       insights: () => ["analytics", "insights", demo] as const,
       cashFlowForecast: () => ["analytics", "cash-flow-forecast", demo] as const,
+      dashboard: () => ["analytics", "dashboard", demo] as const,
     },
   };
 }
@@ -241,6 +241,12 @@ async def run_scraper(args: argparse.Namespace) -> int:
     except asyncio.TimeoutError:
         print("Error: scrape exceeded the 600-second limit", file=sys.stderr)
         return 1
+    finally:
+        # The scrape leaves its browser warm in the pool for reuse; a
+        # one-shot CLI run has nothing to reuse it for.
+        from scraper.utils.browser_pool import get_browser_pool
+
+        await get_browser_pool().close()
 
     if not result.success:
         print(
@@ -1,6 +1,7 @@
 import httpx
 
 from scraper.base.base_scraper import BaseScraper
+from scraper.utils.http_client import HttpStats, create_http_client
 
 
 class ApiScraper(BaseScraper):
@@ -9,12 +10,15 @@ class ApiScraper(BaseScraper):
     client: httpx.AsyncClient
 
     async def initialize(self) -> None:
-        """Create an async HTTP client."""
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(30.0), follow_redirects=True
-        )
+        """Use the run's pooled HTTP client.
+
+        Outside :meth:`scrape` (which manages the client) a private one is
+        created and closed in :meth:`terminate`.
+        """
+        self._owns_client = self.http_client is None
+        self.client = self.http_client or create_http_client(HttpStats())
 
     async def terminate(self, success: bool) -> None:
-        """Close the HTTP client."""
-        if hasattr(self, "client"):
+        """Close the HTTP client if this scraper created it."""
+        if hasattr(self, "client") and getattr(self, "_owns_client", False):
             await self.client.aclose()
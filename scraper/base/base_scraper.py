@@ -5,9 +5,13 @@ from dataclasses import dataclass, field
 from datetime import date
 from typing import Awaitable, Callable, Optional
 
+import httpx
+
 from scraper.exceptions import ScraperError
 from scraper.models.account import AccountResult
 from scraper.models.result import LoginResult, ScrapingResult
+from scraper.utils.http_client import HttpStats, scraper_http_client
+from scraper.utils.telemetry import ScrapeTelemetry
 
 logger = logging.getLogger(__name__)
 
@@ -100,10 +104,39 @@ class BaseScraper(ABC):
         # the recorded error message so the scraping-history row carries the
         # real reason rather than just the LoginResult label.
         self._login_error_detail: Optional[str] = None
+        # One pooled keep-alive client per run, open for the duration of
+        # ``scrape``; the fetch helpers pick it up when given no client.
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self.http_stats = HttpStats()
+        # Phase spans of the run; attached to the result by ``scrape``.
+        self.telemetry = ScrapeTelemetry()
 
     async def scrape(self) -> ScrapingResult:
         """Orchestrate the full scraping lifecycle.
 
+        Runs inside one managed HTTP client (see
+        :func:`~scraper.utils.http_client.scraper_http_client`) whose
+        per-host instrumentation is attached to the result, together with
+        the run's phase spans.
+
+        Returns
+        -------
+        ScrapingResult
+            Result containing accounts data on success, or error info on failure.
+        """
+        try:
+            async with scraper_http_client(self.http_stats) as client:
+                self.http_client = client
+                result = await self._run_lifecycle()
+        finally:
+            self.http_client = None
+        result.http_stats = self.http_stats.to_dict()
+        result.telemetry = self.telemetry.to_list()
+        return result
+
+    async def _run_lifecycle(self) -> ScrapingResult:
+        """Run initialize -> login -> fetch_data -> terminate.
+
         Returns
         -------
         ScrapingResult
@@ -115,13 +148,15 @@ class BaseScraper(ABC):
         # an empty message and the phase it died in was only in the log.
         self._emit_progress("initializing")
         try:
-            await self.initialize()
+            with self.telemetry.span("initialize"):
+                await self.initialize()
         except Exception as e:
             return self._phase_failure("initialize", "INIT_ERROR", e, terminate=False)
 
         self._emit_progress("logging in")
         try:
-            login_result = await self.login()
+            with self.telemetry.span("login"):
+                login_result = await self.login()
         except asyncio.TimeoutError as e:
             return await self._phase_failure_async("login", "TIMEOUT", e)
         except ScraperError as e:
@@ -136,7 +171,9 @@ class BaseScraper(ABC):
 
         self._emit_progress("fetching data")
         try:
-            accounts = await self.fetch_data()
+            with self.telemetry.span("fetch") as span:
+                accounts = await self.fetch_data()
+                span.rows = sum(len(account.transactions) for account in accounts)
         except asyncio.TimeoutError as e:
             return await self._phase_failure_async("fetch data", "TIMEOUT", e)
         except ScraperError as e:
@@ -211,6 +248,20 @@ class BaseScraper(ABC):
             f"{self.provider} does not support resending the OTP in place"
         )
 
+    async def _request_otp(self) -> str:
+        """Ask ``on_otp_request`` for the OTP code, timing the wait.
+
+        The wait is recorded as an ``otp_wait`` span inside ``login``, so a
+        slow login can be told apart from a user slow to type the code.
+
+        Returns
+        -------
+        str
+            The code, or ``OTP_CANCEL_SENTINEL`` if the user aborted.
+        """
+        with self.telemetry.span("otp_wait"):
+            return await self.on_otp_request()
+
     def _emit_progress(self, message: str) -> None:
         """Call the progress callback if one is set."""
         if self.on_progress is not None:
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Any, Awaitable, Callable, Optional, Union
 from urllib.parse import urlparse
 
-from playwright.async_api import Browser, Frame, Page, async_playwright
+from playwright.async_api import Browser, BrowserContext, Frame, Page
 
 from scraper.base.base_scraper import BaseScraper
 from scraper.models.result import LoginResult
@@ -18,6 +18,12 @@ from scraper.utils import (
     wait_for_navigation,
     wait_until_element_found,
 )
+from scraper.utils.browser_pool import get_browser_pool
+from scraper.utils.resource_blocking import (
+    ResourceBlockPolicy,
+    ResourceBlockStats,
+    install_resource_blocking,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +82,7 @@ class BrowserScraper(BaseScraper):
     """
 
     page: Page
+    context: BrowserContext
     browser: Browser
 
     # Real Chrome user agent to use in headless mode
@@ -93,104 +100,46 @@ class BrowserScraper(BaseScraper):
     window.chrome = { runtime: {} };
     """
 
-    # Browser channels Playwright can drive against the user's installed
-    # browser (no Playwright-bundled Chromium download needed). Order
-    # matters: we prefer Chrome (best automation parity), fall back to
-    # Edge (always pre-installed on Windows since Win10). Both are
-    # Chromium-based, so the stealth scripts and CDP usage are identical.
-    _BROWSER_CHANNELS = ("chrome", "msedge")
+    # Opt-in request blocking: providers whose pages work without images,
+    # fonts and third-party trackers set a policy (with their own allow and
+    # deny lists) so the login page is ready sooner and Chrome holds less.
+    # ``None`` loads every request, as a normal browser would.
+    resource_blocking: Optional[ResourceBlockPolicy] = None
 
     async def initialize(self) -> None:
-        """Launch the user's installed Chrome (or Edge), with stealth.
-
-        We deliberately do NOT use Playwright's bundled Chromium build:
-        that's a ~800MB download we don't want shipping inside the
-        desktop bundle, and it goes stale against bank fingerprinting
-        (banks flag old Chromium revisions). Using the system browser
-        gives us automatic security updates and an unmodified Chrome
-        user agent, both of which make scrapes more robust.
-
-        Tries Chrome first; on ``BrowserType.NotInstalledError`` falls
-        back to Edge (always present on Windows). If neither is
-        installed (rare on Windows, common on macOS where Safari is
-        default), raises ``RuntimeError`` with a clear "install Chrome"
-        message — the scraping route surfaces it to the user via the
-        existing error toast.
+        """Open an isolated browser context on the shared browser pool.
+
+        The pool (:func:`~scraper.utils.browser_pool.get_browser_pool`)
+        keeps the user's installed Chrome (or Edge) warm across scrapes, so
+        only the first scrape pays its cold start. Every scraper gets its
+        own fresh context — cookies, storage and cache are never shared
+        between accounts — with the stealth init script applied. If
+        neither browser is installed, raises ``RuntimeError`` with a clear
+        "install Chrome" message — the scraping route surfaces it to the
+        user via the existing error toast.
         """
-        self._playwright = await async_playwright().start()
-
-        last_exc: Optional[Exception] = None
-        for channel in self._BROWSER_CHANNELS:
-            try:
-                self.browser = await self._playwright.chromium.launch(
-                    channel=channel,
-                    headless=not self.options.show_browser,
-                    args=[
-                        "--disable-blink-features=AutomationControlled",
-                        "--no-first-run",
-                        "--no-default-browser-check",
-                    ],
-                )
-                logger.info("scraper using channel=%s", channel)
-                break
-            except Exception as exc:
-                # Playwright raises a generic Error subclass when the
-                # channel binary isn't installed; rather than depending
-                # on its specific exception class (which has changed
-                # across versions), we match on the message and fall
-                # through to the next channel.
-                if "Chromium distribution" in str(exc) or "not found" in str(exc).lower():
-                    logger.info("channel=%s not available: %s", channel, exc)
-                    last_exc = exc
-                    continue
-                # Unexpected launch failure: the Playwright driver process is
-                # already running and no caller will terminate us (scrape()
-                # only cleans up after initialize() returns) — stop it before
-                # re-raising or the driver process leaks.
-                try:
-                    await self._playwright.stop()
-                except Exception as cleanup_exc:
-                    logger.warning(
-                        "Failed to stop playwright during launch cleanup: %s",
-                        cleanup_exc,
-                    )
-                raise
-        else:
-            await self._playwright.stop()
-            raise RuntimeError(
-                "No supported browser found. Install Google Chrome from "
-                "https://www.google.com/chrome/ (or Microsoft Edge on Windows) "
-                "and try again."
-            ) from last_exc
-
+        self._browser_pool = get_browser_pool()
+        self.context = await self._browser_pool.acquire_context(
+            headless=not self.options.show_browser,
+            init_script=self._STEALTH_INIT_SCRIPT,
+            user_agent=self._DEFAULT_USER_AGENT,
+            viewport={"width": 1024, "height": 768},
+            locale="he-IL",
+        )
+        self.browser = self.context.browser
+        self.resource_block_stats = ResourceBlockStats()
         try:
-            context = await self.browser.new_context(
-                user_agent=self._DEFAULT_USER_AGENT,
-                viewport={"width": 1024, "height": 768},
-                locale="he-IL",
-            )
-            await context.add_init_script(self._STEALTH_INIT_SCRIPT)
-            self.page = await context.new_page()
+            if self.resource_blocking is not None:
+                await install_resource_blocking(
+                    self.context, self.resource_blocking, self.resource_block_stats
+                )
+            self.page = await self.context.new_page()
             self.page.set_default_timeout(self.options.default_timeout)
         except Exception:
-            # Post-launch setup failed: the browser (and playwright) are
-            # already running, and a context may have been created. Tear
-            # everything down so we don't leak a live browser process /
-            # playwright driver, then re-raise for the caller to handle.
-            try:
-                await self.browser.close()
-            except Exception as cleanup_exc:
-                logger.warning(
-                    "Failed to close browser during initialize cleanup: %s",
-                    cleanup_exc,
-                )
-            try:
-                await self._playwright.stop()
-            except Exception as cleanup_exc:
-                logger.warning(
-                    "Failed to stop playwright during initialize cleanup: %s",
-                    cleanup_exc,
-                )
+            # No caller will terminate us (scrape() only cleans up after
+            # initialize() returns) — give the context back before
+            # re-raising so it doesn't pin the pooled browser.
+            await self._browser_pool.release_context(self.context)
             raise
 
     async def login(self) -> LoginResult:
@@ -255,7 +204,7 @@ class BrowserScraper(BaseScraper):
         )
 
     async def terminate(self, success: bool) -> None:
-        """Take failure screenshot if configured, then close browser."""
+        """Take failure screenshot if configured, then close the browser context."""
         if not success and self.options.store_failure_screenshot_path:
             try:
                 await self.page.screenshot(
@@ -268,14 +217,17 @@ class BrowserScraper(BaseScraper):
             except Exception as e:
                 logger.warning("Failed to take failure screenshot: %s", e)
 
-        try:
-            await self.browser.close()
-        except Exception as exc:
-            logger.warning("Failed to close browser during terminate: %s", exc)
-        try:
-            await self._playwright.stop()
-        except Exception as exc:
-            logger.warning("Failed to stop playwright during terminate: %s", exc)
+        if self.resource_block_stats.blocked:
+            logger.info(
+                "%s: blocked %d requests (~%d KB saved)",
+                self.provider,
+                self.resource_block_stats.blocked,
+                self.resource_block_stats.estimated_bytes_saved // 1024,
+            )
+
+        # Closing the context drops the account's cookies and storage; the
+        # browser itself stays warm in the pool for the next scrape.
+        await self._browser_pool.release_context(self.context)
 
     def get_login_options(self, credentials: dict) -> LoginOptions:
         """Return provider-specific login configuration.
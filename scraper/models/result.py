@@ -20,3 +20,9 @@ class ScrapingResult:
     accounts: list[AccountResult] = field(default_factory=list)
     error_type: Optional[str] = None
     error_message: Optional[str] = None
+    # Per-host HTTP instrumentation of the run's pooled client (requests,
+    # errors, bytes, latency histogram); see scraper.utils.http_client.
+    http_stats: dict[str, dict] = field(default_factory=dict)
+    # Phase spans of the run (initialize, login, otp_wait, fetch, …) as
+    # dicts; see scraper.utils.telemetry.
+    telemetry: list[dict] = field(default_factory=list)
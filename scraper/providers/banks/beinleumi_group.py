@@ -15,6 +15,7 @@ from scraper.utils import (
     convert_credit_debit_rows,
     element_present_on_page,
     fill_input,
+    gather_accounts,
     page_eval,
     page_eval_all,
     parse_amount,
@@ -729,19 +730,18 @@ async def _fetch_accounts(
             )
         ]
 
-    results: list[AccountResult] = []
-    for account_id in accounts_ids:
+    async def fetch_account(account_id: str) -> AccountResult:
         await _select_account_both_uis(page, account_id)
         account_data = await _fetch_account_data_both_uis(page, start_date)
-        results.append(
-            AccountResult(
-                account_number=account_data["accountNumber"],
-                transactions=account_data["txns"],
-                balance=account_data["balance"],
-            )
+        return AccountResult(
+            account_number=account_data["accountNumber"],
+            transactions=account_data["txns"],
+            balance=account_data["balance"],
         )
 
-    return results
+    # The account is selected in the page's UI and the transactions are read
+    # from whatever it shows, so accounts must be fetched one at a time.
+    return await gather_accounts(accounts_ids, fetch_account, concurrent=False)
 
 
 class BeinleumiGroupBaseScraper(BrowserScraper):
@@ -8,7 +8,9 @@ from scraper.models.account import AccountResult
 from scraper.models.result import LoginResult
 from scraper.models.transaction import Transaction, TransactionStatus, TransactionType
 from scraper.utils import (
+    ResourceBlockPolicy,
     fetch_get_within_page,
+    gather_accounts,
     parse_provider_date,
     wait_for_navigation,
     wait_until_element_found,
@@ -124,8 +126,7 @@ async def _fetch_account_data(page, options) -> list[AccountResult]:
     effective_start = max(default_start, start_date)
     start_date_str = effective_start.strftime(DATE_FORMAT)
 
-    results: list[AccountResult] = []
-    for account_number in accounts_ids:
+    async def fetch_account(account_number: str) -> AccountResult:
         txns_url = (
             f"{api_site_url}/lastTransactions/{account_number}/Date"
             f"?IsCategoryDescCode=True"
@@ -165,15 +166,14 @@ async def _fetch_account_data(page, options) -> list[AccountResult]:
             "AccountBalance"
         )
 
-        results.append(
-            AccountResult(
-                account_number=account_number,
-                transactions=[*completed_txns, *pending_txns],
-                balance=balance,
-            )
+        return AccountResult(
+            account_number=account_number,
+            transactions=[*completed_txns, *pending_txns],
+            balance=balance,
         )
 
-    return results
+    # Each request names its account, so accounts are fetched side by side.
+    return await gather_accounts(accounts_ids, fetch_account)
 
 
 async def _navigate_or_error_label(page) -> None:
@@ -245,6 +245,8 @@ class DiscountScraper(BrowserScraper):
     via the bank's internal REST API (Titan gateway).
     """
 
+    resource_blocking = ResourceBlockPolicy()
+
     def get_login_options(self, credentials: dict) -> LoginOptions:
         """Return Discount Bank login configuration.
 
@@ -11,6 +11,7 @@ from scraper.models.result import LoginResult
 from scraper.models.transaction import Transaction, TransactionStatus, TransactionType
 from scraper.utils import (
     fetch_get_within_page,
+    gather_accounts,
     parse_provider_date,
     wait_until,
     wait_until_element_found,
@@ -498,7 +499,7 @@ class HapoalimScraper(BrowserScraper):
             )
 
         self._emit_progress("waiting for OTP code")
-        otp_code = await self.on_otp_request()
+        otp_code = await self._request_otp()
 
         if otp_code == "cancel":
             return self._fail_login(
@@ -588,8 +589,7 @@ class HapoalimScraper(BrowserScraper):
         start_date_str = effective_start.strftime(DATE_FORMAT)
         end_date_str = date.today().strftime(DATE_FORMAT)
 
-        accounts: list[AccountResult] = []
-        for account in open_accounts:
+        async def fetch_account(account: dict) -> AccountResult:
             account_number = (
                 f"{account['bankNumber']}-{account['branchNumber']}-{account['accountNumber']}"
             )
@@ -606,14 +606,15 @@ class HapoalimScraper(BrowserScraper):
                 start_date_str,
                 end_date_str,
             )
-
-            accounts.append(
-                AccountResult(
-                    account_number=account_number,
-                    transactions=txns,
-                    balance=balance,
-                )
+            return AccountResult(
+                account_number=account_number,
+                transactions=txns,
+                balance=balance,
             )
 
+        # The account number is part of every request, so accounts are
+        # independent and can be fetched side by side.
+        accounts = await gather_accounts(open_accounts, fetch_account)
+
         logger.debug("Fetching ended")
         return accounts
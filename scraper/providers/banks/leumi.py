@@ -13,9 +13,11 @@ from scraper.models.account import AccountResult
 from scraper.models.result import LoginResult
 from scraper.models.transaction import Transaction, TransactionStatus, TransactionType
 from scraper.utils import (
+    ResourceBlockPolicy,
     click_button,
     fetch_get_within_page,
     fill_input,
+    gather_accounts,
     page_eval_all,
     sleep,
     wait_for_first,
@@ -393,10 +395,11 @@ async def _fetch_savings_accounts(
         Flattened savings accounts. Failures are logged, never raised — a
         missing deposits endpoint must not fail the whole scrape.
     """
-    savings: list[AccountResult] = []
-    for account in regular_accounts:
-        savings.extend(await _fetch_savings_for_account(page, account.account_number))
-    return savings
+    per_account = await gather_accounts(
+        regular_accounts,
+        lambda account: _fetch_savings_for_account(page, account.account_number),
+    )
+    return [saving for savings in per_account for saving in savings]
 
 
 class LeumiScraper(BrowserScraper):
@@ -406,6 +409,8 @@ class LeumiScraper(BrowserScraper):
     from Leumi's online banking after browser-based authentication.
     """
 
+    resource_blocking = ResourceBlockPolicy()
+
     def get_login_options(self, credentials: dict) -> LoginOptions:
         """Return Leumi-specific login configuration.
 
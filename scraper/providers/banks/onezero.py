@@ -917,7 +917,7 @@ class OneZeroScraper(ApiScraper):
         logger.debug("Triggering OTP flow")
         await self._trigger_two_factor_auth(phone_number)
 
-        otp_code = await self.on_otp_request()
+        otp_code = await self._request_otp()
         if otp_code == OTP_CANCEL_SENTINEL:
             # User aborted the 2FA prompt — end cleanly instead of POSTing the
             # sentinel to /otp/verify (which would be a wasted, failing call).
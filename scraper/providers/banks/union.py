@@ -15,6 +15,7 @@ from scraper.utils import (
     dropdown_select,
     element_present_on_page,
     fill_input,
+    gather_accounts,
     page_eval_all,
     parse_int_identifier,
     wait_for_first,
@@ -365,17 +366,15 @@ async def _fetch_accounts(
     list[AccountResult]
         List of account results.
     """
-    accounts: list[AccountResult] = []
     accounts_list = await dropdown_elements(page, ACCOUNTS_DROPDOWN_SELECTOR)
 
-    for account in accounts_list:
-        if account.get("value") != "-1":
-            account_data = await _fetch_account_data(
-                page, start_date, account["value"]
-            )
-            accounts.append(account_data)
-
-    return accounts
+    # Accounts are switched through the page's dropdown, so they can only be
+    # fetched one after another.
+    return await gather_accounts(
+        [account["value"] for account in accounts_list if account.get("value") != "-1"],
+        lambda account_id: _fetch_account_data(page, start_date, account_id),
+        concurrent=False,
+    )
 
 
 async def _wait_for_post_login(page) -> None:
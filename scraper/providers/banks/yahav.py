@@ -13,6 +13,7 @@ from scraper.utils import (
     click_button,
     convert_credit_debit_rows,
     element_present_on_page,
+    gather_accounts,
     page_eval,
     page_eval_all,
     parse_digits_identifier,
@@ -364,8 +365,8 @@ async def _fetch_accounts(page, start_date: date) -> list[AccountResult]:
             "No portfolios found on /main/home — Yahav DOM likely changed"
         )
 
-    accounts: list[AccountResult] = []
-    for i, portfolio_id in enumerate(portfolio_ids):
+    async def fetch_portfolio(indexed: tuple[int, str]) -> AccountResult:
+        i, portfolio_id = indexed
         if i > 0:
             await _select_portfolio(page, portfolio_id)
         await wait_until_element_found(
@@ -375,11 +376,12 @@ async def _fetch_accounts(page, start_date: date) -> list[AccountResult]:
         await wait_until_element_found(
             page, ".statement-options .selected-item-top", only_visible=True
         )
-        accounts.append(
-            await _fetch_account_data(page, start_date, portfolio_id)
-        )
+        return await _fetch_account_data(page, start_date, portfolio_id)
 
-    return accounts
+    # The portfolio is switched through the page's selector: one at a time.
+    return await gather_accounts(
+        list(enumerate(portfolio_ids)), fetch_portfolio, concurrent=False
+    )
 
 
 class YahavScraper(BrowserScraper):
@@ -16,6 +16,7 @@ from scraper.models.transaction import (
 )
 from scraper.utils import (
     fetch_get_within_page,
+    fetch_months,
     filter_old_transactions,
     fix_installments,
     get_all_months,
@@ -43,6 +44,12 @@ RATE_LIMIT_SLEEP_BETWEEN = 2.5  # seconds
 RATE_LIMIT_SLEEP_JITTER = 0.5  # seconds added to the upper bound
 RATE_LIMIT_TRANSACTIONS_BATCH_SIZE = 10
 
+# Months fetched at once. Kept serial: each month sleeps
+# RATE_LIMIT_SLEEP_BETWEEN before its requests, and months in flight together
+# would sleep the same span and fire in pairs, which is exactly the cadence
+# the detector reacts to.
+MONTH_FETCH_CONCURRENCY = 1
+
 
 def _get_accounts_url(services_url: str, month_date: date) -> str:
     """Build the accounts (DashboardMonth) URL for a given month.
@@ -425,6 +432,7 @@ async def _fetch_all_transactions(
     options: ScraperOptions,
     services_url: str,
     start_date: date,
+    concurrency: int = MONTH_FETCH_CONCURRENCY,
 ) -> list[AccountResult]:
     """Fetch transactions for all months and combine into account results.
 
@@ -438,6 +446,8 @@ async def _fetch_all_transactions(
         The base services proxy URL.
     start_date : date
         Effective start date for fetching.
+    concurrency : int
+        Maximum number of months fetched at once.
 
     Returns
     -------
@@ -447,12 +457,14 @@ async def _fetch_all_transactions(
     future_months = options.future_months_to_scrape
     all_months = get_all_months(start_date, future_months)
 
-    results: list[dict[str, dict]] = []
-    for month_date in all_months:
-        result = await _fetch_transactions_for_month(
+    # Requests are already paced inside each month; no extra jitter here.
+    results: list[dict[str, dict]] = await fetch_months(
+        all_months,
+        lambda month_date: _fetch_transactions_for_month(
             page, options, services_url, start_date, month_date
-        )
-        results.append(result)
+        ),
+        concurrency=concurrency,
+    )
 
     # Combine transactions across months
     combined_txns: dict[str, list[Transaction]] = {}
@@ -484,6 +496,7 @@ class IsracardAmexBaseScraper(BrowserScraper):
 
     BASE_URL: str = ""
     COMPANY_CODE: str = ""
+    MONTH_FETCH_CONCURRENCY: int = MONTH_FETCH_CONCURRENCY
 
     def __init__(
         self,
@@ -593,8 +606,8 @@ class IsracardAmexBaseScraper(BrowserScraper):
     async def fetch_data(self) -> list[AccountResult]:
         """Fetch transaction data from the Isracard/Amex API.
 
-        Fetches transactions month by month from the effective start date
-        to the current month.
+        Fetches transactions per month from the effective start date to
+        the current month, ``MONTH_FETCH_CONCURRENCY`` months at a time.
 
         Returns
         -------
@@ -610,4 +623,5 @@ class IsracardAmexBaseScraper(BrowserScraper):
             self.options,
             self._services_url,
             effective_start,
+            concurrency=self.MONTH_FETCH_CONCURRENCY,
         )
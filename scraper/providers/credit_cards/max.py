@@ -18,9 +18,11 @@ from scraper.models.transaction import (
     TransactionType,
 )
 from scraper.utils import (
+    ResourceBlockPolicy,
     click_button,
     element_present_on_page,
     fetch_get_within_page,
+    fetch_months,
     filter_old_transactions,
     fix_installments,
     get_all_months,
@@ -48,6 +50,12 @@ SHEKEL_CURRENCY = "ILS"
 DOLLAR_CURRENCY = "USD"
 EURO_CURRENCY = "EUR"
 
+# Months fetched at once on a sync, and the jittered gap (seconds) before each
+# month's request. Max's API tolerates a few parallel in-page fetches; the
+# jitter keeps a 4-year first sync from landing as one burst.
+MONTH_FETCH_CONCURRENCY = 4
+MONTH_FETCH_PACING = (0.1, 0.4)
+
 # Plan names for transaction type classification
 NORMAL_PLAN_NAMES = {
     "רגילה",
@@ -456,6 +464,8 @@ class MaxScraper(BrowserScraper):
     after authenticating via the browser login flow.
     """
 
+    resource_blocking = ResourceBlockPolicy()
+
     def get_login_options(self, credentials: dict) -> LoginOptions:
         """Return Max-specific login configuration.
 
@@ -522,8 +532,9 @@ class MaxScraper(BrowserScraper):
     async def fetch_data(self) -> list[AccountResult]:
         """Fetch transaction data from Max API.
 
-        Iterates through months from start_date to now, loading categories
-        first, then fetching and merging transactions per card.
+        Fetches the months from start_date to now a few at a time (see
+        ``MONTH_FETCH_CONCURRENCY``), loading categories first, then merges
+        the transactions per card in month order.
 
         Returns
         -------
@@ -539,9 +550,15 @@ class MaxScraper(BrowserScraper):
         await _load_categories(self.page)
         home_page_cards = await _load_home_page_data(self.page)
 
+        monthly_results = await fetch_months(
+            all_months,
+            lambda month_date: _fetch_transactions_for_month(self.page, month_date),
+            concurrency=MONTH_FETCH_CONCURRENCY,
+            pacing=MONTH_FETCH_PACING,
+        )
+
         all_results: dict[str, list[Transaction]] = {}
-        for month_date in all_months:
-            result = await _fetch_transactions_for_month(self.page, month_date)
+        for result in monthly_results:
             for account_number, txns in result.items():
                 if account_number not in all_results:
                     all_results[account_number] = []
@@ -19,8 +19,10 @@ from scraper.models.transaction import (
     TransactionType,
 )
 from scraper.utils import (
+    ResourceBlockPolicy,
     click_button,
     element_present_on_page,
+    fetch_months,
     fetch_post,
     filter_old_transactions,
     page_eval,
@@ -68,6 +70,11 @@ INVALID_PASSWORD_MESSAGE = (
 
 X_SITE_ID = "09031987-273E-2311-906C-8AF85B17C8D9"
 
+# Months of a card fetched at once, and the jittered gap (seconds) before each
+# month's request.
+MONTH_FETCH_CONCURRENCY = 4
+MONTH_FETCH_PACING = (0.1, 0.4)
+
 # Forced-password-change detection. Upstream (2026-06-14, commit 809513e)
 # expanded this from a single subtitle check to four signals — the modal can
 # surface as a frame route, an Angular component, a title, or a subtitle — plus
@@ -441,6 +448,8 @@ class VisaCalScraper(BrowserScraper):
     transaction data via the Cal REST API.
     """
 
+    resource_blocking = ResourceBlockPolicy()
+
     _authorization: Optional[str] = None
 
     def get_login_options(self, credentials: dict) -> LoginOptions:
@@ -628,10 +637,7 @@ class VisaCalScraper(BrowserScraper):
             headers,
         )
 
-        logger.debug("Fetching completed transactions for card %s", card_uid)
-        all_months_data: list[dict] = []
-        for i in range(months_diff + 1):
-            month_date = final_month - relativedelta(months=i)
+        async def fetch_month(month_date: date) -> dict:
             month_data = await fetch_post(
                 TRANSACTIONS_REQUEST_ENDPOINT,
                 {
@@ -641,14 +647,20 @@ class VisaCalScraper(BrowserScraper):
                 },
                 headers,
             )
-
             if month_data.get("statusCode") != 1:
                 raise Exception(
                     f"Failed to fetch transactions for card {last4}. "
                     f"Message: {month_data.get('title', '')}"
                 )
+            return month_data
 
-            all_months_data.append(month_data)
+        logger.debug("Fetching completed transactions for card %s", card_uid)
+        all_months_data = await fetch_months(
+            [final_month - relativedelta(months=i) for i in range(months_diff + 1)],
+            fetch_month,
+            concurrency=MONTH_FETCH_CONCURRENCY,
+            pacing=MONTH_FETCH_PACING,
+        )
 
         if pending_data.get("statusCode") not in (1, 96):
             logger.debug(
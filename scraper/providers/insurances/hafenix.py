@@ -9,7 +9,11 @@ from scraper.base import BrowserScraper
 from scraper.models.account import AccountResult
 from scraper.models.result import LoginResult
 from scraper.models.transaction import Transaction, TransactionStatus, TransactionType
-from scraper.utils import parse_provider_date, wait_until_element_found
+from scraper.utils import (
+    ResourceBlockPolicy,
+    parse_provider_date,
+    wait_until_element_found,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +137,8 @@ class HaPhoenixScraper(BrowserScraper):
     Fetches pension, keren hishtalmut, and insurance data.
     """
 
+    resource_blocking = ResourceBlockPolicy()
+
     async def login(self) -> LoginResult:
         """Authenticate with HaPhoenix personal area.
 
@@ -198,7 +204,7 @@ class HaPhoenixScraper(BrowserScraper):
                 )
 
             self._emit_progress("waiting for OTP code")
-            otp_code = await self.on_otp_request()
+            otp_code = await self._request_otp()
 
             if otp_code == "cancel":
                 return self._fail_login(
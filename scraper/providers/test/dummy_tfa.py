@@ -29,7 +29,7 @@ class DummyTFAScraper(DummyRegularScraper):
             )
 
         self._emit_progress("Waiting for OTP code")
-        otp_code = await self.on_otp_request()
+        otp_code = await self._request_otp()
 
         if otp_code == OTP_CANCEL_SENTINEL:
             return self._fail_login(
@@ -12,6 +12,7 @@ from scraper.utils.browser import (
     wait_until_element_found,
     wait_until_iframe_found,
 )
+from scraper.utils.concurrency import fetch_months, gather_accounts
 from scraper.utils.dates import get_all_months
 from scraper.utils.fetch import (
     fetch_get,
@@ -39,6 +40,7 @@ from scraper.utils.transactions import (
     sort_transactions_by_date,
     to_amount,
 )
+from scraper.utils.resource_blocking import ResourceBlockPolicy
 from scraper.utils.waiting import random_delay, sleep, wait_for_first, wait_until
 
 __all__ = [
@@ -54,6 +56,8 @@ __all__ = [
     "wait_until_element_disappear",
     "wait_until_element_found",
     "wait_until_iframe_found",
+    "fetch_months",
+    "gather_accounts",
     "get_all_months",
     "fetch_get",
     "fetch_get_within_page",
@@ -74,6 +78,7 @@ __all__ = [
     "parse_provider_date",
     "parse_transaction_date",
     "sort_transactions_by_date",
+    "ResourceBlockPolicy",
     "random_delay",
     "to_amount",
     "sleep",
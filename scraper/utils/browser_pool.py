@@ -0,0 +1,314 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+logger = logging.getLogger(__name__)
+
+# Browser channels Playwright can drive against the user's installed
+# browser (no Playwright-bundled Chromium download needed). Order
+# matters: we prefer Chrome (best automation parity), fall back to
+# Edge (always pre-installed on Windows since Win10). Both are
+# Chromium-based, so the stealth scripts and CDP usage are identical.
+BROWSER_CHANNELS = ("chrome", "msedge")
+
+BROWSER_LAUNCH_ARGS = [
+    "--disable-blink-features=AutomationControlled",
+    "--no-first-run",
+    "--no-default-browser-check",
+]
+
+# Chrome processes kept per display mode (headless / headed). Contexts are
+# cheap and fully isolated, so one warm browser serves concurrent scrapes.
+BROWSER_POOL_SIZE = 1
+
+# Contexts handed out by one browser before it is retired and relaunched,
+# bounding the memory a long-lived Chrome accumulates.
+MAX_CONTEXTS_PER_BROWSER = 20
+
+# Seconds without any open context before idle browsers (and the Playwright
+# driver, once none are left) are shut down.
+IDLE_SHUTDOWN_SECONDS = 120.0
+
+
+@dataclass(eq=False)
+class _PooledBrowser:
+    """A launched browser and its lease counters."""
+
+    browser: Browser
+    headless: bool
+    uses: int = 0
+    leases: int = 0
+    retired: bool = False
+
+
+class BrowserPool:
+    """Process-wide pool of warm Chrome instances.
+
+    Launching Chrome costs one to three seconds and hundreds of MB, so
+    instead of one browser per scrape the pool keeps up to ``size``
+    browsers per display mode running and hands every scraper a fresh
+    :class:`BrowserContext` — its own cookies, storage and cache, so
+    accounts stay isolated from each other. A browser is retired after
+    ``max_uses`` contexts and every browser is closed after
+    ``idle_timeout`` seconds without open contexts.
+
+    Playwright objects belong to the event loop that created them; a pool
+    used from a new loop (e.g. a second ``asyncio.run``) starts afresh.
+
+    Parameters
+    ----------
+    size : int
+        Maximum browsers per display mode.
+    max_uses : int
+        Contexts a browser hands out before it is retired.
+    idle_timeout : float
+        Seconds of idleness before browsers are shut down.
+    """
+
+    def __init__(
+        self,
+        size: int = BROWSER_POOL_SIZE,
+        max_uses: int = MAX_CONTEXTS_PER_BROWSER,
+        idle_timeout: float = IDLE_SHUTDOWN_SECONDS,
+    ):
+        if size < 1 or max_uses < 1:
+            raise ValueError("size and max_uses must be at least 1")
+        self.size = size
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self._reset(None)
+
+    def _reset(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        """Forget every browser and bind the pool to ``loop``."""
+        self._loop = loop
+        self._lock = asyncio.Lock()
+        self._playwright: Optional[Playwright] = None
+        self._browsers: list[_PooledBrowser] = []
+        self._leases: dict[BrowserContext, _PooledBrowser] = {}
+        self._idle_timer: Optional[asyncio.TimerHandle] = None
+        self._idle_task: Optional[asyncio.Task] = None
+
+    def _bind_loop(self) -> None:
+        """Start afresh when called from a different event loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._browsers:
+                logger.debug("Browser pool moved to a new event loop; dropping browsers")
+            self._reset(loop)
+
+    @property
+    def browser_count(self) -> int:
+        """Number of browsers currently running."""
+        return len(self._browsers)
+
+    async def acquire_context(
+        self, headless: bool, init_script: Optional[str] = None, **options: Any
+    ) -> BrowserContext:
+        """Open a fresh context on a warm browser.
+
+        Parameters
+        ----------
+        headless : bool
+            Whether the browser runs headless.
+        init_script : str, optional
+            Script added to every page of the context (e.g. stealth patches).
+        **options
+            Keyword arguments for ``Browser.new_context``.
+
+        Returns
+        -------
+        BrowserContext
+            The context; give it back with :meth:`release_context`.
+
+        Raises
+        ------
+        RuntimeError
+            If neither Chrome nor Edge is installed.
+        """
+        self._bind_loop()
+        async with self._lock:
+            self._cancel_idle_timer()
+            entry = await self._pick_browser(headless)
+            entry.uses += 1
+            entry.leases += 1
+            if entry.uses >= self.max_uses:
+                entry.retired = True
+        context = None
+        try:
+            context = await entry.browser.new_context(**options)
+            if init_script:
+                await context.add_init_script(init_script)
+        except BaseException:
+            # Cancellation (adapter timeout, shutdown) must give the lease
+            # back too, or the browser never counts as idle again.
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception as exc:
+                    logger.warning("Failed to close browser context: %s", exc)
+            await self._return_lease(entry)
+            raise
+        self._leases[context] = entry
+        return context
+
+    async def release_context(self, context: BrowserContext) -> None:
+        """Close a context from :meth:`acquire_context` and free its lease.
+
+        Parameters
+        ----------
+        context : BrowserContext
+            The context to close. Unknown contexts are only closed.
+        """
+        entry = self._leases.pop(context, None)
+        try:
+            await context.close()
+        except Exception as exc:
+            logger.warning("Failed to close browser context: %s", exc)
+        if entry is not None:
+            await self._return_lease(entry)
+
+    async def close(self) -> None:
+        """Close every browser and stop the Playwright driver."""
+        if asyncio.get_running_loop() is not self._loop:
+            # Nothing was started on this loop.
+            self._reset(None)
+            return
+        async with self._lock:
+            self._cancel_idle_timer()
+            for entry in list(self._browsers):
+                await self._close_browser(entry)
+            await self._stop_playwright()
+
+    async def _pick_browser(self, headless: bool) -> _PooledBrowser:
+        """Return the least-loaded usable browser, launching one if allowed."""
+        self._browsers = [
+            entry
+            for entry in self._browsers
+            if entry.browser.is_connected() or entry.leases
+        ]
+        candidates = [
+            entry
+            for entry in self._browsers
+            if entry.headless == headless
+            and not entry.retired
+            and entry.browser.is_connected()
+        ]
+        launched = sum(1 for entry in self._browsers if entry.headless == headless)
+        idle = [entry for entry in candidates if not entry.leases]
+        if idle:
+            return idle[0]
+        if launched < self.size or not candidates:
+            entry = _PooledBrowser(await self._launch(headless), headless)
+            self._browsers.append(entry)
+            return entry
+        return min(candidates, key=lambda entry: entry.leases)
+
+    async def _launch(self, headless: bool) -> Browser:
+        """Launch the user's installed Chrome (or Edge).
+
+        We deliberately do NOT use Playwright's bundled Chromium build:
+        that's a ~800MB download we don't want shipping inside the
+        desktop bundle, and it goes stale against bank fingerprinting
+        (banks flag old Chromium revisions). Using the system browser
+        gives us automatic security updates and an unmodified Chrome
+        user agent, both of which make scrapes more robust.
+        """
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        last_exc: Optional[Exception] = None
+        for channel in BROWSER_CHANNELS:
+            try:
+                browser = await self._playwright.chromium.launch(
+                    channel=channel, headless=headless, args=BROWSER_LAUNCH_ARGS
+                )
+                logger.info("scraper using channel=%s", channel)
+                return browser
+            except Exception as exc:
+                # Playwright raises a generic Error subclass when the
+                # channel binary isn't installed; rather than depending
+                # on its specific exception class (which has changed
+                # across versions), we match on the message and fall
+                # through to the next channel.
+                if "Chromium distribution" in str(exc) or "not found" in str(exc).lower():
+                    logger.info("channel=%s not available: %s", channel, exc)
+                    last_exc = exc
+                    continue
+                # Don't leave a driver process running with no browser.
+                if not self._browsers:
+                    await self._stop_playwright()
+                raise
+        if not self._browsers:
+            await self._stop_playwright()
+        raise RuntimeError(
+            "No supported browser found. Install Google Chrome from "
+            "https://www.google.com/chrome/ (or Microsoft Edge on Windows) "
+            "and try again."
+        ) from last_exc
+
+    async def _return_lease(self, entry: _PooledBrowser) -> None:
+        """Free one lease; close a drained retired browser, arm the idle timer."""
+        async with self._lock:
+            entry.leases -= 1
+            if entry.leases <= 0 and (entry.retired or not entry.browser.is_connected()):
+                await self._close_browser(entry)
+            if not any(other.leases for other in self._browsers):
+                self._arm_idle_timer()
+
+    async def _close_browser(self, entry: _PooledBrowser) -> None:
+        """Close ``entry``'s browser and drop it from the pool."""
+        if entry in self._browsers:
+            self._browsers.remove(entry)
+        try:
+            await entry.browser.close()
+        except Exception as exc:
+            logger.warning("Failed to close pooled browser: %s", exc)
+
+    async def _stop_playwright(self) -> None:
+        """Stop the Playwright driver, if running."""
+        playwright, self._playwright = self._playwright, None
+        if playwright is None:
+            return
+        try:
+            await playwright.stop()
+        except Exception as exc:
+            logger.warning("Failed to stop playwright: %s", exc)
+
+    def _arm_idle_timer(self) -> None:
+        """Schedule :meth:`_scale_down` after :attr:`idle_timeout`."""
+        self._cancel_idle_timer()
+        loop = asyncio.get_running_loop()
+        self._idle_timer = loop.call_later(
+            self.idle_timeout,
+            lambda: setattr(self, "_idle_task", loop.create_task(self._scale_down())),
+        )
+
+    def _cancel_idle_timer(self) -> None:
+        """Cancel a pending idle shutdown."""
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+
+    async def _scale_down(self) -> None:
+        """Close every browser without open contexts; stop the driver if none remain."""
+        async with self._lock:
+            self._idle_timer = None
+            for entry in [entry for entry in self._browsers if not entry.leases]:
+                await self._close_browser(entry)
+            if not self._browsers:
+                await self._stop_playwright()
+            logger.debug("Browser pool scaled down to %d browsers", len(self._browsers))
+
+
+_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Return the process-wide :class:`BrowserPool`, creating it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = BrowserPool()
+    return _pool
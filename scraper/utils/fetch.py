@@ -7,6 +7,7 @@ import httpx
 from playwright.async_api import Page
 
 from scraper.exceptions import AutomationBlockedError, ErrorType, ScraperError
+from scraper.utils.http_client import current_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -162,20 +163,50 @@ def _raise_for_status_with_body(resp: httpx.Response) -> None:
         ) from error
 
 
+def _select_client(
+    client: httpx.AsyncClient | None,
+) -> tuple[httpx.AsyncClient, bool, Any]:
+    """Pick the client for a fetch helper call.
+
+    Returns
+    -------
+    tuple
+        ``(client, owned, follow_redirects)``. ``owned`` is True for a
+        one-off client the caller must close; ``follow_redirects`` is
+        ``False`` unless the caller passed its own ``client``, whose setting
+        is then left alone.
+    """
+    if client is not None:
+        return client, False, httpx.USE_CLIENT_DEFAULT
+    pooled = current_http_client()
+    if pooled is not None:
+        return pooled, False, False
+    return httpx.AsyncClient(), True, False
+
+
 async def fetch_get(
     url: str,
     extra_headers: dict[str, str] | None = None,
     client: httpx.AsyncClient | None = None,
 ) -> Any:
-    """HTTP GET returning parsed JSON. Uses httpx (no browser)."""
+    """HTTP GET returning parsed JSON. Uses httpx (no browser).
+
+    Without ``client``, uses the scraper run's pooled client (see
+    :func:`~scraper.utils.http_client.scraper_http_client`), falling back to
+    a one-off client outside a run. On those, redirects are not followed: a
+    provider answering a JSON call with a 3xx (typically an expired session
+    bounced to its login page) raises ``HTTPStatusError`` with the body
+    instead of failing later on HTML. A ``client`` passed in keeps its own
+    redirect setting.
+    """
     headers = {**_json_headers(), **(extra_headers or {})}
-    _client = client or httpx.AsyncClient()
+    _client, owned, follow_redirects = _select_client(client)
     try:
-        resp = await _client.get(url, headers=headers)
+        resp = await _client.get(url, headers=headers, follow_redirects=follow_redirects)
         _raise_for_status_with_body(resp)
         return resp.json()
     finally:
-        if not client:
+        if owned:
             await _client.aclose()
 
 
@@ -185,15 +216,20 @@ async def fetch_post(
     extra_headers: dict[str, str] | None = None,
     client: httpx.AsyncClient | None = None,
 ) -> Any:
-    """HTTP POST returning parsed JSON. Uses httpx (no browser)."""
+    """HTTP POST returning parsed JSON. Uses httpx (no browser).
+
+    Client selection and redirect handling are as in :func:`fetch_get`.
+    """
     headers = {**_json_headers(), **(extra_headers or {})}
-    _client = client or httpx.AsyncClient()
+    _client, owned, follow_redirects = _select_client(client)
     try:
-        resp = await _client.post(url, json=data, headers=headers)
+        resp = await _client.post(
+            url, json=data, headers=headers, follow_redirects=follow_redirects
+        )
         _raise_for_status_with_body(resp)
         return resp.json()
     finally:
-        if not client:
+        if owned:
             await _client.aclose()
 
 
@@ -0,0 +1,191 @@
+import bisect
+import importlib.util
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Callable, Optional
+
+import httpx
+
+from scraper.utils.telemetry import count_request
+
+# HTTP/2 needs the ``h2`` package, installed by the ``httpx[http2]`` extra the
+# project declares. An environment installed without the extra still works:
+# the pool then reuses HTTP/1.1 keep-alive connections.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# A scrape talks to one or two API hosts; a small pool with long-lived idle
+# connections saves a TCP+TLS handshake on every request after the first.
+POOL_LIMITS = httpx.Limits(
+    max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0
+)
+REQUEST_TIMEOUT = httpx.Timeout(30.0)
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000)
+
+_current_client: ContextVar[Optional[httpx.AsyncClient]] = ContextVar(
+    "scraper_http_client", default=None
+)
+
+
+@dataclass
+class HostStats:
+    """Request counters of one host."""
+
+    requests: int = 0
+    errors: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    total_latency_ms: float = 0.0
+    latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+
+    def to_dict(self) -> dict:
+        """Return the counters as a JSON-safe dict."""
+        labels = [f"<={bound}" for bound in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]}")
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "mean_latency_ms": (
+                round(self.total_latency_ms / self.requests, 1) if self.requests else 0.0
+            ),
+            "latency_histogram_ms": dict(zip(labels, self.latency_histogram)),
+        }
+
+
+@dataclass
+class HttpStats:
+    """Per-host instrumentation of a scraper run's HTTP traffic.
+
+    Latency is measured to the response headers — the wait on the
+    provider — not including the body download.
+    """
+
+    hosts: dict[str, HostStats] = field(default_factory=dict)
+
+    def record(
+        self, host: str, latency_ms: float, bytes_sent: int, failed: bool
+    ) -> None:
+        """Count one request to ``host``."""
+        stats = self.hosts.setdefault(host, HostStats())
+        stats.requests += 1
+        stats.errors += int(failed)
+        stats.bytes_sent += bytes_sent
+        stats.total_latency_ms += latency_ms
+        stats.latency_histogram[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+
+    def record_received(self, host: str, size: int) -> None:
+        """Count ``size`` response body bytes from ``host``."""
+        self.hosts.setdefault(host, HostStats()).bytes_received += size
+
+    def to_dict(self) -> dict[str, dict]:
+        """Return the per-host counters, keyed by host."""
+        return {host: stats.to_dict() for host, stats in self.hosts.items()}
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """Response body stream that reports every chunk's size."""
+
+    def __init__(self, inner: httpx.AsyncByteStream, on_chunk: Callable[[int], None]):
+        self._inner = inner
+        self._on_chunk = on_chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._inner:
+            self._on_chunk(len(chunk))
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper feeding :class:`HttpStats`."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, stats: HttpStats):
+        self._inner = inner
+        self._stats = stats
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        bytes_sent = int(request.headers.get("content-length") or 0)
+        count_request()
+        started = time.perf_counter()
+        try:
+            response = await self._inner.handle_async_request(request)
+        except httpx.TransportError:
+            latency_ms = (time.perf_counter() - started) * 1000
+            self._stats.record(host, latency_ms, bytes_sent, failed=True)
+            raise
+        latency_ms = (time.perf_counter() - started) * 1000
+        self._stats.record(host, latency_ms, bytes_sent, failed=response.status_code >= 400)
+        response.stream = _CountingStream(
+            response.stream, lambda size: self._stats.record_received(host, size)
+        )
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+def create_http_client(stats: HttpStats) -> httpx.AsyncClient:
+    """Create a pooled, keep-alive client that records into ``stats``.
+
+    Parameters
+    ----------
+    stats : HttpStats
+        Instrumentation sink for every request the client sends.
+
+    Returns
+    -------
+    httpx.AsyncClient
+        Client with HTTP/2 (when ``h2`` is installed), :data:`POOL_LIMITS`,
+        a 30-second timeout and redirect following (which the JSON fetch
+        helpers turn off per request). The caller closes it.
+    """
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=POOL_LIMITS)
+    return httpx.AsyncClient(
+        transport=_InstrumentedTransport(transport, stats),
+        timeout=REQUEST_TIMEOUT,
+        follow_redirects=True,
+    )
+
+
+@asynccontextmanager
+async def scraper_http_client(stats: HttpStats) -> AsyncIterator[httpx.AsyncClient]:
+    """Provide one managed client for a scraper run.
+
+    While the context is open the client is also the default of
+    :func:`~scraper.utils.fetch.fetch_get` / ``fetch_post`` /
+    ``fetch_graphql`` calls made without an explicit ``client`` (including
+    from tasks spawned inside it), so every request of the run shares one
+    connection pool.
+
+    Parameters
+    ----------
+    stats : HttpStats
+        Instrumentation sink for the run.
+
+    Yields
+    ------
+    httpx.AsyncClient
+        The run's client; closed when the context exits.
+    """
+    client = create_http_client(stats)
+    token = _current_client.set(client)
+    try:
+        yield client
+    finally:
+        _current_client.reset(token)
+        await client.aclose()
+
+
+def current_http_client() -> Optional[httpx.AsyncClient]:
+    """Return the client of the enclosing :func:`scraper_http_client`, if any."""
+    return _current_client.get()
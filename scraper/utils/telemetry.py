@@ -0,0 +1,125 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+# Spans open in the current task, outermost first. Tasks copy their parent's
+# context when created, so a month fetched in its own task counts its requests
+# towards its own span and every phase enclosing it, never a sibling's.
+_active_spans: ContextVar[tuple["PhaseSpan", ...]] = ContextVar(
+    "scrape_active_spans", default=()
+)
+_active_telemetry: ContextVar[Optional["ScrapeTelemetry"]] = ContextVar(
+    "scrape_active_telemetry", default=None
+)
+
+
+@dataclass
+class PhaseSpan:
+    """One timed phase of a scrape.
+
+    Attributes
+    ----------
+    name : str
+        Phase name (``initialize``, ``login``, ``otp_wait``, ``fetch``,
+        ``fetch_month``, ``fetch_account``, ``convert``, ``save``, …).
+    duration_ms : float
+        Wall-clock duration.
+    requests : int
+        HTTP requests sent through the run's pooled client while the span
+        was open in this task. Browser-page traffic is not counted.
+    rows : int, optional
+        Transactions the phase produced or wrote, where that is meaningful.
+    attributes : dict
+        Extra labels, e.g. ``month`` or ``account``.
+    """
+
+    name: str
+    duration_ms: float = 0.0
+    requests: int = 0
+    rows: Optional[int] = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        """Return the span as a flat JSON-safe dict."""
+        return {
+            **self.attributes,
+            "name": self.name,
+            "duration_ms": round(self.duration_ms, 1),
+            "requests": self.requests,
+            "rows": self.rows,
+        }
+
+
+class ScrapeTelemetry:
+    """Phase spans of one scrape run, in the order they started."""
+
+    def __init__(self):
+        self.spans: list[PhaseSpan] = []
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[PhaseSpan]:
+        """Time the enclosed block as a phase called ``name``.
+
+        Spans nest: child spans opened inside the block (directly or by
+        :func:`child_span` in helpers it calls) are recorded too, and
+        requests count towards every span open in the task.
+
+        Parameters
+        ----------
+        name : str
+            Phase name.
+        **attributes
+            Labels stored with the span.
+
+        Yields
+        ------
+        PhaseSpan
+            The span, so the block can set ``rows``.
+        """
+        span = PhaseSpan(name, attributes=attributes)
+        self.spans.append(span)
+        spans_token = _active_spans.set(_active_spans.get() + (span,))
+        telemetry_token = _active_telemetry.set(self)
+        started = time.perf_counter()
+        try:
+            yield span
+        finally:
+            span.duration_ms = (time.perf_counter() - started) * 1000
+            _active_spans.reset(spans_token)
+            _active_telemetry.reset(telemetry_token)
+
+    def add(
+        self, name: str, duration_ms: float, rows: Optional[int] = None, **attributes: Any
+    ) -> PhaseSpan:
+        """Record a phase that was timed elsewhere."""
+        span = PhaseSpan(name, duration_ms, rows=rows, attributes=attributes)
+        self.spans.append(span)
+        return span
+
+    def to_list(self) -> list[dict]:
+        """Return every span as a JSON-safe dict."""
+        return [span.to_dict() for span in self.spans]
+
+
+@contextmanager
+def child_span(name: str, **attributes: Any) -> Iterator[Optional[PhaseSpan]]:
+    """Open a span on the telemetry of the enclosing phase, if there is one.
+
+    For shared helpers (month and account fan-out) that do not know which
+    scraper called them. Outside an instrumented scrape this yields ``None``
+    and records nothing.
+    """
+    telemetry = _active_telemetry.get()
+    if telemetry is None:
+        yield None
+        return
+    with telemetry.span(name, **attributes) as span:
+        yield span
+
+
+def count_request() -> None:
+    """Count one HTTP request towards every span open in the current task."""
+    for span in _active_spans.get():
+        span.requests += 1
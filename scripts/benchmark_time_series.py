@@ -0,0 +1,129 @@
+"""
+Benchmark the "total" line of the multi-series charts.
+
+Compares the per-date nested scan that ``get_debt_over_time`` and
+``get_portfolio_balance_history`` used to build their total series against
+``backend.utils.time_series.sum_series``, on a synthetic portfolio shaped
+like the real endpoints' output:
+
+- 20 liabilities with a monthly payment over 10 years, each on its own
+  day of the month (debt points are per payment date).
+- 30 investments downsampled to one point per month over 10 years.
+
+Usage:
+    python scripts/benchmark_time_series.py
+    python scripts/benchmark_time_series.py --repeat 10
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Path setup — allow importing backend modules from project root
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.utils.time_series import sum_series  # noqa: E402
+
+YEARS = 10
+LIABILITIES = 20
+INVESTMENTS = 30
+
+
+def build_debt_series(rng: random.Random) -> list[list[dict]]:
+    """One declining balance series per liability, a point per payment."""
+    series = []
+    for _ in range(LIABILITIES):
+        start = date(2015, 1, 1) + timedelta(days=rng.randint(0, 365))
+        balance = rng.uniform(50_000, 1_500_000)
+        payment = balance / (YEARS * 12)
+        points = [{"date": start.strftime("%Y-%m-%d"), "balance": balance}]
+        for k in range(1, YEARS * 12 + 1):
+            balance -= payment
+            points.append({
+                "date": (start + timedelta(days=30 * k)).strftime("%Y-%m-%d"),
+                "balance": round(balance, 2),
+            })
+        series.append(points)
+    return series
+
+
+def build_investment_series(rng: random.Random) -> list[list[dict]]:
+    """One monthly balance series per investment."""
+    series = []
+    for _ in range(INVESTMENTS):
+        first_month = rng.randint(0, 24)
+        balance = rng.uniform(1_000, 200_000)
+        points = []
+        for m in range(first_month, YEARS * 12):
+            balance *= 1 + rng.gauss(0.004, 0.02)
+            points.append({
+                "date": date(2015 + m // 12, m % 12 + 1, 1).strftime("%Y-%m-%d"),
+                "balance": balance,
+            })
+        series.append(points)
+    return series
+
+
+def nested_scan_total(series: list[list[dict]]) -> list[dict]:
+    """The previous implementation: scan every series' points for every date."""
+    all_dates = sorted({p["date"] for s in series for p in s})
+    total = []
+    for d in all_dates:
+        balance_sum = 0.0
+        for s in series:
+            last = 0.0
+            for p in s:
+                if p["date"] <= d:
+                    last = p["balance"]
+                else:
+                    break
+            balance_sum += last
+        total.append({"date": d, "balance": balance_sum})
+    return total
+
+
+def timed(fn, series, repeat: int) -> tuple[float, list[dict]]:
+    """Best-of-``repeat`` wall time in seconds, plus the last result."""
+    best = float("inf")
+    result: list[dict] = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(series)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (best is kept)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cases = {
+        f"debt ({LIABILITIES} liabilities)": build_debt_series(rng),
+        f"portfolio ({INVESTMENTS} investments)": build_investment_series(rng),
+    }
+
+    for label, series in cases.items():
+        old_time, old_total = timed(nested_scan_total, series, args.repeat)
+        new_time, new_total = timed(sum_series, series, args.repeat)
+        assert len(old_total) == len(new_total)
+        assert all(
+            a["date"] == b["date"] and abs(a["balance"] - b["balance"]) < 1e-6
+            for a, b in zip(old_total, new_total)
+        )
+        print(
+            f"{label:<30} {len(new_total):>5} dates  "
+            f"nested scan {old_time * 1000:8.1f} ms  "
+            f"sum_series {new_time * 1000:6.2f} ms  "
+            f"({old_time / new_time:5.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
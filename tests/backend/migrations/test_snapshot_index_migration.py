@@ -0,0 +1,142 @@
+"""Tests for the unique (investment_id, date) snapshot index migration."""
+
+import os
+
+import pandas as pd
+import pytest
+import sqlalchemy as sa
+from alembic import command
+from alembic.config import Config
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base
+from backend.repositories.investment_snapshots_repository import (
+    InvestmentSnapshotsRepository,
+)
+
+ALEMBIC_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "backend", "alembic"
+)
+PREV_REVISION = "a3c5e7f9b1d4"
+INDEX = "uq_snapshot_investment_date"
+
+
+def _alembic_config(url: str) -> Config:
+    """Build an Alembic Config pointed at the project's migration env."""
+    cfg = Config()
+    cfg.set_main_option("script_location", os.path.abspath(ALEMBIC_DIR))
+    cfg.set_main_option("sqlalchemy.url", url)
+    return cfg
+
+
+def _execute(url: str, *statements: str) -> list:
+    """Run statements in one transaction; return the last one's rows."""
+    engine = sa.create_engine(url)
+    try:
+        with engine.begin() as conn:
+            for statement in statements:
+                result = conn.exec_driver_sql(statement)
+            return result.fetchall() if result.returns_rows else []
+    finally:
+        engine.dispose()
+
+
+def _index_names(url: str) -> set[str]:
+    """Return the named indexes on the snapshots table."""
+    engine = sa.create_engine(url)
+    try:
+        return {
+            idx["name"] for idx in sa.inspect(engine).get_indexes("investment_balance_snapshots")
+        }
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def snapshots_db(tmp_path, monkeypatch):
+    """Temp DB factory creating the snapshots table with or without the unique constraint."""
+
+    def build(unique: bool) -> str:
+        url = f"sqlite:///{tmp_path / 'snapshots.db'}"
+        constraint = ", CONSTRAINT uq_snapshot_investment_date UNIQUE (investment_id, date)"
+        engine = sa.create_engine(url)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE TABLE investment_balance_snapshots ("
+                "id INTEGER PRIMARY KEY, investment_id INTEGER NOT NULL, "
+                "date VARCHAR NOT NULL, balance FLOAT NOT NULL, source VARCHAR NOT NULL"
+                f"{constraint if unique else ''})"
+            )
+        engine.dispose()
+        monkeypatch.setattr("backend.database.get_database_url", lambda *a, **k: url)
+        return url
+
+    return build
+
+
+class TestSnapshotIndexMigration:
+    """Tests for the composite snapshot index upgrade."""
+
+    def test_creates_unique_index_on_legacy_table(self, snapshots_db):
+        """A table without the unique constraint is deduplicated and made upsertable."""
+        url = snapshots_db(unique=False)
+        _execute(
+            url,
+            "INSERT INTO investment_balance_snapshots (investment_id, date, balance, source) "
+            "VALUES (1, '2024-01-01', 100, 'manual'), (1, '2024-01-01', 150, 'calculated'), "
+            "(1, '2024-02-01', 200, 'manual')",
+        )
+        cfg = _alembic_config(url)
+        command.stamp(cfg, PREV_REVISION)
+        command.upgrade(cfg, "head")
+
+        assert INDEX in _index_names(url)
+        rows = _execute(
+            url,
+            "INSERT INTO investment_balance_snapshots (investment_id, date, balance, source) "
+            "VALUES (1, '2024-02-01', 250, 'calculated') "
+            "ON CONFLICT (investment_id, date) DO UPDATE SET balance = excluded.balance",
+            "SELECT date, balance FROM investment_balance_snapshots ORDER BY date",
+        )
+        assert rows == [("2024-01-01", 150.0), ("2024-02-01", 250.0)]
+
+        command.downgrade(cfg, PREV_REVISION)
+        assert INDEX not in _index_names(url)
+
+    def test_skipped_when_unique_constraint_covers_it(self, snapshots_db):
+        """The unique constraint's index already serves the lookups."""
+        url = snapshots_db(unique=True)
+        cfg = _alembic_config(url)
+        command.stamp(cfg, PREV_REVISION)
+        command.upgrade(cfg, "head")
+
+        assert INDEX not in _index_names(url)
+
+    def test_bulk_upsert_works_after_upgrading_legacy_schema(self, tmp_path, monkeypatch):
+        """upsert_snapshots' ON CONFLICT target exists once the legacy table is migrated."""
+        url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        engine = sa.create_engine(url)
+        Base.metadata.create_all(engine)
+        metadata = sa.MetaData()
+        Base.metadata.tables["investments"].to_metadata(metadata)
+        legacy = Base.metadata.tables["investment_balance_snapshots"].to_metadata(
+            metadata
+        )
+        legacy.constraints = {c for c in legacy.constraints if c.name != INDEX}
+        legacy.drop(engine)
+        legacy.create(engine)
+        monkeypatch.setattr("backend.database.get_database_url", lambda *a, **k: url)
+        cfg = _alembic_config(url)
+        command.stamp(cfg, PREV_REVISION)
+        command.upgrade(cfg, "head")
+
+        engine.dispose()
+        session = sessionmaker(bind=engine)()
+        try:
+            repo = InvestmentSnapshotsRepository(session)
+            repo.upsert_snapshots(1, pd.DataFrame({"date": ["2024-01-01"], "balance": [1.0]}))
+            repo.upsert_snapshots(1, pd.DataFrame({"date": ["2024-01-01"], "balance": [2.0]}))
+            assert repo.get_snapshots_for_investment(1)["balance"].tolist() == [2.0]
+        finally:
+            session.close()
+            engine.dispose()
@@ -116,6 +116,60 @@ class TestAnalyticsRoutes:
         assert response.json() == []
 
 
+class TestCashFlowForecastRoute:
+    """Tests for the GET /api/analytics/cash-flow-forecast endpoint."""
+
+    def test_forecast_with_horizon(self, test_client, seed_base_transactions):
+        """horizon_days adds a banded projection of that many days."""
+        response = test_client.get("/api/analytics/cash-flow-forecast?horizon_days=30")
+        assert response.status_code == 200
+        assert len(response.json()["horizon"]["daily"]) == 30
+
+    def test_forecast_rejects_out_of_range_horizon(self, test_client):
+        """A non-positive horizon is a validation error."""
+        response = test_client.get("/api/analytics/cash-flow-forecast?horizon_days=0")
+        assert response.status_code == 422
+
+
+class TestRecurringRoutes:
+    """Tests for the recurring-charge endpoints."""
+
+    def test_rebuild_recurring_returns_series_count(self, test_client, seed_base_transactions):
+        """POST /api/analytics/recurring/rebuild rebuilds and reports the series count."""
+        response = test_client.post("/api/analytics/recurring/rebuild")
+        assert response.status_code == 200
+        series = response.json()["series"]
+        assert isinstance(series, int)
+
+        recurring = test_client.get("/api/analytics/recurring").json()
+        assert len(recurring["items"]) == series
+
+
+class TestDashboardRoute:
+    """Tests for the single-pass dashboard bundle endpoint."""
+
+    def test_dashboard_returns_all_panels(self, test_client, seed_base_transactions):
+        """GET /api/analytics/dashboard returns every panel, matching the per-panel endpoints."""
+        response = test_client.get("/api/analytics/dashboard")
+        assert response.status_code == 200
+        data = response.json()
+        assert set(data) == {
+            "overview", "cash_flow_forecast", "insights", "recurring",
+            "net_worth_over_time", "debt_payments_over_time", "by_category",
+            "sankey", "income_expenses_over_time",
+            "expenses_by_category_over_time", "income_by_source_over_time",
+            "monthly_expenses",
+        }
+        assert data["overview"] == test_client.get("/api/analytics/overview").json()
+        assert data["recurring"] == test_client.get("/api/analytics/recurring").json()
+
+    def test_dashboard_empty_db(self, test_client):
+        """An empty database still yields a well-formed bundle."""
+        response = test_client.get("/api/analytics/dashboard")
+        assert response.status_code == 200
+        assert response.json()["recurring"] == {"items": [], "total_monthly": 0.0}
+
+
 class TestIncomeBySourceRoute:
     """Tests for the GET /api/analytics/income-by-source endpoint."""
 
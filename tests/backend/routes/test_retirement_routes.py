@@ -0,0 +1,54 @@
+"""Tests for the /api/retirement projection endpoints."""
+
+GOAL = {
+    "current_age": 35,
+    "target_retirement_age": 50,
+    "life_expectancy": 90,
+    "monthly_expenses_in_retirement": 15000.0,
+    "keren_hishtalmut_balance": 200000.0,
+    "net_worth_override": 1500000.0,
+    "monthly_income": 25000.0,
+    "monthly_expenses_override": 12000.0,
+}
+
+
+class TestProjectionsMonteCarlo:
+    """Tests for the stochastic mode of POST /api/retirement/projections."""
+
+    def test_deterministic_by_default(self, test_client):
+        """Without monte_carlo=true the stochastic block is null."""
+        response = test_client.post("/api/retirement/projections", json=GOAL)
+        assert response.status_code == 200
+        assert response.json()["monte_carlo"] is None
+
+    def test_monte_carlo_bands(self, test_client):
+        """monte_carlo=true adds seeded percentile bands per projected age."""
+        params = {"monte_carlo": "true", "paths": 1000, "seed": 3, "distribution": "student_t"}
+        first = test_client.post("/api/retirement/projections", json=GOAL, params=params)
+        second = test_client.post("/api/retirement/projections", json=GOAL, params=params)
+
+        assert first.status_code == 200
+        mc = first.json()["monte_carlo"]
+        assert mc["paths"] == 1000
+        assert mc["distribution"] == "student_t"
+        assert len(mc["projection"]) == len(first.json()["net_worth_projection"])
+        assert 0 <= mc["success_probability"] <= 1
+        assert mc == second.json()["monte_carlo"]
+
+    def test_rejects_unknown_distribution(self, test_client):
+        """Distribution names are validated at the boundary."""
+        response = test_client.post(
+            "/api/retirement/projections",
+            json=GOAL,
+            params={"monte_carlo": "true", "distribution": "cauchy"},
+        )
+        assert response.status_code == 422
+
+    def test_rejects_path_count_above_cap(self, test_client):
+        """The path count is capped so one request cannot exhaust memory."""
+        response = test_client.post(
+            "/api/retirement/projections",
+            json=GOAL,
+            params={"monte_carlo": "true", "paths": 200_000},
+        )
+        assert response.status_code == 422
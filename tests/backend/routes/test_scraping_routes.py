@@ -16,6 +16,15 @@ def mock_scraping(monkeypatch):
     mock_service.submit_2fa_code.return_value = None
     mock_service.abort_scraping_process.return_value = None
     mock_service.get_last_scrape_dates.return_value = []
+    mock_service.get_telemetry_summary.return_value = []
+    mock_service.start_scraping_all.return_value = 5
+    mock_service.get_scraping_all_status.return_value = {
+        "batch_id": 5,
+        "accounts": [],
+        "counts": {},
+        "awaiting_2fa": None,
+        "done": True,
+    }
 
     monkeypatch.setattr(
         "backend.routes.scraping.ScrapingService",
@@ -64,12 +73,33 @@ class TestScrapingRoutes:
         assert response.status_code == 200
         assert response.json()["status"] == "aborted"
 
+    def test_start_scraping_all(self, test_client):
+        """POST /api/scraping/start-all returns the batch id."""
+        response = test_client.post(
+            "/api/scraping/start-all", json={"scraping_period_days": 30}
+        )
+        assert response.status_code == 200
+        assert response.json() == 5
+
+    def test_get_scraping_all_status(self, test_client):
+        """GET /api/scraping/start-all/status returns the batch progress."""
+        response = test_client.get("/api/scraping/start-all/status?batch_id=5")
+        assert response.status_code == 200
+        assert response.json()["done"] is True
+
     def test_get_last_scrapes(self, test_client):
         """GET /api/scraping/last-scrapes returns last scrape dates."""
         response = test_client.get("/api/scraping/last-scrapes")
         assert response.status_code == 200
         assert isinstance(response.json(), list)
 
+    def test_get_telemetry_summary(self, test_client):
+        """GET /api/scraping/telemetry/summary validates the window."""
+        response = test_client.get("/api/scraping/telemetry/summary?days=7")
+        assert response.status_code == 200
+        assert response.json() == []
+        assert test_client.get("/api/scraping/telemetry/summary?days=0").status_code == 422
+
     def test_start_forwards_force_2fa(self, test_client):
         """POST /api/scraping/start passes force_2fa through to the service."""
         instance = MagicMock()
@@ -88,3 +118,26 @@ class TestScrapingRoutes:
             )
         assert resp.status_code == 200
         assert instance.start_scraping_single.call_args.kwargs["force_2fa"] is True
+
+    def test_stream_events_replays_after_last_event_id(self, test_client):
+        """GET /api/scraping/events streams missed events and closes on the final one."""
+        from backend.scraper.events import ScrapeEventBus
+        from backend.services.scraping_service import ScrapingService
+
+        bus = ScrapeEventBus()
+        bus.publish(4242, "status", {"status": "in_progress"})
+        bus.publish(4242, "progress", {"message": "Logging in"})
+        bus.publish(4242, "status", {"status": "success"}, final=True)
+        with patch(
+            "backend.routes.scraping.ScrapingService", ScrapingService
+        ), patch("backend.services.scraping_service.scrape_events", bus):
+            response = test_client.get(
+                "/api/scraping/events?scraping_process_id=4242",
+                headers={"Last-Event-ID": "1"},
+            )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            'id: 2\nevent: progress\ndata: {"message": "Logging in"}\n\n'
+            'id: 3\nevent: status\ndata: {"status": "success"}\n\n'
+        )
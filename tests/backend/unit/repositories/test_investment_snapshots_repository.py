@@ -2,6 +2,7 @@
 Unit tests for InvestmentSnapshotsRepository CRUD operations.
 """
 
+import pandas as pd
 import pytest
 from sqlalchemy.orm import Session
 
@@ -73,6 +74,50 @@ class TestUpsertSnapshot:
         assert row["source"] == "scraped"
 
 
+class TestUpsertSnapshots:
+    """Tests for the bulk upsert_snapshots method."""
+
+    def test_inserts_and_updates_in_one_call(self, db_session: Session):
+        """Verify new dates are inserted and existing dates overwritten."""
+        inv_id = _create_investment(db_session)
+        repo = InvestmentSnapshotsRepository(db_session)
+        repo.upsert_snapshot(inv_id, "2024-02-01", 1.0, source="manual")
+
+        repo.upsert_snapshots(
+            inv_id,
+            pd.DataFrame(
+                {"date": ["2024-01-01", "2024-02-01", "2024-03-01"], "balance": [10.0, 20.0, 30.0]}
+            ),
+        )
+
+        df = repo.get_snapshots_for_investment(inv_id)
+        assert df["date"].tolist() == ["2024-01-01", "2024-02-01", "2024-03-01"]
+        assert df["balance"].tolist() == [10.0, 20.0, 30.0]
+        assert set(df["source"]) == {"calculated"}
+
+    def test_chunks_large_batches(self, db_session: Session):
+        """Verify batches beyond one statement's row limit are all written."""
+        inv_id = _create_investment(db_session)
+        repo = InvestmentSnapshotsRepository(db_session)
+        dates = pd.date_range("2000-01-01", periods=450, freq="D").strftime("%Y-%m-%d")
+
+        repo.upsert_snapshots(inv_id, pd.DataFrame({"date": dates, "balance": 1.0}))
+
+        assert len(repo.get_snapshots_for_investment(inv_id)) == 450
+
+    def test_without_commit_rolls_back(self, db_session: Session):
+        """Verify commit=False leaves the write to the caller's transaction."""
+        inv_id = _create_investment(db_session)
+        repo = InvestmentSnapshotsRepository(db_session)
+
+        repo.upsert_snapshots(
+            inv_id, pd.DataFrame({"date": ["2024-01-01"], "balance": [5.0]}), commit=False
+        )
+        db_session.rollback()
+
+        assert repo.get_snapshots_for_investment(inv_id).empty
+
+
 class TestGetSnapshotsForInvestment:
     """Tests for the get_snapshots_for_investment method."""
 
@@ -99,6 +144,57 @@ class TestGetSnapshotsForInvestment:
         assert df.empty
 
 
+class TestGetSnapshotsForInvestments:
+    """Tests for the bulk snapshot loaders."""
+
+    @pytest.fixture()
+    def two_investments(self, db_session: Session):
+        """Two investments with interleaved snapshot dates."""
+        repo = InvestmentSnapshotsRepository(db_session)
+        first = _create_investment(db_session, "Fund A")
+        second = _create_investment(db_session, "Fund B")
+        for inv_id, day, balance in [
+            (second, "2024-03-01", 30.0),
+            (first, "2024-02-01", 20.0),
+            (first, "2024-01-01", 10.0),
+            (second, "2024-01-15", 15.0),
+        ]:
+            repo.upsert_snapshot(inv_id, day, balance)
+        return repo, first, second
+
+    def test_long_frame_sorted_by_investment_then_date(self, two_investments):
+        """Verify one frame holds every investment, in (investment, date) order."""
+        repo, first, second = two_investments
+
+        df = repo.get_snapshots_for_investments()
+
+        assert list(zip(df["investment_id"], df["date"])) == [
+            (first, "2024-01-01"),
+            (first, "2024-02-01"),
+            (second, "2024-01-15"),
+            (second, "2024-03-01"),
+        ]
+
+    def test_filters_by_ids_and_dates(self, two_investments):
+        """Verify the id list and inclusive date bounds narrow the result."""
+        repo, first, second = two_investments
+
+        df = repo.get_snapshots_for_investments([second], "2024-01-15", "2024-02-28")
+
+        assert df["date"].tolist() == ["2024-01-15"]
+
+    def test_grouped_arrays(self, two_investments):
+        """Verify the grouped view splits the frame into per-investment arrays."""
+        repo, first, second = two_investments
+
+        arrays = repo.get_snapshot_arrays()
+
+        assert set(arrays) == {first, second}
+        assert arrays[first].dates.astype(str).tolist() == ["2024-01-01", "2024-02-01"]
+        assert arrays[second].balances.tolist() == [15.0, 30.0]
+        assert repo.get_snapshot_arrays([first], start_date="2025-01-01") == {}
+
+
 class TestGetLatestSnapshotOnOrBefore:
     """Tests for the get_latest_snapshot_on_or_before method."""
 
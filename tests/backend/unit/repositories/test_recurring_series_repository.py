@@ -0,0 +1,65 @@
+"""Unit tests for RecurringSeriesRepository."""
+
+from backend.repositories.recurring_series_repository import RecurringSeriesRepository
+
+
+def _row(normalized: str, amount: float = 20.0) -> dict:
+    """Build a persistable series row."""
+    return {
+        "normalized": normalized,
+        "label": normalized.upper(),
+        "category": "Streaming",
+        "cadence": "monthly",
+        "period_days": 30,
+        "occurrences": 4,
+        "first_date": "2026-01-05",
+        "last_date": "2026-04-05",
+        "interval_median": 30.0,
+        "interval_std": 1.0,
+        "amount": amount,
+        "last_amount": amount,
+        "prior_median": amount,
+        "price_change": 0.0,
+        "status": "active",
+    }
+
+
+class TestRecurringSeriesRepository:
+    """Tests for recurring_series data access."""
+
+    def test_get_all_empty_returns_dataframe_with_columns(self, db_session):
+        """An empty table still yields the canonical column schema."""
+        df = RecurringSeriesRepository(db_session).get_all()
+        assert df.empty
+        assert set(RecurringSeriesRepository.COLUMNS) <= set(df.columns)
+
+    def test_replace_all_overwrites_model(self, db_session):
+        """replace_all discards previous rows."""
+        repo = RecurringSeriesRepository(db_session)
+        repo.replace_all([_row("a"), _row("b")])
+        repo.replace_all([_row("c")])
+
+        assert list(repo.get_all()["normalized"]) == ["c"]
+        assert repo.count() == 1
+
+    def test_replace_only_touches_given_keys(self, db_session):
+        """replace refreshes the given keys and drops those without a new row."""
+        repo = RecurringSeriesRepository(db_session)
+        repo.replace_all([_row("a"), _row("b"), _row("c")])
+
+        repo.replace(["a", "b"], [_row("a", amount=99.0)])
+
+        df = repo.get_all().set_index("normalized")
+        assert list(df.index) == ["a", "c"]
+        assert df.loc["a", "amount"] == 99.0
+
+    def test_empty_build_is_recorded_by_its_watermark(self, db_session):
+        """replace_all with no rows still marks the model as built."""
+        repo = RecurringSeriesRepository(db_session)
+        assert repo.get_watermark() is None
+
+        watermark = repo.source_watermark(["credit_card_transactions"])
+        repo.replace_all([], watermark)
+
+        assert repo.count() == 0
+        assert repo.get_watermark() == watermark
@@ -2,7 +2,7 @@
 Unit tests for ScrapingHistoryRepository operations.
 """
 
-from datetime import date
+from datetime import date, datetime, timedelta
 
 from sqlalchemy.orm import Session
 
@@ -280,3 +280,56 @@ class TestScrapingHistoryRepositoryClearOldRecords:
 
         history = repo.get_scraping_history()
         assert len(history) == 2
+
+
+class TestScrapingHistoryTelemetry:
+    """Tests for the persisted per-phase telemetry."""
+
+    @staticmethod
+    def _finished(repo, provider, spans, account="Main"):
+        scrape_id = repo.record_scrape_start(
+            service_name="credit_cards",
+            provider_name=provider,
+            account_name=account,
+            start_date=date(2024, 1, 15),
+        )
+        repo.record_scrape_end(scrape_id, repo.SUCCESS, telemetry=spans)
+        return scrape_id
+
+    def test_latest_telemetry_skips_uninstrumented_runs(self, db_session: Session):
+        """The newest run that recorded spans is returned, with its status."""
+        repo = ScrapingHistoryRepository(db_session)
+        spans = [{"name": "login", "duration_ms": 1200.0, "requests": 3, "rows": None}]
+        scrape_id = self._finished(repo, "isracard", spans)
+        self._finished(repo, "isracard", None)
+        self._finished(repo, "max", None)
+
+        by_account = repo.get_latest_telemetry_by_account()
+
+        latest = by_account[("credit_cards", "isracard", "Main")]
+        assert latest["scrape_id"] == scrape_id
+        assert latest["status"] == repo.SUCCESS
+        assert latest["phases"] == spans
+        assert ("credit_cards", "max", "Main") not in by_account
+
+    def test_latest_telemetry_per_account(self, db_session: Session):
+        """Each account gets its own newest instrumented run."""
+        repo = ScrapingHistoryRepository(db_session)
+        self._finished(repo, "isracard", [{"name": "fetch", "duration_ms": 1.0}])
+        newer = self._finished(repo, "isracard", [{"name": "fetch", "duration_ms": 2.0}])
+        other = self._finished(repo, "isracard", [{"name": "fetch", "duration_ms": 3.0}], account="Joint")
+
+        by_account = repo.get_latest_telemetry_by_account()
+
+        assert by_account[("credit_cards", "isracard", "Main")]["scrape_id"] == newer
+        assert by_account[("credit_cards", "isracard", "Joint")]["scrape_id"] == other
+
+    def test_telemetry_since(self, db_session: Session):
+        """Every instrumented run in the window is returned with its provider."""
+        repo = ScrapingHistoryRepository(db_session)
+        self._finished(repo, "isracard", [{"name": "fetch", "duration_ms": 5.0}])
+        self._finished(repo, "max", None)
+
+        runs = repo.get_telemetry_since(datetime.now() - timedelta(days=1))
+
+        assert runs == [("isracard", [{"name": "fetch", "duration_ms": 5.0}])]
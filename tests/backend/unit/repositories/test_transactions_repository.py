@@ -455,6 +455,19 @@ class TestAddScrapedTransactionsDistinctDuplicates:
         repo.add_scraped_transactions(self._withdrawals_df(), "bank_transactions")
         assert db_session.query(BankTransaction).count() == 2
 
+    def test_returns_only_inserted_rows(self, db_session):
+        """Verify the returned delta holds the inserted rows, empty on a re-scrape."""
+        repo = TransactionsRepository(db_session)
+        first = repo.add_scraped_transactions(
+            self._withdrawals_df(), "bank_transactions"
+        )
+        assert len(first) == 2
+
+        second = repo.add_scraped_transactions(
+            self._withdrawals_df(), "bank_transactions"
+        )
+        assert second.empty
+
 
 class TestGetTransactionById:
     """Tests for TransactionsRepository.get_transaction_by_id."""
@@ -983,3 +996,56 @@ class TestCountUncategorized:
         )
         assert expected > 0
         assert repo.count_uncategorized() == expected
+
+
+class TestGetCategoryTransactions:
+    """Tests for the SQL-filtered single-category view."""
+
+    @staticmethod
+    def _bank(id_, category, amount=-100.0, type_="normal"):
+        return BankTransaction(
+            id=id_,
+            date="2025-03-04",
+            provider="hapoalim",
+            account_name="Checking",
+            description=id_,
+            amount=amount,
+            category=category,
+            tag="Mortgage",
+            source="bank_transactions",
+            type=type_,
+            status="completed",
+        )
+
+    def test_matches_filtered_merged_view(self, db_session):
+        """Rows, split parents and split children match get_table() filtered by category."""
+        parent = self._bank("split-parent", "Other", type_="split_parent")
+        db_session.add_all([
+            self._bank("loan-payment", "Liabilities"),
+            self._bank("groceries", "Food"),
+            self._bank("liab-parent", "Liabilities", type_="split_parent"),
+            parent,
+        ])
+        db_session.commit()
+        db_session.add_all([
+            SplitTransaction(transaction_id=parent.unique_id, source="bank_transactions",
+                             amount=-60.0, category="Liabilities", tag="Mortgage"),
+            SplitTransaction(transaction_id=parent.unique_id, source="bank_transactions",
+                             amount=-40.0, category="Food", tag=None),
+        ])
+        db_session.commit()
+
+        repo = TransactionsRepository(db_session)
+        result = repo.get_category_transactions("Liabilities")
+        full = repo.get_table()
+        expected = full[full["category"] == "Liabilities"]
+
+        assert sorted(result["unique_id"].astype(str)) == sorted(expected["unique_id"].astype(str))
+        assert sorted(result["amount"]) == [-100.0, -60.0]
+        assert set(result["date"]) == {"2025-03-04"}
+
+    def test_empty_has_canonical_columns(self, db_session):
+        """No matching rows still yields the canonical transaction columns."""
+        result = TransactionsRepository(db_session).get_category_transactions("Liabilities")
+        assert result.empty
+        assert "date" in result.columns and "tag" in result.columns
@@ -0,0 +1,81 @@
+"""Tests for the array-based amortization engine."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from backend.services.amortization import compute_schedule, payment_dates
+from backend.services.rate_series import RateSeries
+
+
+def _reference_shpitzer(principal, rates, term):
+    """Month-by-month annuity loop with re-amortization on rate change."""
+    balance, payment, current, rows = principal, 0.0, None, []
+    for i, rate in enumerate(rates, start=1):
+        monthly = rate / 1200
+        if rate != current:
+            m = term - i + 1
+            payment = balance / m if monthly == 0 else balance * monthly / (1 - (1 + monthly) ** -m)
+            current = rate
+        interest = balance * monthly
+        principal_part = balance if i == term else payment - interest
+        balance -= principal_part
+        rows.append(balance)
+    return rows
+
+
+def _steps(*pairs):
+    """Rate series from ``(date, percent)`` pairs."""
+    return RateSeries.from_records({"date": d, "value": v} for d, v in pairs)
+
+
+class TestComputeSchedule:
+    """Tests for compute_schedule."""
+
+    def test_stepped_shpitzer_matches_sequential_loop(self):
+        """Segment closed forms reproduce the month-by-month recurrence."""
+        steps = _steps(("2020-01-01", 3.0), ("2021-03-10", 4.5), ("2023-06-01", 0.0), ("2024-01-01", 6.25))
+        schedule = compute_schedule(850000.0, 3.0, 240, date(2020, 1, 1), "shpitzer", steps)
+
+        expected = _reference_shpitzer(850000.0, schedule.annual_rate.tolist(), 240)
+        np.testing.assert_allclose(schedule.remaining, expected, atol=0.011)
+        assert schedule.remaining[-1] == 0.0
+
+    def test_memoized_and_read_only(self):
+        """Identical parameters return the cached schedule, whose columns are immutable."""
+        first = compute_schedule(120000.0, 5.0, 120, date(2022, 5, 17), "equal_principal")
+        second = compute_schedule(120000.0, 5.0, 120, date(2022, 5, 17), "equal_principal")
+
+        assert first is second
+        with pytest.raises(ValueError):
+            first.payment[0] = 0.0
+
+    def test_new_rate_steps_miss_the_cache(self):
+        """A changed rate series is a different key, not a stale hit."""
+        old = compute_schedule(100000.0, 4.0, 60, date(2024, 1, 1), "shpitzer", _steps(("2024-01-01", 4.0)))
+        new = compute_schedule(
+            100000.0, 4.0, 60, date(2024, 1, 1), "shpitzer",
+            _steps(("2024-01-01", 4.0), ("2025-01-01", 5.0)),
+        )
+        again = compute_schedule(
+            100000.0, 4.0, 60, date(2024, 1, 1), "shpitzer",
+            _steps(("2024-01-01", 4.0), ("2025-01-01", 5.0)),
+        )
+
+        assert old is not new
+        assert again is new
+        assert new.payment[-1] > old.payment[-1]
+
+    def test_zero_term_is_empty(self):
+        """A zero-month loan has no payments."""
+        assert len(compute_schedule(1000.0, 5.0, 0, date(2024, 1, 1))) == 0
+
+
+class TestHelpers:
+    """Tests for the date helpers."""
+
+    def test_payment_dates_clamp_day_to_28(self):
+        """Month-end start dates land on the 28th of each following month."""
+        dates = payment_dates(date(2024, 1, 31), 2).astype(str).tolist()
+        assert dates == ["2024-01-28", "2024-02-28", "2024-03-28"]
@@ -1268,6 +1268,94 @@ class TestCashFlowForecast:
             0.0, result["expected_income"] - result["actual_expenses"]
         )
 
+    def test_forecast_recurring_charge_lands_on_due_day(self, db_session):
+        """The projected trajectory steps down by a recurring charge on its due day."""
+        today = pd.Timestamp.today().normalize()
+        month_end = today + pd.offsets.MonthEnd(0)
+        if today >= month_end:
+            pytest.skip("run on the last day of the month — no remaining days")
+
+        next_due = today + pd.Timedelta(days=1)
+        for k in range(1, 5):
+            db_session.add(
+                CreditCardTransaction(
+                    id=f"sub-{k}",
+                    date=(next_due - pd.Timedelta(days=30 * k)).strftime("%Y-%m-%d"),
+                    provider="visa",
+                    account_name="card",
+                    description="NETFLIX.COM",
+                    amount=-45.0,
+                    category="Streaming",
+                    source=Tables.CREDIT_CARD.value,
+                )
+            )
+        db_session.commit()
+
+        result = AnalysisService(db_session).get_cash_flow_forecast()
+        by_date = {d["date"]: d for d in result["daily"]}
+        before = by_date[today.strftime("%Y-%m-%d")]["projected_balance"]
+        after = by_date[next_due.strftime("%Y-%m-%d")]["projected_balance"]
+        # The impulse is at least the charge itself; trend flow may add to it.
+        assert before - after >= 45.0 - 0.01
+        assert result["expected_expenses"] >= result["committed_remaining"]
+
+    def test_forecast_horizon_shape(self, db_session, seed_base_transactions):
+        """A horizon adds one banded point per day ahead, consistent at month end."""
+        result = AnalysisService(db_session).get_cash_flow_forecast(horizon_days=90)
+        horizon = result["horizon"]
+
+        assert horizon["days"] == 90
+        assert len(horizon["daily"]) == 90
+        first = pd.Timestamp(horizon["daily"][0]["date"])
+        assert first == pd.Timestamp.today().normalize() + pd.Timedelta(days=1)
+        for point in horizon["daily"]:
+            assert point["low_balance"] <= point["projected_balance"] <= point["high_balance"]
+        assert horizon["end_balance"] == horizon["daily"][-1]["projected_balance"]
+        assert horizon["min_balance"] == min(p["projected_balance"] for p in horizon["daily"])
+
+        if result["days_remaining"] > 0:
+            month_end = horizon["daily"][result["days_remaining"] - 1]
+            assert month_end["projected_balance"] == pytest.approx(
+                result["projected_end_balance"], abs=0.02
+            )
+
+    def test_forecast_paths_start_from_current_balance(self, db_session):
+        """The actual line ends at today's balance, where month and horizon paths both start."""
+        from backend.models.bank_balance import BankBalance
+
+        today = pd.Timestamp.today().normalize()
+        db_session.add(BankBalance(provider="hapoalim", account_name="Checking", balance=10000.0))
+        # A transfer to investments moves the bank balance but is neither
+        # income nor expense, so it separates the two possible anchors.
+        db_session.add(
+            BankTransaction(
+                id="invest-1",
+                date=today.strftime("%Y-%m-%d"),
+                provider="hapoalim",
+                account_name="Checking",
+                description="Transfer to brokerage",
+                amount=-3000.0,
+                category="Investments",
+                source=Tables.BANK.value,
+                type="normal",
+            )
+        )
+        db_session.commit()
+
+        result = AnalysisService(db_session).get_cash_flow_forecast(horizon_days=30)
+        daily = result["daily"]
+        today_point = daily[result["day_of_month"] - 1]
+
+        assert today_point["actual_balance"] == result["current_bank_balance"] == 10000.0
+        if result["days_remaining"] > 0:
+            assert result["horizon"]["daily"][0]["projected_balance"] == pytest.approx(
+                daily[result["day_of_month"]]["projected_balance"], abs=0.01
+            )
+
+    def test_forecast_horizon_omitted_by_default(self, db_session):
+        """Without horizon_days the payload keeps its current-month shape."""
+        assert "horizon" not in AnalysisService(db_session).get_cash_flow_forecast()
+
 
 class TestAnalysisServiceIncomeBySourceAggregate:
     """Tests for get_income_by_source (date-range aggregate)."""
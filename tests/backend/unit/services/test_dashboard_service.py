@@ -0,0 +1,49 @@
+"""Tests for DashboardService — the single-pass dashboard bundle."""
+
+from unittest.mock import patch
+
+from backend.services.analysis import AnalysisService
+from backend.services.budget_service import MonthlyBudgetService
+from backend.services.dashboard_service import DashboardService
+from backend.services.insights_service import InsightsService
+from backend.services.recurring_service import RecurringService
+
+
+class TestDashboardBundle:
+    """DashboardService.get_dashboard assembles all panels from one memo."""
+
+    def test_bundle_matches_individual_panels(self, db_session, seed_base_transactions):
+        """Every panel equals what its own service call returns."""
+        bundle = DashboardService(db_session).get_dashboard()
+
+        db_session.commit()  # drop the memo so the reference values are fresh
+        analysis = AnalysisService(db_session)
+        assert bundle["cash_flow_forecast"] == analysis.get_cash_flow_forecast()
+        assert bundle["recurring"] == RecurringService(db_session).get_recurring()
+        assert bundle["insights"] == InsightsService(db_session).get_insights()
+        assert bundle["net_worth_over_time"] == analysis.get_net_worth_over_time()
+        assert bundle["by_category"] == analysis.get_expenses_by_category()
+        assert bundle["monthly_expenses"] == analysis.get_monthly_expenses()
+        assert bundle["income_expenses_over_time"] == analysis.get_income_expenses_over_time(
+            exclude_projects=True
+        )
+
+    def test_shared_intermediates_are_computed_once(self, db_session, seed_base_transactions):
+        """Monthly expenses and recurring charges are evaluated once for the whole bundle."""
+        filtered = MonthlyBudgetService.get_filtered_expenses
+        rows_to_result = RecurringService._rows_to_result
+        calls = {"expenses": 0, "recurring": 0}
+
+        def count_expenses(self, *args, **kwargs):
+            calls["expenses"] += 1
+            return filtered(self, *args, **kwargs)
+
+        def count_recurring(self, rows):
+            calls["recurring"] += 1
+            return rows_to_result(self, rows)
+
+        with patch.object(MonthlyBudgetService, "get_filtered_expenses", count_expenses), \
+                patch.object(RecurringService, "_rows_to_result", count_recurring):
+            DashboardService(db_session).get_dashboard()
+
+        assert calls == {"expenses": 1, "recurring": 1}
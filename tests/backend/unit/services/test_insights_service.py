@@ -1,5 +1,8 @@
 """Tests for InsightsService insight-card generation."""
 
+import threading
+import time
+
 import pandas as pd
 
 from backend.constants.tables import Tables
@@ -66,3 +69,90 @@ class TestInsights:
 
         codes = {i["code"] for i in InsightsService(db_session).get_insights()}
         assert "categorySpike" in codes
+
+
+class TestInsightProducers:
+    """Tests for dependency resolution and per-producer isolation."""
+
+    def test_dependencies_resolved_once_per_call(self, db_session, monkeypatch):
+        """Each declared dependency is loaded exactly once per get_insights."""
+        service = InsightsService(db_session)
+        calls = {key: 0 for key in service._dependencies}
+
+        def counting(key, loader):
+            def wrapper():
+                calls[key] += 1
+                return loader()
+            return wrapper
+
+        service._dependencies = {k: counting(k, v) for k, v in service._dependencies.items()}
+        service.get_insights()
+
+        assert calls == {key: 1 for key in calls}
+
+    def test_producers_run_on_the_calling_thread(self, db_session, monkeypatch):
+        """Producers run inline, so none can outlive the request on a worker."""
+        threads = []
+        service = InsightsService(db_session)
+        monkeypatch.setattr(
+            service, "_pace_insight", lambda forecast: threads.append(threading.current_thread()) or []
+        )
+
+        service.get_insights()
+
+        assert threads == [threading.current_thread()]
+
+    def test_slow_producer_skipped_with_the_rest(self, db_session, monkeypatch):
+        """A producer overrunning the budget is dropped and later ones never load their data."""
+        for n in range(3):
+            _add(db_session, "DISNEY PLUS", -30.0, _months_ago(n), category="Streaming")
+        db_session.commit()
+
+        service = InsightsService(db_session)
+        monkeypatch.setattr(InsightsService, "_PRODUCER_BUDGET_SECONDS", 0.05)
+
+        def slow(forecast):
+            time.sleep(0.1)
+            return [{"code": "onTrack", "severity": "positive", "data": {"amount": 1.0}}]
+
+        monkeypatch.setattr(service, "_pace_insight", slow)
+        loaded = []
+        service._dependencies = {
+            k: (lambda k=k, v=v: loaded.append(k) or v())
+            for k, v in service._dependencies.items()
+        }
+
+        assert service.get_insights() == []
+        assert loaded == ["forecast"]
+
+    def test_failing_producer_isolated(self, db_session, monkeypatch):
+        """A producer that raises contributes nothing but doesn't fail the call."""
+        for n in range(3):
+            _add(db_session, "DISNEY PLUS", -30.0, _months_ago(n), category="Streaming")
+        db_session.commit()
+
+        def boom(forecast):
+            raise RuntimeError("boom")
+
+        service = InsightsService(db_session)
+        monkeypatch.setattr(service, "_pace_insight", boom)
+
+        codes = {i["code"] for i in service.get_insights()}
+        assert "newRecurring" in codes
+
+    def test_failing_dependency_skips_only_its_producers(self, db_session):
+        """A dependency that fails to load skips just the producers needing it."""
+        for n in range(3):
+            _add(db_session, "DISNEY PLUS", -30.0, _months_ago(n), category="Streaming")
+        db_session.commit()
+
+        service = InsightsService(db_session)
+
+        def broken():
+            raise RuntimeError("db down")
+
+        service._dependencies["forecast"] = broken
+        codes = {i["code"] for i in service.get_insights()}
+
+        assert "newRecurring" in codes
+        assert not codes & {"overspendPace", "onTrack"}
@@ -1,5 +1,7 @@
 """Tests for InvestmentsService using real in-memory SQLite database."""
 
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
@@ -963,3 +965,70 @@ class TestInsuranceLinkedTransactions:
 
         metrics = service.calculate_profit_loss(inv_id)
         assert metrics["total_deposits"] == 0.0
+
+    def _seed_mixed_transactions(self, db_session, service):
+        """Seed a linked fund with manual + insurance rows and a standalone ETF."""
+        linked_id = self._seed_linked_investment(service, policy_id="POL-MIX")
+        linked_tag = service.get_all_investments()[0]["tag"]
+        service.create_investment(
+            category="Investments",
+            tag="Standalone",
+            type_="etf",
+            name="Standalone ETF",
+            interest_rate_type="variable",
+        )
+        standalone_id = next(
+            inv["id"] for inv in service.get_all_investments() if inv["tag"] == "Standalone"
+        )
+        db_session.add_all([
+            InsuranceTransaction(
+                id="ins-mix", date="2025-01-15", provider="hafenix",
+                account_name="Linked Fund", account_number="POL-MIX",
+                description="Monthly deposit", amount=1000.0,
+                source="insurance_transactions",
+            ),
+            ManualInvestmentTransaction(
+                id="man-linked", date="2025-02-01", provider="manual_investments",
+                account_name="KH", description="Top-up", amount=-300.0,
+                category="Investments", tag=linked_tag,
+                source="manual_investment_transactions", type="normal", status="completed",
+            ),
+            ManualInvestmentTransaction(
+                id="man-etf", date="2025-03-01", provider="manual_investments",
+                account_name="Broker", description="Buy", amount=-700.0,
+                category="Investments", tag="Standalone",
+                source="manual_investment_transactions", type="normal", status="completed",
+            ),
+        ])
+        db_session.commit()
+        return linked_id, standalone_id
+
+    def test_combined_transactions_grouped_by_investment(self, db_session):
+        """Verify the bulk loader attributes manual and negated insurance rows per investment."""
+        service = InvestmentsService(db_session)
+        linked_id, standalone_id = self._seed_mixed_transactions(db_session, service)
+
+        combined = service.get_all_investment_transactions_combined()
+
+        linked = combined[combined["investment_id"] == linked_id]
+        assert linked["id"].tolist() == ["man-linked", "ins-mix"]
+        assert linked["amount"].tolist() == [-300.0, -1000.0]
+        standalone = combined[combined["investment_id"] == standalone_id]
+        assert standalone["amount"].tolist() == [-700.0]
+
+    def test_transactions_loaded_once_per_session(self, db_session):
+        """Verify per-investment lookups slice one load instead of querying per investment."""
+        service = InvestmentsService(db_session)
+        linked_id, standalone_id = self._seed_mixed_transactions(db_session, service)
+
+        with patch.object(
+            service.investments_repo,
+            "get_linked_insurance_transactions",
+            wraps=service.investments_repo.get_linked_insurance_transactions,
+        ) as loader:
+            linked = service.calculate_profit_loss(linked_id)
+            standalone = service.calculate_profit_loss(standalone_id)
+
+        assert loader.call_count == 1
+        assert linked["total_deposits"] == 1300.0
+        assert standalone["total_deposits"] == 700.0
@@ -2,9 +2,11 @@
 Unit tests for InvestmentsService snapshot-related methods.
 """
 
+from datetime import date, timedelta
 from unittest.mock import MagicMock
 
 import pandas as pd
+import pytest
 from sqlalchemy.orm import Session
 
 from backend.models.investment import Investment
@@ -13,6 +15,7 @@ from backend.repositories.investment_snapshots_repository import (
 )
 from backend.repositories.investments_repository import InvestmentsRepository
 from backend.services.investments_service import InvestmentsService
+from backend.services.rate_series import RateSeries
 
 
 def _create_investment(db_session: Session, tag: str = "Test Fund", **kwargs) -> int:
@@ -32,13 +35,27 @@ def _create_investment(db_session: Session, tag: str = "Test Fund", **kwargs) ->
     return inv.id
 
 
+def _mock_transactions_service(db_session: Session, transactions_df: pd.DataFrame) -> MagicMock:
+    """Mock a TransactionsService whose analysis table gives every investment ``transactions_df``."""
+
+    def analysis() -> pd.DataFrame:
+        investments = InvestmentsRepository(db_session).get_all_investments(include_closed=True)
+        return pd.concat(
+            [transactions_df.assign(category=inv.category, tag=inv.tag) for inv in investments.itertuples()]
+            or [transactions_df],
+            ignore_index=True,
+        )
+
+    mock_txn_service = MagicMock()
+    mock_txn_service.get_data_for_analysis.side_effect = analysis
+    return mock_txn_service
+
+
 def _make_service(db_session: Session, transactions_df: pd.DataFrame | None = None) -> InvestmentsService:
     """Create an InvestmentsService, optionally mocking transaction data."""
     service = InvestmentsService(db_session)
     if transactions_df is not None:
-        mock_txn_service = MagicMock()
-        mock_txn_service.get_transactions_by_tag.return_value = transactions_df
-        service.transactions_service = mock_txn_service
+        service.transactions_service = _mock_transactions_service(db_session, transactions_df)
     return service
 
 
@@ -152,6 +169,37 @@ class TestFixedRateCalculation:
         last_snapshot = snapshots[-1]
         assert last_snapshot["balance"] < 80000
 
+    def test_matches_daily_loop_through_negative_balance(self, db_session: Session):
+        """Verify the vectorized replay equals a day-by-day walk, including
+        a withdrawal that takes the balance below zero (no interest accrues)."""
+        inv_id = _create_investment(
+            db_session, tag="Savings Loop", interest_rate=7.5, interest_rate_type="fixed"
+        )
+        flows = {
+            date(2024, 1, 15): 50000.0,
+            date(2024, 5, 3): -65000.0,
+            date(2024, 9, 20): 30000.0,
+            date(2025, 2, 1): 12000.0,
+        }
+        txn_df = pd.DataFrame(
+            [{"date": d.isoformat(), "amount": -a, "description": "x"} for d, a in flows.items()]
+        )
+        service = _make_service(db_session, transactions_df=txn_df)
+
+        service.calculate_fixed_rate_snapshots(inv_id, end_date="2025-06-10")
+
+        expected, balance, day = {}, 0.0, date(2024, 1, 15)
+        while day <= date(2025, 6, 10):
+            balance += flows.get(day, 0.0)
+            if balance > 0:
+                balance *= 1.075 ** (1 / 365)
+            if day.day == 1 or day == date(2025, 6, 10):
+                expected[day.isoformat()] = round(balance, 2)
+            day += timedelta(days=1)
+        snapshots = service.get_balance_snapshots(inv_id)
+        assert {s["date"]: s["balance"] for s in snapshots} == pytest.approx(expected, abs=0.011)
+        assert snapshots[4]["balance"] < 0
+
     def test_manual_snapshots_not_overwritten_by_calculation(self, db_session: Session):
         """Verify manual snapshots are preserved when calculating fixed-rate snapshots."""
         inv_id = _create_investment(
@@ -167,8 +215,7 @@ class TestFixedRateCalculation:
         txn_df = pd.DataFrame(
             [{"date": "2025-01-01", "amount": -100000, "description": "Deposit"}]
         )
-        service.transactions_service = MagicMock()
-        service.transactions_service.get_transactions_by_tag.return_value = txn_df
+        service.transactions_service = _mock_transactions_service(db_session, txn_df)
 
         service.calculate_fixed_rate_snapshots(inv_id, end_date="2026-01-01")
 
@@ -283,8 +330,8 @@ class TestPrimeLinkedCalculation:
         service = _make_service(db_session, transactions_df=txn_df)
 
         with patch(
-            "backend.services.rates_service.RatesService.get_prime_steps",
-            return_value=[],
+            "backend.services.rates_service.RatesService.get_series",
+            return_value=RateSeries.from_records([]),
         ):
             service.calculate_fixed_rate_snapshots(inv_id, end_date="2026-01-01")
 
@@ -334,6 +381,41 @@ class TestPrimeLinkedCalculation:
         assert service.get_balance_snapshots(fixed_id) == []
 
 
+    def test_recalculate_prime_linked_is_all_or_nothing(
+        self, db_session: Session, monkeypatch
+    ):
+        """Verify a failure mid re-price leaves every investment untouched."""
+        self._seed_rates(db_session, [{"date": "2024-01-01", "value": 4.0}])
+        ids = []
+        for tag in ("Prime C", "Prime D"):
+            inv_id = _create_investment(db_session, tag=tag, interest_rate_type="prime_linked")
+            db_session.get(Investment, inv_id).rate_spread = 0.0
+            ids.append(inv_id)
+        db_session.commit()
+        txn_df = pd.DataFrame(
+            [{"date": "2025-01-01", "amount": -1000, "description": "Deposit"}]
+        )
+        service = _make_service(db_session, transactions_df=txn_df)
+        service.recalculate_prime_linked_snapshots()
+        before = [service.get_balance_snapshots(i) for i in ids]
+        self._seed_rates(db_session, [{"date": "2025-03-01", "value": 6.0}])
+
+        calls = []
+        original = service._write_rate_snapshots
+
+        def failing_second(investment_id, *args, **kwargs):
+            calls.append(investment_id)
+            if len(calls) == 2:
+                raise RuntimeError("boom")
+            return original(investment_id, *args, **kwargs)
+
+        monkeypatch.setattr(service, "_write_rate_snapshots", failing_second)
+        with pytest.raises(RuntimeError):
+            service.recalculate_prime_linked_snapshots()
+
+        assert [service.get_balance_snapshots(i) for i in ids] == before
+
+
 class TestOrphanSnapshots:
     """Snapshots must not survive their investment.
 
@@ -508,3 +508,48 @@ class TestPrimeBasedLoans:
             # Flat fallback: every entry runs at the stored 5.0%
             analysis = service.get_liability_analysis(record["id"])
             assert all(e["annual_rate"] == 5.0 for e in analysis["schedule"])
+
+
+class TestSharedPaymentFrames:
+    """Tests for the request-wide payment and actual-vs-expected frames."""
+
+    def test_views_do_not_load_full_transaction_table(self, db_session, seed_liabilities):
+        """Liability views read only the Liabilities category, never the merged table."""
+        service = LiabilitiesService(db_session)
+        car_loan = seed_liabilities["liabilities"][0]
+
+        with patch.object(
+            service.transactions_repo, "get_table", side_effect=AssertionError("full table load")
+        ):
+            service.get_all_liabilities()
+            service.get_liability_analysis(car_loan.id)
+            service.get_debt_over_time()
+
+    def test_frames_built_once_per_session(self, db_session, seed_liabilities):
+        """The list, detail and debt views share one payments / comparison frame."""
+        service = LiabilitiesService(db_session)
+        car_loan = seed_liabilities["liabilities"][0]
+
+        with patch.object(
+            service.liabilities_repo,
+            "get_all_liability_transactions",
+            wraps=service.liabilities_repo.get_all_liability_transactions,
+        ) as generated:
+            service.get_all_liabilities()
+            service.get_liability_analysis(car_loan.id)
+            service.get_debt_over_time()
+
+        assert generated.call_count == 1
+
+    def test_debt_points_follow_schedule_per_payment(self, db_session, seed_liabilities):
+        """The k-th payment maps to the k-th schedule row's remaining balance."""
+        service = LiabilitiesService(db_session)
+        car_loan = seed_liabilities["liabilities"][0]
+        schedule = service.get_liability_analysis(car_loan.id)["schedule"]
+
+        car_series = next(
+            s for s in service.get_debt_over_time()["series"] if s["name"] == "Car Loan"
+        )
+        balances = [p["balance"] for p in car_series["points"][1:]]
+
+        assert balances == [e["remaining_balance"] for e in schedule[: len(balances)]]
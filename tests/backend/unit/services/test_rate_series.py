@@ -0,0 +1,97 @@
+"""Tests for the immutable RateSeries step function."""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from backend.services.rate_series import RateSeries
+
+POINTS = [
+    {"date": "2024-01-01", "value": 4.0},
+    {"date": "2022-01-01", "value": 0.1},
+    {"date": "2023-01-01", "value": 4.5},
+]
+
+
+@pytest.fixture()
+def series():
+    """Three BoI-like steps, given out of order."""
+    return RateSeries.from_records(POINTS)
+
+
+class TestLookups:
+    """Tests for point lookups and transformations."""
+
+    def test_sorted_and_read_only(self, series):
+        """Records are sorted by date and the arrays cannot be modified."""
+        assert series.dates.astype(str).tolist() == ["2022-01-01", "2023-01-01", "2024-01-01"]
+        with pytest.raises(ValueError):
+            series.values[0] = 1.0
+
+    def test_value_at(self, series):
+        """The step in effect is found, with step days inclusive."""
+        assert series.value_at("2022-06-01") == 0.1
+        assert series.value_at(date(2023, 1, 1)) == 4.5
+        assert series.value_at("2030-01-01") == 4.0
+        assert series.value_at("2021-12-31") is None
+
+    def test_values_at_is_vectorized(self, series):
+        """Many days are resolved in one call, NaN before the series."""
+        values = series.values_at(["2021-01-01", "2023-06-01", "2022-01-01"])
+        np.testing.assert_array_equal(values, [np.nan, 4.5, 0.1])
+
+    def test_anchored(self, series):
+        """The curve starts at the given day with the rate then in effect."""
+        assert series.anchored("2022-06-15").to_records() == [
+            {"date": "2022-06-15", "value": 0.1},
+            {"date": "2023-01-01", "value": 4.5},
+            {"date": "2024-01-01", "value": 4.0},
+        ]
+        assert series.anchored("2020-01-01").to_records()[0] == {"date": "2020-01-01", "value": 0.1}
+        assert series.anchored("2024-01-01").to_records() == [{"date": "2024-01-01", "value": 4.0}]
+
+    def test_shifted_and_sampled(self, series):
+        """Spreads are added per step; sampling locks the rate at each reset."""
+        sampled = series.shifted(1.5).sampled(["2021-06-01", "2023-03-01"])
+        assert sampled.to_records() == [
+            {"date": "2021-06-01", "value": 1.6},
+            {"date": "2023-03-01", "value": 6.0},
+        ]
+
+    def test_equal_series_share_a_hash(self, series):
+        """Series compare by value, so they work as cache keys."""
+        same = RateSeries.from_records(reversed(POINTS))
+        assert same == series and hash(same) == hash(series)
+        assert series.shifted(0.25) != series
+
+    def test_empty(self):
+        """An empty series is falsy and has no rate anywhere."""
+        empty = RateSeries.from_records([])
+        assert not empty
+        assert empty.value_at("2024-01-01") is None
+        assert len(empty.anchored("2024-01-01")) == 0
+        np.testing.assert_array_equal(empty.growth_factor(["2024-01-01"], ["2025-01-01"]), [1.0])
+
+
+class TestGrowth:
+    """Tests for range compounding."""
+
+    def test_growth_factor_matches_daily_walk(self, series):
+        """Integrated growth equals multiplying the daily factor of every day."""
+        start, end = date(2022, 3, 10), date(2024, 8, 20)
+        expected, day = 1.0, start
+        while day < end:
+            annual = series.value_at(day)
+            expected *= (1 + annual / 100.0) ** (1 / 365)
+            day += timedelta(days=1)
+
+        assert series.growth_factor(start, end) == pytest.approx(expected, rel=1e-12)
+
+    def test_growth_factor_is_vectorized(self, series):
+        """Ranges compose: the factor over [a, c) is [a, b) times [b, c)."""
+        starts = np.array(["2022-02-01", "2023-05-01"], dtype="datetime64[D]")
+        ends = np.array(["2023-05-01", "2025-01-01"], dtype="datetime64[D]")
+        parts = series.growth_factor(starts, ends)
+        whole = series.growth_factor(starts[0], ends[1])
+        assert parts.prod() == pytest.approx(whole, rel=1e-12)
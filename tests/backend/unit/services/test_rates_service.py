@@ -96,6 +96,19 @@ class TestRatesLookups:
 
         assert steps[0] == {"date": "2020-01-01", "value": 1.6}
 
+    def test_series_loaded_once_and_shared(self, seeded, db_session):
+        """Verify later services reuse the loaded series until the table changes."""
+        first = seeded.get_series("prime")
+        with patch.object(InterestRatesRepository, "get_series") as reload:
+            again = RatesService(db_session).get_series("prime")
+        reload.assert_not_called()
+        assert again is first
+
+        InterestRatesRepository(db_session).upsert_points(
+            "boi_rate", [{"date": "2025-01-01", "value": 3.5}], source="fetched"
+        )
+        assert RatesService(db_session).get_prime_at("2025-06-01") == 5.0
+
 
 class TestRatesRefresh:
     """Tests for the BoI public API refresh — must never raise."""
@@ -1,6 +1,7 @@
 """Tests for RecurringService subscription detection."""
 
 import pandas as pd
+import pytest
 
 from backend.constants.tables import Tables
 from backend.models.transaction import CreditCardTransaction
@@ -152,3 +153,247 @@ class TestRecurringDetection:
         db_session.commit()
 
         assert RecurringService(db_session).get_recurring()["items"] == []
+
+    def test_groups_description_variants_and_keeps_mode_label(self, db_session):
+        """Digit/punctuation variants share a merchant key; the label is the most common raw description."""
+        _add_charge(db_session, "Netflix #1234", -45.0, _months_ago(3))
+        for n in range(3):
+            _add_charge(db_session, "NETFLIX 99", -45.0, _months_ago(n))
+        db_session.commit()
+
+        items = RecurringService(db_session).get_recurring()["items"]
+        assert len(items) == 1
+        assert items[0]["normalized"] == "netflix"
+        assert items[0]["label"] == "NETFLIX 99"
+        assert items[0]["occurrences"] == 4
+
+    def test_result_is_cached_until_commit(self, db_session, monkeypatch):
+        """Repeated calls in one session reuse the result; a commit invalidates it."""
+        for n in range(4):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+        db_session.commit()
+
+        service = RecurringService(db_session)
+        service.rebuild_series()
+        first = service.get_recurring()
+        calls = []
+        original = service.series_repo.get_all
+        monkeypatch.setattr(service.series_repo, "get_all", lambda: calls.append(1) or original())
+
+        first["items"].clear()  # caller mutation must not leak into the cache
+        assert len(service.get_recurring()["items"]) == 1
+        assert calls == []
+
+        db_session.commit()
+        service.get_recurring()
+        assert calls == [1]
+
+
+class TestPersistedSeries:
+    """Tests for the persisted ``recurring_series`` model."""
+
+    def test_read_with_empty_model_detects_without_persisting(self, db_session):
+        """Before the first build, reads detect on the fly and write nothing."""
+        for n in range(4):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+        db_session.commit()
+
+        service = RecurringService(db_session)
+        assert len(service.get_recurring()["items"]) == 1
+        assert service.series_repo.count() == 0
+
+    def test_first_update_builds_full_model(self, db_session):
+        """The first scrape update on an empty model persists every series."""
+        for n in range(4):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+            _add_charge(db_session, "GYM CLUB", -100.0, _months_ago(n))
+        db_session.commit()
+
+        service = RecurringService(db_session)
+        service.update_series(pd.DataFrame({"description": ["GYM CLUB"]}))
+
+        stored = service.series_repo.get_all()
+        assert list(stored["normalized"]) == ["gym club", "spotify ab"]
+
+    def test_rebuild_persists_detected_series(self, db_session):
+        """rebuild_series stores one row per detected series."""
+        for n in range(4):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+        db_session.commit()
+
+        service = RecurringService(db_session)
+        assert service.rebuild_series() == 1
+
+        stored = service.series_repo.get_all()
+        assert list(stored["normalized"]) == ["spotify ab"]
+        assert stored.iloc[0]["cadence"] == "monthly"
+        assert stored.iloc[0]["interval_median"] > 0
+
+    def test_update_series_refreshes_only_touched_merchants(self, db_session):
+        """New rows re-evaluate their own merchant; untouched series are left as stored."""
+        for n in range(1, 5):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+            _add_charge(db_session, "GYM CLUB", -100.0, _months_ago(n))
+        db_session.commit()
+        service = RecurringService(db_session)
+        service.rebuild_series()
+
+        # A price hike for the gym arrives; the gym's series must pick it up.
+        _add_charge(db_session, "GYM CLUB", -150.0, _months_ago(0))
+        # Spotify gets a row too but is not part of the delta passed in.
+        _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(0))
+        db_session.commit()
+
+        delta = pd.DataFrame({"description": ["GYM CLUB"]})
+        assert service.update_series(delta) == 1
+
+        items = {i["normalized"]: i for i in service.get_recurring()["items"]}
+        assert items["gym club"]["last_amount"] == 150.0
+        assert items["gym club"]["status"] == "price_changed"
+        assert items["spotify ab"]["occurrences"] == 4
+
+    def test_update_series_drops_merchant_that_stops_qualifying(self, db_session):
+        """A merchant whose refreshed history no longer passes detection is removed."""
+        for n in range(1, 4):
+            _add_charge(db_session, "GYM CLUB", -100.0, _months_ago(n))
+        db_session.commit()
+        service = RecurringService(db_session)
+        assert service.rebuild_series() == 1
+
+        # Full refund of the middle month leaves two charge days.
+        _add_charge(db_session, "GYM CLUB", 100.0, _months_ago(2))
+        db_session.commit()
+        service.update_series(pd.DataFrame({"description": ["GYM CLUB"]}))
+
+        assert service.series_repo.count() == 0
+        assert service.get_recurring()["items"] == []
+
+    def test_rebuild_series_applies_category_changes(self, db_session):
+        """Re-categorizing history takes effect after a full rebuild."""
+        for n in range(4):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+        db_session.commit()
+        service = RecurringService(db_session)
+        assert service.rebuild_series() == 1
+
+        for txn in db_session.query(CreditCardTransaction).all():
+            txn.category = "Ignore"
+        db_session.commit()
+
+        assert service.rebuild_series() == 0
+        assert service.get_recurring()["items"] == []
+
+    def test_read_detects_on_the_fly_after_retagging(self, db_session):
+        """A re-tag committed after the build is picked up by the next read, which writes nothing."""
+        for n in range(4):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+        db_session.commit()
+        service = RecurringService(db_session)
+        assert service.rebuild_series() == 1
+
+        for txn in db_session.query(CreditCardTransaction).all():
+            txn.category = "Ignore"
+        db_session.commit()
+
+        assert service.get_recurring()["items"] == []
+        assert service.series_repo.count() == 1
+
+    def test_read_rebuilds_model_after_delete(self, db_session):
+        """Deleting a charge drops a merchant that no longer has three occurrences."""
+        for n in range(1, 4):
+            _add_charge(db_session, "GYM CLUB", -100.0, _months_ago(n))
+        db_session.commit()
+        service = RecurringService(db_session)
+        assert service.rebuild_series() == 1
+
+        db_session.delete(db_session.query(CreditCardTransaction).first())
+        db_session.commit()
+
+        assert service.get_recurring()["items"] == []
+
+    def test_empty_build_is_served_from_the_model(self, db_session, monkeypatch):
+        """A build that found nothing is stored as such and not re-run per read."""
+        _add_charge(db_session, "RANDOM SHOP", -120.0, _months_ago(1))
+        db_session.commit()
+        service = RecurringService(db_session)
+        assert service.rebuild_series() == 0
+
+        monkeypatch.setattr(service, "_build_all_rows", lambda: pytest.fail("detection re-ran"))
+        assert service.model_is_current()
+        assert service.get_recurring()["items"] == []
+
+    def test_watermark_catches_writes_the_process_did_not_see(self, db_session, monkeypatch):
+        """After a restart (write generations reset) a stale model is still detected."""
+        for n in range(4):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+        db_session.commit()
+        service = RecurringService(db_session)
+        service.rebuild_series()
+
+        db_session.delete(db_session.query(CreditCardTransaction).first())
+        db_session.commit()
+        monkeypatch.setattr(
+            "backend.services.recurring_service.data_generation", lambda **kwargs: 0
+        )
+
+        assert not service.model_is_current()
+
+    def test_update_series_reads_only_affected_merchants(self, db_session, monkeypatch):
+        """The incremental path queries the affected merchants' rows, not the whole history."""
+        for n in range(1, 5):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+            _add_charge(db_session, f"GYM CLUB {n}", -100.0, _months_ago(n))
+        db_session.commit()
+        service = RecurringService(db_session)
+        service.rebuild_series()
+
+        _add_charge(db_session, "GYM CLUB 0", -100.0, _months_ago(0))
+        db_session.commit()
+        monkeypatch.setattr(
+            service.repo, "get_itemized_transactions",
+            lambda **kwargs: pytest.fail("loaded the whole history"),
+        )
+        requested = []
+        original = service.repo.get_itemized_transactions_by_description
+        monkeypatch.setattr(
+            service.repo, "get_itemized_transactions_by_description",
+            lambda descriptions: requested.extend(descriptions) or original(descriptions),
+        )
+
+        service.update_series(pd.DataFrame({"description": ["GYM CLUB 0"]}))
+
+        assert sorted(requested) == [f"GYM CLUB {n}" for n in range(5)]
+        assert service.model_is_current()
+        items = {i["normalized"]: i for i in service.get_recurring()["items"]}
+        assert items["gym club"]["occurrences"] == 5
+
+    def test_update_series_rebuilds_a_model_that_was_already_stale(self, db_session):
+        """Edits made before the scrape are not hidden behind the scrape's refresh."""
+        for n in range(4):
+            _add_charge(db_session, "SPOTIFY AB", -20.0, _months_ago(n))
+            _add_charge(db_session, "GYM CLUB", -100.0, _months_ago(n))
+        db_session.commit()
+        service = RecurringService(db_session)
+        service.rebuild_series()
+
+        for txn in db_session.query(CreditCardTransaction).filter_by(description="SPOTIFY AB"):
+            txn.category = "Ignore"
+        db_session.commit()
+        was_current = service.model_is_current()
+        _add_charge(db_session, "GYM CLUB", -100.0, _months_ago(0, day=20))
+        db_session.commit()
+
+        service.update_series(pd.DataFrame({"description": ["GYM CLUB"]}), was_current)
+
+        assert not was_current
+        assert list(service.series_repo.get_all()["normalized"]) == ["gym club"]
+
+
+class TestNormalize:
+    """Tests for merchant-key normalization."""
+
+    def test_normalize_column_matches_scalar(self, db_session):
+        """The factorized column path agrees with ``_normalize`` row by row."""
+        service = RecurringService(db_session)
+        raw = pd.Series(["NETFLIX 1234", None, "גן ילדים 3", "NETFLIX 1234", "12 34", float("nan")])
+        assert list(service._normalize_column(raw)) == [service._normalize(v) for v in raw]
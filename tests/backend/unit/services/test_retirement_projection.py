@@ -0,0 +1,209 @@
+"""Tests for the array-based retirement projection kernel."""
+
+import numpy as np
+import pytest
+
+from backend.services.retirement_projection import (
+    MonteCarloConfig,
+    bracket_search,
+    future_value,
+    project_wealth,
+    sample_real_returns,
+    simulate_wealth,
+)
+
+KERNEL_PARAMS = {
+    "current_age": 40, "life_expectancy": 90, "full_pension_age": 67,
+    "wealth": 1_500_000.0, "annual_contribution": 120_000.0,
+    "retirement_age": 55, "annual_expenses": 180_000.0,
+    "passive_income": 0.0, "pension_income": 60_000.0,
+}
+
+
+def _reference_projection(
+    nw, kh, savings, kh_contribution, rate, current_age, life_exp, retire_age,
+    expenses, passive, pension, pension_age,
+):
+    """Year-by-year two-bucket loop with KH-first drawdown."""
+    totals = []
+    for age in range(current_age, life_exp + 1):
+        totals.append(nw + kh)
+        if age < retire_age:
+            nw = nw * (1 + rate) + savings
+            kh = kh * (1 + rate) + kh_contribution
+        else:
+            income = passive + (pension if age >= pension_age else 0.0)
+            withdrawal = max(0.0, expenses - income)
+            nw, kh = nw * (1 + rate), kh * (1 + rate)
+            kh_draw = min(kh, withdrawal) if kh > 0 else 0.0
+            kh -= kh_draw
+            nw -= withdrawal - kh_draw
+    return totals
+
+
+class TestProjectWealth:
+    """Tests for project_wealth."""
+
+    def test_matches_two_bucket_loop_for_every_path(self):
+        """Each row reproduces the sequential KH-first simulation."""
+        rates = np.array([0.05, 0.01, -0.02])
+        retire_ages = np.array([45, 55, 60])
+        expenses = np.array([240000.0, 120000.0, 300000.0])
+
+        totals = project_wealth(
+            current_age=35, life_expectancy=95, full_pension_age=67,
+            wealth=900000.0 + 150000.0, annual_contribution=100000.0 + 24000.0,
+            real_rate=rates, retirement_age=retire_ages, annual_expenses=expenses,
+            passive_income=12000.0, pension_income=80000.0,
+        )
+
+        assert totals.shape == (3, 61)
+        for row, (rate, retire, spend) in enumerate(zip(rates, retire_ages, expenses)):
+            expected = _reference_projection(
+                900000.0, 150000.0, 100000.0, 24000.0, rate, 35, 95, retire,
+                spend, 12000.0, 80000.0, 67,
+            )
+            np.testing.assert_allclose(totals[row], expected, rtol=1e-9, atol=1e-4)
+
+    def test_scalars_give_single_path(self):
+        """All-scalar parameters project one path."""
+        totals = project_wealth(
+            current_age=60, life_expectancy=62, full_pension_age=67,
+            wealth=1000.0, annual_contribution=0.0, real_rate=0.0,
+            retirement_age=60, annual_expenses=100.0, passive_income=0.0,
+            pension_income=0.0,
+        )
+        np.testing.assert_allclose(totals, [[1000.0, 900.0, 800.0]])
+
+    def test_life_expectancy_before_current_age_is_empty(self):
+        """No ages to project yields an empty row per path."""
+        totals = project_wealth(
+            current_age=70, life_expectancy=65, full_pension_age=67,
+            wealth=1.0, annual_contribution=0.0, real_rate=[0.01, 0.02],
+            retirement_age=70, annual_expenses=0.0, passive_income=0.0,
+            pension_income=0.0,
+        )
+        assert totals.shape == (2, 0)
+
+    def test_per_year_rates_match_loop(self):
+        """A (paths, years) rate matrix compounds each year at its own rate."""
+        rng = np.random.default_rng(3)
+        rates = rng.normal(0.03, 0.1, size=(4, 31))
+
+        totals = project_wealth(
+            current_age=50, life_expectancy=80, full_pension_age=67,
+            wealth=800000.0, annual_contribution=50000.0, real_rate=rates,
+            retirement_age=60, annual_expenses=150000.0, passive_income=0.0,
+            pension_income=70000.0,
+        )
+
+        for row in range(4):
+            wealth, expected = 800000.0, []
+            for t, age in enumerate(range(50, 81)):
+                expected.append(wealth)
+                if age < 60:
+                    wealth = wealth * (1 + rates[row, t]) + 50000.0
+                else:
+                    income = 70000.0 if age >= 67 else 0.0
+                    wealth = wealth * (1 + rates[row, t]) - max(0.0, 150000.0 - income)
+            np.testing.assert_allclose(totals[row], expected, rtol=1e-9, atol=1e-4)
+
+
+class TestMonteCarlo:
+    """Tests for sample_real_returns and simulate_wealth."""
+
+    @pytest.mark.parametrize("distribution", ["normal", "lognormal", "student_t"])
+    def test_distributions_hit_requested_moments(self, distribution):
+        """Every distribution is scaled to the configured mean and volatility."""
+        config = MonteCarloConfig(
+            distribution=distribution, return_volatility=0.15, inflation_volatility=0.0
+        )
+        real = sample_real_returns(
+            config, 0.06, 0.0, (200_000, 1), np.random.default_rng(0)
+        )
+        assert abs(real.mean() - 0.06) < 0.002
+        assert abs(real.std() - 0.15) < 0.005
+
+    def test_unknown_distribution_rejected(self):
+        """A typo in the distribution name fails loudly."""
+        with pytest.raises(ValueError):
+            sample_real_returns(
+                MonteCarloConfig(distribution="cauchy"), 0.05, 0.02, (2, 2),
+                np.random.default_rng(0),
+            )
+
+    def test_seeded(self):
+        """Equal seeds give equal paths; another seed gives other paths."""
+        config = MonteCarloConfig(paths=5_000, seed=7)
+        first = simulate_wealth(KERNEL_PARAMS, 0.05, 0.02, config)
+        again = simulate_wealth(KERNEL_PARAMS, 0.05, 0.02, config)
+        other = simulate_wealth(KERNEL_PARAMS, 0.05, 0.02, MonteCarloConfig(paths=5_000, seed=8))
+
+        assert first.shape == (5_000, 51)
+        np.testing.assert_array_equal(first, again)
+        assert not np.array_equal(first, other)
+
+    def test_chunks_cover_every_path(self, monkeypatch):
+        """A partial last chunk is simulated and stacked after the full ones."""
+        monkeypatch.setattr(
+            "backend.services.retirement_projection.CHUNK_PATHS", 1_000
+        )
+        paths = simulate_wealth(
+            KERNEL_PARAMS, 0.05, 0.02, MonteCarloConfig(paths=2_500)
+        )
+        assert paths.shape == (2_500, 51)
+        assert not np.array_equal(paths[:1_000], paths[1_000:2_000])
+
+    def test_zero_volatility_reproduces_deterministic_path(self):
+        """Without randomness every path is the deterministic projection."""
+        config = MonteCarloConfig(
+            paths=10, return_volatility=0.0, inflation_volatility=0.0
+        )
+        paths = simulate_wealth(KERNEL_PARAMS, 0.05, 0.02, config)
+        expected = project_wealth(real_rate=1.05 / 1.02 - 1, **KERNEL_PARAMS)
+        np.testing.assert_allclose(paths, np.repeat(expected, 10, axis=0), rtol=1e-9)
+
+
+class TestFutureValue:
+    """Tests for future_value."""
+
+    def test_matches_compounding_loop(self):
+        """Closed form equals yearly growth plus end-of-year deposits."""
+        balance = 50000.0
+        for _ in range(12):
+            balance = balance * 1.035 + 6000.0
+        assert abs(future_value(50000.0, 6000.0, 0.035, 12) - balance) < 1e-6
+
+    def test_zero_rate(self):
+        """Without growth the deposits simply add up."""
+        assert future_value(100.0, 10.0, 0.0, 5) == 150.0
+
+
+class TestBracketSearch:
+    """Tests for bracket_search."""
+
+    def test_minimum_passing_value(self):
+        """Finds the smallest value above the threshold within tolerance."""
+        lo, hi = bracket_search(lambda x: x >= 0.0123, -0.1, 0.3, 1e-5)
+        assert hi - lo < 1e-5
+        assert lo < 0.0123 <= hi
+
+    def test_maximum_passing_value(self):
+        """With passes_above=False the passing side is the lower bound."""
+        lo, hi = bracket_search(
+            lambda x: x <= 4321.0, 0.0, 10000.0, 100, passes_above=False
+        )
+        assert hi - lo < 100
+        assert lo <= 4321.0 < hi
+
+    def test_few_vectorized_rounds(self):
+        """Each round evaluates the whole grid in a single predicate call."""
+        calls = []
+
+        def passes(x):
+            calls.append(len(x))
+            return x >= 0.2
+
+        bracket_search(passes, -0.1, 0.3, 1e-5)
+        assert len(calls) == 3
+        assert all(n == 63 for n in calls)
@@ -10,6 +10,12 @@ from backend.errors import EntityNotFoundException
 from backend.services.scraping_service import ScrapingService
 
 
+def _discard_coroutine(coro, loop):
+    """Stand-in for ``run_coroutine_threadsafe`` that drops the launched run."""
+    coro.close()
+    return MagicMock()
+
+
 @pytest.fixture(autouse=True)
 def reset_tfa_waiting():
     """Clear _tfa_scrapers_waiting between tests."""
@@ -116,6 +122,10 @@ class TestScrapingServiceStatus:
             "2026-02-18",
             None,
         ]
+        telemetry = {"scrape_id": 7, "date": "2026-02-18", "status": "success", "phases": []}
+        service.scraping_history_repo.get_latest_telemetry_by_account.return_value = {
+            ("banks", "hapoalim", "Checking"): telemetry,
+        }
 
         result = service.get_last_scrape_dates()
 
@@ -125,8 +135,46 @@ class TestScrapingServiceStatus:
             "provider": "isracard",
             "account_name": "Main",
             "last_scrape_date": "2026-02-18",
+            "last_scrape_telemetry": None,
         }
         assert result[1]["last_scrape_date"] is None
+        assert result[1]["last_scrape_telemetry"] == telemetry
+        service.scraping_history_repo.get_latest_telemetry_by_account.assert_called_once_with()
+
+    def test_get_telemetry_summary(self, service):
+        """Verify p50/p95 are computed per provider and phase."""
+        service.scraping_history_repo.get_telemetry_since.return_value = [
+            ("max", [{"name": "login", "duration_ms": float(ms)}])
+            for ms in range(100, 1100, 100)
+        ] + [
+            (
+                "isracard",
+                [
+                    {"name": "login", "duration_ms": 50.0},
+                    {"name": "fetch_month", "duration_ms": 10.0},
+                    {"name": "fetch_month", "duration_ms": 30.0},
+                ],
+            ),
+            ("isracard", None),
+        ]
+
+        summary = service.get_telemetry_summary(days=7)
+
+        assert [entry["provider"] for entry in summary] == ["isracard", "max"]
+        isracard, max_ = summary
+        assert isracard["scrapes"] == 1
+        assert isracard["phases"][1] == {
+            "name": "fetch_month", "count": 2, "p50_ms": 20.0, "p95_ms": 29.0,
+        }
+        assert max_["scrapes"] == 10
+        assert max_["phases"] == [
+            {"name": "login", "count": 10, "p50_ms": 550.0, "p95_ms": 955.0}
+        ]
+
+    def test_get_telemetry_summary_empty(self, service):
+        """Verify no instrumented runs yield an empty summary."""
+        service.scraping_history_repo.get_telemetry_since.return_value = []
+        assert service.get_telemetry_summary() == []
 
 
 class TestScrapingServiceStart:
@@ -140,6 +188,7 @@ class TestScrapingServiceStart:
         self, mock_is_2fa, mock_get_db_ctx, mock_create_adapter, mock_asyncio, service
     ):
         """Verify start_scraping_single returns a process_id and launches an async task."""
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
         mock_is_2fa.return_value = False
         service.credentials_repo.get_credentials.return_value = {"user": "test"}
         service.scraping_history_repo.get_last_successful_scrape_date.return_value = None
@@ -172,6 +221,7 @@ class TestScrapingServiceStart:
         self, mock_is_2fa, mock_get_db_ctx, mock_create_adapter, mock_asyncio, service
     ):
         """Verify that a history record is created via get_db_context."""
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
         mock_is_2fa.return_value = False
         service.credentials_repo.get_credentials.return_value = {"user": "test"}
         service.scraping_history_repo.get_last_successful_scrape_date.return_value = None
@@ -206,6 +256,7 @@ class TestScrapingServiceStart:
         self, mock_is_2fa, mock_get_db_ctx, mock_create_adapter, mock_asyncio, service
     ):
         """Verify adapter is added to _tfa_scrapers_waiting when 2FA is required."""
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
         mock_is_2fa.return_value = True
         service.credentials_repo.get_credentials.return_value = {"user": "test"}
         service.scraping_history_repo.get_last_successful_scrape_date.return_value = None
@@ -247,6 +298,7 @@ class TestScrapingServiceStart:
         show a 2FA prompt for providers like Hapoalim that don't always need
         one.
         """
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
         mock_is_2fa.return_value = True
         service.credentials_repo.get_credentials.return_value = {"user": "test"}
         service.scraping_history_repo.get_last_successful_scrape_date.return_value = None
@@ -281,6 +333,7 @@ class TestScrapingServiceStart:
         self, mock_is_2fa, mock_get_db_ctx, mock_create_adapter, mock_asyncio, service
     ):
         """force_2fa=True drops otpLongTermToken from creds and passes the flag."""
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
         mock_is_2fa.return_value = True
         service.credentials_repo.get_credentials.return_value = {
             "email": "e", "password": "p", "phoneNumber": "+1", "otpLongTermToken": "OLD",
@@ -312,6 +365,7 @@ class TestScrapingServiceStart:
         self, mock_is_2fa, mock_get_db_ctx, mock_create_adapter, mock_asyncio, service
     ):
         """Without force_2fa the stored token is preserved and the flag is False."""
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
         mock_is_2fa.return_value = True
         service.credentials_repo.get_credentials.return_value = {
             "email": "e", "password": "p", "otpLongTermToken": "OLD",
@@ -427,6 +481,7 @@ class TestScrapingServiceSingleFlight:
     ):
         """A duplicate call for the same account returns the existing
         process_id and does not create a second adapter or task."""
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
         mock_is_2fa.return_value = True
         service.credentials_repo.get_credentials.return_value = {"user": "test"}
         service.scraping_history_repo.get_last_successful_scrape_date.return_value = None
@@ -468,6 +523,7 @@ class TestScrapingServiceSingleFlight:
         self, mock_is_2fa, mock_get_db_ctx, mock_create_adapter, mock_asyncio, service
     ):
         """The active-scraper registry guards ALL providers, not just 2FA ones."""
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
         mock_is_2fa.return_value = False
         service.credentials_repo.get_credentials.return_value = {"user": "test"}
         service.scraping_history_repo.get_last_successful_scrape_date.return_value = None
@@ -503,6 +559,7 @@ class TestScrapingServiceSingleFlight:
         self, mock_is_2fa, mock_get_db_ctx, mock_create_adapter, mock_asyncio, service
     ):
         """Two different accounts are unaffected by each other's registration."""
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
         mock_is_2fa.return_value = False
         service.credentials_repo.get_credentials.return_value = {"user": "test"}
         service.scraping_history_repo.get_last_successful_scrape_date.return_value = None
@@ -666,6 +723,8 @@ class TestScrapingServiceCustomPeriod:
         """Verify scraping_period_days overrides automatic start date calculation."""
         from datetime import date, timedelta
 
+        mock_asyncio.run_coroutine_threadsafe.side_effect = _discard_coroutine
+
         mock_is_2fa.return_value = False
         service.credentials_repo.get_credentials.return_value = {"user": "test"}
 
@@ -734,54 +793,228 @@ class TestScrapingServiceStartDate:
         assert result == expected
 
 
-class TestScrapingServiceCollectAdapters:
-    """Tests for _collect_adapters method."""
+@pytest.fixture(autouse=True)
+def reset_scrape_batches():
+    """Clear _scrape_batches between tests."""
+    ss._scrape_batches.clear()
+    yield
+    ss._scrape_batches.clear()
+
+
+class _FakeAdapter:
+    """Adapter stand-in recording how many runs overlap."""
+
+    def __init__(self, name, process_id, tracker):
+        self.name = name
+        self.process_id = process_id
+        self.tracker = tracker
+
+    async def run(self):
+        self.tracker["running"].append(self.name)
+        self.tracker["peak"] = max(self.tracker["peak"], len(self.tracker["running"]))
+        self.tracker["order"].append(self.name)
+        await asyncio.sleep(0.01)
+        self.tracker["running"].remove(self.name)
+        ss._active_scrapers.pop(self.name, None)
+
+
+def _batch_entry(name, tracker, requires_2fa=False, process_id=1):
+    """Queue a fake adapter as a batch entry, registered as active."""
+    adapter = _FakeAdapter(name, process_id, tracker)
+    ss._active_scrapers[name] = adapter
+    service, provider, account = name.split(" - ")
+    return ss._BatchEntry(
+        name, service, provider, account, adapter, requires_2fa, process_id
+    )
+
+
+class TestScrapingServiceStartAll:
+    """Tests for the "scrape all accounts" batch."""
+
+    def test_run_batch_caps_concurrency_and_serializes_2fa(self, monkeypatch):
+        """Runs never exceed the browser limit and 2FA accounts never overlap."""
+        monkeypatch.setattr(ss, "MAX_CONCURRENT_BROWSERS", 2)
+        tracker = {"running": [], "peak": 0, "order": []}
+        tfa_seen = []
+
+        entries = [
+            _batch_entry(f"banks - p{i} - a", tracker, process_id=i) for i in range(4)
+        ] + [
+            _batch_entry(f"banks - otp{i} - a", tracker, requires_2fa=True)
+            for i in range(2)
+        ]
+        original_run = _FakeAdapter.run
+
+        async def run_checking_2fa(self):
+            if "otp" in self.name:
+                tfa_seen.append(
+                    [n for n in tracker["running"] if "otp" in n]
+                )
+                assert ss._tfa_scrapers_waiting.get(self.name) is self
+            await original_run(self)
+
+        monkeypatch.setattr(_FakeAdapter, "run", run_checking_2fa)
 
-    @patch("backend.services.scraping_service.create_adapter")
+        asyncio.run(ss._run_batch(entries))
+
+        assert tracker["peak"] == 2
+        assert len(tracker["order"]) == 6
+        assert tfa_seen == [[], []]
+        # The 2FA chain is scheduled first so its prompt comes up early.
+        assert tracker["order"][0] == "banks - otp0 - a"
+        assert all(entry.state == "started" for entry in entries)
+
+    def test_run_batch_skips_entries_aborted_while_queued(self):
+        """An entry whose adapter left _active_scrapers is not run."""
+        tracker = {"running": [], "peak": 0, "order": []}
+        kept = _batch_entry("banks - p1 - a", tracker)
+        aborted = _batch_entry("banks - p2 - a", tracker)
+        ss._active_scrapers.pop(aborted.name)
+
+        asyncio.run(ss._run_batch([kept, aborted]))
+
+        assert tracker["order"] == ["banks - p1 - a"]
+        assert aborted.state == "skipped"
+
+    @patch("backend.services.scraping_service._submit")
     @patch("backend.services.scraping_service.is_2fa_required")
-    def test_collect_adapters_separates_normal_and_2fa(
-        self, mock_is_2fa, mock_create_adapter, service
+    def test_start_scraping_all_queues_accounts_and_adopts_running(
+        self, mock_is_2fa, mock_submit, service
     ):
-        """Verify adapters are separated into normal and 2FA dicts."""
+        """Every account is registered; an already-running one is not relaunched."""
         mock_is_2fa.side_effect = lambda svc, prov: prov == "onezero"
-        service.scraping_history_repo.get_last_successful_scrape_date.return_value = None
+        service.credentials_repo.list_accounts.return_value = [
+            {"service": "banks", "provider": "hapoalim", "account_name": "Main"},
+            {"service": "banks", "provider": "onezero", "account_name": "Acc"},
+            {"service": "credit_cards", "provider": "max", "account_name": "Card"},
+        ]
+        running = MagicMock(process_id=3)
+        ss._active_scrapers["credit_cards - max - Card"] = running
+        prepared = iter([(MagicMock(), 1), (MagicMock(), 2)])
+        future = MagicMock()
+        future.done.return_value = False
+        mock_submit.side_effect = lambda coro: (coro.close(), future)[1]
+
+        with patch.object(
+            service, "_prepare_adapter", side_effect=lambda *a, **k: next(prepared)
+        ) as mock_prepare:
+            batch_id = service.start_scraping_all(scraping_period_days=30)
+            again = service.start_scraping_all()
+
+        assert again == batch_id
+        assert mock_prepare.call_count == 2
+        mock_submit.assert_called_once()
+        entries = ss._scrape_batches[batch_id].entries
+        assert [(e.provider, e.process_id, e.state) for e in entries] == [
+            ("hapoalim", 1, "queued"),
+            ("onezero", 2, "queued"),
+            ("max", 3, "started"),
+        ]
+        assert entries[1].requires_2fa
+        assert ss._active_scrapers["banks - hapoalim - Main"] is entries[0].adapter
+        # 2FA accounts are only parked for a code once their turn comes.
+        assert ss._tfa_scrapers_waiting == {}
 
-        mock_adapter = MagicMock()
-        mock_create_adapter.return_value = mock_adapter
+    def test_single_launches_share_the_batch_browser_limit(self, monkeypatch):
+        """Single-account runs and batch runs draw from one process-wide limit."""
+        monkeypatch.setattr(ss, "MAX_CONCURRENT_BROWSERS", 2)
+        tracker = {"running": [], "peak": 0, "order": []}
+        entries = [_batch_entry(f"banks - p{i} - a", tracker) for i in range(2)]
+        singles = [_batch_entry(f"banks - s{i} - a", tracker) for i in range(2)]
 
-        credentials = {
-            "banks": {
-                "hapoalim": {"Main": {"userCode": "test"}},
-                "onezero": {"Account1": {"email": "test@test.com"}},
-            }
-        }
+        async def scenario():
+            await asyncio.gather(
+                ss._run_batch(entries),
+                *(ss._run_in_browser_slot(e.name, e.adapter) for e in singles),
+            )
 
-        normal, tfa = service._collect_adapters(credentials)
+        asyncio.run(scenario())
 
-        assert "banks - hapoalim - Main" in normal
-        assert "banks - onezero - Account1" in tfa
-        assert len(normal) == 1
-        assert len(tfa) == 1
+        assert tracker["peak"] == 2
+        assert len(tracker["order"]) == 4
 
-    @patch("backend.services.scraping_service.create_adapter")
-    @patch("backend.services.scraping_service.is_2fa_required")
-    def test_collect_adapters_multiple_services(
-        self, mock_is_2fa, mock_create_adapter, service
+    def test_single_launch_aborted_while_waiting_is_not_run(self):
+        """A single-account run whose entry was aborted before its slot freed is skipped."""
+        tracker = {"running": [], "peak": 0, "order": []}
+        entry = _batch_entry("banks - p1 - a", tracker)
+        ss._active_scrapers.pop(entry.name)
+
+        asyncio.run(ss._run_in_browser_slot(entry.name, entry.adapter))
+
+        assert tracker["order"] == []
+
+    @patch("backend.services.scraping_service.publish_status")
+    @patch("backend.services.scraping_service.get_db_context")
+    @patch("backend.services.scraping_service._submit")
+    @patch("backend.services.scraping_service.is_2fa_required", return_value=False)
+    def test_start_scraping_all_releases_accounts_when_submit_fails(
+        self, mock_is_2fa, mock_submit, mock_get_db_ctx, mock_publish, service
     ):
-        """Verify adapters are created for accounts across multiple services."""
-        mock_is_2fa.return_value = False
-        service.scraping_history_repo.get_last_successful_scrape_date.return_value = None
+        """A failed submission unregisters the queued accounts and fails their rows."""
+        service.credentials_repo.list_accounts.return_value = [
+            {"service": "banks", "provider": "hapoalim", "account_name": "Main"},
+            {"service": "credit_cards", "provider": "max", "account_name": "Card"},
+        ]
+        running = MagicMock(process_id=3)
+        ss._active_scrapers["credit_cards - max - Card"] = running
 
-        mock_adapter = MagicMock()
-        mock_create_adapter.return_value = mock_adapter
+        def fail_submit(coro):
+            coro.close()
+            raise RuntimeError("no loop")
 
-        credentials = {
-            "banks": {"hapoalim": {"Checking": {"userCode": "abc"}}},
-            "credit_cards": {"isracard": {"Card1": {"id": "123"}}},
-        }
+        mock_submit.side_effect = fail_submit
+
+        @contextmanager
+        def fake_db_context():
+            yield MagicMock()
 
-        normal, tfa = service._collect_adapters(credentials)
+        mock_get_db_ctx.side_effect = fake_db_context
+        history_repo = MagicMock(FAILED="failed")
+        with patch.object(
+            service, "_prepare_adapter", return_value=(MagicMock(process_id=1), 1)
+        ), patch(
+            "backend.services.scraping_service.ScrapingHistoryRepository",
+            return_value=history_repo,
+        ), pytest.raises(RuntimeError):
+            service.start_scraping_all()
+
+        # The adopted scrape keeps running; only the queued account is released.
+        assert ss._active_scrapers == {"credit_cards - max - Card": running}
+        history_repo.record_scrape_end.assert_called_once_with(1, "failed")
+        assert ss._scrape_batches == {}
+
+    def test_get_scraping_all_status_aggregates(self, service):
+        """Queued, running, waiting and finished accounts roll up into one view."""
+        tracker = {"running": [], "peak": 0, "order": []}
+        queued = _batch_entry("banks - p1 - a", tracker, process_id=1)
+        waiting = _batch_entry("banks - onezero - a", tracker, True, process_id=2)
+        waiting.state = "started"
+        failed = _batch_entry("banks - p3 - a", tracker, process_id=3)
+        failed.state = "started"
+        aborted = _batch_entry("banks - p4 - a", tracker, process_id=4)
+        ss._active_scrapers.pop(aborted.name)
+        ss._scrape_batches[9] = ss._ScrapeBatch(9, [queued, waiting, failed, aborted])
+
+        repo = service.scraping_history_repo
+        repo.FAILED = "failed"
+        repo.IN_PROGRESS = "in_progress"
+        repo.WAITING_FOR_2FA = "waiting_for_2fa"
+        repo.get_scraping_status.side_effect = lambda pid: {
+            2: "waiting_for_2fa", 3: "failed", 4: "failed"
+        }[pid]
+        repo.get_error.return_value = ("boom", "TIMEOUT")
+
+        result = service.get_scraping_all_status(9)
+
+        assert [a["status"] for a in result["accounts"]] == [
+            "queued", "waiting_for_2fa", "failed", "failed"
+        ]
+        assert result["counts"] == {"queued": 1, "waiting_for_2fa": 1, "failed": 2}
+        assert result["awaiting_2fa"]["provider"] == "onezero"
+        assert result["accounts"][2]["error_type"] == "TIMEOUT"
+        assert result["done"] is False
 
-        assert len(normal) == 2
-        assert len(tfa) == 0
-        assert mock_create_adapter.call_count == 2
+    def test_get_scraping_all_status_unknown_batch(self, service):
+        """An unknown batch id raises EntityNotFoundException."""
+        with pytest.raises(EntityNotFoundException):
+            service.get_scraping_all_status(404)
@@ -5,9 +5,11 @@ Tests the core FIRE number, net worth projection, retirement income
 phase analysis, and required savings calculations.
 """
 
+import numpy as np
 import pytest
 from unittest.mock import MagicMock, patch
 
+from backend.services.retirement_projection import MonteCarloConfig
 from backend.services.retirement_service import (
     RetirementService,
     FULL_PENSION_AGE_MALE,
@@ -398,6 +400,54 @@ class TestAutoAdjustSolver:
         service = RetirementService.__new__(RetirementService)
         assert service._solve_monthly_expenses(goal, status) == -1
 
+    @patch.object(RetirementService, "__init__", lambda self, db: None)
+    def test_solved_values_sit_on_the_on_track_boundary(
+        self, sample_goal, sample_status
+    ):
+        """Solutions pass the on-track predicate; a step beyond them fails."""
+        service = RetirementService.__new__(RetirementService)
+
+        rate = service._solve_return_rate(sample_goal, sample_status)
+        assert service._on_track(
+            sample_goal, sample_status, return_rate=np.array([rate, rate - 0.0001])
+        ).tolist() == [True, False]
+
+        expenses = service._solve_monthly_expenses(sample_goal, sample_status)
+        assert service._on_track(
+            sample_goal, sample_status, monthly_expenses=np.array([expenses, expenses + 100])
+        ).tolist() == [True, False]
+
+        age = service._solve_target_retirement_age(sample_goal, sample_status)
+        assert service._on_track(
+            sample_goal, sample_status, retirement_age=np.array([age - 1, age])
+        ).tolist() == [False, True]
+
+    @patch.object(RetirementService, "__init__", lambda self, db: None)
+    def test_on_track_batch_matches_single_projections(
+        self, sample_goal, sample_status
+    ):
+        """A candidate batch agrees with projecting each candidate alone."""
+        service = RetirementService.__new__(RetirementService)
+        ages = np.arange(40, 70)
+
+        batch = service._on_track(sample_goal, sample_status, retirement_age=ages)
+
+        single = []
+        for age in ages.tolist():
+            goal = {**sample_goal, "target_retirement_age": age}
+            projection = service._project_net_worth(goal, sample_status)
+            fire_number = goal["monthly_expenses_in_retirement"] * 12 / goal["withdrawal_rate"]
+            reached = any(
+                p["age"] <= age and p["net_worth_baseline"] >= fire_number
+                for p in projection
+            )
+            single.append(
+                reached
+                and service._find_depletion_age(projection, goal["life_expectancy"], age)
+                is None
+            )
+        assert batch.tolist() == single
+
 
 class TestLongevityCheck:
     """Tests for portfolio longevity / depletion detection."""
@@ -506,6 +556,57 @@ class TestLifeExpectancySolver:
 class TestGetProjections:
     """Tests for the main get_projections method including readiness logic."""
 
+    @patch.object(RetirementService, "__init__", lambda self, db: None)
+    @patch.object(RetirementService, "get_current_status")
+    def test_monte_carlo_off_by_default(self, mock_status, sample_goal, sample_status):
+        """Deterministic projections carry no stochastic block unless asked."""
+        mock_status.return_value = sample_status
+        service = RetirementService.__new__(RetirementService)
+        assert "monte_carlo" not in service.get_projections(goal_override=sample_goal)
+
+    @patch.object(RetirementService, "__init__", lambda self, db: None)
+    @patch.object(RetirementService, "get_current_status")
+    def test_monte_carlo_bands_and_depletion(self, mock_status, sample_goal, sample_status):
+        """Percentile bands are ordered and depletion odds only accumulate."""
+        mock_status.return_value = sample_status
+        sample_goal["monthly_expenses_in_retirement"] = 30000.0
+        service = RetirementService.__new__(RetirementService)
+
+        result = service.get_projections(
+            goal_override=sample_goal, monte_carlo=MonteCarloConfig(paths=2_000, seed=1)
+        )["monte_carlo"]
+
+        points = result["projection"]
+        assert [p["age"] for p in points] == list(range(35, 91))
+        assert points[0]["p10"] == points[0]["p90"] == 1_700_000
+        for p in points:
+            assert p["p10"] <= p["p25"] <= p["p50"] <= p["p75"] <= p["p90"]
+        odds = [p["depletion_probability"] for p in points]
+        assert odds == sorted(odds)
+        assert all(o == 0 for o, p in zip(odds, points) if p["age"] < 50)
+        assert 0 < odds[-1] < 1
+        assert result["success_probability"] == round(1 - odds[-1], 4)
+        assert result["paths"] == 2_000 and result["seed"] == 1
+
+    @patch.object(RetirementService, "__init__", lambda self, db: None)
+    @patch.object(RetirementService, "get_current_status")
+    def test_monte_carlo_median_tracks_baseline(self, mock_status, sample_goal, sample_status):
+        """With little volatility the median path sits on the baseline scenario."""
+        mock_status.return_value = sample_status
+        service = RetirementService.__new__(RetirementService)
+
+        result = service.get_projections(
+            goal_override=sample_goal,
+            monte_carlo=MonteCarloConfig(
+                paths=500, return_volatility=0.001, inflation_volatility=0.0
+            ),
+        )
+
+        for point, band in zip(
+            result["net_worth_projection"], result["monte_carlo"]["projection"]
+        ):
+            assert band["p50"] == pytest.approx(point["net_worth_baseline"], rel=0.01, abs=1)
+
     @patch.object(RetirementService, "__init__", lambda self, db: None)
     @patch.object(RetirementService, "get_current_status")
     def test_readiness_on_track(self, mock_status, sample_goal, sample_status):
@@ -775,6 +876,44 @@ class TestCurrentStatus:
         assert status["tracked_kh_value"] == 205000.0
 
 
+class TestCurrentStatusCache:
+    """get_current_status is reused across requests until the data changes."""
+
+    GOAL = {
+        "current_age": 35, "gender": "male", "target_retirement_age": 50,
+        "life_expectancy": 90, "monthly_expenses_in_retirement": 15000.0,
+        "inflation_rate": 0.025, "expected_return_rate": 0.04,
+        "withdrawal_rate": 0.035, "pension_monthly_payout_estimate": 5000.0,
+        "keren_hishtalmut_balance": 0.0,
+        "keren_hishtalmut_monthly_contribution": 0.0,
+        "bituach_leumi_eligible": True, "bituach_leumi_monthly_estimate": 2800.0,
+        "other_passive_income": 0.0,
+    }
+
+    def test_goal_previews_skip_analytics(self, db_session):
+        """Only the first preview derives the status; a data write re-derives it."""
+        from backend.models.bank_balance import BankBalance
+        from backend.services.analysis_service import AnalysisService
+
+        original = AnalysisService.get_net_worth_over_time
+        with patch.object(
+            AnalysisService, "get_net_worth_over_time", autospec=True,
+            side_effect=original,
+        ) as net_worth:
+            for expenses in (10000.0, 12000.0, 14000.0):
+                RetirementService(db_session).get_projections(
+                    goal_override={**self.GOAL, "monthly_expenses_in_retirement": expenses}
+                )
+            RetirementService(db_session).upsert_goal(**self.GOAL)
+            RetirementService(db_session).solve_all_fields()
+            assert net_worth.call_count == 1
+
+            db_session.add(BankBalance(provider="p", account_name="a", balance=5.0))
+            db_session.commit()
+            RetirementService(db_session).get_projections(goal_override=self.GOAL)
+            assert net_worth.call_count == 2
+
+
 class TestProjectionAlignment:
     """The projection curve is aligned to the ages it is labelled with."""
 
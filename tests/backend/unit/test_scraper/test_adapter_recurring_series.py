@@ -0,0 +1,108 @@
+"""Tests for ScraperAdapter._update_recurring_series.
+
+The post-scrape step refreshes the persisted recurring-charge model for the
+merchants in the scraped batch; like the other pipeline helpers it must never
+fail the scrape.
+"""
+
+from contextlib import contextmanager
+from datetime import date
+from unittest.mock import patch
+
+import pandas as pd
+
+from backend.constants.tables import Tables
+from backend.models.transaction import CreditCardTransaction
+from backend.repositories.recurring_series_repository import RecurringSeriesRepository
+from backend.scraper.adapter import ScraperAdapter
+
+DUMMY_CREDENTIALS = {"username": "user", "password": "pass123"}
+
+
+@contextmanager
+def _fake_db_context(db_session):
+    """Context manager yielding the test's real in-memory session."""
+    yield db_session
+
+
+def _adapter(service_name: str = "credit_cards") -> ScraperAdapter:
+    """Build an adapter without running the scrape lifecycle."""
+    return ScraperAdapter(
+        service_name, "max", "Card", DUMMY_CREDENTIALS, date(2026, 1, 1), 1,
+    )
+
+
+def _seed_subscription(db_session, description: str, months: int) -> None:
+    """Insert ``months`` monthly charges ending this month."""
+    today = pd.Timestamp.today().normalize()
+    for n in range(months):
+        d = (today - pd.DateOffset(months=n)).replace(day=5).strftime("%Y-%m-%d")
+        db_session.add(
+            CreditCardTransaction(
+                id=f"{description}-{d}", date=d, provider="max",
+                account_name="Card", description=description, amount=-30.0,
+                category="Streaming", source=Tables.CREDIT_CARD.value,
+            )
+        )
+    db_session.commit()
+
+
+class TestUpdateRecurringSeries:
+    """The adapter feeds the scraped batch to RecurringService.update_series."""
+
+    def test_scraped_merchants_are_persisted(self, db_session):
+        """A scrape touching a subscription persists its series."""
+        _seed_subscription(db_session, "NETFLIX", 4)
+        adapter = _adapter()
+        adapter._data = pd.DataFrame({"description": ["NETFLIX"]})
+
+        with patch(
+            "backend.scraper.adapter.get_db_context",
+            side_effect=lambda: _fake_db_context(db_session),
+        ):
+            adapter._update_recurring_series()
+
+        stored = RecurringSeriesRepository(db_session).get_all()
+        assert list(stored["normalized"]) == ["netflix"]
+
+    def test_insurance_scrapes_are_skipped(self, db_session):
+        """Insurance deposits never reach the recurring model."""
+        adapter = _adapter("insurances")
+        adapter._data = pd.DataFrame({"description": ["DEPOSIT"]})
+
+        with patch("backend.scraper.adapter.RecurringService") as service_cls:
+            adapter._update_recurring_series()
+
+        service_cls.assert_not_called()
+
+    def test_failure_does_not_raise(self, db_session):
+        """An error refreshing the model is logged, not propagated."""
+        adapter = _adapter()
+        adapter._data = pd.DataFrame({"description": ["NETFLIX"]})
+
+        with patch(
+            "backend.scraper.adapter.get_db_context",
+            side_effect=lambda: _fake_db_context(db_session),
+        ), patch(
+            "backend.scraper.adapter.RecurringService.update_series",
+            side_effect=RuntimeError("boom"),
+        ):
+            adapter._update_recurring_series()
+
+    def test_stale_model_is_rebuilt_in_full(self, db_session):
+        """A model stale before the scrape wrote anything is rebuilt, not patched."""
+        _seed_subscription(db_session, "NETFLIX", 4)
+        _seed_subscription(db_session, "SPOTIFY", 4)
+        adapter = _adapter()
+        adapter._data = pd.DataFrame({"description": ["NETFLIX"]})
+
+        with patch(
+            "backend.scraper.adapter.get_db_context",
+            side_effect=lambda: _fake_db_context(db_session),
+        ):
+            adapter._check_recurring_model()
+            adapter._update_recurring_series()
+
+        assert adapter._recurring_was_current is False
+        stored = RecurringSeriesRepository(db_session).get_all()
+        assert list(stored["normalized"]) == ["netflix", "spotify"]
@@ -0,0 +1,283 @@
+"""Tests for the shared browser pool behind BrowserScraper."""
+
+import asyncio
+from datetime import date
+
+import pytest
+
+from scraper.base.base_scraper import ScraperOptions
+from scraper.models.result import LoginResult
+from scraper.utils import browser_pool
+from scraper.utils.browser_pool import BrowserPool
+
+
+class _FakeContext:
+    """Playwright BrowserContext stand-in."""
+
+    def __init__(self, browser, options):
+        self.browser = browser
+        self.options = options
+        self.init_scripts = []
+        self.closed = False
+
+    async def add_init_script(self, script):
+        self.init_scripts.append(script)
+
+    async def new_page(self):
+        return _FakePage()
+
+    async def close(self):
+        self.closed = True
+
+    async def route(self, pattern, handler):
+        self.routes = getattr(self, "routes", []) + [(pattern, handler)]
+
+
+class _FakePage:
+    """Playwright Page stand-in."""
+
+    def set_default_timeout(self, timeout):
+        self.timeout = timeout
+
+
+class _FakeBrowser:
+    """Playwright Browser stand-in."""
+
+    def __init__(self, channel, headless):
+        self.channel = channel
+        self.headless = headless
+        self.closed = False
+
+    def is_connected(self):
+        return not self.closed
+
+    async def new_context(self, **options):
+        return _FakeContext(self, options)
+
+    async def close(self):
+        self.closed = True
+
+
+class _FakePlaywright:
+    """Fake Playwright driver recording launches."""
+
+    def __init__(self, installed):
+        self.installed = installed
+        self.launched = []
+        self.stopped = False
+        self.chromium = self
+
+    async def launch(self, channel, headless, args):
+        if channel not in self.installed:
+            raise Exception(f'Chromium distribution "{channel}" is not found')
+        browser = _FakeBrowser(channel, headless)
+        self.launched.append(browser)
+        return browser
+
+    async def stop(self):
+        self.stopped = True
+
+
+class _Drivers(list):
+    """Started fake drivers, plus the channels they can launch."""
+
+    installed: set
+
+
+@pytest.fixture
+def drivers(monkeypatch):
+    """Patch async_playwright; returns the list of started fake drivers."""
+    started = _Drivers()
+    installed = {"chrome", "msedge"}
+
+    class _Starter:
+        async def start(self):
+            driver = _FakePlaywright(installed)
+            started.append(driver)
+            return driver
+
+    monkeypatch.setattr(browser_pool, "async_playwright", _Starter)
+    started.installed = installed
+    return started
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool."""
+
+    def test_reuses_warm_browser_with_fresh_contexts(self, drivers):
+        """Sequential and concurrent scrapes share one browser, never a context."""
+        pool = BrowserPool()
+
+        async def scenario():
+            first = await pool.acquire_context(True, init_script="stealth", locale="he-IL")
+            second = await pool.acquire_context(True)
+            assert first is not second
+            assert first.browser is second.browser
+            assert first.init_scripts == ["stealth"]
+            assert first.options == {"locale": "he-IL"}
+            await pool.release_context(first)
+            await pool.release_context(second)
+            third = await pool.acquire_context(True)
+            assert third.browser is first.browser
+            assert first.closed and second.closed
+            await pool.close()
+
+        asyncio.run(scenario())
+        assert len(drivers) == 1
+        assert len(drivers[0].launched) == 1
+        assert drivers[0].stopped
+
+    def test_headed_and_headless_use_separate_browsers(self, drivers):
+        """show_browser scrapes never land in the headless browser."""
+        pool = BrowserPool()
+
+        async def scenario():
+            headless = await pool.acquire_context(True)
+            headed = await pool.acquire_context(False)
+            assert headless.browser is not headed.browser
+            assert headed.browser.headless is False
+            await pool.close()
+
+        asyncio.run(scenario())
+
+    def test_retires_browser_after_max_uses(self, drivers):
+        """A browser is relaunched after max_uses contexts, once drained."""
+        pool = BrowserPool(max_uses=2)
+
+        async def scenario():
+            first = await pool.acquire_context(True)
+            second = await pool.acquire_context(True)
+            third = await pool.acquire_context(True)
+            old = first.browser
+            assert third.browser is not old
+            await pool.release_context(first)
+            assert not old.closed
+            await pool.release_context(second)
+            assert old.closed
+            assert pool.browser_count == 1
+            await pool.close()
+
+        asyncio.run(scenario())
+
+    def test_scales_down_when_idle(self, drivers):
+        """With no open contexts the pool closes browsers and the driver."""
+        pool = BrowserPool(idle_timeout=0.01)
+
+        async def scenario():
+            context = await pool.acquire_context(True)
+            await pool.release_context(context)
+            assert pool.browser_count == 1
+            await asyncio.sleep(0.05)
+            assert pool.browser_count == 0
+            assert context.browser.closed
+
+        asyncio.run(scenario())
+        assert drivers[0].stopped
+
+    def test_cancelled_acquire_returns_its_lease(self, drivers, monkeypatch):
+        """A cancellation while the context opens frees the lease, so the pool still scales down."""
+        pool = BrowserPool(idle_timeout=0.01)
+        opening = asyncio.Event()
+
+        async def slow_new_context(self, **options):
+            opening.set()
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(_FakeBrowser, "new_context", slow_new_context)
+
+        async def scenario():
+            task = asyncio.create_task(pool.acquire_context(True))
+            await opening.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            await asyncio.sleep(0.05)
+            assert pool.browser_count == 0
+
+        asyncio.run(scenario())
+        assert drivers[0].stopped
+
+    def test_falls_back_to_edge_and_reports_missing_browser(self, drivers):
+        """Edge is used without Chrome; with neither, a clear error is raised."""
+        drivers.installed.discard("chrome")
+        pool = BrowserPool()
+
+        async def edge():
+            context = await pool.acquire_context(True)
+            assert context.browser.channel == "msedge"
+            await pool.close()
+
+        asyncio.run(edge())
+
+        drivers.installed.clear()
+
+        async def missing():
+            with pytest.raises(RuntimeError, match="No supported browser found"):
+                await pool.acquire_context(True)
+
+        asyncio.run(missing())
+        assert drivers[-1].stopped
+
+
+class TestBrowserScraperPool:
+    """BrowserScraper takes its page from the pool and gives it back."""
+
+    def test_initialize_and_terminate_lease_a_context(self, drivers, monkeypatch):
+        """initialize opens a stealth context; terminate closes only the context."""
+        from scraper.base.browser_scraper import BrowserScraper
+
+        class _Concrete(BrowserScraper):
+            async def login(self):
+                return LoginResult.SUCCESS
+
+            async def fetch_data(self):
+                return []
+
+        pool = BrowserPool()
+        monkeypatch.setattr(
+            "scraper.base.browser_scraper.get_browser_pool", lambda: pool
+        )
+        options = ScraperOptions(start_date=date(2024, 1, 1))
+
+        async def scenario():
+            scraper = _Concrete("max", {}, options)
+            await scraper.initialize()
+            context = scraper.context
+            assert context.init_scripts == [BrowserScraper._STEALTH_INIT_SCRIPT]
+            assert context.options["user_agent"] == BrowserScraper._DEFAULT_USER_AGENT
+            assert scraper.browser is context.browser
+            await scraper.terminate(True)
+            assert context.closed
+            assert not context.browser.closed
+            await pool.close()
+
+        asyncio.run(scenario())
+
+    def test_opt_in_resource_blocking_routes_the_context(self, drivers, monkeypatch):
+        """A provider policy is installed on the scrape's context only."""
+        from scraper.base.browser_scraper import BrowserScraper
+        from scraper.utils.resource_blocking import ResourceBlockPolicy
+
+        class _Blocking(BrowserScraper):
+            resource_blocking = ResourceBlockPolicy()
+
+            async def login(self):
+                return LoginResult.SUCCESS
+
+            async def fetch_data(self):
+                return []
+
+        pool = BrowserPool()
+        monkeypatch.setattr(
+            "scraper.base.browser_scraper.get_browser_pool", lambda: pool
+        )
+        options = ScraperOptions(start_date=date(2024, 1, 1))
+
+        async def scenario():
+            scraper = _Blocking("max", {}, options)
+            await scraper.initialize()
+            assert [pattern for pattern, _ in scraper.context.routes] == ["**/*"]
+            await scraper.terminate(True)
+            await pool.close()
+
+        asyncio.run(scenario())
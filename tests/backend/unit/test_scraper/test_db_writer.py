@@ -0,0 +1,365 @@
+"""Tests for the post-scrape single-writer thread and its cancellation contract."""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import create_db_engine
+from backend.models.base import Base
+from backend.models.bank_balance import BankBalance
+from backend.models.transaction import CreditCardTransaction
+from backend.scraper.adapter import ScraperAdapter
+from backend.scraper.db_writer import (
+    CancelToken,
+    PipelineCancelled,
+    run_on_writer,
+    unit_of_work,
+)
+
+
+def _balance() -> BankBalance:
+    return BankBalance(
+        provider="p", account_name="a", balance=1.0, last_manual_update="2024-01-01"
+    )
+
+
+class TestRunOnWriter:
+    """Tests for run_on_writer."""
+
+    def test_runs_off_the_event_loop(self):
+        """The pipeline runs on the writer thread while the loop keeps ticking."""
+        ticks = []
+
+        def pipeline(token):
+            time.sleep(0.05)
+            return threading.current_thread().name
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(1)
+                await asyncio.sleep(0.005)
+
+        async def scenario():
+            name, _ = await asyncio.gather(run_on_writer(pipeline), ticker())
+            return name
+
+        assert asyncio.run(scenario()).startswith("scrape-db-writer")
+        assert len(ticks) == 3
+
+    def test_timeout_stops_at_next_checkpoint(self):
+        """A timed-out pipeline skips its remaining stages and has stopped on return."""
+        ran = []
+
+        def pipeline(token):
+            for stage in ("save", "tag", "rebalance"):
+                token.check()
+                time.sleep(0.05)
+                ran.append(stage)
+
+        with pytest.raises(PipelineCancelled):
+            asyncio.run(run_on_writer(pipeline, timeout=0.01))
+        assert ran == ["save"]
+
+    def test_swallowed_refusal_is_still_reported(self):
+        """A stage that swallows the refused commit cannot hide the timeout."""
+
+        def pipeline(token):
+            time.sleep(0.05)
+            try:
+                token.check()
+            except PipelineCancelled:
+                pass
+
+        with pytest.raises(PipelineCancelled):
+            asyncio.run(run_on_writer(pipeline, timeout=0.01))
+
+    def test_finished_within_budget_returns_result(self):
+        """No timeout, no cancellation."""
+        assert asyncio.run(run_on_writer(lambda token: 7, timeout=5)) == 7
+
+
+class TestCancelTokenGuard:
+    """Guarded sessions refuse to commit after cancellation."""
+
+    def test_commit_refused_and_rolled_back(self, db_engine):
+        """The open transaction is discarded instead of committed."""
+        session = sessionmaker(bind=db_engine)()
+        token = CancelToken()
+        token.guard(session)
+        try:
+            session.add(_balance())
+            session.flush()
+            token.cancel()
+            with pytest.raises(PipelineCancelled):
+                session.commit()
+            session.rollback()
+        finally:
+            session.close()
+
+        other = sessionmaker(bind=db_engine)()
+        try:
+            assert other.scalar(select(func.count()).select_from(BankBalance)) == 0
+        finally:
+            other.close()
+
+    def test_uncancelled_commit_goes_through(self, db_session):
+        """A guarded session commits normally until cancellation."""
+        CancelToken().guard(db_session)
+        db_session.add(_balance())
+        db_session.commit()
+        assert db_session.scalar(select(func.count()).select_from(BankBalance)) == 1
+
+
+class TestAdapterPipeline:
+    """ScraperAdapter._run_pipeline honours its token."""
+
+    def test_cancelled_token_runs_no_stage(self):
+        """Cancellation before the first checkpoint skips every stage."""
+        adapter = ScraperAdapter(
+            "banks", "hapoalim", "Main", {}, date(2026, 1, 1), 1
+        )
+        adapter._save_scraped_transactions = MagicMock()
+        token = CancelToken()
+        token.cancel()
+
+        with pytest.raises(PipelineCancelled):
+            adapter._run_pipeline(MagicMock(), token)
+        adapter._save_scraped_transactions.assert_not_called()
+        assert adapter._cancel_token is None
+
+    def test_run_records_timeout_when_pipeline_overruns(self):
+        """The scrape ceiling covers the pipeline: later stages never run."""
+        adapter = ScraperAdapter(
+            "credit_cards", "isracard", "Card1", {}, date(2026, 1, 1), 5
+        )
+        fake_scraper = MagicMock()
+        fake_scraper.scrape = AsyncMock(
+            return_value=SimpleNamespace(
+                success=True, accounts=[object()], http_stats={}
+            )
+        )
+        fake_scraper.refreshed_otp_long_term_token = None
+        modules = {
+            "scraper": SimpleNamespace(
+                create_scraper=MagicMock(return_value=fake_scraper),
+                is_2fa_required=MagicMock(return_value=False),
+            ),
+            "scraper.base.base_scraper": SimpleNamespace(ScraperOptions=MagicMock()),
+        }
+        adapter._result_to_dataframe = MagicMock(
+            return_value=pd.DataFrame({"date": ["2026-01-02"]})
+        )
+        adapter._save_scraped_transactions = lambda: time.sleep(0.2)
+        adapter._apply_auto_tagging = MagicMock()
+
+        @contextmanager
+        def fake_db_context(*args):
+            yield MagicMock()
+
+        with patch(
+            "backend.scraper.adapter._import_scraper_module", side_effect=modules.get
+        ), patch(
+            "backend.scraper.adapter.get_db_context", side_effect=fake_db_context
+        ), patch(
+            "backend.scraper.adapter.unit_of_work", side_effect=fake_db_context
+        ), patch(
+            "backend.scraper.adapter.ScrapingHistoryRepository"
+        ) as repo_cls, patch("backend.scraper.adapter.SCRAPE_TIMEOUT_SECONDS", 0.05):
+            asyncio.run(adapter.run())
+
+        adapter._apply_auto_tagging.assert_not_called()
+        args = repo_cls.return_value.record_scrape_end.call_args.args
+        assert args[1] == repo_cls.FAILED
+        assert args[3] == "TIMEOUT"
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """A file-backed engine, so a second connection sees only committed data."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'uow.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _count_balances(engine) -> int:
+    with sessionmaker(bind=engine)() as other:
+        return other.scalar(select(func.count()).select_from(BankBalance))
+
+
+class TestUnitOfWork:
+    """Stage commits inside unit_of_work land in one transaction."""
+
+    def test_stage_commits_are_published_once(self, file_engine):
+        """Nothing is visible to other connections until the block exits."""
+        with unit_of_work(engine=file_engine) as db:
+            db.add(_balance())
+            db.commit()
+            db.add(
+                BankBalance(
+                    provider="p", account_name="b", balance=2.0,
+                    last_manual_update="2024-01-01",
+                )
+            )
+            db.commit()
+            assert _count_balances(file_engine) == 0
+        assert _count_balances(file_engine) == 2
+
+    def test_failure_rolls_back_committed_stages(self, file_engine):
+        """An error after a stage commit discards the whole unit."""
+        with pytest.raises(RuntimeError):
+            with unit_of_work(engine=file_engine) as db:
+                db.add(_balance())
+                db.commit()
+                raise RuntimeError("later stage failed")
+        assert _count_balances(file_engine) == 0
+
+    def test_stage_rollback_keeps_earlier_commits(self, file_engine):
+        """A rollback only discards work since the stage's last commit."""
+        with unit_of_work(engine=file_engine) as db:
+            db.add(_balance())
+            db.commit()
+            db.add(
+                BankBalance(
+                    provider="p", account_name="b", balance=2.0,
+                    last_manual_update="2024-01-01",
+                )
+            )
+            db.flush()
+            db.rollback()
+        assert _count_balances(file_engine) == 1
+
+
+class TestUnitOfWorkConcurrency:
+    """Other connections keep working while a unit of work holds the lock."""
+
+    def test_readers_proceed_and_writers_wait(self, tmp_path):
+        """WAL lets readers in; a second writer waits instead of failing."""
+        engine = create_db_engine(str(tmp_path / "wal.db"))
+        Base.metadata.create_all(engine)
+        errors = []
+
+        def other_writer():
+            try:
+                with sessionmaker(bind=engine)() as other:
+                    other.add(
+                        BankBalance(
+                            provider="q", account_name="b", balance=2.0,
+                            last_manual_update="2024-01-01",
+                        )
+                    )
+                    other.commit()
+            except Exception as exc:  # pragma: no cover - failure path
+                errors.append(exc)
+
+        try:
+            with unit_of_work(engine=engine) as db:
+                db.add(_balance())
+                db.commit()
+                assert _count_balances(engine) == 0
+                writer = threading.Thread(target=other_writer)
+                writer.start()
+                time.sleep(0.2)
+                assert writer.is_alive()
+            writer.join(timeout=10)
+            assert errors == []
+            assert _count_balances(engine) == 2
+        finally:
+            engine.dispose()
+
+
+class TestAdapterUnitOfWork:
+    """ScraperAdapter._run_pipeline shares one session across its stages."""
+
+    @staticmethod
+    def _adapter() -> ScraperAdapter:
+        adapter = ScraperAdapter(
+            "credit_cards", "isracard", "Card1", {}, date(2026, 1, 1), 1
+        )
+        adapter._data = pd.DataFrame(
+            {
+                "id": ["t1", "t2"],
+                "date": ["2026-01-02", "2026-01-03"],
+                "amount": [-10.0, -20.0],
+                "description": ["Shop", "Cafe"],
+                "account_number": ["1234", "1234"],
+                "type": ["normal", "normal"],
+                "status": ["completed", "completed"],
+                "account_name": ["Card1", "Card1"],
+                "provider": ["isracard", "isracard"],
+                "category": [None, None],
+                "tag": [None, None],
+                "source": ["credit_card_transactions"] * 2,
+                "unique_id": ["u1", "u2"],
+                "split_id": [None, None],
+            }
+        )
+        return adapter
+
+    @staticmethod
+    def _count_rows(engine) -> int:
+        with sessionmaker(bind=engine)() as other:
+            return other.scalar(
+                select(func.count()).select_from(CreditCardTransaction)
+            )
+
+    def test_single_commit_shared_session_and_timings(self, file_engine):
+        """Stages see one session and the save is published after the last stage."""
+        adapter = self._adapter()
+        seen = []
+
+        def tag():
+            with adapter._pipeline_db() as db:
+                seen.append(db)
+            assert self._count_rows(file_engine) == 0
+
+        adapter._apply_auto_tagging = tag
+        adapter._update_recurring_series = lambda: None
+
+        with patch("backend.scraper.db_writer.get_engine", return_value=file_engine):
+            adapter._run_pipeline(MagicMock(), CancelToken())
+
+        assert seen and seen[0] is not None
+        assert self._count_rows(file_engine) == 2
+        assert len(adapter._delta) == 2
+        assert list(adapter.stage_timings) == [
+            "save", "tag", "recurring", "rebalance", "post_save", "commit",
+        ]
+        assert adapter._pipeline_session is None
+
+    def test_rescrape_without_new_rows_skips_tagging(self, file_engine):
+        """The empty delta frame spares the tagging stage its table scans."""
+        with patch("backend.scraper.db_writer.get_engine", return_value=file_engine):
+            first = self._adapter()
+            first._apply_auto_tagging = MagicMock()
+            first._update_recurring_series = lambda: None
+            first._run_pipeline(MagicMock(), CancelToken())
+
+            second = self._adapter()
+            second._update_recurring_series = lambda: None
+            with patch("backend.scraper.adapter.CategoriesTagsService") as service:
+                second._run_pipeline(MagicMock(), CancelToken())
+
+        assert second._delta.empty
+        service.assert_not_called()
+
+    def test_cancellation_rolls_back_the_saved_rows(self, file_engine):
+        """A timeout after the save stage leaves no scraped rows behind."""
+        adapter = self._adapter()
+        token = CancelToken()
+        adapter._apply_auto_tagging = token.cancel
+
+        with patch("backend.scraper.db_writer.get_engine", return_value=file_engine):
+            with pytest.raises(PipelineCancelled):
+                adapter._run_pipeline(MagicMock(), token)
+
+        assert self._count_rows(file_engine) == 0
@@ -1,9 +1,14 @@
-"""Tests for the Discount Bank provider's pure parsing helpers."""
+"""Tests for the Discount Bank provider's parsing and account-fetch helpers."""
+
+import asyncio
+from datetime import date
+from types import SimpleNamespace
 
 from scraper.models.result import LoginResult
 from scraper.models.transaction import TransactionStatus, TransactionType
 from scraper.providers.banks.discount import (
     _convert_transactions,
+    _fetch_account_data,
     _create_login_fields,
     _get_possible_login_results,
 )
@@ -112,3 +117,35 @@ class TestDiscountLoginConfig:
         assert {"selector": "#tzId", "value": "123"} in fields
         assert {"selector": "#tzPassword", "value": "pw"} in fields
         assert {"selector": "#aidnum", "value": "9"} in fields
+
+
+class TestDiscountFetchAccountData:
+    """Tests for fetching every account after login."""
+
+    def test_accounts_fetched_concurrently_in_order(self, monkeypatch):
+        """Per-account requests overlap, and results keep the accounts' order."""
+        state = {"active": 0, "peak": 0}
+
+        async def fake_fetch(page, url):
+            if url.endswith("/userAccountsData"):
+                return {"UserAccountsData": {"UserAccounts": [
+                    {"NewAccountInfo": {"AccountID": account_id}} for account_id in ("A", "B", "C")
+                ]}}
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            # Later accounts answer first.
+            await asyncio.sleep(0.01 if "/C/" in url else 0.03)
+            state["active"] -= 1
+            return {"CurrentAccountLastTransactions": {
+                "OperationEntry": [_raw_txn()],
+                "CurrentAccountInfo": {"AccountBalance": 100.0},
+            }}
+
+        monkeypatch.setattr("scraper.providers.banks.discount.fetch_get_within_page", fake_fetch)
+        options = SimpleNamespace(start_date=date.today())
+
+        results = asyncio.run(_fetch_account_data(None, options))
+
+        assert [r.account_number for r in results] == ["A", "B", "C"]
+        assert all(r.balance == 100.0 and len(r.transactions) == 1 for r in results)
+        assert state["peak"] == 3
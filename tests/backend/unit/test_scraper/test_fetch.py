@@ -10,6 +10,7 @@ import asyncio
 import httpx
 
 from scraper.utils import fetch
+from scraper.utils import http_client
 
 
 def _client(handler) -> httpx.AsyncClient:
@@ -103,3 +104,134 @@ class TestFetchErrorBody:
                 await client.aclose()
 
         assert asyncio.run(run()) == {"ok": True}
+
+
+class TestPooledClient:
+    """The run-scoped pooled client and its instrumentation."""
+
+    @staticmethod
+    def _mock_transport(monkeypatch, handler) -> list:
+        """Serve the pooled client's requests with ``handler``; return the transports built."""
+        built = []
+
+        def transport(**_kwargs):
+            built.append(httpx.MockTransport(handler))
+            return built[-1]
+
+        monkeypatch.setattr(http_client.httpx, "AsyncHTTPTransport", transport)
+        return built
+
+    def test_fetch_helpers_share_the_run_client(self, monkeypatch):
+        """Without an explicit client, every helper call inside a run reuses one pool."""
+        built = self._mock_transport(monkeypatch, lambda request: httpx.Response(200, json={"ok": 1}))
+
+        async def run():
+            stats = http_client.HttpStats()
+            async with http_client.scraper_http_client(stats) as client:
+                await fetch.fetch_get("https://api.example/a")
+                await fetch.fetch_post("https://api.example/b", {"x": 1})
+                await asyncio.gather(*(fetch.fetch_get("https://api.example/c") for _ in range(3)))
+                assert http_client.current_http_client() is client
+            assert http_client.current_http_client() is None
+            return stats
+
+        stats = asyncio.run(run())
+        assert len(built) == 1
+        assert stats.hosts["api.example"].requests == 5
+
+    def test_session_expiry_redirect_raises_instead_of_following(self, monkeypatch):
+        """The run client follows redirects, but a 3xx on a JSON call still raises with its body."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.url.path)
+            if request.url.path == "/login":
+                return httpx.Response(200, text="<html>login</html>")
+            return httpx.Response(302, headers={"location": "/login"}, text="session expired")
+
+        self._mock_transport(monkeypatch, handler)
+
+        async def run():
+            errors = []
+            async with http_client.scraper_http_client(http_client.HttpStats()):
+                for call in (
+                    fetch.fetch_get("https://api.example/data"),
+                    fetch.fetch_post("https://api.example/data", {}),
+                ):
+                    try:
+                        await call
+                    except httpx.HTTPStatusError as error:
+                        errors.append(error)
+            return errors
+
+        errors = asyncio.run(run())
+        assert [error.response.status_code for error in errors] == [302, 302]
+        assert "session expired" in str(errors[0])
+        assert seen == ["/data", "/data"]
+
+    def test_explicit_client_keeps_its_redirect_setting(self):
+        """A caller-supplied client that follows redirects still does so."""
+
+        def handler(request):
+            if request.url.path == "/moved":
+                return httpx.Response(307, headers={"location": "/data"})
+            return httpx.Response(200, json={"ok": True})
+
+        async def run():
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler), follow_redirects=True
+            ) as client:
+                return (
+                    await fetch.fetch_get("https://api.example/moved", client=client),
+                    await fetch.fetch_post("https://api.example/moved", {}, client=client),
+                )
+
+        assert asyncio.run(run()) == ({"ok": True}, {"ok": True})
+
+    def test_stats_count_requests_errors_and_bytes(self, monkeypatch):
+        """Per-host counters cover status errors, request and response bytes, and latency."""
+
+        # Streamed bodies, as a network transport returns them.
+        def handler(request):
+            if request.url.path == "/fail":
+                return httpx.Response(500, stream=httpx.ByteStream(b"nope"))
+            return httpx.Response(200, stream=httpx.ByteStream(b'{"value": 12345}'))
+
+        self._mock_transport(monkeypatch, handler)
+
+        async def run():
+            stats = http_client.HttpStats()
+            async with http_client.scraper_http_client(stats):
+                await fetch.fetch_post("https://bank.example/ok", {"a": 1})
+                try:
+                    await fetch.fetch_get("https://bank.example/fail")
+                except httpx.HTTPStatusError:
+                    pass
+            return stats.to_dict()
+
+        host = asyncio.run(run())["bank.example"]
+        assert host["requests"] == 2
+        assert host["errors"] == 1
+        assert host["bytes_sent"] == len(b'{"a":1}')
+        assert host["bytes_received"] == len(b'{"value": 12345}') + len(b"nope")
+        assert sum(host["latency_histogram_ms"].values()) == 2
+
+    def test_transport_failure_counts_as_error(self, monkeypatch):
+        """A connection failure is recorded before it propagates."""
+
+        def handler(request):
+            raise httpx.ConnectError("refused", request=request)
+
+        self._mock_transport(monkeypatch, handler)
+
+        async def run():
+            stats = http_client.HttpStats()
+            async with http_client.scraper_http_client(stats):
+                try:
+                    await fetch.fetch_get("https://down.example/")
+                except httpx.ConnectError:
+                    pass
+            return stats.to_dict()
+
+        host = asyncio.run(run())["down.example"]
+        assert (host["requests"], host["errors"]) == (1, 1)
@@ -0,0 +1,99 @@
+"""Tests for opt-in request blocking in browser scrapes."""
+
+import asyncio
+from types import SimpleNamespace
+
+from scraper.utils.resource_blocking import (
+    ResourceBlockPolicy,
+    ResourceBlockStats,
+    install_resource_blocking,
+)
+
+
+class _FakeRoute:
+    """Playwright Route stand-in recording how it was handled."""
+
+    def __init__(self, resource_type, url):
+        self.request = SimpleNamespace(resource_type=resource_type, url=url)
+        self.outcome = None
+
+    async def abort(self, error_code=None):
+        self.outcome = ("abort", error_code)
+
+    async def fallback(self):
+        self.outcome = ("fallback", None)
+
+
+class _FakeTarget:
+    """Page/context stand-in capturing the registered route handler."""
+
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+
+class TestResourceBlockPolicy:
+    """Tests for ResourceBlockPolicy.should_block."""
+
+    def test_blocks_default_types_but_not_documents_or_apis(self):
+        """Images and fonts are blocked; pages, scripts and XHR go through."""
+        policy = ResourceBlockPolicy()
+        assert policy.should_block("image", "https://www.max.co.il/logo.png")
+        assert policy.should_block("font", "https://www.max.co.il/a.woff2")
+        assert not policy.should_block("document", "https://www.max.co.il/login")
+        assert not policy.should_block("xhr", "https://onlinelcapi.max.co.il/api")
+        assert not policy.should_block("script", "https://www.max.co.il/app.js")
+
+    def test_blocks_tracker_subdomains(self):
+        """Tracker hosts match as domain suffixes, not substrings."""
+        policy = ResourceBlockPolicy()
+        assert policy.should_block("script", "https://www.google-analytics.com/ga.js")
+        assert not policy.should_block("script", "https://notgoogle-analytics.com/x.js")
+
+    def test_allow_list_wins(self):
+        """An allowed host is never blocked, whatever its type or deny entry."""
+        policy = ResourceBlockPolicy(
+            blocked_hosts=("cal-online.co.il",), allowed_hosts=("connect.cal-online.co.il",)
+        )
+        assert policy.should_block("script", "https://www.cal-online.co.il/x.js")
+        assert not policy.should_block("image", "https://connect.cal-online.co.il/captcha.png")
+
+
+class TestInstallResourceBlocking:
+    """Tests for the route handler and its counters."""
+
+    def test_handler_aborts_blocked_and_falls_back_otherwise(self):
+        """Blocked requests are aborted and counted; the rest fall through."""
+        target = _FakeTarget()
+        image = _FakeRoute("image", "https://www.leumi.co.il/hero.jpg")
+        api = _FakeRoute("fetch", "https://hb2.bankleumi.co.il/api")
+
+        async def scenario():
+            stats = await install_resource_blocking(target, ResourceBlockPolicy())
+            pattern, handler = target.routes[0]
+            assert pattern == "**/*"
+            await handler(image)
+            await handler(api)
+            return stats
+
+        stats = asyncio.run(scenario())
+        assert image.outcome == ("abort", "blockedbyclient")
+        assert api.outcome == ("fallback", None)
+        assert stats.blocked == 1
+        assert stats.by_type == {"image": 1}
+        assert stats.estimated_bytes_saved > 0
+
+    def test_records_into_given_stats(self):
+        """A caller-owned stats object is updated in place."""
+        stats = ResourceBlockStats()
+        target = _FakeTarget()
+
+        async def scenario():
+            returned = await install_resource_blocking(target, ResourceBlockPolicy(), stats)
+            await target.routes[0][1](_FakeRoute("font", "https://x.co.il/f.woff"))
+            return returned
+
+        assert asyncio.run(scenario()) is stats
+        assert stats.to_dict()["by_type"] == {"font": 1}
@@ -0,0 +1,139 @@
+"""Tests for the scrape event bus behind GET /api/scraping/events."""
+
+import asyncio
+import threading
+from contextlib import contextmanager
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from backend.scraper.adapter import ScraperAdapter
+from backend.scraper.events import ScrapeEventBus
+from backend.services.scraping_service import ScrapingService
+
+
+async def _collect(stream) -> list:
+    return [event async for event in stream]
+
+
+class TestScrapeEventBus:
+    """Tests for ScrapeEventBus."""
+
+    def test_late_subscriber_is_replayed_after_last_event_id(self):
+        """A finished process replays what the client missed and ends."""
+        bus = ScrapeEventBus()
+        bus.publish(1, "status", {"status": "in_progress"})
+        bus.publish(1, "progress", {"message": "Logging in"})
+        bus.publish(1, "status", {"status": "success"}, final=True)
+
+        events = asyncio.run(_collect(bus.subscribe(1, last_event_id=1)))
+
+        assert [event.seq for event in events] == [2, 3]
+        assert events[-1].final
+        assert events[0].to_sse() == (
+            'id: 2\nevent: progress\ndata: {"message": "Logging in"}\n\n'
+        )
+
+    def test_live_events_from_another_thread_close_on_final(self):
+        """Events published off the loop reach the subscriber in order."""
+        bus = ScrapeEventBus()
+        bus.publish(2, "status", {"status": "in_progress"})
+
+        def worker():
+            bus.publish(2, "status", {"status": "waiting_for_2fa"})
+            bus.publish(2, "status", {"status": "failed"}, final=True)
+
+        async def scenario():
+            stream = bus.subscribe(2)
+            first = await stream.__anext__()
+            threading.Thread(target=worker).start()
+            return [first] + await _collect(stream)
+
+        events = asyncio.run(scenario())
+        assert [event.data["status"] for event in events] == [
+            "in_progress", "waiting_for_2fa", "failed",
+        ]
+        assert not bus._subscribers
+
+    def test_idle_stream_yields_keep_alives(self):
+        """With nothing to send the stream yields None at the heartbeat."""
+        bus = ScrapeEventBus()
+
+        async def scenario():
+            stream = bus.subscribe(3, heartbeat=0.01)
+            keep_alive = await stream.__anext__()
+            bus.publish(3, "status", {"status": "success"}, final=True)
+            return keep_alive, await _collect(stream)
+
+        keep_alive, rest = asyncio.run(scenario())
+        assert keep_alive is None
+        assert [event.final for event in rest] == [True]
+
+    def test_finished_processes_are_evicted(self):
+        """Only the most recent finished processes keep their history."""
+        bus = ScrapeEventBus()
+        with patch("backend.scraper.events.MAX_KEPT_FINISHED_PROCESSES", 2):
+            for process_id in (1, 2, 3):
+                bus.publish(process_id, "status", {"status": "success"}, final=True)
+        assert [bus.knows(process_id) for process_id in (1, 2, 3)] == [
+            False, True, True,
+        ]
+
+
+class TestAdapterEvents:
+    """ScraperAdapter pushes its transitions to the bus."""
+
+    def test_2fa_prompt_and_final_status_are_published(self):
+        """The OTP prompt and the recorded end of the scrape reach the stream."""
+        bus = ScrapeEventBus()
+        adapter = ScraperAdapter(
+            "banks", "onezero", "Acc", {}, date(2026, 1, 1), 77
+        )
+
+        @contextmanager
+        def fake_db_context():
+            yield MagicMock()
+
+        with patch("backend.scraper.events.scrape_events", bus), patch(
+            "backend.scraper.adapter.scrape_events", bus
+        ), patch(
+            "backend.scraper.adapter.get_db_context", side_effect=fake_db_context
+        ):
+            adapter._mark_waiting_for_2fa()
+            adapter._on_progress("Fetching transactions")
+            adapter._otp_code = adapter.CANCEL
+            adapter._record_scraping_attempt(77)
+
+        events = asyncio.run(_collect(bus.subscribe(77)))
+        assert [(event.type, event.data.get("status")) for event in events] == [
+            ("status", "waiting_for_2fa"),
+            ("2fa_required", None),
+            ("progress", None),
+            ("status", "canceled"),
+        ]
+        assert events[1].data == {
+            "service": "banks", "provider": "onezero", "account": "Acc",
+        }
+        assert events[-1].final
+
+
+class TestStreamEvents:
+    """ScrapingService.stream_events falls back to the history table."""
+
+    def test_unknown_finished_process_gets_one_final_status(self):
+        """A process the bus forgot is answered from the DB and the stream ends."""
+        status = {
+            "status": "success", "process_id": 5,
+            "error_message": None, "error_type": None,
+        }
+        with patch(
+            "backend.services.scraping_service.scrape_events", ScrapeEventBus()
+        ), patch(
+            "backend.services.scraping_service._read_scraping_status",
+            return_value=status,
+        ):
+            frames = asyncio.run(_collect(ScrapingService(MagicMock()).stream_events(5)))
+
+        assert frames == [
+            'id: 0\nevent: status\ndata: {"status": "success", "process_id": 5, '
+            '"error_message": null, "error_type": null}\n\n'
+        ]
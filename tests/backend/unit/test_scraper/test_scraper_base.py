@@ -280,3 +280,40 @@ class TestScraperErrorClassification:
         result = asyncio.run(scraper.scrape())
         assert result.success is False
         assert result.error_type == "INVALID_PASSWORD"
+
+
+class TestScrapeHttpClient:
+    """Tests for the run-scoped pooled HTTP client."""
+
+    def test_api_scraper_uses_run_client_and_reports_stats(self, monkeypatch):
+        """An ApiScraper's client is the run's pool, and its traffic lands in the result."""
+        import asyncio
+
+        import httpx
+
+        from scraper.base import ApiScraper
+        from scraper.utils import fetch_get, http_client
+
+        monkeypatch.setattr(
+            http_client.httpx,
+            "AsyncHTTPTransport",
+            lambda **_kwargs: httpx.MockTransport(lambda request: httpx.Response(200, json={})),
+        )
+
+        class _ApiStub(ApiScraper):
+            async def login(self) -> LoginResult:
+                await fetch_get("https://auth.example/login", client=self.client)
+                return LoginResult.SUCCESS
+
+            async def fetch_data(self) -> list:
+                await fetch_get("https://api.example/accounts")
+                assert self.client is self.http_client
+                return []
+
+        scraper = _ApiStub("stub", {}, ScraperOptions())
+        result = asyncio.run(scraper.scrape())
+
+        assert result.success is True
+        assert set(result.http_stats) == {"auth.example", "api.example"}
+        assert result.http_stats["api.example"]["requests"] == 1
+        assert scraper.http_client is None
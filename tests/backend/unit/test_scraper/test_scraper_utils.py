@@ -1,10 +1,11 @@
-"""Tests for scraper utility helpers (waiting/polling)."""
+"""Tests for scraper utility helpers (waiting/polling, bounded concurrency)."""
 
 import asyncio
 
 import pytest
 
 from scraper.exceptions import TimeoutError
+from scraper.utils.concurrency import fetch_months, gather_accounts
 from scraper.utils.waiting import wait_until
 
 
@@ -66,3 +67,124 @@ class TestWaitUntil:
         calls = asyncio.run(run())
         # Wall-clock deadline: ~0.06s per iteration against a 0.1s budget.
         assert calls <= 4
+
+
+class TestFetchMonths:
+    """Tests for the bounded-concurrency month fetcher."""
+
+    def test_results_follow_month_order(self):
+        """Verify results are merged in month order whatever the completion order."""
+
+        async def run():
+            async def fetch(month):
+                await asyncio.sleep(0.01 * (5 - month))
+                return month * 10
+
+            return await fetch_months(range(5), fetch, concurrency=5)
+
+        assert asyncio.run(run()) == [0, 10, 20, 30, 40]
+
+    def test_concurrency_limit(self):
+        """Verify no more than ``concurrency`` months are in flight at once."""
+
+        async def run():
+            state = {"active": 0, "peak": 0}
+
+            async def fetch(month):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                return month
+
+            result = await fetch_months(range(8), fetch, concurrency=3)
+            return result, state["peak"]
+
+        result, peak = asyncio.run(run())
+        assert result == list(range(8))
+        assert peak == 3
+
+    def test_failure_cancels_siblings(self):
+        """Verify the first failure is re-raised and in-flight months are cancelled."""
+
+        async def run():
+            cancelled = []
+
+            async def fetch(month):
+                if month == 1:
+                    raise ValueError("month 1 failed")
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(month)
+                    raise
+                return month
+
+            with pytest.raises(ValueError, match="month 1 failed"):
+                await fetch_months(range(4), fetch, concurrency=4)
+            return cancelled
+
+        assert sorted(asyncio.run(run())) == [0, 2, 3]
+
+    def test_pacing_skips_first_month(self, monkeypatch):
+        """Verify the jittered delay precedes every month but the first."""
+        delays = []
+
+        async def fake_delay(minimum, maximum):
+            delays.append((minimum, maximum))
+
+        monkeypatch.setattr("scraper.utils.concurrency.random_delay", fake_delay)
+
+        async def run():
+            async def fetch(month):
+                return month
+
+            return await fetch_months(range(3), fetch, concurrency=1, pacing=(0.2, 0.5))
+
+        assert asyncio.run(run()) == [0, 1, 2]
+        assert delays == [(0.2, 0.5), (0.2, 0.5)]
+
+    def test_rejects_zero_concurrency(self):
+        """Verify a non-positive limit is rejected rather than deadlocking."""
+
+        async def run():
+            async def fetch(month):
+                return month
+
+            with pytest.raises(ValueError):
+                await fetch_months(range(2), fetch, concurrency=0)
+
+        asyncio.run(run())
+
+
+class TestGatherAccounts:
+    """Tests for the per-account fetch helper."""
+
+    @staticmethod
+    def _peak_in_flight(**kwargs):
+        async def run():
+            state = {"active": 0, "peak": 0}
+
+            async def fetch(account):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                return f"acc-{account}"
+
+            result = await gather_accounts(range(5), fetch, **kwargs)
+            return result, state["peak"]
+
+        return asyncio.run(run())
+
+    def test_fetches_accounts_concurrently(self):
+        """Verify stateless providers overlap accounts up to the limit."""
+        result, peak = self._peak_in_flight(concurrency=2)
+        assert result == [f"acc-{i}" for i in range(5)]
+        assert peak == 2
+
+    def test_opt_out_fetches_serially(self):
+        """Verify concurrent=False runs one account at a time whatever the limit."""
+        result, peak = self._peak_in_flight(concurrency=4, concurrent=False)
+        assert result == [f"acc-{i}" for i in range(5)]
+        assert peak == 1
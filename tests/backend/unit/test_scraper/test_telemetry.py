@@ -0,0 +1,148 @@
+"""Tests for scrape phase telemetry, from the scraper spans to the history row."""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pandas as pd
+
+from backend.scraper.adapter import ScraperAdapter
+from scraper.base.base_scraper import BaseScraper, ScraperOptions
+from scraper.models.account import AccountResult
+from scraper.models.result import LoginResult
+from scraper.utils.concurrency import fetch_months
+from scraper.utils.telemetry import ScrapeTelemetry, child_span, count_request
+
+
+class TestScrapeTelemetry:
+    """Tests for ScrapeTelemetry spans."""
+
+    def test_requests_count_towards_enclosing_spans_only(self):
+        """Concurrent month spans each see their own requests; the phase sees all."""
+        telemetry = ScrapeTelemetry()
+
+        async def fetch_month(month):
+            for _ in range(month.month):
+                count_request()
+                await asyncio.sleep(0)
+            return month.month
+
+        async def scenario():
+            with telemetry.span("fetch"):
+                return await fetch_months(
+                    [date(2026, 1, 1), date(2026, 2, 1)], fetch_month, concurrency=2
+                )
+
+        assert asyncio.run(scenario()) == [1, 2]
+        spans = telemetry.to_list()
+        assert [(s["name"], s.get("label"), s["requests"]) for s in spans] == [
+            ("fetch", None, 3),
+            ("fetch_month", "2026-01", 1),
+            ("fetch_month", "2026-02", 2),
+        ]
+
+    def test_child_span_is_a_no_op_outside_a_scrape(self):
+        """Shared helpers record nothing when no scrape is instrumenting them."""
+        with child_span("fetch_month") as span:
+            count_request()
+        assert span is None
+
+
+class _Scraper(BaseScraper):
+    """Minimal scraper going through one OTP round."""
+
+    async def initialize(self):
+        pass
+
+    async def login(self):
+        await self._request_otp()
+        return LoginResult.SUCCESS
+
+    async def fetch_data(self):
+        return [AccountResult(account_number="1", transactions=[MagicMock()] * 3)]
+
+
+class TestBaseScraperTelemetry:
+    """BaseScraper records its lifecycle phases on the result."""
+
+    def test_lifecycle_phases_are_attached_to_the_result(self):
+        scraper = _Scraper("test", {}, ScraperOptions(start_date=date(2026, 1, 1)))
+        scraper.on_otp_request = AsyncMock(return_value="123456")
+
+        result = asyncio.run(scraper.scrape())
+
+        assert result.success
+        names = [span["name"] for span in result.telemetry]
+        assert names == ["initialize", "login", "otp_wait", "fetch"]
+        assert result.telemetry[-1]["rows"] == 3
+
+
+class TestAdapterTelemetry:
+    """ScraperAdapter persists the scraper's spans plus its own."""
+
+    def test_run_records_scraper_and_pipeline_phases(self):
+        adapter = ScraperAdapter(
+            "credit_cards", "isracard", "Card1", {}, date(2026, 1, 1), 5
+        )
+        fake_scraper = MagicMock()
+        fake_scraper.scrape = AsyncMock(
+            return_value=SimpleNamespace(
+                success=True,
+                accounts=[object()],
+                http_stats={},
+                telemetry=[{"name": "login", "duration_ms": 10.0}],
+            )
+        )
+        fake_scraper.refreshed_otp_long_term_token = None
+        modules = {
+            "scraper": SimpleNamespace(
+                create_scraper=MagicMock(return_value=fake_scraper),
+                is_2fa_required=MagicMock(return_value=False),
+            ),
+            "scraper.base.base_scraper": SimpleNamespace(ScraperOptions=MagicMock()),
+        }
+        adapter._result_to_dataframe = MagicMock(
+            return_value=pd.DataFrame({"date": ["2026-01-02", "2026-01-03"]})
+        )
+
+        def save():
+            adapter._delta = adapter._data.iloc[:1]
+
+        adapter._save_scraped_transactions = save
+        adapter._apply_auto_tagging = MagicMock()
+        adapter._update_recurring_series = MagicMock()
+
+        @contextmanager
+        def fake_db_context(*args):
+            yield MagicMock()
+
+        with patch(
+            "backend.scraper.adapter._import_scraper_module", side_effect=modules.get
+        ), patch(
+            "backend.scraper.adapter.get_db_context", side_effect=fake_db_context
+        ), patch(
+            "backend.scraper.adapter.unit_of_work", side_effect=fake_db_context
+        ), patch("backend.scraper.adapter.ScrapingHistoryRepository") as repo_cls:
+            asyncio.run(adapter.run())
+
+        spans = repo_cls.return_value.record_scrape_end.call_args.kwargs["telemetry"]
+        by_name = {span["name"]: span for span in spans}
+        assert [span["name"] for span in spans] == [
+            "login", "convert", "save", "tag", "recurring", "rebalance",
+            "post_save", "commit", "total",
+        ]
+        assert by_name["convert"]["rows"] == 2
+        assert by_name["save"]["rows"] == 1
+
+    def test_timed_out_scrape_reports_the_phases_recorded_so_far(self):
+        """Without a result, the scraper's partial spans are persisted."""
+        adapter = ScraperAdapter(
+            "banks", "hapoalim", "Main", {}, date(2026, 1, 1), 1
+        )
+        telemetry = ScrapeTelemetry()
+        telemetry.add("login", 300_000.0)
+        adapter._scraper = SimpleNamespace(telemetry=telemetry)
+
+        assert [span["name"] for span in adapter._collect_telemetry()] == ["login"]
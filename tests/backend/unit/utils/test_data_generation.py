@@ -0,0 +1,209 @@
+"""Tests for the process-wide table write generations."""
+
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+from backend.database import reset_engine
+from backend.models.base import Base
+from backend.models.bank_balance import BankBalance
+from backend.utils.data_generation import (
+    data_generation,
+    generation_memoized,
+    has_pending_writes,
+    invalidate_all,
+)
+
+
+class _Counter:
+    """Minimal service exposing ``self.db`` for the decorator."""
+
+    def __init__(self, db):
+        self.db = db
+        self.calls = 0
+
+    @generation_memoized("test.generation_counter", ignore=("retirement_goals",))
+    def compute(self, flag: bool = False) -> dict:
+        self.calls += 1
+        return {"flag": flag, "calls": self.calls}
+
+
+class _BalanceTotal:
+    """Cached sum of bank balances."""
+
+    def __init__(self, db):
+        self.db = db
+
+    @generation_memoized("test.balance_total")
+    def total(self) -> float:
+        return self.db.scalar(select(func.sum(BankBalance.balance)))
+
+
+def _balance(amount: float) -> BankBalance:
+    return BankBalance(
+        provider="p", account_name=str(amount), balance=amount,
+        last_manual_update="2024-01-01",
+    )
+
+
+class TestDataGeneration:
+    """Tests for data_generation and write tracking."""
+
+    def test_committed_write_advances_generation(self, db_session):
+        """A committed UPDATE moves the generation forward."""
+        before = data_generation()
+        db_session.execute(text("UPDATE bank_balances SET balance = 0"))
+        assert data_generation() == before
+        db_session.commit()
+        assert data_generation() > before
+
+    def test_rolled_back_write_does_not_count(self, db_session):
+        """Writes discarded by a rollback leave the generation alone."""
+        before = data_generation()
+        db_session.execute(text("DELETE FROM bank_balances"))
+        db_session.rollback()
+        assert data_generation() == before
+
+    def test_ignored_tables(self, db_session):
+        """Writes to ignored tables do not move the filtered generation."""
+        before = data_generation(ignore=("retirement_goals",))
+        db_session.execute(text("DELETE FROM retirement_goals"))
+        db_session.commit()
+        assert data_generation(ignore=("retirement_goals",)) == before
+        assert data_generation() > before
+
+    def test_watched_tables(self, db_session):
+        """A table allow-list ignores writes to every other table."""
+        before = data_generation(tables=("interest_rates",))
+        db_session.execute(text("DELETE FROM bank_balances"))
+        db_session.commit()
+        assert data_generation(tables=("interest_rates",)) == before
+        db_session.execute(text("DELETE FROM interest_rates"))
+        db_session.commit()
+        assert data_generation(tables=("interest_rates",)) > before
+
+    def test_invalidate_all_and_engine_reset(self):
+        """Out-of-band changes advance every table's generation."""
+        before = data_generation(ignore=("retirement_goals",))
+        invalidate_all()
+        middle = data_generation(ignore=("retirement_goals",))
+        reset_engine()
+        assert before < middle < data_generation(ignore=("retirement_goals",))
+
+    def test_pending_writes_detected(self, db_session):
+        """Unflushed objects and executed-but-uncommitted SQL both count."""
+        assert not has_pending_writes(db_session)
+        db_session.add(
+            BankBalance(provider="p", account_name="a", balance=1.0, last_manual_update="2024-01-01")
+        )
+        assert has_pending_writes(db_session)
+        db_session.flush()
+        assert has_pending_writes(db_session)
+        db_session.commit()
+        assert not has_pending_writes(db_session)
+
+
+class TestGenerationMemoized:
+    """Tests for the generation_memoized decorator."""
+
+    def test_reused_across_sessions_until_a_write(self, db_session, db_engine):
+        """A fresh session hits the cache; a committed write misses it."""
+        from sqlalchemy.orm import sessionmaker
+
+        first = _Counter(db_session)
+        assert first.compute() == {"flag": False, "calls": 1}
+
+        other_session = sessionmaker(bind=db_engine)()
+        try:
+            other = _Counter(other_session)
+            assert other.compute() == {"flag": False, "calls": 1}
+            assert other.calls == 0
+
+            db_session.execute(text("UPDATE bank_balances SET balance = 0"))
+            db_session.commit()
+            assert other.compute() == {"flag": False, "calls": 1}
+            assert other.calls == 1
+        finally:
+            other_session.close()
+
+    def test_ignored_table_write_keeps_entry(self, db_session):
+        """Writing a table the value does not depend on keeps the cache warm."""
+        service = _Counter(db_session)
+        service.compute(flag=True)
+        db_session.execute(text("DELETE FROM retirement_goals"))
+        db_session.commit()
+        service.compute(flag=True)
+        assert service.calls == 1
+
+    def test_bypassed_with_uncommitted_writes(self, db_session):
+        """A session holding its own uncommitted writes never reads or fills the cache."""
+        service = _Counter(db_session)
+        db_session.execute(text("UPDATE bank_balances SET balance = 0"))
+        service.compute()
+        service.compute()
+        assert service.calls == 2
+
+    def test_returns_copies(self, db_session):
+        """Mutating a returned value does not corrupt the cached one."""
+        service = _Counter(db_session)
+        result = service.compute()
+        result["flag"] = "mutated"
+        assert service.compute()["flag"] is False
+
+    def test_read_during_commit_is_not_served_afterwards(self, tmp_path):
+        """A value read while another thread's commit is landing is not reused."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'gen.db'}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        try:
+            with Session() as setup:
+                setup.add(_balance(1.0))
+                setup.commit()
+
+            during = []
+
+            def read_mid_commit(conn):
+                with Session() as reader:
+                    during.append(_BalanceTotal(reader).total())
+
+            with Session() as writer:
+                writer.add(_balance(10.0))
+                writer.flush()
+                event.listen(engine, "commit", read_mid_commit)
+                try:
+                    writer.commit()
+                finally:
+                    event.remove(engine, "commit", read_mid_commit)
+
+            assert during == [1.0]
+            with Session() as reader:
+                assert _BalanceTotal(reader).total() == 11.0
+        finally:
+            engine.dispose()
+
+    def test_other_process_commit_is_noticed(self, tmp_path):
+        """A write that bypasses this process's engine events still misses the cache."""
+        import sqlite3
+
+        path = tmp_path / "external.db"
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        Session = sessionmaker(bind=engine)
+        try:
+            with Session() as reader:
+                assert _BalanceTotal(reader).total() is None
+
+            external = sqlite3.connect(str(path))
+            try:
+                external.execute(
+                    "INSERT INTO bank_balances (provider, account_name, balance, "
+                    "prior_wealth_amount, created_at, updated_at) VALUES "
+                    "('p', 'x', 5.0, 0.0, '2024-01-01', '2024-01-01')"
+                )
+                external.commit()
+            finally:
+                external.close()
+
+            with Session() as reader:
+                assert _BalanceTotal(reader).total() == 5.0
+        finally:
+            engine.dispose()
@@ -3,7 +3,11 @@
 import pandas as pd
 from sqlalchemy import text
 
-from backend.utils.session_cache import session_cache_get, session_cache_set
+from backend.utils.session_cache import (
+    session_cache_get,
+    session_cache_set,
+    session_memoized,
+)
 
 
 class TestSessionCache:
@@ -56,3 +60,58 @@ class TestSessionCache:
         session_cache_set(db_session, ("b",), pd.DataFrame({"x": [2]}))
         assert session_cache_get(db_session, ("a",))["x"].iloc[0] == 1
         assert session_cache_get(db_session, ("b",))["x"].iloc[0] == 2
+
+    def test_non_frame_values_are_deep_copied(self, db_session):
+        """Derived dict results round-trip and are isolated from mutation."""
+        value = {"items": [{"amount": 1.0}], "total": 1.0}
+        session_cache_set(db_session, ("d",), value)
+        value["items"][0]["amount"] = 999.0
+        out = session_cache_get(db_session, ("d",))
+        assert out == {"items": [{"amount": 1.0}], "total": 1.0}
+        out["items"].clear()
+        assert session_cache_get(db_session, ("d",))["items"] == [{"amount": 1.0}]
+
+
+class _Counter:
+    """Minimal service exposing ``db`` with a memoized method."""
+
+    def __init__(self, db):
+        self.db = db
+        self.calls = 0
+
+    @session_memoized("test.counter")
+    def compute(self, flag: bool = False) -> dict:
+        self.calls += 1
+        return {"flag": flag, "calls": self.calls}
+
+
+class TestSessionMemoized:
+    """Tests for the session_memoized method decorator."""
+
+    def test_result_is_reused_within_session(self, db_session):
+        """A second call with equivalent arguments hits the cache."""
+        service = _Counter(db_session)
+        assert service.compute() == {"flag": False, "calls": 1}
+        assert service.compute(flag=False) == {"flag": False, "calls": 1}
+        assert service.calls == 1
+
+    def test_distinct_arguments_get_distinct_entries(self, db_session):
+        """Different argument values are memoized separately."""
+        service = _Counter(db_session)
+        service.compute(False)
+        assert service.compute(True) == {"flag": True, "calls": 2}
+
+    def test_memo_is_shared_across_instances_on_one_session(self, db_session):
+        """Another service on the same session reuses the entry."""
+        _Counter(db_session).compute()
+        other = _Counter(db_session)
+        other.compute()
+        assert other.calls == 0
+
+    def test_commit_invalidates_memo(self, db_session):
+        """A commit forces recomputation."""
+        service = _Counter(db_session)
+        service.compute()
+        db_session.commit()
+        service.compute()
+        assert service.calls == 2
@@ -0,0 +1,71 @@
+"""Tests for the multi-series alignment helpers."""
+
+import numpy as np
+
+from backend.utils.time_series import align_series, sum_series
+
+
+class TestAlignSeries:
+    """Tests for align_series."""
+
+    def test_forward_fills_onto_union_of_dates(self):
+        """Each series holds its last value and is zero before its first point."""
+        a = [{"date": "2024-01-01", "balance": 100.0}, {"date": "2024-03-01", "balance": 80.0}]
+        b = [{"date": "2024-02-01", "balance": 50.0}]
+
+        dates, aligned = align_series([a, b])
+
+        assert dates == ["2024-01-01", "2024-02-01", "2024-03-01"]
+        np.testing.assert_array_equal(aligned, [[100.0, 100.0, 80.0], [0.0, 50.0, 50.0]])
+
+    def test_unsorted_points_and_same_day_duplicates(self):
+        """Points are sorted first; the later-listed point wins on a shared date."""
+        points = [
+            {"date": "2024-02-01", "balance": 5.0},
+            {"date": "2024-01-01", "balance": 9.0},
+            {"date": "2024-02-01", "balance": 4.0},
+        ]
+
+        _, aligned = align_series([points])
+
+        np.testing.assert_array_equal(aligned, [[9.0, 4.0]])
+
+    def test_empty_inputs(self):
+        """No series, or an empty series, align without error."""
+        dates, aligned = align_series([])
+        assert dates == [] and aligned.size == 0
+        dates, aligned = align_series([[], [{"date": "2024-01-01", "balance": 1.0}]])
+        assert dates == ["2024-01-01"]
+        np.testing.assert_array_equal(aligned, [[0.0], [1.0]])
+
+
+class TestSumSeries:
+    """Tests for sum_series."""
+
+    def test_total_matches_nested_scan(self):
+        """The total equals the per-date last-known-value scan it replaces."""
+        rng = np.random.default_rng(7)
+        days = np.datetime64("2020-01-01") + np.arange(0, 3650, 30)
+        series = [
+            [
+                {"date": str(d), "balance": float(v)}
+                for d, v in zip(
+                    np.sort(rng.choice(days, size=40, replace=False)), rng.normal(1000, 300, 40)
+                )
+            ]
+            for _ in range(12)
+        ]
+
+        total = sum_series(series)
+
+        for point in total:
+            expected = sum(
+                next((p["balance"] for p in reversed(s) if p["date"] <= point["date"]), 0.0)
+                for s in series
+            )
+            assert abs(point["balance"] - expected) < 1e-9
+
+    def test_custom_keys(self):
+        """Date and value keys are configurable and echoed in the output."""
+        total = sum_series([[{"day": "2024-01-01", "net_worth": 3.0}]], "day", "net_worth")
+        assert total == [{"day": "2024-01-01", "net_worth": 3.0}]